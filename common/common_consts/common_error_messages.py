@@ -26,3 +26,12 @@ class InvalidInputResponseErrorStatus(StrValueLabel):
     INVALID_RECRUIT_JOB_INPUT_ERROR_400 = (
         '400-invalid_recruit_job_input-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
     )
+    INVALID_BOOKMARK_SYNC_INPUT_ERROR_400 = (
+        '400-invalid_bookmark_sync_input-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
+    )
+    INVALID_RECRUIT_APPLICATION_LIST_PARAM_ERROR_400 = (
+        '400-invalid_recruit_application_list_input-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
+    )
+    INVALID_RECRUIT_APPLICATION_DECISION_INPUT_ERROR_400 = (
+        '400-invalid_recruit_application_decision_input-00001', ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label
+    )
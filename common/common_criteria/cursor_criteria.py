@@ -4,13 +4,26 @@ from datetime import (
 )
 from typing import Any
 
+from common.common_expressions.row_value_expressions import RowValueComparison
 from common.common_interfaces.cursor_criteria_interfaces import CursorCriteriaInterface
 from common.common_utils import format_iso8601
 from common.common_utils.encode_utils import data_to_urlsafe_base64
+from django.db.models import Q
 
 
 class CursorCriteria(CursorCriteriaInterface):
+    """
+    cursor_keys 는 정렬 우선순위 순서로 정의하고, 마지막 key 는 유일한 값(id 등)이어야 합니다.
+    비교 연산자가 있는 key 들은 (a, b, ...) < (x, y, ...) 하나의 row value 비교로 묶이므로
+    모두 같은 정렬 방향이어야 하며, 동일 tuple 포함 여부는 마지막 key 의 연산자를 따릅니다.
+    """
     cursor_keys = []
+    row_value_operators = {
+        'lt': '<',
+        'lte': '<=',
+        'gt': '>',
+        'gte': '>=',
+    }
 
     @classmethod
     def is_valid_decoded_cursor(cls, decoded_cursor: dict) -> bool:
@@ -30,12 +43,43 @@ class CursorCriteria(CursorCriteriaInterface):
             except AttributeError:
                 raise ValueError(f"Attribute '{attribute}' not found in '{data.__class__.__name__}'")
             if isinstance(value, (datetime, date)):
-                encoding_data[cursor_key] = format_iso8601(value)
+                # keyset 비교에서 동일 시각이 누락되지 않도록 microsecond 까지 유지합니다.
+                encoding_data[cursor_key] = format_iso8601(value, with_microseconds=True)
             else:
                 encoding_data[cursor_key] = value
 
         return data_to_urlsafe_base64(encoding_data)
 
+    @classmethod
+    def get_filtering_q(cls, decoded_cursor: dict) -> Q:
+        if not decoded_cursor:
+            return Q()
+
+        q = Q()
+        attributes = []
+        operators = []
+        values = []
+        for cursor_key in cls.cursor_keys:
+            if '__' not in cursor_key:
+                q &= Q(**{cursor_key: decoded_cursor[cursor_key]})
+                continue
+            attribute, operator = cursor_key.split('__')
+            attributes.append(attribute)
+            operators.append(operator)
+            values.append(decoded_cursor[cursor_key])
+
+        if not attributes:
+            return q
+        if len({operator[:2] for operator in operators}) > 1:
+            raise ValueError(f"Cursor keys of '{cls.__name__}' must have the same direction")
+        return q & Q(
+            RowValueComparison(
+                attributes,
+                cls.row_value_operators[operators[-1]],
+                values,
+            )
+        )
+
     @classmethod
     def get_ordering_data(cls):
         ordering_data = []
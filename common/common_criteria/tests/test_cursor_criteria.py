@@ -6,6 +6,10 @@ from unittest.mock import patch
 
 from common.common_criteria.cursor_criteria import CursorCriteria
 from common.common_testcase_helpers.testcase_helpers import SampleModel
+from django.db.models import (
+    F,
+    Q,
+)
 from django.test import TestCase
 
 
@@ -114,3 +118,58 @@ class CursorCriteriaTests(TestCase):
 
         # Then:
         self.assertEqual(ordering_data, ['-id', '-created', 'name'])
+
+    def test_get_filtering_q_empty_cursor(self):
+        # Given: empty cursor
+        # When: get_filtering_q
+        q = SampleCursorCriteria.get_filtering_q({})
+
+        # Then: empty Q
+        self.assertEqual(q, Q())
+
+    def test_get_filtering_q_should_build_row_value_comparison(self):
+        # Given: cursor keys with same direction
+        class SampleRowValueCursorCriteria(CursorCriteria):
+            cursor_keys = ['name', 'created__lt', 'id__lt']
+
+        # When: get_filtering_q
+        q = SampleRowValueCursorCriteria.get_filtering_q(
+            {'name': 'test', 'created__lt': '2021-08-01T12:00:00+09:00', 'id__lt': 10}
+        )
+
+        # Then: equal filter for key without operator
+        self.assertEqual(q.children[0], ('name', 'test'))
+        # And: (created, id) < ('2021-08-01T12:00:00+09:00', 10)
+        row_value_comparison = q.children[1]
+        self.assertEqual(row_value_comparison.operator, '<')
+        self.assertEqual(row_value_comparison.lhs, [F('created'), F('id')])
+        self.assertEqual(
+            [value.value for value in row_value_comparison.rhs],
+            ['2021-08-01T12:00:00+09:00', 10],
+        )
+
+    def test_get_filtering_q_should_follow_last_key_operator(self):
+        # Given: last key is inclusive
+        class SampleRowValueCursorCriteria(CursorCriteria):
+            cursor_keys = ['created__gt', 'id__gte']
+
+        # When: get_filtering_q
+        q = SampleRowValueCursorCriteria.get_filtering_q({'created__gt': '2021-08-01', 'id__gte': 10})
+
+        # Then: (created, id) >= ('2021-08-01', 10)
+        self.assertEqual(q.children[0].operator, '>=')
+
+    def test_get_filtering_q_should_raise_when_direction_is_mixed(self):
+        # Given: cursor keys with mixed direction
+        class SampleMixedCursorCriteria(CursorCriteria):
+            cursor_keys = ['created__lt', 'id__gt']
+
+        # When: get_filtering_q
+        with self.assertRaises(ValueError) as e:
+            SampleMixedCursorCriteria.get_filtering_q({'created__lt': '2021-08-01', 'id__gt': 10})
+
+        # Then: expected exception
+        self.assertEqual(
+            e.exception.args[0],
+            'Cursor keys of \'SampleMixedCursorCriteria\' must have the same direction',
+        )
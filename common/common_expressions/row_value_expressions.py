@@ -0,0 +1,67 @@
+from itertools import chain
+from typing import (
+    Any,
+    List,
+)
+
+from django.db.models import (
+    BooleanField,
+    Expression,
+    F,
+    Value,
+)
+
+
+class RowValueComparison(Expression):
+    """
+    (a, b, ...) < (x, y, ...) 형태의 row value 비교식입니다.
+    사전순 keyset 비교를 하나의 조건으로 만들어 (a, b, ...) 복합 인덱스를 그대로 탈 수 있도록 합니다.
+    """
+    conditional = True
+    output_field = BooleanField()
+    operators = {'<', '<=', '>', '>='}
+
+    def __init__(self, lhs: List[Any], operator: str, rhs: List[Any]):
+        if not lhs or len(lhs) != len(rhs):
+            raise ValueError('lhs and rhs must have the same length.')
+        if operator not in self.operators:
+            raise ValueError(f'Invalid operator: {operator}')
+        super().__init__()
+        self.lhs = [F(expression) if isinstance(expression, str) else expression for expression in lhs]
+        self.rhs = [value if hasattr(value, 'resolve_expression') else Value(value) for value in rhs]
+        self.operator = operator
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.lhs}, {self.operator!r}, {self.rhs})'
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs, self.rhs = exprs[:len(self.lhs)], exprs[len(self.lhs):]
+
+    def resolve_expression(self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False):
+        c = self.copy()
+        c.is_summary = summarize
+        c.lhs = [
+            expression.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+            for expression in self.lhs
+        ]
+        # cursor 에서 복원한 문자열 값도 비교 대상 컬럼 타입으로 변환되도록 output_field 를 맞춥니다.
+        c.rhs = [
+            (
+                Value(value.value, output_field=expression.output_field)
+                if isinstance(value, Value) and 'output_field' not in value.__dict__
+                else value
+            ).resolve_expression(query, allow_joins, reuse, summarize, for_save)
+            for expression, value in zip(c.lhs, self.rhs)
+        ]
+        return c
+
+    def as_sql(self, compiler, connection):
+        lhs_sqls, lhs_params = zip(*[compiler.compile(expression) for expression in self.lhs])
+        rhs_sqls, rhs_params = zip(*[compiler.compile(value) for value in self.rhs])
+        return (
+            f'({", ".join(lhs_sqls)}) {self.operator} ({", ".join(rhs_sqls)})',
+            [*chain.from_iterable(lhs_params), *chain.from_iterable(rhs_params)],
+        )
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from common.common_expressions.row_value_expressions import RowValueComparison
+from django.test import TestCase
+from django.utils import timezone
+from member.models import Member
+from project.models import Project
+
+
+class RowValueComparisonTests(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.rearrangement_time = timezone.make_aware(datetime(2021, 8, 1, 12, 0, 0))
+        self.projects = [
+            Project.objects.create(
+                title=f'Project{i}',
+                created_member_id=self.member.id,
+            )
+            for i in range(3)
+        ]
+        Project.objects.update(rearrangement_time=self.rearrangement_time)
+
+    def test_row_value_comparison_should_compare_lexicographically(self):
+        # Given: same rearrangement_time and middle project id
+        # When: filter (rearrangement_time, id) < (rearrangement_time, projects[1].id)
+        project_ids = list(
+            Project.objects.filter(
+                RowValueComparison(
+                    ['rearrangement_time', 'id'],
+                    '<',
+                    [self.rearrangement_time, self.projects[1].id],
+                )
+            ).values_list('id', flat=True)
+        )
+
+        # Then: only tie broken by id
+        self.assertEqual(project_ids, [self.projects[0].id])
+
+    def test_row_value_comparison_should_cast_string_value_by_lhs_field(self):
+        # Given: iso8601 string value from cursor
+        # When: filter (rearrangement_time, id) <= ('2021-08-01T12:00:00+09:00', projects[1].id)
+        project_ids = set(
+            Project.objects.filter(
+                RowValueComparison(
+                    ['rearrangement_time', 'id'],
+                    '<=',
+                    ['2021-08-01T12:00:00+09:00', self.projects[1].id],
+                )
+            ).values_list('id', flat=True)
+        )
+
+        # Then: projects[0], projects[1] are filtered
+        self.assertEqual(project_ids, {self.projects[0].id, self.projects[1].id})
+
+    def test_row_value_comparison_sql(self):
+        # When: compile queryset
+        sql = str(
+            Project.objects.filter(
+                RowValueComparison(['rearrangement_time', 'id'], '<', [self.rearrangement_time, 1])
+            ).query
+        )
+
+        # Then: single row value comparison
+        self.assertIn('("project_project"."rearrangement_time", "project_project"."id") <', sql)
+
+    def test_row_value_comparison_should_raise_when_length_is_different(self):
+        # When: lhs and rhs length is different
+        with self.assertRaises(ValueError):
+            RowValueComparison(['rearrangement_time', 'id'], '<', [1])
+
+    def test_row_value_comparison_should_raise_when_operator_is_invalid(self):
+        # When: invalid operator
+        with self.assertRaises(ValueError):
+            RowValueComparison(['id'], '=', [1])
@@ -18,6 +18,12 @@ class CursorCriteriaInterface(ABC):
         """Define this method to get cursor data in subclasses."""
         pass
 
+    @classmethod
+    @abstractmethod
+    def get_filtering_q(cls, decoded_cursor: dict) -> Any:
+        """Define this method to build the queryset filter for a decoded cursor in subclasses."""
+        pass
+
     @classmethod
     @abstractmethod
     def get_ordering_data(cls) -> list[str]:
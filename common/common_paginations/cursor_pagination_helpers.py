@@ -16,7 +16,7 @@ def get_objects_with_cursor_pagination(qs: QuerySet,
                                        size: int) -> tuple[List[Any], bool, str]:
     objects = list(
         qs.filter(
-            **filtering_operator
+            cursor_criteria.get_filtering_q(filtering_operator)
         ).order_by(
             *cursor_criteria.get_ordering_data()
         )[:size + 1]
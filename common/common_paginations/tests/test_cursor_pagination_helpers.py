@@ -1,7 +1,10 @@
 from common.common_paginations.cursor_pagination_helpers import get_objects_with_cursor_pagination
 from common.common_paginations.tests import MockCursorCriteria
+from common.common_utils.decode_utils import urlsafe_base64_to_data
 from django.test import TestCase
+from django.utils import timezone
 from member.models import Member
+from project.cursor_criteria.cursor_criteria import HomeProjectListCursorCriteria
 from project.models import Project
 
 
@@ -76,3 +79,30 @@ class TestGetObjectsWithCursorPagination(TestCase):
         self.assertEqual(has_more, False)
         # And: No next cursor needed
         self.assertEqual(next_cursor, None)
+
+    def test_pagination_with_row_value_cursor_should_not_skip_ties(self):
+        # Given: every project has same rearrangement_time
+        Project.objects.update(rearrangement_time=timezone.now())
+        qs = Project.objects.all()
+        size = 7
+
+        # When: walk all pages with next cursor
+        project_ids = []
+        filtered_operator = {}
+        while True:
+            projects, has_more, next_cursor = get_objects_with_cursor_pagination(
+                qs,
+                HomeProjectListCursorCriteria,
+                filtered_operator,
+                size
+            )
+            project_ids.extend(project.id for project in projects)
+            if not has_more:
+                break
+            filtered_operator = urlsafe_base64_to_data(next_cursor)
+
+        # Then: every project is returned exactly once in id desc order
+        self.assertEqual(
+            project_ids,
+            list(Project.objects.order_by('-id').values_list('id', flat=True)),
+        )
@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+
+class StubResponse(object):
+    def __init__(self,
+                 status_code: int = 200,
+                 json_body: Optional[dict] = None,
+                 delay_seconds: float = 0,
+                 headers: Optional[dict] = None):
+        self.status_code = status_code
+        self.json_body = json_body if json_body is not None else {}
+        self.delay_seconds = delay_seconds
+        self.headers = headers or {}
+
+
+class StubRequest(object):
+    def __init__(self, method: str, path: str, query: str, headers: dict, body: bytes, client_address: Tuple[str, int]):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.client_address = client_address
+
+    def json(self) -> dict:
+        return json.loads(self.body)
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    # keep-alive 연결 재사용을 확인할 수 있도록 HTTP/1.1 로 응답합니다.
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        split_url = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        stub_response = self.server.stub_server.record(
+            StubRequest(self.command, split_url.path, split_url.query, dict(self.headers), body, self.client_address)
+        )
+        time.sleep(stub_response.delay_seconds)
+        response_body = json.dumps(stub_response.json_body).encode()
+        try:
+            self.send_response(stub_response.status_code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(response_body)))
+            for header, value in stub_response.headers.items():
+                self.send_header(header, value)
+            self.end_headers()
+            self.wfile.write(response_body)
+        except (BrokenPipeError, ConnectionResetError):
+            # timeout 으로 client 가 먼저 연결을 끊었습니다.
+            self.close_connection = True
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpStubServer(object):
+    """
+    외부 API 대신 테스트에서 띄우는 로컬 HTTP 서버입니다.
+    (method, path) 별로 응답을 순서대로 등록하며, 마지막 응답은 이후 요청에도 반복됩니다.
+
+    with HttpStubServer() as stub_server:
+        stub_server.add_responses('POST', '/oauth/token', StubResponse(200, {'access_token': 'token'}))
+        http_client.post(stub_server.get_url('/oauth/token'))
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.responses: Dict[Tuple[str, str], List[StubResponse]] = defaultdict(list)
+        self.requests: List[StubRequest] = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubRequestHandler)
+        self.server.daemon_threads = True
+        self.server.stub_server = self
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+
+    def __enter__(self) -> 'HttpStubServer':
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def host(self) -> str:
+        return f'127.0.0.1:{self.server.server_address[1]}'
+
+    def get_url(self, path: str) -> str:
+        return f'http://{self.host}{path}'
+
+    def add_responses(self, method: str, path: str, *stub_responses: StubResponse) -> None:
+        with self.lock:
+            self.responses[(method, path)].extend(stub_responses)
+
+    def record(self, stub_request: StubRequest) -> StubResponse:
+        with self.lock:
+            self.requests.append(stub_request)
+            stub_responses = self.responses[(stub_request.method, stub_request.path)]
+            if not stub_responses:
+                return StubResponse(404)
+            if len(stub_responses) > 1:
+                return stub_responses.pop(0)
+            return stub_responses[0]
+
+    def get_requests(self, method: str, path: str) -> List[StubRequest]:
+        with self.lock:
+            return [
+                stub_request for stub_request in self.requests
+                if stub_request.method == method and stub_request.path == path
+            ]
@@ -1,4 +1,12 @@
+from typing import List
+
+from common.common_utils import format_utc
+from job.dtos.model_dtos import (
+    ProjectJobAvailabilities,
+    ProjectJobRecruitInfo,
+)
 from project.consts import ProjectRecruitmentStatus
+from project.dtos.model_dtos import ProjectCardFragment
 from project.models import (
     Project,
     ProjectCategory,
@@ -33,3 +41,19 @@ def create_project_category_for_testcase(name: str) -> ProjectCategory:
         display_name=name,
         name=name,
     )
+
+
+def get_project_card_fragment_for_testcase(project: Project,
+                                           job_recruits: List[ProjectJobRecruitInfo]) -> ProjectCardFragment:
+    return ProjectCardFragment(
+        id=project.id,
+        category_id=project.category_id,
+        title=project.title,
+        simple_description=project.description[:100],
+        jobs=[ProjectJobAvailabilities.from_recruit_info(job_recruit) for job_recruit in job_recruits],
+        experience=project.job_experience_type,
+        hours_per_week=project.hours_per_week,
+        current_recruit_status=project.current_recruit_status,
+        image=project.main_image,
+        recent_recruited_at=format_utc(project.latest_recruited_at) if project.latest_recruited_at else None,
+    )
@@ -0,0 +1,206 @@
+import os
+import threading
+import time
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+import requests
+from common.consts import (
+    HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+    HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS,
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+    HTTP_CLIENT_LATENCY_BUCKET_MILLISECONDS,
+    HTTP_CLIENT_METRICS_KEY_PREFIX,
+    HTTP_CLIENT_POOL_HOST_COUNT,
+    HTTP_CLIENT_POOL_SIZE,
+    HTTP_CLIENT_READ_TIMEOUT_SECONDS,
+    HTTP_CLIENT_RETRY_BACKOFF_FACTOR,
+    HTTP_CLIENT_RETRY_COUNT,
+    HTTP_CLIENT_RETRY_STATUSES,
+)
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class CircuitBreakerOpenError(requests.exceptions.ConnectionError):
+    """
+    host 의 circuit 이 열려 요청을 보내지 않았습니다.
+    requests 의 연결 실패로 취급되므로 RequestException 으로 함께 처리할 수 있습니다.
+    """
+
+
+class HostCircuitBreaker(object):
+    """
+    host 별 연속 실패 수를 세어 기준을 넘으면 circuit 을 엽니다.
+    열린 뒤 recovery 시간이 지나면 한 요청만 시험으로 보내고, 성공하면 닫고 실패하면 다시 엽니다.
+    """
+    def __init__(self, failure_threshold: int, recovery_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.lock = threading.Lock()
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+
+    def allow_request(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.recovery_seconds:
+                return False
+            # 시험 요청이 끝날 때까지 다른 요청은 다시 recovery 시간 동안 막습니다.
+            self.opened_at = time.monotonic()
+            return True
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failure_count = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failure_count += 1
+            if self.failure_count >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def _get_http_client_metrics_key(host: str) -> str:
+    return f'{HTTP_CLIENT_METRICS_KEY_PREFIX}:{host}'
+
+
+def _get_latency_bucket(elapsed_milliseconds: float) -> str:
+    for bucket_milliseconds in HTTP_CLIENT_LATENCY_BUCKET_MILLISECONDS:
+        if elapsed_milliseconds <= bucket_milliseconds:
+            return f'le_{bucket_milliseconds}'
+    return f'gt_{HTTP_CLIENT_LATENCY_BUCKET_MILLISECONDS[-1]}'
+
+
+def _record_http_client_metrics(host: str, elapsed_milliseconds: Optional[float], is_failed: bool) -> None:
+    # elapsed_milliseconds 가 None 이면 circuit 이 열려 요청을 보내지 않은 경우입니다.
+    if not settings.HTTP_CLIENT_METRICS_ENABLED:
+        return
+    key = _get_http_client_metrics_key(host)
+    try:
+        pipeline = get_redis_connection('default').pipeline(transaction=False)
+        if elapsed_milliseconds is None:
+            pipeline.hincrby(key, 'circuit_open_count', 1)
+        else:
+            pipeline.hincrby(key, 'request_count', 1)
+            pipeline.hincrbyfloat(key, 'total_milliseconds', elapsed_milliseconds)
+            pipeline.hincrby(key, _get_latency_bucket(elapsed_milliseconds), 1)
+            if is_failed:
+                pipeline.hincrby(key, 'failure_count', 1)
+        pipeline.execute()
+    except RedisError:
+        pass
+
+
+def get_http_client_metrics(host: str) -> Dict[str, float]:
+    """
+    host 의 요청 수, 실패 수, circuit 으로 막힌 수, 응답 시간 합계와 구간별 요청 수를 반환합니다.
+    """
+    metrics = get_redis_connection('default').hgetall(_get_http_client_metrics_key(host))
+    return {
+        field.decode(): float(value) if field == b'total_milliseconds' else int(value)
+        for field, value in metrics.items()
+    }
+
+
+class HttpClient(object):
+    """
+    외부 API 호출용 HTTP client 입니다.
+    process 별 session 으로 host 별 keep-alive 연결을 재사용하고, 연결/응답 timeout, 재시도,
+    host 별 circuit breaker 와 응답 시간 지표를 적용합니다.
+    """
+    def __init__(self,
+                 timeout: Tuple[float, float] = (HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS, HTTP_CLIENT_READ_TIMEOUT_SECONDS),
+                 retry_count: int = HTTP_CLIENT_RETRY_COUNT,
+                 retry_backoff_factor: float = HTTP_CLIENT_RETRY_BACKOFF_FACTOR,
+                 circuit_failure_threshold: int = HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+                 circuit_recovery_seconds: float = HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS):
+        self.timeout = timeout
+        self.retry_count = retry_count
+        self.retry_backoff_factor = retry_backoff_factor
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_recovery_seconds = circuit_recovery_seconds
+        self.lock = threading.Lock()
+        self.session: Optional[requests.Session] = None
+        self.session_pid: Optional[int] = None
+        self.circuit_breakers: Dict[str, HostCircuitBreaker] = {}
+
+    def _create_session(self) -> requests.Session:
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_CLIENT_POOL_HOST_COUNT,
+            pool_maxsize=HTTP_CLIENT_POOL_SIZE,
+            max_retries=Retry(
+                total=self.retry_count,
+                backoff_factor=self.retry_backoff_factor,
+                status_forcelist=HTTP_CLIENT_RETRY_STATUSES,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                raise_on_status=False,
+            ),
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        # fork 된 worker 가 부모 process 의 연결을 함께 쓰지 않도록 process 마다 session 을 만듭니다.
+        with self.lock:
+            if self.session is None or self.session_pid != os.getpid():
+                self.session = self._create_session()
+                self.session_pid = os.getpid()
+            return self.session
+
+    def _get_circuit_breaker(self, host: str) -> HostCircuitBreaker:
+        with self.lock:
+            if host not in self.circuit_breakers:
+                self.circuit_breakers[host] = HostCircuitBreaker(
+                    self.circuit_failure_threshold,
+                    self.circuit_recovery_seconds,
+                )
+            return self.circuit_breakers[host]
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        requests.request 와 같은 인자를 받습니다. timeout 을 지정하지 않으면 기본 timeout 을 사용합니다.
+        5xx 응답과 연결/응답 실패는 circuit breaker 의 실패로 셉니다.
+        """
+        host = urlsplit(url).netloc
+        circuit_breaker = self._get_circuit_breaker(host)
+        if not circuit_breaker.allow_request():
+            _record_http_client_metrics(host, None, True)
+            raise CircuitBreakerOpenError(f'{host} circuit is open')
+
+        kwargs.setdefault('timeout', self.timeout)
+        started_at = time.monotonic()
+        try:
+            response = self._get_session().request(method, url, **kwargs)
+        except requests.RequestException:
+            circuit_breaker.record_failure()
+            _record_http_client_metrics(host, (time.monotonic() - started_at) * 1000, True)
+            raise
+
+        is_failed = response.status_code >= 500
+        if is_failed:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        _record_http_client_metrics(host, (time.monotonic() - started_at) * 1000, is_failed)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+
+http_client = HttpClient()
@@ -0,0 +1,75 @@
+import uuid
+from typing import (
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from common.consts import (
+    CACHE_GENERATION_KEY_SUFFIX,
+    CACHE_GENERATION_TIMEOUT_SECONDS,
+)
+from redis import Redis
+
+# KEYS: (값 키, 세대 키) 쌍, ARGV: 만료 초, 이후 (조회 시 세대, 값) 쌍
+# 세대가 조회 시점과 같은 값만 저장하고, 저장한 수를 반환합니다.
+_SET_IF_GENERATION_UNCHANGED_SCRIPT = """
+local count = 0
+for i = 1, #KEYS, 2 do
+    if (redis.call('GET', KEYS[i + 1]) or '') == ARGV[i + 1] then
+        redis.call('SET', KEYS[i], ARGV[i + 2], 'EX', ARGV[1])
+        count = count + 1
+    end
+end
+return count
+"""
+
+
+def get_cache_generation_key(key: str) -> str:
+    return f'{key}:{CACHE_GENERATION_KEY_SUFFIX}'
+
+
+def get_cached_values_with_generations(
+        redis: Redis,
+        keys: Sequence[str],
+) -> Tuple[List[Optional[bytes]], List[bytes]]:
+    """
+    캐시 값과 세대를 MGET 한 번으로 조회합니다.
+    세대는 DB 조회 전에 읽어 두었다가 set_cached_values_if_generation_unchanged 에 넘깁니다.
+    """
+    cached_values = redis.mget([*keys, *[get_cache_generation_key(key) for key in keys]])
+    return cached_values[:len(keys)], [generation or b'' for generation in cached_values[len(keys):]]
+
+
+def set_cached_values_if_generation_unchanged(
+        redis: Redis,
+        values: Sequence[Tuple[str, bytes, str]],
+        timeout_seconds: int,
+) -> None:
+    """
+    (키, 조회 시 세대, 값) 목록 중 그 사이 무효화되지 않은 값만 저장합니다.
+    DB 조회와 저장 사이에 커밋된 변경의 무효화를 오래된 값이 덮어쓰지 않도록 합니다.
+    redis 로 pipeline 을 넘기면 pipeline 실행 시 함께 저장합니다.
+    """
+    if not values:
+        return
+    keys, args = [], [timeout_seconds]
+    for key, generation, value in values:
+        keys += [key, get_cache_generation_key(key)]
+        args += [generation, value]
+    redis.eval(_SET_IF_GENERATION_UNCHANGED_SCRIPT, len(keys), *keys, *args)
+
+
+def invalidate_cached_values(redis: Redis, keys: Sequence[str]) -> None:
+    """
+    캐시 값을 삭제하고 세대를 바꿔, 이미 진행 중인 조회가 이전 값을 다시 저장하지 못하게 합니다.
+    """
+    if not keys:
+        return
+    generation = uuid.uuid4().hex
+    pipeline = redis.pipeline(transaction=False)
+    for key in keys:
+        pipeline.set(get_cache_generation_key(key), generation, ex=CACHE_GENERATION_TIMEOUT_SECONDS)
+    pipeline.delete(*keys)
+    pipeline.execute()
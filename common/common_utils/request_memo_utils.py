@@ -0,0 +1,23 @@
+from contextvars import (
+    ContextVar,
+    Token,
+)
+from typing import Optional
+
+# 요청 하나 동안만 유지되는 메모 (RequestMemoMiddleware 가 요청마다 새로 만듭니다.)
+_request_memo: ContextVar[Optional[dict]] = ContextVar('request_memo', default=None)
+
+
+def start_request_memo() -> Token:
+    return _request_memo.set({})
+
+
+def end_request_memo(token: Token) -> None:
+    _request_memo.reset(token)
+
+
+def get_request_memo() -> Optional[dict]:
+    """
+    현재 요청의 메모를 반환합니다. 요청 밖(celery, 커맨드 등)에서는 None 입니다.
+    """
+    return _request_memo.get()
@@ -1,8 +1,28 @@
+from django.conf import settings
 from django.http import HttpRequest
+from django.utils.http import parse_etags
 
 
 def get_request_ip(request: HttpRequest) -> str:
+    """
+    X-Forwarded-For 의 앞쪽 항목은 client 가 임의로 보낼 수 있으므로,
+    신뢰하는 proxy 수만큼 뒤에서부터 센 항목(가장 바깥 proxy 가 추가한 접속 ip)을 사용합니다.
+    """
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        return x_forwarded_for.split(',')[0]
+    if x_forwarded_for and settings.TRUSTED_PROXY_COUNT:
+        forwarded_ips = [forwarded_ip.strip() for forwarded_ip in x_forwarded_for.split(',')]
+        return forwarded_ips[-min(settings.TRUSTED_PROXY_COUNT, len(forwarded_ips))]
     return request.META.get('REMOTE_ADDR')
+
+
+def is_etag_matched(request: HttpRequest, etag: str) -> bool:
+    """
+    If-None-Match 헤더에 etag 가 있는지 약한 비교(W/ 무시)로 확인합니다.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    if '*' in etags:
+        return True
+    return etag.removeprefix('W/') in {tag.removeprefix('W/') for tag in etags}
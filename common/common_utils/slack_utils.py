@@ -1,10 +1,16 @@
 import json
 
-import requests
+from common.common_utils.http_utils import http_client
+from config.settings.base import logger
+from requests import RequestException
 
 
 def notify_slack_simple_text(channel_url: str, text: str):
-    requests.post(
-        url=channel_url,
-        data=json.dumps({'text': text}),
-    )
+    # 알림 실패가 호출한 요청을 실패시키지 않도록 기록만 합니다.
+    try:
+        http_client.post(
+            url=channel_url,
+            data=json.dumps({'text': text}),
+        )
+    except RequestException as e:
+        logger.error(f'slack notification failed: {e}')
@@ -0,0 +1,114 @@
+import requests
+from common.common_testcase_helpers.http_stub_server import (
+    HttpStubServer,
+    StubResponse,
+)
+from common.common_utils.http_utils import (
+    CircuitBreakerOpenError,
+    HttpClient,
+    get_http_client_metrics,
+)
+from common.consts import HTTP_CLIENT_METRICS_KEY_PREFIX
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django_redis import get_redis_connection
+
+
+class HttpClientTest(TestCase):
+    def setUp(self):
+        self.stub_server = HttpStubServer().__enter__()
+        self.http_client = HttpClient(timeout=(1, 1), retry_backoff_factor=0, circuit_failure_threshold=2)
+
+    def tearDown(self):
+        self.stub_server.__exit__(None, None, None)
+
+    def test_request_should_reuse_connection(self):
+        # Given: stub api
+        self.stub_server.add_responses('GET', '/api', StubResponse(200, {'ok': True}))
+
+        # When: request twice
+        responses = [self.http_client.get(self.stub_server.get_url('/api')) for _ in range(2)]
+
+        # Then: same keep-alive connection is used
+        self.assertEqual([response.json() for response in responses], [{'ok': True}, {'ok': True}])
+        stub_requests = self.stub_server.get_requests('GET', '/api')
+        self.assertEqual(stub_requests[0].client_address, stub_requests[1].client_address)
+
+    def test_request_should_raise_timeout(self):
+        # Given: slow api
+        self.stub_server.add_responses('POST', '/api', StubResponse(200, delay_seconds=0.5))
+
+        # When: request with short read timeout
+        # Then: timeout
+        with self.assertRaises(requests.Timeout):
+            self.http_client.post(self.stub_server.get_url('/api'), timeout=(1, 0.1))
+
+    def test_get_should_retry_on_retry_status(self):
+        # Given: api fails once
+        self.stub_server.add_responses('GET', '/api', StubResponse(503), StubResponse(200, {'ok': True}))
+
+        # When: get
+        response = self.http_client.get(self.stub_server.get_url('/api'))
+
+        # Then: retried
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.stub_server.get_requests('GET', '/api')), 2)
+
+    def test_post_should_not_retry_on_retry_status(self):
+        # Given: api fails once
+        self.stub_server.add_responses('POST', '/api', StubResponse(503), StubResponse(200, {'ok': True}))
+
+        # When: post
+        response = self.http_client.post(self.stub_server.get_url('/api'), json={'id': 1})
+
+        # Then: not retried because post is not idempotent
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.stub_server.get_requests('POST', '/api')), 1)
+        self.assertEqual(self.stub_server.get_requests('POST', '/api')[0].json(), {'id': 1})
+
+    def test_request_should_open_circuit_after_failures(self):
+        # Given: api keeps failing
+        self.stub_server.add_responses('POST', '/api', StubResponse(500))
+        for _ in range(2):
+            self.http_client.post(self.stub_server.get_url('/api'))
+
+        # When: post again
+        # Then: circuit is open and request is not sent
+        with self.assertRaises(CircuitBreakerOpenError):
+            self.http_client.post(self.stub_server.get_url('/api'))
+        self.assertEqual(len(self.stub_server.get_requests('POST', '/api')), 2)
+
+    def test_request_should_close_circuit_after_recovery(self):
+        # Given: open circuit
+        http_client = HttpClient(timeout=(1, 1), circuit_failure_threshold=1, circuit_recovery_seconds=0)
+        self.stub_server.add_responses('POST', '/api', StubResponse(500), StubResponse(200))
+        http_client.post(self.stub_server.get_url('/api'))
+
+        # When: post after recovery seconds
+        response = http_client.post(self.stub_server.get_url('/api'))
+
+        # Then: trial request succeeds and circuit is closed
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(http_client.circuit_breakers[self.stub_server.host].opened_at)
+
+    @override_settings(HTTP_CLIENT_METRICS_ENABLED=True)
+    def test_request_should_record_metrics(self):
+        # Given: api succeeds once and fails
+        get_redis_connection('default').delete(f'{HTTP_CLIENT_METRICS_KEY_PREFIX}:{self.stub_server.host}')
+        self.stub_server.add_responses('POST', '/api', StubResponse(200), StubResponse(500))
+
+        # When: request until circuit is open
+        for _ in range(3):
+            self.http_client.post(self.stub_server.get_url('/api'))
+        with self.assertRaises(CircuitBreakerOpenError):
+            self.http_client.post(self.stub_server.get_url('/api'))
+
+        # Then: metrics of host
+        metrics = get_http_client_metrics(self.stub_server.host)
+        self.assertEqual(metrics['request_count'], 3)
+        self.assertEqual(metrics['failure_count'], 2)
+        self.assertEqual(metrics['circuit_open_count'], 1)
+        self.assertEqual(metrics['le_100'], 3)
+        self.assertGreater(metrics['total_milliseconds'], 0)
@@ -0,0 +1,62 @@
+from common.common_utils.redis_cache_utils import (
+    get_cache_generation_key,
+    get_cached_values_with_generations,
+    invalidate_cached_values,
+    set_cached_values_if_generation_unchanged,
+)
+from django.test import TestCase
+from django_redis import get_redis_connection
+
+
+class RedisCacheGenerationTest(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.keys = ['test:generation_cache:1', 'test:generation_cache:2']
+        self.redis.delete(*self.keys, *[get_cache_generation_key(key) for key in self.keys])
+
+    def test_set_cached_values_if_generation_unchanged(self):
+        # Given: 캐시 miss 시 세대를 조회합니다.
+        cached_values, generations = get_cached_values_with_generations(self.redis, self.keys)
+        self.assertEqual(cached_values, [None, None])
+
+        # When: 세대가 그대로일 때 저장합니다.
+        set_cached_values_if_generation_unchanged(
+            self.redis,
+            [(key, generation, 'value') for key, generation in zip(self.keys, generations)],
+            60,
+        )
+
+        # Then: 저장됩니다.
+        self.assertEqual(get_cached_values_with_generations(self.redis, self.keys)[0], [b'value', b'value'])
+
+    def test_set_cached_values_should_skip_when_invalidated_after_read(self):
+        # Given: 캐시 miss 시 세대를 조회합니다.
+        _, generations = get_cached_values_with_generations(self.redis, self.keys)
+
+        # When: DB 조회 중 첫 번째 키가 무효화된 뒤 저장합니다.
+        invalidate_cached_values(self.redis, self.keys[:1])
+        set_cached_values_if_generation_unchanged(
+            self.redis,
+            [(key, generation, 'stale') for key, generation in zip(self.keys, generations)],
+            60,
+        )
+
+        # Then: 무효화된 키는 저장되지 않습니다.
+        self.assertEqual(get_cached_values_with_generations(self.redis, self.keys)[0], [None, b'stale'])
+
+    def test_invalidate_cached_values_should_delete_values(self):
+        # Given: 캐시된 값
+        _, generations = get_cached_values_with_generations(self.redis, self.keys)
+        set_cached_values_if_generation_unchanged(
+            self.redis,
+            [(key, generation, 'value') for key, generation in zip(self.keys, generations)],
+            60,
+        )
+
+        # When: 무효화합니다.
+        invalidate_cached_values(self.redis, self.keys)
+
+        # Then: 값이 삭제되고 세대가 바뀝니다.
+        cached_values, new_generations = get_cached_values_with_generations(self.redis, self.keys)
+        self.assertEqual(cached_values, [None, None])
+        self.assertNotEqual(new_generations, generations)
@@ -1,7 +1,13 @@
 from unittest.mock import Mock
 
-from common.common_utils.request_utils import get_request_ip
-from django.test import TestCase
+from common.common_utils.request_utils import (
+    get_request_ip,
+    is_etag_matched,
+)
+from django.test import (
+    TestCase,
+    override_settings,
+)
 
 
 class TestGetRequestIP(TestCase):
@@ -16,6 +22,41 @@ class TestGetRequestIP(TestCase):
         # Then:
         self.assertEqual(result, '1.2.3.4')
 
+    def test_with_client_supplied_x_forwarded_for(self):
+        # Given: client 가 보낸 X-Forwarded-For 뒤에 proxy 가 접속 ip 를 추가한 경우
+        request = Mock()
+        request.META = {'HTTP_X_FORWARDED_FOR': '5.6.7.8, 1.2.3.4', 'REMOTE_ADDR': '10.0.0.1'}
+
+        # When:
+        result = get_request_ip(request)
+
+        # Then: proxy 가 추가한 ip
+        self.assertEqual(result, '1.2.3.4')
+
+    @override_settings(TRUSTED_PROXY_COUNT=2)
+    def test_with_x_forwarded_for_behind_two_proxies(self):
+        # Given: 두 proxy 가 차례로 ip 를 추가한 경우
+        request = Mock()
+        request.META = {'HTTP_X_FORWARDED_FOR': '5.6.7.8, 1.2.3.4, 10.0.0.2', 'REMOTE_ADDR': '10.0.0.1'}
+
+        # When:
+        result = get_request_ip(request)
+
+        # Then: 가장 바깥 proxy 가 추가한 ip
+        self.assertEqual(result, '1.2.3.4')
+
+    @override_settings(TRUSTED_PROXY_COUNT=0)
+    def test_with_x_forwarded_for_without_trusted_proxy(self):
+        # Given: proxy 없이 client 가 X-Forwarded-For 를 보낸 경우
+        request = Mock()
+        request.META = {'HTTP_X_FORWARDED_FOR': '5.6.7.8', 'REMOTE_ADDR': '9.10.11.12'}
+
+        # When:
+        result = get_request_ip(request)
+
+        # Then: 접속 ip
+        self.assertEqual(result, '9.10.11.12')
+
     def test_without_x_forwarded_for(self):
         # Given:
         request = Mock()
@@ -26,3 +67,33 @@ class TestGetRequestIP(TestCase):
 
         # Then:
         self.assertEqual(result, '9.10.11.12')
+
+
+class TestIsEtagMatched(TestCase):
+    def test_without_if_none_match(self):
+        # Given:
+        request = Mock()
+        request.META = {}
+
+        # When:
+        # Then:
+        self.assertFalse(is_etag_matched(request, '"abc"'))
+
+    def test_with_if_none_match(self):
+        # Given:
+        request = Mock()
+        request.META = {'HTTP_IF_NONE_MATCH': '"def", W/"abc"'}
+
+        # When:
+        # Then: weak comparison
+        self.assertTrue(is_etag_matched(request, '"abc"'))
+        self.assertFalse(is_etag_matched(request, '"ghi"'))
+
+    def test_with_asterisk(self):
+        # Given:
+        request = Mock()
+        request.META = {'HTTP_IF_NONE_MATCH': '*'}
+
+        # When:
+        # Then:
+        self.assertTrue(is_etag_matched(request, '"abc"'))
@@ -144,6 +144,16 @@ class FormatISO8601Tests(TestCase):
         # Then: The datetime object is formatted correctly
         self.assertEqual(result, "2024-05-01T13:00:00+00:00")
 
+    def test_datetime_with_microseconds_keep_microseconds(self):
+        # Given: A datetime object with microseconds
+        dt = datetime(2024, 5, 1, 13, 0, 0, 500000, tzinfo=timezone.utc)
+
+        # When: The datetime object is formatted with microseconds
+        result = format_iso8601(dt, with_microseconds=True)
+
+        # Then: The microseconds are kept
+        self.assertEqual(result, "2024-05-01T13:00:00.500000+00:00")
+
 
 class FormatUTCTests(TestCase):
     def test_naive_datetime(self):
@@ -1,4 +1,7 @@
-from datetime import datetime
+from datetime import (
+    datetime,
+    timezone,
+)
 from unittest.mock import patch
 
 from common.common_utils.token_utils import (
@@ -81,6 +84,9 @@ class JWTPayloadHandlerTest(TestCase):
             {
                 'guest_id': self.guest.id,
                 'member_id': self.guest.member.id,
+                'member_status_id': self.guest.member.member_status_id,
+                'is_blacklisted': self.guest.is_blacklisted,
+                'iat': datetime(2020, 1, 1).replace(tzinfo=timezone.utc).timestamp(),
                 'exp': datetime.utcnow() + api_settings.JWT_EXPIRATION_DELTA,
             }
         )
@@ -1,3 +1,4 @@
+import time
 from datetime import (
     datetime,
     timedelta,
@@ -10,9 +11,14 @@ jwt_encode_handler = api_settings.JWT_ENCODE_HANDLER
 
 
 def jwt_payload_handler(guest: 'Guest') -> dict:  # noqa
+    # 회원 상태와 블랙리스트 여부를 함께 담아 인증 시 DB 를 조회하지 않도록 합니다.
+    # iat 는 토큰 폐기 시각과 비교하므로 초 단위 이하까지 담습니다.
     payload = {
         'guest_id': guest.pk,
         'member_id': guest.member_id,
+        'member_status_id': guest.member.member_status_id if guest.member_id else None,
+        'is_blacklisted': guest.is_blacklisted,
+        'iat': time.time(),
         'exp': datetime.utcnow() + api_settings.JWT_EXPIRATION_DELTA,
     }
     return payload
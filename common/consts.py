@@ -2,3 +2,26 @@ IMAGE_CONSTANCE_TYPES = {
     'project-image',
     'member-image',
 }
+
+# 외부 API HTTP client
+HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS = 3
+HTTP_CLIENT_READ_TIMEOUT_SECONDS = 10
+# 연결 실패는 모든 요청을, 응답 실패(읽기 실패, 재시도 응답 코드)는 멱등한 요청만 재시도합니다.
+HTTP_CLIENT_RETRY_COUNT = 2
+HTTP_CLIENT_RETRY_BACKOFF_FACTOR = 0.2
+HTTP_CLIENT_RETRY_STATUSES = (502, 503, 504)
+# process 별로 유지할 host 수와 host 별 keep-alive 연결 수
+HTTP_CLIENT_POOL_HOST_COUNT = 10
+HTTP_CLIENT_POOL_SIZE = 10
+# host 별 연속 실패가 기준을 넘으면 일정 시간 요청을 보내지 않고 바로 실패합니다.
+HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD = 5
+HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS = 30
+# host 별 요청 수/실패 수/응답 시간 지표 (redis hash)
+HTTP_CLIENT_METRICS_KEY_PREFIX = 'common:http_client:metrics'
+HTTP_CLIENT_LATENCY_BUCKET_MILLISECONDS = (100, 300, 1000, 3000)
+
+# redis 읽기 캐시 세대 키
+# 무효화할 때마다 새 세대 값을 쓰고, 조회 중 세대가 바뀐 값은 다시 저장하지 않습니다.
+# 세대 키는 조회 한 번(세대 조회 ~ 저장)보다 충분히 오래 유지되어야 합니다.
+CACHE_GENERATION_KEY_SUFFIX = 'generation'
+CACHE_GENERATION_TIMEOUT_SECONDS = 60 * 10
@@ -1,9 +1,12 @@
 import jwt
-from django.apps import apps
 from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.utils.encoding import smart_str
 from django.utils.translation import gettext as _
 from member.exceptions import BlackMemberException
+from member.services import (
+    get_authenticated_guest,
+    get_guest_from_token_claims,
+)
 from rest_framework import exceptions
 from rest_framework.authentication import (
     BaseAuthentication,
@@ -19,6 +22,22 @@ class DefaultAuthentication(BaseAuthentication):
     www_authenticate_realm = 'api'
 
     def authenticate(self, request):
+        """
+        미들웨어와 DRF 가 같은 요청을 한 번만 인증하도록 결과(혹은 예외)를 HttpRequest 에 저장해 재사용합니다.
+        """
+        http_request = getattr(request, '_request', request)
+        if not hasattr(http_request, '_default_authentication'):
+            try:
+                http_request._default_authentication = (self._authenticate(http_request), None)
+            except APIException as e:
+                http_request._default_authentication = (None, e)
+
+        authentication, exception = http_request._default_authentication
+        if exception:
+            raise exception
+        return authentication
+
+    def _authenticate(self, request):
         jwt_value = self.get_jwt_value(request)
 
         if jwt_value is None:
@@ -36,7 +55,8 @@ class DefaultAuthentication(BaseAuthentication):
             msg = _('유효하지 않은 토큰 입니다.')
             raise exceptions.AuthenticationFailed(msg)
 
-        guest = self.authenticate_credentials(payload)
+        # 토큰의 인증 정보(claims)를 믿을 수 없을 때만 인증 정보를 조회합니다.
+        guest = get_guest_from_token_claims(payload) or self.authenticate_credentials(payload)
         request.guest = guest
         if guest.is_blacklisted:
             raise BlackMemberException()
@@ -74,16 +94,14 @@ class DefaultAuthentication(BaseAuthentication):
         return '{0} realm="{1}"'.format(api_settings.JWT_AUTH_HEADER_PREFIX, self.www_authenticate_realm)
 
     def authenticate_credentials(self, payload):
-        Guest = apps.get_model('member', 'Guest')
         guest_id = payload.get('guest_id')
 
         if not guest_id:
             msg = _('잘못된 Token 입니다.')
             raise exceptions.AuthenticationFailed(msg)
 
-        try:
-            guest = Guest.objects.select_related('member').get(id=guest_id)
-        except Guest.DoesNotExist:
+        guest = get_authenticated_guest(guest_id)
+        if not guest:
             msg = _('존재하지 않는 사용자입니다.')
             raise exceptions.AuthenticationFailed(msg)
 
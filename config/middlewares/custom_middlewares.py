@@ -1,3 +1,9 @@
+from common.common_utils.request_memo_utils import (
+    end_request_memo,
+    start_request_memo,
+)
+
+
 class RequestUserToMemberMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -7,3 +13,18 @@ class RequestUserToMemberMiddleware:
         request.guest = None
         response = self.get_response(request)
         return response
+
+
+class RequestMemoMiddleware:
+    """
+    요청마다 메모를 만들어 같은 요청에서 같은 객체를 두 번 조회하지 않도록 합니다.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = start_request_memo()
+        try:
+            return self.get_response(request)
+        finally:
+            end_request_memo(token)
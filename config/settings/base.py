@@ -20,6 +20,7 @@ DJANGO_APPS = [
     'django.contrib.staticfiles',
     'django.contrib.sites',
     'django.contrib.humanize',
+    'django.contrib.postgres',
 ]
 
 THIRD_APPS = [
@@ -63,6 +64,7 @@ THIRD_MIDDLEWARE = [
 ]
 
 CUSTOM_MIDDLEWARE = [
+    'config.middlewares.custom_middlewares.RequestMemoMiddleware',
     'config.middlewares.custom_middlewares.RequestUserToMemberMiddleware',
     'config.middlewares.authentications.JWTAuthenticationMiddleware',
 ]
@@ -218,3 +220,57 @@ KAKAO_PAY_BASE_DOMAIN = 'http://127.0.0.1:8000'
 CSRF_COOKIE_SECURE = False
 
 SESSION_COOKIE_SECURE = False
+
+# worker 메모리 프로젝트 필터 인덱스 사용 여부
+PROJECT_FILTER_INDEX_ENABLED = True
+
+# 홈 목록 응답 redis 캐시 사용 여부
+PROJECT_LIST_CACHE_ENABLED = True
+
+# 프로젝트 카드 redis 캐시 사용 여부
+PROJECT_CARD_FRAGMENT_CACHE_ENABLED = True
+
+# 회원 정보 블록 redis 캐시 사용 여부
+MEMBER_INFO_BLOCK_CACHE_ENABLED = True
+
+# 활성 프로젝트 redis 캐시 사용 여부
+ACTIVE_PROJECT_CACHE_ENABLED = True
+
+# 회원별 프로젝트 관계(북마크/리더/참여) redis 캐시 사용 여부
+MEMBER_PROJECT_RELATIONS_CACHE_ENABLED = True
+
+# 비회원 인증 정보 redis 캐시 사용 여부
+GUEST_PRINCIPAL_CACHE_ENABLED = True
+
+# access token 인증 정보(claims)로 인증 사용 여부
+GUEST_TOKEN_CLAIMS_ENABLED = True
+
+# IP 별 비회원 id redis 캐시 사용 여부
+GUEST_IP_CACHE_ENABLED = True
+
+# IP 별 비회원 토큰 발급 제한 사용 여부
+GUEST_TOKEN_RATE_LIMIT_ENABLED = True
+
+# X-Forwarded-For 를 추가하는 신뢰하는 proxy 수 (nginx)
+TRUSTED_PROXY_COUNT = 1
+
+# 외부 API HTTP client 의 host 별 지표 redis 기록 여부
+HTTP_CLIENT_METRICS_ENABLED = True
+
+# Google ID token 로컬 검증 사용 여부
+GOOGLE_ID_TOKEN_VERIFICATION_ENABLED = True
+
+# 로그인에 실패한 소셜 프로필을 같은 code 의 회원가입에서 한 번 사용할지 여부
+SOCIAL_SIGN_UP_PROFILE_CACHE_ENABLED = True
+
+# celery beat 주기 작업 (schedule 단위: 초)
+CELERY_BEAT_SCHEDULE = {
+    'flush-project-bookmark-counts': {
+        'task': 'project.tasks.flush_project_bookmark_counts',
+        'schedule': 10.0,
+    },
+    'compact-stale-guests': {
+        'task': 'member.tasks.compact_stale_guests',
+        'schedule': 60.0 * 60,
+    },
+}
@@ -62,3 +62,20 @@ CACHES = {
 
 KAKAO_PAY_BASE_DOMAIN = 'http://127.0.0.1:8000'
 OPENAI_API_KEY = 'development_OPENAI_API_KEY'
+
+# 테스트마다 DB 가 롤백되므로 worker 메모리 인덱스는 필요한 테스트에서만 켭니다.
+PROJECT_FILTER_INDEX_ENABLED = False
+
+# 테스트 간 redis 캐시가 공유되므로 필요한 테스트에서만 켭니다.
+PROJECT_LIST_CACHE_ENABLED = False
+PROJECT_CARD_FRAGMENT_CACHE_ENABLED = False
+MEMBER_INFO_BLOCK_CACHE_ENABLED = False
+ACTIVE_PROJECT_CACHE_ENABLED = False
+MEMBER_PROJECT_RELATIONS_CACHE_ENABLED = False
+GUEST_PRINCIPAL_CACHE_ENABLED = False
+GUEST_TOKEN_CLAIMS_ENABLED = False
+GUEST_IP_CACHE_ENABLED = False
+GUEST_TOKEN_RATE_LIMIT_ENABLED = False
+HTTP_CLIENT_METRICS_ENABLED = False
+GOOGLE_ID_TOKEN_VERIFICATION_ENABLED = False
+SOCIAL_SIGN_UP_PROFILE_CACHE_ENABLED = False
@@ -35,7 +35,7 @@ if [ "$data_all_services_up" = "false" ]; then
 fi
 
 WEB_COMPOSE_FILE=docker-compose-web.yml
-web_services="web_server celery_monitor"
+web_services="web_server celery_monitor celery_beat"
 
 # Check if all web services are running
 web_all_services_up=true
@@ -66,6 +66,13 @@ green_app_services="web_green cron_green celery_green"
 app_blue_services_up=true
 app_green_services_up=true
 
+# celery beat runs once outside blue/green, so restart it after every app deploy
+# (once only the new environment is left) to apply the new schedule and task code.
+restart_celery_beat() {
+    docker-compose -f $WEB_COMPOSE_FILE restart celery_beat
+    echo "Restart celery beat."
+}
+
 # Check if all blue app services are running
 for service in $blue_app_services; do
     if ! docker-compose -f $BLUE_APP_COMPOSE_FILE ps | grep -q $service; then
@@ -90,6 +97,7 @@ if [ "$app_blue_services_up" = "false" ] && [ "$app_green_services_up" = "false"
     docker-compose -f $BLUE_APP_COMPOSE_FILE up -d
     docker exec web_server /bin/sh -c '/etc/nginx/conf.d/nginx_update_blue.sh'
     echo "Nginx setting to blue environment"
+    restart_celery_beat
 elif [ "$app_blue_services_up" = "true" ]; then
     echo "Deploying green server."
     docker-compose -f $GREEN_APP_COMPOSE_FILE up -d
@@ -97,6 +105,7 @@ elif [ "$app_blue_services_up" = "true" ]; then
     echo "Nginx setting to green environment."
     docker-compose -f $BLUE_APP_COMPOSE_FILE down
     echo "Remove blue environment."
+    restart_celery_beat
 elif [ "$app_green_services_up" = "true" ]; then
     echo "Deploying blue server."
     docker-compose -f $BLUE_APP_COMPOSE_FILE up -d
@@ -104,6 +113,7 @@ elif [ "$app_green_services_up" = "true" ]; then
     echo "Nginx setting to blue environment."
     docker-compose -f $GREEN_APP_COMPOSE_FILE down
     echo "Remove green environment."
+    restart_celery_beat
 fi
 
 docker rmi $(docker images -f "dangling=true" -q) 2> /dev/null
@@ -0,0 +1,94 @@
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.db import connection
+from job.models import Job
+from job.services.project_job_services import ProjectJobRecruitService
+from member.models import Member
+from project.consts import ProjectRecruitApplicationStatus
+from project.models import (
+    Project,
+    ProjectRecruitApplication,
+    ProjectRecruitment,
+    ProjectRecruitmentJob,
+)
+from project.services.project_services import create_project_recruitment_and_update_project
+
+
+class Command(BaseCommand):
+    help = 'Load test concurrent recruit applications on one job (each member applies several times at once)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--members', type=int, default=200)
+        parser.add_argument('--attempts', type=int, default=3)
+        parser.add_argument('--workers', type=int, default=16)
+
+    def handle(self, *args, **kwargs):
+        member_count = kwargs['members']
+        attempts = kwargs['attempts']
+        workers = kwargs['workers']
+
+        # 여러 worker 가 서로 다른 connection 으로 조회해야 하므로 데이터를 커밋하고 마지막에 삭제합니다.
+        prefix = f'load-{uuid.uuid4().hex[:8]}'
+        members = Member.objects.bulk_create([
+            Member(username=f'{prefix}-{i}') for i in range(member_count)
+        ])
+        member_ids = [member.id for member in members]
+        job = Job.objects.create(display_name=prefix, name=prefix)
+        project = Project.objects.create(title=prefix, created_member_id=member_ids[0])
+        project_recruitment = create_project_recruitment_and_update_project(project, member_ids[0])
+        project_recruitment_job = ProjectRecruitmentJob.objects.create(
+            project_recruitment=project_recruitment,
+            job=job,
+            total_limit=None,
+            created_member_id=member_ids[0],
+        )
+
+        def _recruit(member_id: int) -> str:
+            try:
+                recruit_result = ProjectJobRecruitService(project.id, job.id, member_id).recruit(prefix)
+                return type(recruit_result.exception).__name__ if recruit_result.exception else 'created'
+            finally:
+                if workers > 1:
+                    connection.close()
+
+        try:
+            started_at = time.perf_counter()
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_recruit, member_ids * attempts))
+            else:
+                results = [_recruit(member_id) for member_id in member_ids * attempts]
+            elapsed = time.perf_counter() - started_at
+
+            in_review_count = ProjectRecruitApplication.objects.filter(
+                project_recruitment_job=project_recruitment_job,
+                request_status=ProjectRecruitApplicationStatus.IN_REVIEW.value,
+            ).count()
+            result_counts = ', '.join(f'{name} {count}' for name, count in sorted(Counter(results).items()))
+            self.stdout.write(
+                f'applications: {len(results)} attempts in {elapsed:.3f}s ({len(results) / elapsed:.1f}/s), '
+                f'{result_counts}, in_review {in_review_count}'
+            )
+            # 회원마다 검토중 신청이 정확히 하나여야 합니다.
+            if in_review_count != member_count or results.count('created') != member_count:
+                raise CommandError(f'expected {member_count} applications, got in_review {in_review_count}')
+        finally:
+            ProjectRecruitApplication.objects.filter(project_recruitment_job=project_recruitment_job).delete()
+            Project.objects.filter(id=project.id).update(latest_project_recruitment=None)
+            project_recruitment_job.delete()
+            ProjectRecruitment.objects.filter(id=project_recruitment.id).delete()
+            project.delete()
+            job.delete()
+            Member.objects.filter(id__in=member_ids).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully load tested recruit application with {member_count} members, '
+            f'{attempts} attempts and {workers} workers'
+        ))
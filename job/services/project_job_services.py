@@ -3,14 +3,20 @@ from collections import (
 )
 from functools import cached_property
 from typing import (
-    Dict,
     List,
     Optional,
-    Set,
 )
 
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.models import (
+    Exists,
+    OuterRef,
+)
+from django.utils import timezone
 from job.dtos.model_dtos import (
-    ProjectJobAvailabilities,
     ProjectJobRecruitInfo,
     RecruitResult,
 )
@@ -34,8 +40,10 @@ from project.exceptions import (
 from project.models import (
     Project,
     ProjectRecruitApplication,
+    ProjectRecruitment,
     ProjectRecruitmentJob,
 )
+from project.services.project_services import get_active_project
 
 
 def get_current_active_project_job_recruitments(project_ids: list[int]) -> dict[int, List[ProjectJobRecruitInfo]]:
@@ -67,14 +75,28 @@ def get_current_active_project_job_recruitments(project_ids: list[int]) -> dict[
     return project_recruitment_jobs_by_project_id
 
 
-def get_current_project_job_availabilities(project_id: int, job_ids: Optional[Set[int]] = None) -> Dict[int, ProjectJobAvailabilities]:
-    job_recruits_by_project_id = get_current_active_project_job_recruitments([project_id])
-    project_job_availabilities_by_job_id = {}
-    for job_recruit in job_recruits_by_project_id.get(project_id, []):
-        if job_ids and job_recruit.job_id not in job_ids:
-            continue
-        project_job_availabilities_by_job_id[job_recruit.job_id] = ProjectJobAvailabilities.from_recruit_info(job_recruit)
-    return project_job_availabilities_by_job_id
+_CREATE_RECRUIT_APPLICATION_SQL = f'''
+INSERT INTO {ProjectRecruitApplication._meta.db_table} (
+    project_recruitment_job_id, project_recruitment_id, member_id, request_message, request_status, created_at, updated_at
+)
+SELECT recruitment_job.id, recruitment.id, %(member_id)s, %(request_message)s, %(in_review)s, %(now)s, %(now)s
+FROM {ProjectRecruitmentJob._meta.db_table} recruitment_job
+JOIN {ProjectRecruitment._meta.db_table} recruitment
+  ON recruitment.id = recruitment_job.project_recruitment_id
+WHERE recruitment_job.project_recruitment_id = %(project_recruitment_id)s
+  AND recruitment.recruit_status = %(recruiting)s
+  AND recruitment_job.job_id = %(job_id)s
+  AND recruitment_job.recruit_status = %(recruiting)s
+  AND (
+    COALESCE(recruitment_job.total_limit, 0) = 0
+    OR recruitment_job.current_recruited < recruitment_job.total_limit
+  )
+ORDER BY recruitment_job.id DESC
+LIMIT 1
+FOR SHARE
+ON CONFLICT (project_recruitment_job_id, member_id) WHERE request_status = %(in_review)s DO NOTHING
+RETURNING id
+'''
 
 
 class ProjectJobRecruitService:
@@ -85,14 +107,7 @@ class ProjectJobRecruitService:
 
     @cached_property
     def project(self) -> Optional[Project]:
-        try:
-            return Project.objects.get(id=self.project_id)
-        except Project.DoesNotExist:
-            return None
-
-    @cached_property
-    def current_project_job_availabilities(self) -> Dict[int, ProjectJobAvailabilities]:
-        return get_current_project_job_availabilities(self.project_id, {self.job_id})
+        return get_active_project(self.project_id)
 
     @cached_property
     def project_recruitment_job_recruiting(self) -> Optional[ProjectRecruitmentJob]:
@@ -102,12 +117,10 @@ class ProjectJobRecruitService:
             recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
         ).last()
 
-    def is_job_available(self) -> bool:
-        if self.job_id not in self.current_project_job_availabilities:
-            return False
-        return self.current_project_job_availabilities[self.job_id].is_available
-
     def validate_recruit(self) -> RecruitResult:
+        """
+        캐시된 활성 프로젝트로 프로젝트 단위 조건만 확인합니다. 모집 직무 조건은 신청 INSERT 에서 확인합니다.
+        """
         if not self.project:
             return RecruitResult(
                 exception=ProjectRecruitProjectNotFoundErrorException(),
@@ -120,14 +133,6 @@ class ProjectJobRecruitService:
             return RecruitResult(
                 exception=ProjectCurrentRecruitStatusNotRecruitingException(),
             )
-        if not self.is_job_available():
-            return RecruitResult(
-                exception=ProjectRecruitmentJobNotAvailableException(),
-            )
-        if not self.project_recruitment_job_recruiting:
-            return RecruitResult(
-                exception=ProjectRecruitmentJobRecruitingNotFoundErrorException(),
-            )
         return RecruitResult()
 
     def recruit(self, request_message: str) -> RecruitResult:
@@ -135,7 +140,7 @@ class ProjectJobRecruitService:
         if recruit_result.exception:
             return recruit_result
 
-        return self.get_or_create_recruit_application(request_message)
+        return self.create_recruit_application(request_message)
 
     def get_latest_member_recruit_application(self) -> Optional[ProjectRecruitApplication]:
         return ProjectRecruitApplication.objects.filter(
@@ -143,21 +148,59 @@ class ProjectJobRecruitService:
             member_id=self.member_id,
         ).last()
 
-    def get_or_create_recruit_application(self, request_message: str) -> RecruitResult:
-        project_recruit_application, is_created = ProjectRecruitApplication.objects.get_or_create(
-            project_recruitment_job_id=self.project_recruitment_job_recruiting.id,
-            member_id=self.member_id,
-            request_status=ProjectRecruitApplicationStatus.IN_REVIEW.value,
-            defaults={
-                'request_message': request_message,
-            }
-        )
-        if not is_created:
+    @transaction.atomic
+    def create_recruit_application(self, request_message: str) -> RecruitResult:
+        """
+        모집과 모집 직무가 모두 모집중이고 정원이 남은 경우에만 검토중 신청을 INSERT 한 문장으로 생성합니다.
+        모집과 모집 직무 row 를 FOR SHARE 로 잠가 신청이 커밋될 때까지 모집 마감/인원 변경과 겹치지 않고,
+        검토중 신청 partial unique 제약으로 동시에 신청해도 하나만 생성됩니다.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                _CREATE_RECRUIT_APPLICATION_SQL,
+                {
+                    'member_id': self.member_id,
+                    'request_message': request_message,
+                    'in_review': ProjectRecruitApplicationStatus.IN_REVIEW.value,
+                    'recruiting': ProjectRecruitmentStatus.RECRUITING.value,
+                    'now': timezone.now(),
+                    'project_recruitment_id': self.project.latest_project_recruitment_id,
+                    'job_id': self.job_id,
+                },
+            )
+            row = cursor.fetchone()
+        if row:
+            return RecruitResult(
+                project_recruit_application_id=row[0],
+            )
+        return self._get_recruit_application_failure()
+
+    def _get_recruit_application_failure(self) -> RecruitResult:
+        # 신청이 생성되지 않은 경우에만 원인을 조회합니다.
+        project_recruitment_job = ProjectRecruitmentJob.objects.filter(
+            project_recruitment_id=self.project.latest_project_recruitment_id,
+            job_id=self.job_id,
+        ).annotate(
+            has_applied=Exists(
+                ProjectRecruitApplication.objects.filter(
+                    project_recruitment_job_id=OuterRef('id'),
+                    member_id=self.member_id,
+                    request_status=ProjectRecruitApplicationStatus.IN_REVIEW.value,
+                )
+            ),
+        ).order_by(
+            'id',
+        ).last()
+        if not project_recruitment_job:
+            return RecruitResult(
+                exception=ProjectRecruitmentJobRecruitingNotFoundErrorException(),
+            )
+        if project_recruitment_job.has_applied:
             return RecruitResult(
                 exception=ProjectRecruitmentJobAlreadyRecruitedException(),
             )
         return RecruitResult(
-            project_recruit_application_id=project_recruit_application.id,
+            exception=ProjectRecruitmentJobNotAvailableException(),
         )
 
 
@@ -1,6 +1,5 @@
 from unittest.mock import (
     MagicMock,
-    PropertyMock,
     patch,
 )
 
@@ -12,11 +11,15 @@ from common.common_testcase_helpers.job.testcase_helpers import (
 from common.common_testcase_helpers.project.testcase_helpers import (
     create_project_with_active_job_recruitment_for_testcase,
 )
+from django.db import (
+    IntegrityError,
+    connection,
+)
 from django.test import (
     TestCase,
 )
+from django.test.utils import CaptureQueriesContext
 from job.dtos.model_dtos import (
-    ProjectJobAvailabilities,
     ProjectJobRecruitInfo,
     RecruitResult,
 )
@@ -26,7 +29,6 @@ from job.services.project_job_services import (
     get_active_job_categories,
     get_active_jobs,
     get_current_active_project_job_recruitments,
-    get_current_project_job_availabilities,
 )
 from member.models import (
     Member,
@@ -189,81 +191,6 @@ class GetActiveJobs(TestCase):
         self.assertEqual(result[0].name, 'valid')
 
 
-class GetCurrentProjectJobAvailabilitiesTest(TestCase):
-    def setUp(self):
-        self.member = Member.objects.create_user(username='test', nickname='test')
-        self.job_backend = create_job_for_testcase('backend')
-        self.job_frontend = create_job_for_testcase('frontend')
-        self.project = Project.objects.create(title='Project', created_member_id=self.member.id)
-        self.project_recruitment_job_for_backend = create_project_with_active_job_recruitment_for_testcase(
-            project=self.project,
-            job_id=self.job_backend.id,
-            created_member_id=self.member.id,
-            total_limit=2,
-            current_recruited=1,
-        )
-        self.project_recruitment_job_for_backend.recruit_status = ProjectRecruitmentStatus.RECRUITING.value
-        self.project_recruitment_job_for_backend.save()
-        self.project_recruitment_job_for_frontend = create_project_with_active_job_recruitment_for_testcase(
-            project=self.project,
-            job_id=self.job_frontend.id,
-            created_member_id=self.member.id,
-            total_limit=1,
-            current_recruited=1,
-        )
-        self.project_recruitment_job_for_frontend.recruit_status = ProjectRecruitmentStatus.RECRUIT_FINISH.value
-        self.project_recruitment_job_for_frontend.save()
-
-    def test_get_current_project_job_availabilities_with_job_ids_exists(self):
-        # Given:
-        # When: We call the function with a project ID and a set of job IDs
-        result = get_current_project_job_availabilities(
-            self.project.id,
-            {self.job_backend.id, self.job_frontend.id},
-        )
-
-        # Then: The result should only contain availabilities for the specified job IDs
-        self.assertEqual(
-            result,
-            {
-                self.job_backend.id: ProjectJobAvailabilities(id=self.job_backend.id, display_name=self.job_backend.display_name, is_available=True),
-                self.job_frontend.id: ProjectJobAvailabilities(id=self.job_frontend.id, display_name=self.job_frontend.display_name, is_available=False),
-            }
-        )
-
-    def test_get_current_project_job_availabilities_with_job_ids_not_exists(self):
-        # Given:
-        # When: We call the function with a project ID and a set of job IDs
-        result = get_current_project_job_availabilities(
-            self.project.id,
-        )
-
-        # Then: The result should only contain availabilities for the specified all job IDs
-        self.assertEqual(
-            result,
-            {
-                self.job_backend.id: ProjectJobAvailabilities(id=self.job_backend.id, display_name=self.job_backend.display_name, is_available=True),
-                self.job_frontend.id: ProjectJobAvailabilities(id=self.job_frontend.id, display_name=self.job_frontend.display_name, is_available=False),
-            }
-        )
-
-    def test_get_current_project_job_availabilities_with_job_ids_specific_exists(self):
-        # Given:
-        # When: We call the function with a project ID and a set of job IDs
-        result = get_current_project_job_availabilities(
-            self.project.id,
-            {self.job_backend.id},
-        )
-
-        # Then: The result should only contain availabilities for the specified job ID
-        self.assertEqual(
-            result,
-            {
-                self.job_backend.id: ProjectJobAvailabilities(id=self.job_backend.id, display_name=self.job_backend.display_name, is_available=True),
-            }
-        )
-
-
 class ProjectJobRecruitServiceTestCase(TestCase):
 
     def setUp(self):
@@ -315,11 +242,11 @@ class ProjectJobRecruitServiceTestCase(TestCase):
             self.member.id,
         )
 
-    @patch('job.services.project_job_services.Project.objects.get')
+    @patch('job.services.project_job_services.get_active_project')
     def test_validate_recruit_project_does_not_exist(self,
-                                                     mock_project_get):
+                                                     mock_get_active_project):
         # Given: 프로젝트가 존재하지 않는 경우
-        mock_project_get.side_effect = Project.DoesNotExist
+        mock_get_active_project.return_value = None
 
         # When: validate_recruit 메서드 호출
         result = self.service.validate_recruit()
@@ -353,30 +280,6 @@ class ProjectJobRecruitServiceTestCase(TestCase):
         self.assertIsInstance(result.exception, ProjectCurrentRecruitStatusNotRecruitingException)
         mock_is_recruiting.assert_called_once()
 
-    def test_validate_recruit_no_job_available(self):
-        # Given: 프로젝트가 존재하고 모집중이지만 해당 job이 없는 경우
-        self.service.job_id = self.job_frontend.id
-
-        # When: validate_recruit 메서드 호출
-        result = self.service.validate_recruit()
-
-        # Then:
-        self.assertIsInstance(result, RecruitResult)
-        self.assertIsInstance(result.exception, ProjectRecruitmentJobNotAvailableException)
-
-    @patch.object(ProjectJobRecruitService, 'project_recruitment_job_recruiting', new_callable=PropertyMock)
-    def test_validate_recruit_project_recruitment_job_invalid(self,
-                                                              mock_project_recruitment_job_recruiting):
-        # Given: 프로젝트가 존재하고 모집중이지만 해당 job이 없는 경우
-        mock_project_recruitment_job_recruiting.return_value = None
-
-        # When: validate_recruit 메서드 호출
-        result = self.service.validate_recruit()
-
-        # Then:
-        self.assertIsInstance(result, RecruitResult)
-        self.assertIsInstance(result.exception, ProjectRecruitmentJobRecruitingNotFoundErrorException)
-
     def test_validate_recruit_success(self):
         # Given:
         # When: validate_recruit 메서드 호출
@@ -386,15 +289,15 @@ class ProjectJobRecruitServiceTestCase(TestCase):
         self.assertIsInstance(result, RecruitResult)
         self.assertEqual(result.exception, None)
 
-    @patch('job.services.project_job_services.ProjectJobRecruitService.get_or_create_recruit_application')
+    @patch('job.services.project_job_services.ProjectJobRecruitService.create_recruit_application')
     @patch('job.services.project_job_services.ProjectJobRecruitService.validate_recruit')
     def test_recruit_success_with_mocking(self,
                                           mock_validate_recruit,
-                                          mock_get_or_create_recruit_application):
+                                          mock_create_recruit_application):
         # Given: validate_recruit 메서드가 True를 반환하도록 설정
         mock_validate_recruit.return_value = RecruitResult(is_recruited=True, message='지원 가능합니다.')
-        # And: get_or_create_recruit_application 메서드가 RecruitResult를 반환하도록 설정
-        mock_get_or_create_recruit_application.return_value = RecruitResult(is_recruited=True, message='지원이 완료되었습니다.')
+        # And: create_recruit_application 메서드가 RecruitResult를 반환하도록 설정
+        mock_create_recruit_application.return_value = RecruitResult(is_recruited=True, message='지원이 완료되었습니다.')
 
         # When: validate_recruit 메서드 호출
         result = self.service.recruit('지원 요청 메시지')
@@ -402,15 +305,15 @@ class ProjectJobRecruitServiceTestCase(TestCase):
         # Then:
         self.assertIsInstance(result, RecruitResult)
         self.assertEqual(result.exception, None)
-        mock_get_or_create_recruit_application.assert_called_once_with(
+        mock_create_recruit_application.assert_called_once_with(
             '지원 요청 메시지'
         )
 
-    @patch('job.services.project_job_services.ProjectJobRecruitService.get_or_create_recruit_application')
+    @patch('job.services.project_job_services.ProjectJobRecruitService.create_recruit_application')
     @patch('job.services.project_job_services.ProjectJobRecruitService.validate_recruit')
     def test_recruit_failed_with_mocking_validate_recruit(self,
                                                           mock_validate_recruit,
-                                                          mock_get_or_create_recruit_application):
+                                                          mock_create_recruit_application):
         # Given: validate_recruit 메서드가 False 반환하도록 설정
         mock_validate_recruit.return_value = RecruitResult(exception=CommonAPIException())
 
@@ -420,9 +323,9 @@ class ProjectJobRecruitServiceTestCase(TestCase):
         # Then:
         self.assertIsInstance(result, RecruitResult)
         self.assertIsInstance(result.exception, CommonAPIException)
-        mock_get_or_create_recruit_application.assert_not_called()
+        mock_create_recruit_application.assert_not_called()
 
-    def test_get_or_create_recruit_application_already_applied(self):
+    def test_create_recruit_application_already_applied(self):
         # Given: 프로젝트와 job이 존재하고, 이미 지원한 경우
         ProjectRecruitApplication.objects.get_or_create(
             project_recruitment_job_id=self.project_recruitment_job_for_backend.id,
@@ -431,59 +334,131 @@ class ProjectJobRecruitServiceTestCase(TestCase):
             request_message='지원하기.',
         )
 
-        # When: get_or_create_recruit_application 메서드 호출
-        result = self.service.get_or_create_recruit_application('지원하기.')
+        # When: create_recruit_application 메서드 호출
+        result = self.service.create_recruit_application('지원하기.')
 
         # Then:
         self.assertIsInstance(result, RecruitResult)
         self.assertIsInstance(result.exception, ProjectRecruitmentJobAlreadyRecruitedException)
 
-    def test_get_or_create_recruit_application_success(self):
+    def test_create_recruit_application_success(self):
         # Given: 프로젝트와 job이 존재하고, 지원하지 않은 경우
-        # When: get_or_create_recruit_application 메서드 호출
-        result = self.service.get_or_create_recruit_application('지원하기.')
-
-        # Then:
+        self.service.project
+        # When: create_recruit_application 메서드 호출
+        # Then: INSERT 한 문장만 실행됩니다.
+        with CaptureQueriesContext(connection) as context:
+            result = self.service.create_recruit_application('지원하기.')
+        self.assertEqual(
+            len([query for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]),
+            1,
+        )
+        # And: 검토중 신청이 생성됩니다.
         self.assertIsInstance(result, RecruitResult)
         self.assertIsInstance(result.project_recruit_application_id, int)
         self.assertEqual(result.exception, None)
+        recruit_application = ProjectRecruitApplication.objects.get(id=result.project_recruit_application_id)
+        self.assertEqual(recruit_application.request_status, ProjectRecruitApplicationStatus.IN_REVIEW.value)
+        # And: 신청함 조회용 프로젝트 모집이 채워집니다.
+        self.assertEqual(recruit_application.project_recruitment_id, self.project.latest_project_recruitment_id)
+
+    def test_create_recruit_application_job_not_available(self):
+        # Given: 모집이 마감된 job
+        self.service.job_id = self.job_frontend.id
+
+        # When: create_recruit_application 메서드 호출
+        result = self.service.create_recruit_application('지원하기.')
+
+        # Then:
+        self.assertIsInstance(result.exception, ProjectRecruitmentJobNotAvailableException)
+        self.assertFalse(ProjectRecruitApplication.objects.exists())
+
+    def test_create_recruit_application_job_full(self):
+        # Given: 정원이 찬 job
+        self.project_recruitment_job_for_backend.current_recruited = 2
+        self.project_recruitment_job_for_backend.save()
+
+        # When: create_recruit_application 메서드 호출
+        result = self.service.create_recruit_application('지원하기.')
+
+        # Then:
+        self.assertIsInstance(result.exception, ProjectRecruitmentJobNotAvailableException)
+
+    def test_create_recruit_application_recruitment_finished(self):
+        # Given: 모집 직무는 모집중이지만 모집이 마감된 경우
+        self.project_recruitment.recruit_status = ProjectRecruitmentStatus.RECRUIT_FINISH.value
+        self.project_recruitment.save()
+
+        # When: create_recruit_application 메서드 호출
+        result = self.service.create_recruit_application('지원하기.')
+
+        # Then:
+        self.assertIsInstance(result.exception, ProjectRecruitmentJobNotAvailableException)
+        self.assertFalse(ProjectRecruitApplication.objects.exists())
+
+    def test_create_recruit_application_recruitment_job_not_found(self):
+        # Given: 모집하지 않는 job
+        self.service.job_id = create_job_for_testcase('design').id
+
+        # When: create_recruit_application 메서드 호출
+        result = self.service.create_recruit_application('지원하기.')
 
-    @patch('job.services.project_job_services.Project.objects.get')
-    def test_project_exists(self, mock_project_get):
+        # Then:
+        self.assertIsInstance(result.exception, ProjectRecruitmentJobRecruitingNotFoundErrorException)
+
+    def test_create_recruit_application_after_rejected(self):
+        # Given: 거절된 신청
+        ProjectRecruitApplication.objects.create(
+            project_recruitment_job_id=self.project_recruitment_job_for_backend.id,
+            member_id=self.member.id,
+            request_status=ProjectRecruitApplicationStatus.REJECTED.value,
+            request_message='지원하기.',
+        )
+
+        # When: create_recruit_application 메서드 호출
+        result = self.service.create_recruit_application('다시 지원하기.')
+
+        # Then: 다시 신청할 수 있습니다.
+        self.assertIsNone(result.exception)
+
+    def test_in_review_recruit_application_should_be_unique(self):
+        # Given: 검토중 신청
+        ProjectRecruitApplication.objects.create(
+            project_recruitment_job_id=self.project_recruitment_job_for_backend.id,
+            member_id=self.member.id,
+            request_message='지원하기.',
+        )
+
+        # When/Then: 같은 모집 직무에 검토중 신청을 다시 생성하면 IntegrityError 가 발생합니다.
+        with self.assertRaises(IntegrityError):
+            ProjectRecruitApplication.objects.create(
+                project_recruitment_job_id=self.project_recruitment_job_for_backend.id,
+                member_id=self.member.id,
+                request_message='지원하기.',
+            )
+
+    @patch('job.services.project_job_services.get_active_project')
+    def test_project_exists(self, mock_get_active_project):
         # Given: 프로젝트가 존재하는 경우
-        mock_project_get.return_value = self.project
+        mock_get_active_project.return_value = self.project
 
         # When: project 속성 접근
         result = self.service.project
 
         # Then: 반환된 결과가 Project 인스턴스여야 함
         self.assertEqual(result, self.project)
-        mock_project_get.assert_called_once_with(id=self.project.id)
+        mock_get_active_project.assert_called_once_with(self.project.id)
 
-    @patch('job.services.project_job_services.Project.objects.get')
-    def test_project_does_not_exist(self, mock_project_get):
+    @patch('job.services.project_job_services.get_active_project')
+    def test_project_does_not_exist(self, mock_get_active_project):
         # Given: 프로젝트가 존재하지 않는 경우
-        mock_project_get.side_effect = Project.DoesNotExist
+        mock_get_active_project.return_value = None
 
         # When: project 속성 접근
         result = self.service.project
 
         # Then: 반환된 결과가 None이어야 함
         self.assertEqual(result, None)
-        mock_project_get.assert_called_once_with(id=self.project.id)
-
-    @patch('job.services.project_job_services.get_current_project_job_availabilities')
-    def test_current_project_job_availabilities(self, mock_get_current_project_job_availabilities):
-        # Given: get_current_project_job_availabilities가 예상된 값을 반환하는 경우
-        expected_availability = {self.job_backend.id: MagicMock(spec=ProjectJobAvailabilities)}
-        mock_get_current_project_job_availabilities.return_value = expected_availability
-
-        # When: current_project_job_availabilities 속성 접근
-        result = self.service.current_project_job_availabilities
-
-        # Then: 반환된 결과가 예상된 값과 동일해야 함
-        self.assertEqual(result, expected_availability)
-        mock_get_current_project_job_availabilities.assert_called_once_with(self.project.id, {self.job_backend.id})
+        mock_get_active_project.assert_called_once_with(self.project.id)
 
     @patch('job.services.project_job_services.ProjectRecruitmentJob.objects.filter')
     def test_project_recruitment_job_recruiting(self, mock_project_recruitment_job_filter):
@@ -518,43 +493,6 @@ class ProjectJobRecruitServiceTestCase(TestCase):
             member_id=self.member.id,
         )
 
-    @patch.object(ProjectJobRecruitService, 'current_project_job_availabilities', new_callable=PropertyMock)
-    def test_is_job_available_job_not_in_availabilities(self, mock_current_project_job_availabilities):
-        # Given: current_project_job_availabilities에 job_id가 없는 경우
-        mock_current_project_job_availabilities.return_value = {}
-
-        # When: is_job_available 메서드 호출
-        result = self.service.is_job_available()
-
-        # Then: 반환된 결과가 False여야 함
-        self.assertEqual(result, False)
-
-    @patch.object(ProjectJobRecruitService, 'current_project_job_availabilities', new_callable=PropertyMock)
-    def test_is_job_available_job_is_available(self, mock_current_project_job_availabilities):
-        # Given: current_project_job_availabilities에 job_id가 있고 is_available이 True인 경우
-        availability = MagicMock(spec=ProjectJobAvailabilities)
-        availability.is_available = True
-        mock_current_project_job_availabilities.return_value = {self.service.job_id: availability}
-
-        # When: is_job_available 메서드 호출
-        result = self.service.is_job_available()
-
-        # Then: 반환된 결과가 True여야 함
-        self.assertEqual(result, True)
-
-    @patch.object(ProjectJobRecruitService, 'current_project_job_availabilities', new_callable=PropertyMock)
-    def test_is_job_available_job_is_not_available(self, mock_current_project_job_availabilities):
-        # Given: current_project_job_availabilities에 job_id가 있고 is_available이 False인 경우
-        availability = MagicMock(spec=ProjectJobAvailabilities)
-        availability.is_available = False
-        mock_current_project_job_availabilities.return_value = {self.service.job_id: availability}
-
-        # When: is_job_available 메서드 호출
-        result = self.service.is_job_available()
-
-        # Then: 반환된 결과가 False여야 함
-        self.assertEqual(result, False)
-
 
 class ProjectRecruitServiceTestCase(TestCase):
 
@@ -0,0 +1,36 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from job.models import Job
+from member.models import Member
+from project.models import (
+    Project,
+    ProjectRecruitApplication,
+)
+
+
+class LoadTestProjectRecruitApplicationCommandTest(TestCase):
+    def test_load_test_project_recruit_application_command(self):
+        # Given: output
+        out = StringIO()
+
+        # When: 한 worker 로 실행합니다.
+        call_command(
+            'load_test_project_recruit_application',
+            '--members', '2',
+            '--attempts', '2',
+            '--workers', '1',
+            stdout=out,
+        )
+
+        # Then: 회원마다 신청 하나만 생성됩니다.
+        output = out.getvalue()
+        self.assertIn('applications: 4 attempts', output)
+        self.assertIn('ProjectRecruitmentJobAlreadyRecruitedException 2, created 2, in_review 2', output)
+        self.assertIn('Successfully load tested recruit application with 2 members, 2 attempts and 1 workers', output)
+        # And: 부하 테스트 데이터는 삭제됩니다.
+        self.assertFalse(ProjectRecruitApplication.objects.exists())
+        self.assertFalse(Project.objects.exists())
+        self.assertFalse(Job.objects.filter(name__startswith='load-').exists())
+        self.assertFalse(Member.objects.filter(username__startswith='load-').exists())
@@ -8,6 +8,8 @@ from member.models import (
     MemberExtraLink,
     MemberInformation,
     MemberJobExperience,
+    MemberProfileSummary,
+    MemberProjectStats,
     MemberProvider,
     MemberStatus,
     MemberType,
@@ -121,6 +123,25 @@ class MemberAttributeAcquisitionAdmin(admin.ModelAdmin):
     ]
 
 
+class MemberProjectStatsAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'member',
+        'success_count',
+        'working_count',
+        'leaved_count',
+        'updated_at',
+    ]
+
+
+class MemberProfileSummaryAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'member',
+        'updated_at',
+    ]
+
+
 admin.site.register(Guest, GuestAdmin)
 admin.site.register(Member, MemberAdmin)
 admin.site.register(MemberProvider, MemberProviderAdmin)
@@ -132,3 +153,5 @@ admin.site.register(MemberExtraLink, MemberExtraLinkAdmin)
 admin.site.register(MemberAttribute, MemberAttributeAdmin)
 admin.site.register(MemberAttributeType, MemberAttributeTypeAdmin)
 admin.site.register(MemberAttributeAcquisition, MemberAttributeAcquisitionAdmin)
+admin.site.register(MemberProjectStats, MemberProjectStatsAdmin)
+admin.site.register(MemberProfileSummary, MemberProfileSummaryAdmin)
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from common.common_consts.common_enums import (
     IntValueSelector,
     StrValueLabel,
@@ -98,3 +100,38 @@ PASSWORD_MAX_LENGTH = 30
 class MemberAttributeAcquisitionStatus(StrValueLabel):
     RECEIVED = ('RECEIVED', '습득')
     REVOKED = ('REVOKED', '회수')
+
+
+# 회원 정보 블록 캐시 (redis)
+MEMBER_INFO_BLOCK_KEY_PREFIX = 'member:info_block'
+MEMBER_INFO_BLOCK_TIMEOUT_SECONDS = 60 * 60
+
+# 비회원 인증 정보(회원 id, 회원 상태, 블랙리스트 여부) 캐시 (redis)
+GUEST_PRINCIPAL_KEY_PREFIX = 'member:guest_principal'
+GUEST_PRINCIPAL_TIMEOUT_SECONDS = 60 * 5
+
+# 토큰 폐기 목록 (redis sorted set, member: 비회원 id, score: 폐기 시각)
+# 폐기 시각 이전에 발급된 access token 의 인증 정보(claims)는 믿지 않고 인증 정보를 다시 조회합니다.
+GUEST_TOKEN_REVOCATION_KEY = 'member:guest_token_revocations'
+# worker 메모리 폐기 목록을 redis 와 맞추는 주기
+GUEST_TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS = 1
+# 서버 간 시계 오차를 감안해 폐기 시각 직후에 발급된 토큰까지 폐기된 것으로 봅니다.
+GUEST_TOKEN_REVOCATION_CLOCK_SKEW_SECONDS = 5
+
+# IP 별 재사용할 비회원 id 캐시 (redis)
+GUEST_IP_KEY_PREFIX = 'member:guest_ip'
+GUEST_IP_TIMEOUT_SECONDS = 60 * 60
+# IP 별 비회원 토큰 발급 제한 (redis, 고정 window)
+GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX = 'member:guest_token_rate_limit'
+GUEST_TOKEN_RATE_LIMIT_COUNT = 60
+GUEST_TOKEN_RATE_LIMIT_WINDOW_SECONDS = 60
+# 재사용된 비회원의 마지막 접속 시각은 하루에 한 번만 갱신합니다.
+GUEST_LAST_JOINED_AT_UPDATE_INTERVAL = timedelta(days=1)
+# 회원 연결 없이 마지막 접속 이후 이 기간이 지나고 참조하는 데이터가 없는 비회원은 정리합니다.
+# refresh token 만료 기간(7일)보다 길어야 합니다.
+GUEST_STALE_PERIOD = timedelta(days=30)
+GUEST_COMPACTION_BATCH_SIZE = 1000
+GUEST_COMPACTION_MAX_BATCH_COUNT = 100
+
+# 회원 프로필 요약에 저장하는 대표 속성 수
+MEMBER_PROFILE_SUMMARY_MAIN_ATTRIBUTE_COUNT = 3
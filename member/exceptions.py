@@ -97,3 +97,9 @@ class UnknownPlatformException(CommonAPIException):
     status_code = 400
     default_detail = '알 수 없는 로그인 방식입니다.'
     default_code = 'platform-error'
+
+
+class GuestTokenRateLimitExceededException(CommonAPIException):
+    status_code = 429
+    default_detail = '비회원 토큰 발급 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.'
+    default_code = 'guest-token-rate-limit-exceeded'
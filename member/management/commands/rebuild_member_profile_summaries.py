@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from member.models import (
+    MemberAttribute,
+    MemberJobExperience,
+    MemberProfileSummary,
+)
+from member.services import (
+    invalidate_member_info_blocks,
+    refresh_members_profile_summary,
+)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild member profile summaries (job experience durations and main attributes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        member_ids = sorted(
+            set(MemberJobExperience.objects.values_list('member_id', flat=True).distinct())
+            | set(MemberAttribute.objects.values_list('member_id', flat=True).distinct())
+            | set(MemberProfileSummary.objects.values_list('member_id', flat=True))
+        )
+        for i in range(0, len(member_ids), batch_size):
+            batch_member_ids = member_ids[i:i + batch_size]
+            refresh_members_profile_summary(batch_member_ids)
+            invalidate_member_info_blocks(batch_member_ids)
+        self.stdout.write(self.style.SUCCESS(f'Successfully rebuilt profile summaries of {len(member_ids)} members'))
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from member.models import MemberProjectStats
+from member.services import (
+    aggregate_members_project_ongoing_info,
+    invalidate_member_info_blocks,
+    refresh_members_project_stats,
+)
+from project.models import ProjectMemberManagement
+
+
+class Command(BaseCommand):
+    help = 'Reconcile member project stats with project member managements and project status'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        member_ids = sorted(
+            set(ProjectMemberManagement.objects.values_list('member_id', flat=True).distinct())
+            | set(MemberProjectStats.objects.values_list('member_id', flat=True))
+        )
+        fixed_count = 0
+        for i in range(0, len(member_ids), batch_size):
+            batch_member_ids = member_ids[i:i + batch_size]
+            members_project_ongoing_info = aggregate_members_project_ongoing_info(batch_member_ids)
+            stats_by_member_id = {
+                member_project_stats['member_id']: {
+                    'success': member_project_stats['success_count'],
+                    'working': member_project_stats['working_count'],
+                    'leaved': member_project_stats['leaved_count'],
+                }
+                for member_project_stats in MemberProjectStats.objects.filter(
+                    member_id__in=batch_member_ids,
+                ).values(
+                    'member_id',
+                    'success_count',
+                    'working_count',
+                    'leaved_count',
+                )
+            }
+            mismatched_member_ids = [
+                member_id
+                for member_id in batch_member_ids
+                if stats_by_member_id.get(member_id) != members_project_ongoing_info.get(
+                    member_id,
+                    {'success': 0, 'working': 0, 'leaved': 0},
+                )
+            ]
+            refresh_members_project_stats(mismatched_member_ids)
+            invalidate_member_info_blocks(mismatched_member_ids)
+            fixed_count += len(mismatched_member_ids)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully reconciled project stats of {len(member_ids)} members ({fixed_count} fixed)'
+            )
+        )
@@ -14,7 +14,7 @@ class MemberManager(UserManager):
     def get_or_create_member_by_token(self, token: str, provider: int) -> tuple:
         data = SocialLoginHandler(
             SocialLoginModuleSelector(int(provider)).selector()
-        ).validate(token)
+        ).validate_for_sign_up(token)
 
         return self.get_or_create(
             username=data['id'],
@@ -28,9 +28,10 @@ class MemberManager(UserManager):
         )
 
     def get_member_by_token(self, token: str, provider: int) -> Optional['Member']:  # noqa
-        data = SocialLoginHandler(
+        social_login_handler = SocialLoginHandler(
             SocialLoginModuleSelector(int(provider)).selector()
-        ).validate(token)
+        )
+        data = social_login_handler.validate(token)
 
         try:
             return self.get(
@@ -38,4 +39,5 @@ class MemberManager(UserManager):
                 member_provider_id=provider,
             )
         except self.model.DoesNotExist:
+            social_login_handler.save_sign_up_profile(token, data)
             return None
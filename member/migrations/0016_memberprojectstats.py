@@ -0,0 +1,31 @@
+# Generated by Django 4.1.10 on 2026-10-18 10:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0015_memberattributeacquisition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberProjectStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('success_count', models.PositiveIntegerField(default=0)),
+                ('working_count', models.PositiveIntegerField(default=0)),
+                ('leaved_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, related_name='project_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '회원 프로젝트 통계',
+                'verbose_name_plural': '회원 프로젝트 통계',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.1.10 on 2026-10-18 10:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0016_memberprojectstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberProfileSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_experience_durations', models.JSONField(default=list)),
+                ('main_attributes', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, related_name='profile_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '회원 프로필 요약',
+                'verbose_name_plural': '회원 프로필 요약',
+            },
+        ),
+    ]
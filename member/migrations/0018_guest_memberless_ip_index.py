@@ -0,0 +1,17 @@
+# Generated by Django 4.1.10 on 2026-10-18 10:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0017_memberprofilesummary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='guest',
+            index=models.Index(condition=models.Q(('member__isnull', True)), fields=['ip', '-id'], name='guest_memberless_ip_idx'),
+        ),
+    ]
@@ -65,6 +65,14 @@ class Guest(models.Model):
     class Meta:
         verbose_name = '비회원'
         verbose_name_plural = '비회원'
+        indexes = [
+            # 비회원 토큰 발급 시 IP 의 최근 비회원을 찾습니다.
+            models.Index(
+                fields=['ip', '-id'],
+                condition=models.Q(member__isnull=True),
+                name='guest_memberless_ip_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.temp_nickname
@@ -186,3 +194,43 @@ class MemberAttributeAcquisition(models.Model):
 
     def __str__(self):
         return f'{self.member_id, self.member_attribute_type_id, self.value, self.status}'
+
+
+class MemberProjectStats(models.Model):
+    u"""
+    ProjectMemberManagement 와 프로젝트 상태로부터 집계한 회원별 프로젝트 통계 (읽기 모델)
+    참여/탈퇴 또는 프로젝트 상태가 바뀌면 같은 트랜잭션에서 다시 집계됩니다.
+    """
+    member = models.OneToOneField(Member, models.DO_NOTHING, related_name='project_stats')
+    success_count = models.PositiveIntegerField(default=0)
+    working_count = models.PositiveIntegerField(default=0)
+    leaved_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '회원 프로젝트 통계'
+        verbose_name_plural = '회원 프로젝트 통계'
+
+    def __str__(self):
+        return f'{self.member_id, self.success_count, self.working_count, self.leaved_count}'
+
+
+class MemberProfileSummary(models.Model):
+    u"""
+    프로필 렌더링용 회원별 요약 (읽기 모델)
+    job_experience_durations: 직무별 종료된 경력 합계와 진행중 경력 시작일 (진행중 경력은 조회 시점 기준으로 더합니다.)
+    main_attributes: value 내림차순 상위 속성
+    """
+    member = models.OneToOneField(Member, models.DO_NOTHING, related_name='profile_summary')
+    job_experience_durations = models.JSONField(default=list)
+    main_attributes = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '회원 프로필 요약'
+        verbose_name_plural = '회원 프로필 요약'
+
+    def __str__(self):
+        return f'{self.member_id}'
@@ -1,16 +1,59 @@
+import json
 import re
+import threading
+import time
 from collections import defaultdict
 from datetime import (
+    date,
     datetime,
     timedelta,
 )
 from typing import (
     Any,
+    Dict,
     List,
+    Optional,
 )
 
 from common.common_utils.datetime_utils import get_date_diff_year_and_month
+from common.common_utils.redis_cache_utils import (
+    get_cached_values_with_generations,
+    invalidate_cached_values,
+    set_cached_values_if_generation_unchanged,
+)
+from common.common_utils.string_utils import generate_random_string_digits
 from common.models import BlackListWord
+from django.conf import settings
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.models import (
+    Count,
+    Q,
+)
+from django.utils import timezone
+from django_redis import get_redis_connection
+from member.consts import (
+    GUEST_COMPACTION_BATCH_SIZE,
+    GUEST_COMPACTION_MAX_BATCH_COUNT,
+    GUEST_IP_KEY_PREFIX,
+    GUEST_IP_TIMEOUT_SECONDS,
+    GUEST_LAST_JOINED_AT_UPDATE_INTERVAL,
+    GUEST_PRINCIPAL_KEY_PREFIX,
+    GUEST_PRINCIPAL_TIMEOUT_SECONDS,
+    GUEST_STALE_PERIOD,
+    GUEST_TOKEN_RATE_LIMIT_COUNT,
+    GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX,
+    GUEST_TOKEN_RATE_LIMIT_WINDOW_SECONDS,
+    GUEST_TOKEN_REVOCATION_CLOCK_SKEW_SECONDS,
+    GUEST_TOKEN_REVOCATION_KEY,
+    GUEST_TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS,
+    MEMBER_INFO_BLOCK_KEY_PREFIX,
+    MEMBER_INFO_BLOCK_TIMEOUT_SECONDS,
+    MEMBER_PROFILE_SUMMARY_MAIN_ATTRIBUTE_COUNT,
+    MemberStatusEnum,
+)
 from member.dtos.model_dtos import (
     JobExperience,
     MemberInfoBlock,
@@ -18,12 +61,16 @@ from member.dtos.model_dtos import (
     MemberMainAttribute,
 )
 from member.models import (
+    Guest,
     Member,
     MemberAttribute,
     MemberExtraLink,
     MemberInformation,
     MemberJobExperience,
+    MemberProfileSummary,
+    MemberProjectStats,
 )
+from order.models import Order
 from project.consts import (
     ProjectMemberManagementLeftStatus,
     ProjectResultStatus,
@@ -31,6 +78,8 @@ from project.consts import (
 )
 from project.dtos.model_dtos import ProjectOngoingInfo
 from project.models import ProjectMemberManagement
+from redis.exceptions import RedisError
+from rest_framework_jwt.settings import api_settings
 
 
 def check_username_exists(username) -> bool:
@@ -89,47 +138,525 @@ def add_member_job_experiences(member_id: int, job_experiences: List[JobExperien
             )
         )
         current_datetime = current_datetime + timedelta(seconds=0.1)
-    return MemberJobExperience.objects.bulk_create(member_job_experiences)
+    created_member_job_experiences = MemberJobExperience.objects.bulk_create(member_job_experiences)
+    # bulk_create 는 post_save signal 을 보내지 않으므로 직접 갱신합니다.
+    refresh_members_profile_summary([member_id])
+    invalidate_member_info_blocks([member_id])
+    return created_member_job_experiences
+
+
+def _get_member_info_block_key(member_id: int) -> str:
+    return f'{MEMBER_INFO_BLOCK_KEY_PREFIX}:{member_id}'
+
+
+def _get_member_info_blocks_from_db(member_ids: List[int]) -> Dict[int, MemberInfoBlock]:
+    members = Member.objects.filter(id__in=member_ids).only('id', 'nickname', 'profile_image_url')
+    # 회원별 가장 최근 소개 / sequence 가 가장 앞선 링크를 DISTINCT ON 으로 한 번에 조회합니다.
+    description_by_member_id = dict(
+        MemberInformation.objects.filter(
+            member_id__in=member_ids,
+            is_deleted=False,
+        ).order_by(
+            'member_id',
+            '-id',
+        ).distinct(
+            'member_id',
+        ).values_list(
+            'member_id',
+            'description',
+        )
+    )
+    link_by_member_id = dict(
+        MemberExtraLink.objects.filter(
+            member_id__in=member_ids,
+            is_deleted=False,
+        ).order_by(
+            'member_id',
+            'sequence',
+            'id',
+        ).distinct(
+            'member_id',
+        ).values_list(
+            'member_id',
+            'url',
+        )
+    )
+    members_profile_summary = get_members_profile_summary(member_ids)
+    members_project_ongoing_info = get_members_project_ongoing_info(member_ids)
+
+    member_info_block_by_member_id = {}
+    for member in members:
+        member_profile_summary = members_profile_summary.get(
+            member.id,
+            {'job_experience_durations': [], 'main_attributes': []},
+        )
+        member_main_attributes = [
+            MemberMainAttribute(
+                member_attribute_type_id=attribute['member_attribute_type_id'],
+                display_name=attribute['display_name'],
+            )
+            for attribute in member_profile_summary['main_attributes']
+        ]
+        member_job_experiences = [
+            MemberJobExperienceDuration(
+                job_id=job['job_id'],
+                display_name=job['display_name'],
+                total_year=job['total_year'],
+                total_month=job['total_month'],
+            )
+            for job in member_profile_summary['job_experience_durations']
+        ]
+        project_ongoing_info = members_project_ongoing_info.get(
+            member.id,
+            {'success': 0, 'working': 0, 'leaved': 0},
+        )
+        member_info_block_by_member_id[member.id] = MemberInfoBlock(
+            member_id=member.id,
+            profile_image=member.profile_image_url,
+            nickname=member.nickname,
+            simple_description=description_by_member_id.get(member.id),
+            link=link_by_member_id.get(member.id),
+            project_info=ProjectOngoingInfo(
+                success=project_ongoing_info['success'],
+                working=project_ongoing_info['working'],
+                leaved=project_ongoing_info['leaved'],
+            ),
+            member_main_attributes=(member_main_attributes if member_main_attributes else None),
+            member_job_experiences=(member_job_experiences if member_job_experiences else None),
+        )
+    return member_info_block_by_member_id
+
+
+def get_member_info_blocks(member_ids: List[int]) -> Dict[int, MemberInfoBlock]:
+    """
+    회원 정보 블록을 redis MGET 한 번으로 조회하고, 없는 회원만 소스별 쿼리 한 번씩으로 DB 에서 조회해 저장합니다.
+    존재하지 않는 회원은 결과에 포함되지 않습니다.
+    """
+    member_ids = list(dict.fromkeys(member_ids))
+    if not member_ids:
+        return {}
+    if not settings.MEMBER_INFO_BLOCK_CACHE_ENABLED:
+        return _get_member_info_blocks_from_db(member_ids)
+
+    keys = [_get_member_info_block_key(member_id) for member_id in member_ids]
+    try:
+        redis = get_redis_connection('default')
+        cached_member_info_blocks, generations = get_cached_values_with_generations(redis, keys)
+    except RedisError:
+        return _get_member_info_blocks_from_db(member_ids)
+
+    member_info_block_by_member_id = {
+        member_id: MemberInfoBlock.model_validate_json(cached_member_info_block)
+        for member_id, cached_member_info_block in zip(member_ids, cached_member_info_blocks)
+        if cached_member_info_block is not None
+    }
+    missed_member_ids = [member_id for member_id in member_ids if member_id not in member_info_block_by_member_id]
+    if not missed_member_ids:
+        return member_info_block_by_member_id
+
+    missed_member_info_block_by_member_id = _get_member_info_blocks_from_db(missed_member_ids)
+    member_info_block_by_member_id.update(missed_member_info_block_by_member_id)
+    try:
+        set_cached_values_if_generation_unchanged(
+            redis,
+            [
+                (key, generation, missed_member_info_block_by_member_id[member_id].model_dump_json())
+                for member_id, key, generation in zip(member_ids, keys, generations)
+                if member_id in missed_member_info_block_by_member_id
+            ],
+            MEMBER_INFO_BLOCK_TIMEOUT_SECONDS,
+        )
+    except RedisError:
+        pass
+    return member_info_block_by_member_id
+
+
+def get_cached_member_info_block_json(member_id: int) -> Optional[str]:
+    """
+    redis 에 캐시된 회원 정보 블록 JSON 을 DB 조회 없이 반환합니다. 캐시가 없으면 None 입니다.
+    """
+    if not settings.MEMBER_INFO_BLOCK_CACHE_ENABLED:
+        return None
+    try:
+        cached_member_info_block = get_redis_connection('default').get(_get_member_info_block_key(member_id))
+    except RedisError:
+        return None
+    if cached_member_info_block is None:
+        return None
+    return cached_member_info_block.decode()
 
 
 def get_member_info_block(member_id: int) -> MemberInfoBlock:
-    member = Member.objects.get(id=member_id)
-    member_information = get_active_member_information_qs(member_id=member_id).last()
-    member_link = get_active_member_extra_link_qa(member_id=member_id).order_by('sequence').first()
-    members_main_attributes = [
-        MemberMainAttribute(
-            member_attribute_type_id=attribute['member_attribute_type_id'],
-            display_name=attribute['display_name'],
-        )
-        for attribute in get_members_main_attributes_with_sort([member.id])[member.id][:3]
-    ]
-    member_job_experiences = [
-        MemberJobExperienceDuration(
-            job_id=job['job_id'],
-            display_name=job['display_name'],
-            total_year=job['total_year'],
-            total_month=job['total_month'],
-        )
-        for job in get_members_job_experience_durations([member.id])[member.id]
-    ]
-    members_project_ongoing_info = next(
-        iter(get_members_project_ongoing_info([member.id]).values()),
-        {'success': 0, 'working': 0, 'leaved': 0},
+    member_info_block = get_member_info_blocks([member_id]).get(member_id)
+    if member_info_block is None:
+        raise Member.DoesNotExist('Member matching query does not exist.')
+    return member_info_block
+
+
+def invalidate_member_info_blocks(member_ids: List[int]) -> None:
+    """
+    커밋 이후 회원 정보 블록 캐시를 삭제합니다. 다음 조회에서 DB 로부터 다시 만들어집니다.
+    """
+    member_ids = list(dict.fromkeys(member_ids))
+    if not member_ids:
+        return
+
+    def _invalidate():
+        try:
+            invalidate_cached_values(
+                get_redis_connection('default'),
+                [_get_member_info_block_key(member_id) for member_id in member_ids],
+            )
+        except RedisError:
+            pass
+
+    transaction.on_commit(_invalidate)
+
+
+def _get_guest_principal_key(guest_id: int) -> str:
+    return f'{GUEST_PRINCIPAL_KEY_PREFIX}:{guest_id}'
+
+
+def _get_guest_from_db(guest_id: int) -> Optional[Guest]:
+    try:
+        return Guest.objects.select_related('member').get(id=guest_id)
+    except Guest.DoesNotExist:
+        pass
+
+
+def _get_guest_from_principal(guest_id: int, principal: dict) -> Guest:
+    # 인증에 필요한 필드만 채우고 나머지 필드는 deferred 로 두어 접근할 때만 조회합니다.
+    guest = Guest.from_db(
+        'default',
+        ['id', 'member_id', 'is_blacklisted'],
+        [guest_id, principal['member_id'], principal['is_blacklisted']],
     )
-    return MemberInfoBlock(
-        member_id=member.id,
-        profile_image=member.profile_image_url,
-        nickname=member.nickname,
-        simple_description=(member_information.description if member_information else None),
-        link=(member_link.url if member_link else None),
-        project_info=ProjectOngoingInfo(
-            success=members_project_ongoing_info['success'],
-            working=members_project_ongoing_info['working'],
-            leaved=members_project_ongoing_info['leaved'],
-        ),
-        member_main_attributes=(members_main_attributes if members_main_attributes else None),
-        member_job_experiences=(member_job_experiences if member_job_experiences else None),
+    if principal['member_id']:
+        guest.member = Member.from_db(
+            'default',
+            ['id', 'member_status_id'],
+            [principal['member_id'], principal['member_status_id']],
+        )
+    return guest
+
+
+def get_authenticated_guest(guest_id: int) -> Optional[Guest]:
+    """
+    토큰의 비회원을 회원과 함께 조회합니다.
+    인증에 필요한 회원 id, 회원 상태, 블랙리스트 여부는 redis 에 짧게 캐시해 두고, 캐시가 있으면 DB 를 조회하지 않습니다.
+    """
+    if not settings.GUEST_PRINCIPAL_CACHE_ENABLED:
+        return _get_guest_from_db(guest_id)
+    try:
+        redis = get_redis_connection('default')
+        cached_principal = redis.get(_get_guest_principal_key(guest_id))
+    except RedisError:
+        return _get_guest_from_db(guest_id)
+    if cached_principal is not None:
+        return _get_guest_from_principal(guest_id, json.loads(cached_principal))
+
+    guest = _get_guest_from_db(guest_id)
+    if guest:
+        try:
+            redis.set(
+                _get_guest_principal_key(guest_id),
+                json.dumps({
+                    'member_id': guest.member_id,
+                    'member_status_id': guest.member.member_status_id if guest.member else None,
+                    'is_blacklisted': guest.is_blacklisted,
+                }),
+                ex=GUEST_PRINCIPAL_TIMEOUT_SECONDS,
+            )
+        except RedisError:
+            pass
+    return guest
+
+
+def invalidate_guest_principals(guest_ids: List[int]) -> None:
+    """
+    커밋 이후 비회원 인증 정보 캐시를 삭제합니다. 블랙리스트/회원 연결/회원 상태가 바뀌면 호출됩니다.
+    """
+    guest_ids = list(dict.fromkeys(guest_ids))
+    if not guest_ids:
+        return
+
+    def _invalidate():
+        try:
+            get_redis_connection('default').delete(
+                *[_get_guest_principal_key(guest_id) for guest_id in guest_ids]
+            )
+        except RedisError:
+            pass
+
+    transaction.on_commit(_invalidate)
+
+
+def _get_guest_token_revocation_retention_seconds() -> float:
+    # access token 이 만료된 이후의 폐기 기록은 필요 없습니다.
+    return api_settings.JWT_EXPIRATION_DELTA.total_seconds()
+
+
+class GuestTokenRevocationMirror(object):
+    """
+    redis 토큰 폐기 목록의 비회원별 마지막 폐기 시각을 worker 메모리에 유지합니다.
+    마지막으로 읽은 폐기 시각 이후의 기록만 주기적으로 읽어 반영합니다.
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.is_synced = False
+        self.synced_at = 0.0
+        self.last_revoked_at = 0.0
+        self.revoked_at_by_guest_id: Dict[int, float] = {}
+
+    def _add(self, guest_id: int, revoked_at: float) -> None:
+        if revoked_at > self.revoked_at_by_guest_id.get(guest_id, 0.0):
+            self.revoked_at_by_guest_id[guest_id] = revoked_at
+        self.last_revoked_at = max(self.last_revoked_at, revoked_at)
+
+    def _prune(self, now: float) -> None:
+        expired_at = now - _get_guest_token_revocation_retention_seconds()
+        self.revoked_at_by_guest_id = {
+            guest_id: revoked_at
+            for guest_id, revoked_at in self.revoked_at_by_guest_id.items()
+            if revoked_at >= expired_at
+        }
+
+    def add(self, guest_ids: List[int], revoked_at: float) -> None:
+        with self.lock:
+            for guest_id in guest_ids:
+                self._add(guest_id, revoked_at)
+
+    def refresh(self) -> bool:
+        """
+        동기화 주기가 지났으면 폐기 목록을 읽어 반영합니다.
+        폐기 목록을 읽을 수 없으면 False 를 반환합니다.
+        """
+        with self.lock:
+            if self.is_synced and time.monotonic() - self.synced_at < GUEST_TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS:
+                return True
+            now = time.time()
+            if self.is_synced:
+                # 다른 서버의 시계가 늦어 이미 읽은 시각보다 앞선 폐기 기록도 놓치지 않도록 겹쳐서 읽습니다.
+                min_revoked_at = self.last_revoked_at - GUEST_TOKEN_REVOCATION_CLOCK_SKEW_SECONDS
+            else:
+                min_revoked_at = now - _get_guest_token_revocation_retention_seconds()
+            try:
+                revocations = get_redis_connection('default').zrangebyscore(
+                    GUEST_TOKEN_REVOCATION_KEY,
+                    min_revoked_at,
+                    '+inf',
+                    withscores=True,
+                )
+            except RedisError:
+                return False
+            for guest_id, revoked_at in revocations:
+                self._add(int(guest_id), revoked_at)
+            self._prune(now)
+            self.is_synced = True
+            self.synced_at = time.monotonic()
+        return True
+
+    def is_revoked(self, guest_id: int, issued_at: float) -> bool:
+        # 폐기 목록을 확인할 수 없으면 폐기된 것으로 봅니다.
+        if not self.refresh():
+            return True
+        revoked_at = self.revoked_at_by_guest_id.get(guest_id)
+        return revoked_at is not None and issued_at <= revoked_at + GUEST_TOKEN_REVOCATION_CLOCK_SKEW_SECONDS
+
+
+guest_token_revocation_mirror = GuestTokenRevocationMirror()
+
+
+def revoke_guest_tokens(guest_ids: List[int]) -> None:
+    """
+    커밋 이후 비회원들에게 이미 발급된 access token 의 인증 정보(claims)를 폐기합니다.
+    폐기된 토큰은 만료될 때까지 get_authenticated_guest 로 인증 정보를 조회합니다.
+    """
+    guest_ids = list(dict.fromkeys(guest_ids))
+    if not guest_ids:
+        return
+
+    def _revoke():
+        revoked_at = time.time()
+        guest_token_revocation_mirror.add(guest_ids, revoked_at)
+        try:
+            pipeline = get_redis_connection('default').pipeline()
+            pipeline.zadd(GUEST_TOKEN_REVOCATION_KEY, {guest_id: revoked_at for guest_id in guest_ids})
+            pipeline.zremrangebyscore(
+                GUEST_TOKEN_REVOCATION_KEY,
+                '-inf',
+                revoked_at - _get_guest_token_revocation_retention_seconds(),
+            )
+            pipeline.execute()
+        except RedisError:
+            pass
+
+    transaction.on_commit(_revoke)
+
+
+def get_guest_from_token_claims(payload: dict) -> Optional[Guest]:
+    """
+    access token 에 담긴 회원 상태와 블랙리스트 여부로 DB 조회 없이 비회원을 만듭니다.
+    인증 정보가 없는 이전 형식의 토큰, 접근할 수 없는 상태의 토큰, 폐기된 토큰이면 None 을 반환합니다.
+    """
+    if not settings.GUEST_TOKEN_CLAIMS_ENABLED:
+        return None
+    if not {'guest_id', 'member_id', 'member_status_id', 'is_blacklisted', 'iat'} <= payload.keys():
+        return None
+    # 접근이 제한된 상태는 해제되었을 수 있으므로 항상 인증 정보를 다시 조회합니다.
+    if payload['is_blacklisted']:
+        return None
+    if payload['member_id'] and payload['member_status_id'] != MemberStatusEnum.NORMAL_MEMBER.value:
+        return None
+    if guest_token_revocation_mirror.is_revoked(payload['guest_id'], payload['iat']):
+        return None
+    return _get_guest_from_principal(payload['guest_id'], payload)
+
+
+def _get_guest_ip_key(ip: str) -> str:
+    return f'{GUEST_IP_KEY_PREFIX}:{ip}'
+
+
+def _get_cached_ip_guest(ip: str) -> Optional[Guest]:
+    # 캐시된 비회원이 삭제되었거나 회원과 연결되었으면 None 을 반환합니다.
+    try:
+        cached_guest_id = get_redis_connection('default').get(_get_guest_ip_key(ip))
+    except RedisError:
+        return None
+    if cached_guest_id is None:
+        return None
+    guest = get_authenticated_guest(int(cached_guest_id))
+    if not guest or guest.member_id:
+        return None
+    return guest
+
+
+def get_or_create_ip_guest(ip: str) -> Guest:
+    """
+    IP 의 회원이 연결되지 않은 최근 비회원을 재사용하고, 없으면 생성합니다.
+    재사용할 비회원 id 는 IP 별로 redis 에 캐시하며, 재사용된 비회원의 마지막 접속 시각은 하루에 한 번만 갱신합니다.
+    """
+    if settings.GUEST_IP_CACHE_ENABLED:
+        guest = _get_cached_ip_guest(ip)
+        if guest:
+            return guest
+
+    guest = Guest.objects.filter(
+        ip=ip,
+        member__isnull=True,
+    ).only(
+        'id',
+        'member_id',
+        'is_blacklisted',
+        'last_joined_at',
+    ).order_by(
+        '-id',
+    ).first()
+    now = timezone.now()
+    if not guest:
+        guest = Guest.objects.create(
+            ip=ip,
+            temp_nickname=f'비회원{generate_random_string_digits(8)}'
+        )
+    elif guest.last_joined_at < now - GUEST_LAST_JOINED_AT_UPDATE_INTERVAL:
+        Guest.objects.filter(id=guest.id).update(last_joined_at=now)
+
+    if settings.GUEST_IP_CACHE_ENABLED:
+        try:
+            get_redis_connection('default').set(_get_guest_ip_key(ip), guest.id, ex=GUEST_IP_TIMEOUT_SECONDS)
+        except RedisError:
+            pass
+    return guest
+
+
+def is_guest_token_rate_limited(ip: str) -> bool:
+    """
+    IP 별 비회원 토큰 발급 요청 수를 고정 window 로 세어 제한을 넘었는지 확인합니다.
+    redis 를 사용할 수 없으면 제한하지 않습니다.
+    """
+    if not settings.GUEST_TOKEN_RATE_LIMIT_ENABLED:
+        return False
+    window = int(time.time()) // GUEST_TOKEN_RATE_LIMIT_WINDOW_SECONDS
+    key = f'{GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX}:{ip}:{window}'
+    try:
+        pipeline = get_redis_connection('default').pipeline()
+        pipeline.incr(key)
+        pipeline.expire(key, GUEST_TOKEN_RATE_LIMIT_WINDOW_SECONDS)
+        request_count, _ = pipeline.execute()
+    except RedisError:
+        return False
+    return request_count > GUEST_TOKEN_RATE_LIMIT_COUNT
+
+
+def _get_purge_stale_guests_sql() -> str:
+    # 비회원을 참조하는 모든 테이블에 참조가 없는 비회원만 삭제합니다. (테이블이 없는 모델은 제외합니다.)
+    table_names = set(connection.introspection.table_names())
+    guest_reference_tables = [
+        (related_object.related_model._meta.db_table, related_object.field.column)
+        for related_object in Guest._meta.related_objects
+        if related_object.related_model._meta.db_table in table_names
+    ] + [(Order._meta.db_table, 'guest_id')]
+    not_referenced_conditions = '\n'.join(
+        f'      AND NOT EXISTS (SELECT 1 FROM {table} WHERE {table}.{column} = guest.id)'
+        for table, column in guest_reference_tables
     )
+    # IN (subquery) 는 실행 계획에 따라 subquery 가 다시 실행될 수 있으므로 CTE 로 한 번만 고릅니다.
+    return f'''
+WITH stale_guest AS MATERIALIZED (
+    SELECT guest.id
+    FROM {Guest._meta.db_table} guest
+    WHERE guest.id > %(after_id)s
+      AND guest.member_id IS NULL
+      AND guest.last_joined_at < %(stale_before)s
+{not_referenced_conditions}
+    ORDER BY guest.id
+    LIMIT %(batch_size)s
+    FOR UPDATE SKIP LOCKED
+)
+DELETE FROM {Guest._meta.db_table}
+USING stale_guest
+WHERE {Guest._meta.db_table}.id = stale_guest.id
+RETURNING {Guest._meta.db_table}.id
+'''
+
+
+def _purge_stale_guest_batch(purge_stale_guests_sql: str, after_id: int, batch_size: int) -> List[int]:
+    """
+    id 가 after_id 보다 큰 오래된 비회원 중 회원과 연결되지 않았고 참조하는 데이터가 없는 비회원을
+    id 순으로 batch_size 만큼 삭제하고, 삭제한 비회원 id 를 반환합니다.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            purge_stale_guests_sql,
+            {
+                'after_id': after_id,
+                'stale_before': timezone.now() - GUEST_STALE_PERIOD,
+                'batch_size': batch_size,
+            },
+        )
+        return sorted(guest_id for guest_id, in cursor.fetchall())
+
+
+def purge_stale_guests(batch_size: int = GUEST_COMPACTION_BATCH_SIZE,
+                       max_batch_count: int = GUEST_COMPACTION_MAX_BATCH_COUNT) -> int:
+    """
+    오래된 비회원을 batch 단위로 각각 커밋하며 정리하고, 삭제한 비회원 수를 반환합니다.
+    한 번에 정리할 batch 수를 제한해 남은 비회원은 다음 실행에서 이어서 정리합니다.
+    """
+    purge_stale_guests_sql = _get_purge_stale_guests_sql()
+    purged_count = 0
+    after_id = 0
+    for _ in range(max_batch_count):
+        with transaction.atomic():
+            purged_guest_ids = _purge_stale_guest_batch(purge_stale_guests_sql, after_id, batch_size)
+        purged_count += len(purged_guest_ids)
+        if len(purged_guest_ids) < batch_size:
+            break
+        after_id = purged_guest_ids[-1]
+    return purged_count
 
 
 def get_active_member_information_qs(member_id: int):
@@ -140,7 +667,11 @@ def get_active_member_extra_link_qa(member_id: int):
     return MemberExtraLink.objects.filter(member_id=member_id, is_deleted=False)
 
 
-def get_members_job_experience_durations(member_ids: List[int]) -> defaultdict[int, list[dict[str, Any]]]:
+def _get_members_job_experience_duration_summaries(member_ids: List[int]) -> defaultdict[int, list[dict[str, Any]]]:
+    """
+    직무별로 종료된 경력의 합계와 진행중(end_date 없음) 경력의 시작일을 모읍니다.
+    진행중 경력은 조회 시점에 따라 기간이 달라지므로 합계에 더하지 않습니다.
+    """
     member_job_experiences = MemberJobExperience.objects.filter(
         member_id__in=member_ids,
         is_deleted=False,
@@ -150,27 +681,59 @@ def get_members_job_experience_durations(member_ids: List[int]) -> defaultdict[i
         'job__display_name',
         'start_date',
         'end_date',
+    ).order_by(
+        'id',
+    )
+    member_job_experience_durations = defaultdict(
+        lambda: defaultdict(lambda: {'total_year': 0, 'total_month': 0, 'display_name': '', 'ongoing_start_dates': []})
     )
-    member_job_experience_durations = defaultdict(lambda: defaultdict(lambda: {'total_year': 0, 'total_month': 0, 'display_name': ''}))
     for member_job_experience in member_job_experiences:
-        years, months = get_date_diff_year_and_month(member_job_experience['start_date'], member_job_experience['end_date'])
         job_info = member_job_experience_durations[member_job_experience['member_id']][member_job_experience['job_id']]
+        job_info['display_name'] = member_job_experience['job__display_name']
+        if member_job_experience['end_date'] is None:
+            job_info['ongoing_start_dates'].append(member_job_experience['start_date'].isoformat())
+            continue
+        years, months = get_date_diff_year_and_month(member_job_experience['start_date'], member_job_experience['end_date'])
         job_info['total_year'] += years
         job_info['total_month'] += months
-        job_info['display_name'] = member_job_experience['job__display_name']
 
     final_member_job_experience_durations = defaultdict(list)
     for member_id, jobs in member_job_experience_durations.items():
         for job_id, durations in jobs.items():
             final_member_job_experience_durations[member_id].append({
                 'job_id': job_id,
-                'display_name': durations['display_name'],
-                'total_year': durations['total_year'],
-                'total_month': durations['total_month'],
+                **durations,
             })
     return final_member_job_experience_durations
 
 
+def _resolve_job_experience_durations(job_experience_duration_summaries: List[dict[str, Any]]) -> list[dict[str, Any]]:
+    job_experience_durations = []
+    for job_experience_duration_summary in job_experience_duration_summaries:
+        total_year = job_experience_duration_summary['total_year']
+        total_month = job_experience_duration_summary['total_month']
+        for ongoing_start_date in job_experience_duration_summary['ongoing_start_dates']:
+            years, months = get_date_diff_year_and_month(date.fromisoformat(ongoing_start_date))
+            total_year += years
+            total_month += months
+        job_experience_durations.append({
+            'job_id': job_experience_duration_summary['job_id'],
+            'display_name': job_experience_duration_summary['display_name'],
+            'total_year': total_year,
+            'total_month': total_month,
+        })
+    return job_experience_durations
+
+
+def get_members_job_experience_durations(member_ids: List[int]) -> defaultdict[int, list[dict[str, Any]]]:
+    final_member_job_experience_durations = defaultdict(list)
+    for member_id, job_experience_duration_summaries in _get_members_job_experience_duration_summaries(member_ids).items():
+        final_member_job_experience_durations[member_id] = _resolve_job_experience_durations(
+            job_experience_duration_summaries
+        )
+    return final_member_job_experience_durations
+
+
 def get_members_main_attributes_with_sort(member_ids: List[int]) -> defaultdict[int, list[dict[str, Any]]]:
     member_attributes = MemberAttribute.objects.filter(
         member_id__in=member_ids
@@ -194,28 +757,154 @@ def get_members_main_attributes_with_sort(member_ids: List[int]) -> defaultdict[
     return member_main_attributes_results
 
 
+def _lock_member_read_model_rows(model, member_ids: List[int]) -> None:
+    """
+    회원별 읽기 모델 row 를 (없으면 만들어) member_id 순으로 잠급니다.
+    동시에 같은 회원을 갱신하는 트랜잭션이 서로의 변경을 덮어쓰지 않도록 잠근 뒤 집계합니다.
+    """
+    model.objects.bulk_create(
+        [model(member_id=member_id) for member_id in member_ids],
+        ignore_conflicts=True,
+    )
+    list(
+        model.objects.select_for_update().filter(
+            member_id__in=member_ids,
+        ).order_by(
+            'member_id',
+        ).values_list(
+            'id',
+            flat=True,
+        )
+    )
+
+
+def refresh_members_profile_summary(member_ids: List[int]) -> None:
+    """
+    회원별 직무 경력 기간과 상위 속성을 다시 집계해 MemberProfileSummary 에 저장합니다. 호출한 트랜잭션 안에서 반영됩니다.
+    """
+    member_ids = sorted(set(member_ids))
+    if not member_ids:
+        return
+    with transaction.atomic():
+        _lock_member_read_model_rows(MemberProfileSummary, member_ids)
+        members_job_experience_duration_summaries = _get_members_job_experience_duration_summaries(member_ids)
+        members_main_attributes = get_members_main_attributes_with_sort(member_ids)
+        MemberProfileSummary.objects.bulk_create(
+            [
+                MemberProfileSummary(
+                    member_id=member_id,
+                    job_experience_durations=members_job_experience_duration_summaries.get(member_id, []),
+                    main_attributes=[
+                        {
+                            'member_attribute_type_id': attribute['member_attribute_type_id'],
+                            'display_name': attribute['display_name'],
+                        }
+                        for attribute in members_main_attributes.get(member_id, [])[:MEMBER_PROFILE_SUMMARY_MAIN_ATTRIBUTE_COUNT]
+                    ],
+                )
+                for member_id in member_ids
+            ],
+            update_conflicts=True,
+            unique_fields=['member'],
+            update_fields=['job_experience_durations', 'main_attributes', 'updated_at'],
+        )
+
+
+def get_members_profile_summary(member_ids: List[int]) -> Dict[int, dict[str, list[dict[str, Any]]]]:
+    """
+    MemberProfileSummary 에서 회원별 직무 경력 기간과 상위 속성을 조회합니다. 요약이 없는 회원은 결과에 포함되지 않습니다.
+    """
+    return {
+        member_profile_summary['member_id']: {
+            'job_experience_durations': _resolve_job_experience_durations(
+                member_profile_summary['job_experience_durations']
+            ),
+            'main_attributes': member_profile_summary['main_attributes'],
+        }
+        for member_profile_summary in MemberProfileSummary.objects.filter(
+            member_id__in=member_ids,
+        ).values(
+            'member_id',
+            'job_experience_durations',
+            'main_attributes',
+        )
+    }
+
+
+def aggregate_members_project_ongoing_info(member_ids: List[int]) -> Dict[int, dict[str, int]]:
+    """
+    ProjectMemberManagement 와 프로젝트 상태로부터 회원별 success/working/leaved 를 DB 에서 집계합니다.
+    탈퇴 > 진행중 > 성공 순으로 하나에만 집계됩니다.
+    """
+    if not member_ids:
+        return {}
+    is_left = Q(left_status=ProjectMemberManagementLeftStatus.LEFT.value)
+    is_working = Q(project__project_status=ProjectStatus.WORKING.value)
+    project_member_project_results = ProjectMemberManagement.objects.filter(
+        member_id__in=member_ids,
+    ).values(
+        'member_id',
+    ).annotate(
+        leaved=Count('id', filter=is_left),
+        working=Count('id', filter=~is_left & is_working),
+        success=Count(
+            'id',
+            filter=~is_left & ~is_working & Q(project__project_result_status=ProjectResultStatus.SUCCESS.value),
+        ),
+    ).order_by()
+    return {
+        project_member_project_result['member_id']: {
+            'success': project_member_project_result['success'],
+            'working': project_member_project_result['working'],
+            'leaved': project_member_project_result['leaved'],
+        }
+        for project_member_project_result in project_member_project_results
+    }
+
+
+def refresh_members_project_stats(member_ids: List[int]) -> None:
+    """
+    회원별 프로젝트 통계를 다시 집계해 저장합니다. 호출한 트랜잭션 안에서 반영됩니다.
+    """
+    member_ids = sorted(set(member_ids))
+    if not member_ids:
+        return
+    with transaction.atomic():
+        _lock_member_read_model_rows(MemberProjectStats, member_ids)
+        members_project_ongoing_info = aggregate_members_project_ongoing_info(member_ids)
+        MemberProjectStats.objects.bulk_create(
+            [
+                MemberProjectStats(
+                    member_id=member_id,
+                    success_count=members_project_ongoing_info.get(member_id, {}).get('success', 0),
+                    working_count=members_project_ongoing_info.get(member_id, {}).get('working', 0),
+                    leaved_count=members_project_ongoing_info.get(member_id, {}).get('leaved', 0),
+                )
+                for member_id in member_ids
+            ],
+            update_conflicts=True,
+            unique_fields=['member'],
+            update_fields=['success_count', 'working_count', 'leaved_count', 'updated_at'],
+        )
+
+
 def get_members_project_ongoing_info(member_ids: List[int]) -> defaultdict[int, dict[str, int]]:
-    project_members_project_results = ProjectMemberManagement.objects.filter(
-        member_id__in=member_ids
+    """
+    MemberProjectStats 에서 회원별 프로젝트 통계를 조회합니다. 통계가 없는 회원은 모두 0 입니다.
+    """
+    members_project_stats = MemberProjectStats.objects.filter(
+        member_id__in=member_ids,
     ).values(
         'member_id',
-        'project__project_result_status',
-        'project__project_status',
-        'left_status',
+        'success_count',
+        'working_count',
+        'leaved_count',
     )
     project_member_project_results = defaultdict(lambda: {'success': 0, 'working': 0, 'leaved': 0})
-    for project_member_project_result in project_members_project_results:
-        if project_member_project_result['left_status'] == ProjectMemberManagementLeftStatus.LEFT.value:
-            project_member_project_results[project_member_project_result['member_id']][
-                'leaved'
-            ] += 1
-        elif project_member_project_result['project__project_status'] == ProjectStatus.WORKING.value:
-            project_member_project_results[project_member_project_result['member_id']][
-                'working'
-            ] += 1
-            continue
-        elif project_member_project_result['project__project_result_status'] == ProjectResultStatus.SUCCESS.value:
-            project_member_project_results[project_member_project_result['member_id']][
-                'success'
-            ] += 1
+    for member_project_stats in members_project_stats:
+        project_member_project_results[member_project_stats['member_id']] = {
+            'success': member_project_stats['success_count'],
+            'working': member_project_stats['working_count'],
+            'leaved': member_project_stats['leaved_count'],
+        }
     return project_member_project_results
@@ -0,0 +1,107 @@
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+from member.consts import MemberStatusEnum
+from member.models import (
+    Guest,
+    Member,
+    MemberAttribute,
+    MemberExtraLink,
+    MemberInformation,
+    MemberJobExperience,
+)
+from member.services import (
+    invalidate_guest_principals,
+    invalidate_member_info_blocks,
+    refresh_members_profile_summary,
+    refresh_members_project_stats,
+    revoke_guest_tokens,
+)
+from project.models import (
+    Project,
+    ProjectMemberManagement,
+)
+
+# 회원 정보 블록의 소스 모델입니다. 변경되면 해당 회원의 블록 캐시를 무효화합니다.
+MEMBER_INFO_BLOCK_SOURCE_MODELS = (
+    MemberExtraLink,
+    MemberInformation,
+)
+
+# 회원 프로필 요약의 소스 모델입니다. 변경되면 같은 트랜잭션에서 요약을 다시 집계합니다.
+MEMBER_PROFILE_SUMMARY_SOURCE_MODELS = (
+    MemberAttribute,
+    MemberJobExperience,
+)
+
+
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def invalidate_member_info_block_on_member_change(sender, instance, update_fields=None, **kwargs):
+    # 로그인마다 last_login 만 저장되므로 블록에 포함되지 않는 필드 변경은 무시합니다.
+    if update_fields is not None and update_fields <= {'last_login'}:
+        return
+    invalidate_member_info_blocks([instance.id])
+
+
+@receiver(post_save, sender=Guest)
+@receiver(post_delete, sender=Guest)
+def invalidate_guest_principal_on_guest_change(sender, instance, **kwargs):
+    invalidate_guest_principals([instance.id])
+    # 접근할 수 없게 된 경우에만 이미 발급된 토큰을 폐기합니다.
+    if kwargs['signal'] is post_delete or instance.is_blacklisted:
+        revoke_guest_tokens([instance.id])
+
+
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def invalidate_guest_principal_on_member_change(sender, instance, created=False, update_fields=None, **kwargs):
+    # 인증 정보에는 회원 상태만 포함되므로 회원 상태를 저장하지 않는 경우는 무시합니다.
+    if created:
+        return
+    if update_fields is not None and not update_fields & {'member_status', 'member_status_id'}:
+        return
+    guest_ids = list(Guest.objects.filter(member_id=instance.id).values_list('id', flat=True))
+    invalidate_guest_principals(guest_ids)
+    if kwargs['signal'] is post_delete or instance.member_status_id != MemberStatusEnum.NORMAL_MEMBER.value:
+        revoke_guest_tokens(guest_ids)
+
+
+def invalidate_member_info_block_on_source_change(sender, instance, **kwargs):
+    invalidate_member_info_blocks([instance.member_id])
+
+
+for source_model in MEMBER_INFO_BLOCK_SOURCE_MODELS:
+    post_save.connect(invalidate_member_info_block_on_source_change, sender=source_model)
+    post_delete.connect(invalidate_member_info_block_on_source_change, sender=source_model)
+
+
+def refresh_member_profile_summary_on_source_change(sender, instance, **kwargs):
+    refresh_members_profile_summary([instance.member_id])
+    invalidate_member_info_blocks([instance.member_id])
+
+
+for source_model in MEMBER_PROFILE_SUMMARY_SOURCE_MODELS:
+    post_save.connect(refresh_member_profile_summary_on_source_change, sender=source_model)
+    post_delete.connect(refresh_member_profile_summary_on_source_change, sender=source_model)
+
+
+@receiver(post_save, sender=ProjectMemberManagement)
+@receiver(post_delete, sender=ProjectMemberManagement)
+def refresh_member_project_stats_on_project_member_change(sender, instance, **kwargs):
+    refresh_members_project_stats([instance.member_id])
+    invalidate_member_info_blocks([instance.member_id])
+
+
+@receiver(post_save, sender=Project)
+def refresh_member_project_stats_on_project_change(sender, instance, created, update_fields=None, **kwargs):
+    # 프로젝트 상태/결과는 참여 회원들의 프로젝트 통계에 집계됩니다.
+    if created:
+        return
+    if update_fields is not None and not update_fields & {'project_status', 'project_result_status'}:
+        return
+    member_ids = list(ProjectMemberManagement.objects.filter(project_id=instance.id).values_list('member_id', flat=True))
+    refresh_members_project_stats(member_ids)
+    invalidate_member_info_blocks(member_ids)
@@ -1,5 +1,6 @@
 from common.common_utils import send_email
 from config.celery import app
+from member.services import purge_stale_guests
 
 
 # send_welcome_email.apply_async(('cwadven@naver.com', 'nully')) 같이 사용
@@ -25,3 +26,8 @@ def send_one_time_token_email(email: str, one_time_token: str) -> None:
         },
         to=[email]
     )
+
+
+@app.task
+def compact_stale_guests() -> int:
+    return purge_stale_guests()
@@ -0,0 +1,40 @@
+from datetime import date
+from io import StringIO
+
+from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from django.core.management import call_command
+from django.test import TestCase
+from member.models import (
+    Member,
+    MemberJobExperience,
+    MemberProfileSummary,
+)
+
+
+class RebuildMemberProfileSummariesCommandTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.job = create_job_for_testcase('Developer')
+        MemberJobExperience.objects.create(
+            member=self.member,
+            job=self.job,
+            start_date=date(2020, 1, 1),
+            end_date=date(2021, 3, 1),
+        )
+
+    def test_rebuild_member_profile_summaries_command(self):
+        # Given: summary is lost
+        MemberProfileSummary.objects.all().delete()
+        out = StringIO()
+
+        # When: 커맨드를 실행합니다.
+        call_command('rebuild_member_profile_summaries', batch_size=1, stdout=out)
+
+        # Then: 요약이 다시 만들어집니다.
+        member_profile_summary = MemberProfileSummary.objects.get(member=self.member)
+        self.assertEqual(
+            [(job['job_id'], job['total_year'], job['total_month']) for job in member_profile_summary.job_experience_durations],
+            [(self.job.id, 1, 2)],
+        )
+        self.assertEqual(member_profile_summary.main_attributes, [])
+        self.assertIn('Successfully rebuilt profile summaries of 1 members', out.getvalue())
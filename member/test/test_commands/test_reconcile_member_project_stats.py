@@ -0,0 +1,73 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from member.models import (
+    Member,
+    MemberProjectStats,
+)
+from project.consts import (
+    ProjectResultStatus,
+    ProjectStatus,
+)
+from project.models import (
+    Project,
+    ProjectMemberManagement,
+)
+
+
+class ReconcileMemberProjectStatsCommandTest(TestCase):
+    def setUp(self):
+        self.member1 = Member.objects.create_user(username='test1', nickname='test1')
+        self.member2 = Member.objects.create_user(username='test2', nickname='test2')
+        self.member3 = Member.objects.create_user(username='test3', nickname='test3')
+        self.project = Project.objects.create(
+            title='Project',
+            created_member_id=self.member1.id,
+            project_status=ProjectStatus.WORKING.value,
+        )
+        for member in [self.member1, self.member2, self.member3]:
+            ProjectMemberManagement.objects.create(project=self.project, member=member)
+
+    def test_reconcile_member_project_stats_command(self):
+        # Given: project status is changed without signal
+        Project.objects.filter(id=self.project.id).update(
+            project_status=ProjectStatus.FINISHED.value,
+            project_result_status=ProjectResultStatus.SUCCESS.value,
+        )
+        # And: member3 stats is lost
+        MemberProjectStats.objects.filter(member=self.member3).delete()
+        out = StringIO()
+
+        # When: 커맨드를 실행합니다.
+        call_command('reconcile_member_project_stats', batch_size=2, stdout=out)
+
+        # Then: 모든 회원의 통계가 성공 1 로 맞춰집니다.
+        self.assertEqual(
+            list(
+                MemberProjectStats.objects.order_by(
+                    'member_id',
+                ).values_list(
+                    'member_id',
+                    'success_count',
+                    'working_count',
+                    'leaved_count',
+                )
+            ),
+            [
+                (self.member1.id, 1, 0, 0),
+                (self.member2.id, 1, 0, 0),
+                (self.member3.id, 1, 0, 0),
+            ],
+        )
+        self.assertIn('Successfully reconciled project stats of 3 members (3 fixed)', out.getvalue())
+
+    def test_reconcile_member_project_stats_command_should_not_fix_when_consistent(self):
+        # Given: consistent stats
+        out = StringIO()
+
+        # When: 커맨드를 실행합니다.
+        call_command('reconcile_member_project_stats', stdout=out)
+
+        # Then: 수정된 회원이 없습니다.
+        self.assertIn('Successfully reconciled project stats of 3 members (0 fixed)', out.getvalue())
@@ -1,6 +1,9 @@
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import (
+    TestCase,
+    override_settings,
+)
 from member.consts import (
     MemberStatusEnum,
     MemberTypeEnum,
@@ -142,3 +145,24 @@ class TestMemberManagerManager(TestCase):
 
         # Then:
         self.assertEqual(member, None)
+
+    @override_settings(SOCIAL_SIGN_UP_PROFILE_CACHE_ENABLED=True)
+    @patch('member.managers.SocialLoginHandler.validate')
+    def test_get_or_create_member_by_token_should_use_profile_of_failed_login(self, mock_validate):
+        # Given: login failed because member not exists
+        token = 'sign_up_token'
+        provider = 3
+        mock_validate.return_value = {
+            'id': 'test_id',
+            'email': 'test_email',
+            'nickname': 'test_nickname',
+        }
+        self.assertIsNone(Member.objects.get_member_by_token(token, provider))
+
+        # When: sign up with same token
+        member, is_created = Member.objects.get_or_create_member_by_token(token, provider)
+
+        # Then: provider is not called again
+        self.assertTrue(is_created)
+        self.assertEqual(member.username, 'test_id')
+        mock_validate.assert_called_once_with(token)
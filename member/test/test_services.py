@@ -1,13 +1,36 @@
-from datetime import date
+import time
+from datetime import (
+    date,
+    timedelta,
+)
 from unittest.mock import patch
 
 from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
 from common.common_testcase_helpers.member.testcase_helpers import create_member_attribute_type_for_testcase
+from common.common_utils.token_utils import jwt_payload_handler
 from common.models import (
     BlackListSection,
     BlackListWord,
 )
-from django.test import TestCase
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+from django_redis import get_redis_connection
+from member import services as member_services
+from member.consts import (
+    GUEST_IP_KEY_PREFIX,
+    GUEST_PRINCIPAL_KEY_PREFIX,
+    GUEST_STALE_PERIOD,
+    GUEST_TOKEN_RATE_LIMIT_COUNT,
+    GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX,
+    GUEST_TOKEN_REVOCATION_CLOCK_SKEW_SECONDS,
+    GUEST_TOKEN_REVOCATION_KEY,
+    GUEST_TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS,
+    MEMBER_INFO_BLOCK_KEY_PREFIX,
+    MemberStatusEnum,
+)
 from member.dtos.model_dtos import (
     JobExperience,
     MemberInfoBlock,
@@ -15,14 +38,18 @@ from member.dtos.model_dtos import (
     MemberMainAttribute,
 )
 from member.models import (
+    Guest,
     Member,
     MemberAttribute,
     MemberExtraLink,
     MemberInformation,
     MemberJobExperience,
+    MemberProjectStats,
 )
 from member.services import (
+    GuestTokenRevocationMirror,
     add_member_job_experiences,
+    aggregate_members_project_ongoing_info,
     check_email_exists,
     check_nickname_exists,
     check_nickname_valid,
@@ -31,11 +58,22 @@ from member.services import (
     check_username_exists,
     get_active_member_extra_link_qa,
     get_active_member_information_qs,
+    get_authenticated_guest,
+    get_guest_from_token_claims,
     get_member_info_block,
+    get_member_info_blocks,
     get_members_job_experience_durations,
     get_members_main_attributes_with_sort,
+    get_members_profile_summary,
     get_members_project_ongoing_info,
+    get_or_create_ip_guest,
+    guest_token_revocation_mirror,
+    is_guest_token_rate_limited,
+    purge_stale_guests,
+    refresh_members_project_stats,
+    revoke_guest_tokens,
 )
+from point.models import GuestPoint
 from project.consts import (
     ProjectMemberManagementLeftStatus,
     ProjectResultStatus,
@@ -49,6 +87,7 @@ from project.models import (
     ProjectRecruitment,
     ProjectRecruitmentJob,
 )
+from redis.exceptions import RedisError
 
 
 class MemberCheckMemberInfoTestCase(TestCase):
@@ -277,6 +316,78 @@ class GetMembersProjectOngoingInfoTest(TestCase):
             }
         )
 
+    def test_get_members_project_ongoing_info_should_read_stats_only(self):
+        # Given: Set Working Project Status
+        self.project.project_status = ProjectStatus.WORKING.value
+        self.project.save()
+
+        # When: get_members_project_ongoing_info
+        # Then: stats rows only
+        with self.assertNumQueries(1):
+            result = get_members_project_ongoing_info([self.member1.id, self.project_master.id])
+        self.assertEqual(result[self.member1.id], {'success': 0, 'working': 1, 'leaved': 0})
+        # And: member without stats has nothing
+        self.assertEqual(
+            get_members_project_ongoing_info([self.project_master.id + 1000])[self.project_master.id + 1000],
+            {'success': 0, 'working': 0, 'leaved': 0},
+        )
+
+
+class RefreshMembersProjectStatsTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.projects = [
+            Project.objects.create(
+                title=f'Project {i}',
+                created_member_id=self.member.id,
+            )
+            for i in range(3)
+        ]
+        for project in self.projects:
+            ProjectMemberManagement.objects.create(project=project, member=self.member)
+
+    def test_aggregate_members_project_ongoing_info(self):
+        # Given: working, success and left projects
+        Project.objects.filter(id=self.projects[0].id).update(project_status=ProjectStatus.WORKING.value)
+        Project.objects.filter(id=self.projects[1].id).update(project_result_status=ProjectResultStatus.SUCCESS.value)
+        ProjectMemberManagement.objects.filter(project=self.projects[2]).update(
+            left_status=ProjectMemberManagementLeftStatus.LEFT.value,
+        )
+
+        # When: aggregate_members_project_ongoing_info
+        result = aggregate_members_project_ongoing_info([self.member.id])
+
+        # Then: one of each
+        self.assertEqual(result, {self.member.id: {'success': 1, 'working': 1, 'leaved': 1}})
+
+    def test_refresh_members_project_stats(self):
+        # Given: project status is changed without signal
+        Project.objects.filter(id=self.projects[0].id).update(project_status=ProjectStatus.WORKING.value)
+        self.assertEqual(get_members_project_ongoing_info([self.member.id])[self.member.id]['working'], 0)
+
+        # When: refresh_members_project_stats
+        refresh_members_project_stats([self.member.id])
+
+        # Then: stats is refreshed
+        self.assertEqual(
+            get_members_project_ongoing_info([self.member.id])[self.member.id],
+            {'success': 0, 'working': 1, 'leaved': 0},
+        )
+
+    def test_project_member_left_should_refresh_stats(self):
+        # Given: project member
+        project_member_management = ProjectMemberManagement.objects.get(project=self.projects[0])
+
+        # When: member left
+        project_member_management.left_status = ProjectMemberManagementLeftStatus.LEFT.value
+        project_member_management.save()
+
+        # Then: stats is refreshed in same transaction
+        self.assertEqual(
+            MemberProjectStats.objects.filter(member=self.member).values_list('leaved_count', flat=True).get(),
+            1,
+        )
+
 
 class GetMembersMainAttributesWithSortTest(TestCase):
     def setUp(self):
@@ -398,6 +509,90 @@ class GetMembersJobExperienceDurationsTestCase(TestCase):
         )
 
 
+class MemberProfileSummaryTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.job1 = create_job_for_testcase('Developer')
+        self.job2 = create_job_for_testcase('Designer')
+        self.member_attribute_types = [create_member_attribute_type_for_testcase(f'type{i}') for i in range(4)]
+        for value, member_attribute_type in enumerate(self.member_attribute_types):
+            MemberAttribute.objects.create(
+                member=self.member,
+                member_attribute_type=member_attribute_type,
+                value=value,
+            )
+        MemberJobExperience.objects.create(
+            member=self.member,
+            job=self.job1,
+            start_date=date(2020, 1, 1),
+            end_date=date(2021, 1, 1),
+        )
+
+    def test_get_members_profile_summary_should_read_summary_only(self):
+        # Given: summary is refreshed by signals
+        # When: get_members_profile_summary
+        # Then: summary row only
+        with self.assertNumQueries(1):
+            result = get_members_profile_summary([self.member.id])
+
+        # And: top 3 attributes by value
+        self.assertEqual(
+            [attribute['member_attribute_type_id'] for attribute in result[self.member.id]['main_attributes']],
+            [member_attribute_type.id for member_attribute_type in reversed(self.member_attribute_types[1:])],
+        )
+        self.assertEqual(
+            result[self.member.id]['job_experience_durations'],
+            [{'job_id': self.job1.id, 'display_name': self.job1.display_name, 'total_year': 1, 'total_month': 0}],
+        )
+
+    def test_get_members_profile_summary_should_resolve_ongoing_job_experience(self):
+        # Given: ongoing job experience
+        MemberJobExperience.objects.create(
+            member=self.member,
+            job=self.job2,
+            start_date=date(2020, 1, 1),
+        )
+
+        # When: get_members_profile_summary
+        result = get_members_profile_summary([self.member.id])
+
+        # Then: ongoing duration is same as live calculation
+        self.assertEqual(
+            result[self.member.id]['job_experience_durations'],
+            get_members_job_experience_durations([self.member.id])[self.member.id],
+        )
+
+    def test_refresh_members_profile_summary_on_attribute_change(self):
+        # Given: member attribute of lowest value
+        member_attribute = MemberAttribute.objects.get(
+            member=self.member,
+            member_attribute_type=self.member_attribute_types[0],
+        )
+
+        # When: value becomes highest
+        member_attribute.value = 100
+        member_attribute.save()
+
+        # Then: summary is refreshed
+        self.assertEqual(
+            get_members_profile_summary([self.member.id])[self.member.id]['main_attributes'][0]['member_attribute_type_id'],
+            self.member_attribute_types[0].id,
+        )
+
+    def test_add_member_job_experiences_should_refresh_summary(self):
+        # Given: job experience
+        job_experiences = [JobExperience(job_id=self.job2.id, start_date=date(2020, 1, 1), end_date=date(2020, 7, 1))]
+
+        # When: add_member_job_experiences (bulk_create)
+        add_member_job_experiences(self.member.id, job_experiences)
+
+        # Then: summary is refreshed
+        self.assertEqual(
+            [job['job_id'] for job in get_members_profile_summary([self.member.id])[self.member.id]['job_experience_durations']],
+            [self.job1.id, self.job2.id],
+        )
+
+
 class GetActiveMemberInformationQuerySetTestCase(TestCase):
 
     def setUp(self):
@@ -513,49 +708,8 @@ class GetMemberInfoBlockTestCase(TestCase):
             left_status=None,
         )
 
-    @patch('member.services.get_members_project_ongoing_info')
-    @patch('member.services.get_members_job_experience_durations')
-    @patch('member.services.get_members_main_attributes_with_sort')
-    @patch('member.services.get_active_member_extra_link_qa')
-    @patch('member.services.get_active_member_information_qs')
-    def test_get_member_info_block(self,
-                                   mock_get_active_member_information_qs,
-                                   mock_get_active_member_extra_link_qa,
-                                   mock_get_members_main_attributes_with_sort,
-                                   mock_get_members_job_experience_durations,
-                                   mock_get_members_project_ongoing_info):
-        # Given: Mocking
-        mock_get_active_member_information_qs.return_value = MemberInformation.objects.filter(
-            member_id=self.member1.id,
-            is_deleted=False,
-        )
-        mock_get_active_member_extra_link_qa.return_value = MemberExtraLink.objects.filter(
-            member_id=self.member1.id,
-            is_deleted=False,
-        )
-        mock_get_members_main_attributes_with_sort.return_value = {
-            self.member1.id: [
-                {
-                    'member_attribute_type_id': self.member_attribute_type_kind.id,
-                    'display_name': self.member_attribute_type_kind.display_name,
-                    'value': 4,
-                },
-                {
-                    'member_attribute_type_id': self.member_attribute_type_help.id,
-                    'display_name': self.member_attribute_type_help.display_name,
-                    'value': 2,
-                },
-            ]
-        }
-        mock_get_members_job_experience_durations.return_value = {
-            self.member1.id: [
-                {'job_id': self.job1.id, 'display_name': self.job1.display_name, 'total_year': 1, 'total_month': 11},
-            ]
-        }
-        mock_get_members_project_ongoing_info.return_value = {
-            self.member1.id: {'success': 1, 'working': 0, 'leaved': 0},
-        }
-
+    def test_get_member_info_block(self):
+        # Given: member1 with information, links, attributes, job experiences and success project
         # When:
         member_info_block = get_member_info_block(self.member1.id)
 
@@ -598,12 +752,6 @@ class GetMemberInfoBlockTestCase(TestCase):
                 )
             ],
         )
-        # And: Mocking Check
-        mock_get_active_member_information_qs.assert_called_once_with(member_id=self.member1.id)
-        mock_get_active_member_extra_link_qa.assert_called_once_with(member_id=self.member1.id)
-        mock_get_members_main_attributes_with_sort.assert_called_once_with([self.member1.id])
-        mock_get_members_job_experience_durations.assert_called_once_with([self.member1.id])
-        mock_get_members_project_ongoing_info.assert_called_once_with([self.member1.id])
 
     def test_get_member_info_block_when_member_information_is_none(self):
         # Given: Mocking as Member Information is None
@@ -669,3 +817,459 @@ class GetMemberInfoBlockTestCase(TestCase):
             member_info_block.member_job_experiences,
             None,
         )
+
+    def test_get_member_info_block_when_member_not_exists(self):
+        # Given: Not existing member id
+        # When: get_member_info_block
+        # Then: Member.DoesNotExist
+        with self.assertRaises(Member.DoesNotExist):
+            get_member_info_block(self.member1.id + 1000)
+
+
+class GetMemberInfoBlocksTestCase(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.job = create_job_for_testcase('Developer')
+        self.members = []
+        for i in range(3):
+            member = Member.objects.create_user(username=f'test{i}', nickname=f'test{i}')
+            MemberInformation.objects.create(member=member, description=f'old{i}')
+            MemberInformation.objects.create(member=member, description=f'new{i}')
+            MemberExtraLink.objects.create(member=member, url=f'second{i}', sequence=2)
+            MemberExtraLink.objects.create(member=member, url=f'first{i}', sequence=1)
+            MemberJobExperience.objects.create(
+                member=member,
+                job=self.job,
+                start_date=date(2020, 1, 1),
+                end_date=date(2021, 1, 1),
+            )
+            self.members.append(member)
+        self.member_ids = [member.id for member in self.members]
+        self.redis.delete(*[f'{MEMBER_INFO_BLOCK_KEY_PREFIX}:{member_id}' for member_id in self.member_ids])
+
+    def test_get_member_info_blocks_should_query_once_per_source(self):
+        # Given: 3 members
+        # When: get_member_info_blocks
+        # Then: one query per source (member, information, link, profile summary, project stats)
+        with self.assertNumQueries(5):
+            member_info_block_by_member_id = get_member_info_blocks(self.member_ids + [self.member_ids[0] + 1000])
+
+        # And: not existing member is excluded
+        self.assertEqual(list(member_info_block_by_member_id), self.member_ids)
+        # And: latest information and first link of each member
+        self.assertEqual(
+            [
+                (member_info_block.simple_description, member_info_block.link)
+                for member_info_block in member_info_block_by_member_id.values()
+            ],
+            [(f'new{i}', f'first{i}') for i in range(3)],
+        )
+        self.assertEqual(
+            member_info_block_by_member_id[self.member_ids[0]].project_info,
+            ProjectOngoingInfo(success=0, working=0, leaved=0),
+        )
+
+    @override_settings(MEMBER_INFO_BLOCK_CACHE_ENABLED=True)
+    def test_get_member_info_blocks_should_not_query_when_cached(self):
+        # Given: cached member info blocks
+        get_member_info_blocks(self.member_ids)
+
+        # When: get_member_info_blocks
+        # Then: no query
+        with self.assertNumQueries(0):
+            member_info_block_by_member_id = get_member_info_blocks(self.member_ids)
+        self.assertEqual(member_info_block_by_member_id[self.member_ids[0]].nickname, 'test0')
+
+    @override_settings(MEMBER_INFO_BLOCK_CACHE_ENABLED=True)
+    def test_get_member_info_blocks_should_be_invalidated_by_source_change(self):
+        # Given: cached member info blocks
+        get_member_info_blocks(self.member_ids)
+
+        # When: member information of member0 is created
+        with self.captureOnCommitCallbacks(execute=True):
+            MemberInformation.objects.create(member=self.members[0], description='changed')
+
+        # Then: only member0 is loaded again
+        with self.assertNumQueries(5):
+            member_info_block_by_member_id = get_member_info_blocks(self.member_ids)
+        self.assertEqual(member_info_block_by_member_id[self.member_ids[0]].simple_description, 'changed')
+        self.assertEqual(member_info_block_by_member_id[self.member_ids[1]].simple_description, 'new1')
+
+    @override_settings(MEMBER_INFO_BLOCK_CACHE_ENABLED=True)
+    def test_get_member_info_blocks_should_be_invalidated_by_project_status_change(self):
+        # Given: member0 is working on project
+        project = Project.objects.create(
+            title='Project',
+            created_member_id=self.member_ids[0],
+            project_status=ProjectStatus.WORKING.value,
+        )
+        ProjectMemberManagement.objects.create(project=project, member=self.members[0])
+        # And: cached member info blocks
+        get_member_info_blocks(self.member_ids)
+
+        # When: project is finished with success
+        with self.captureOnCommitCallbacks(execute=True):
+            project.project_status = ProjectStatus.FINISHED.value
+            project.project_result_status = ProjectResultStatus.SUCCESS.value
+            project.save()
+
+        # Then: project info of member0 is changed
+        self.assertEqual(
+            get_member_info_blocks(self.member_ids)[self.member_ids[0]].project_info,
+            ProjectOngoingInfo(success=1, working=0, leaved=0),
+        )
+
+    @override_settings(MEMBER_INFO_BLOCK_CACHE_ENABLED=True)
+    def test_get_member_info_blocks_should_not_cache_when_invalidated_while_querying(self):
+        # Given: member information of member0 is created right after the db query
+        get_member_info_blocks_from_db = member_services._get_member_info_blocks_from_db
+
+        def _get_member_info_blocks_from_db_then_change(member_ids):
+            member_info_block_by_member_id = get_member_info_blocks_from_db(member_ids)
+            with self.captureOnCommitCallbacks(execute=True):
+                MemberInformation.objects.create(member=self.members[0], description='changed')
+            return member_info_block_by_member_id
+
+        # When: get_member_info_blocks
+        with patch.object(
+            member_services,
+            '_get_member_info_blocks_from_db',
+            side_effect=_get_member_info_blocks_from_db_then_change,
+        ):
+            get_member_info_blocks(self.member_ids)
+
+        # Then: stale member0 block is not cached, the others are
+        self.assertIsNone(self.redis.get(f'{MEMBER_INFO_BLOCK_KEY_PREFIX}:{self.member_ids[0]}'))
+        self.assertIsNotNone(self.redis.get(f'{MEMBER_INFO_BLOCK_KEY_PREFIX}:{self.member_ids[1]}'))
+        self.assertEqual(get_member_info_blocks(self.member_ids)[self.member_ids[0]].simple_description, 'changed')
+
+
+@override_settings(GUEST_PRINCIPAL_CACHE_ENABLED=True)
+class GetAuthenticatedGuestTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(
+            username='test',
+            nickname='test',
+            member_status_id=MemberStatusEnum.NORMAL_MEMBER.value,
+        )
+        self.guest = Guest.objects.create(temp_nickname='guest-test', member=self.member)
+        self.redis = get_redis_connection('default')
+        self.redis.delete(f'{GUEST_PRINCIPAL_KEY_PREFIX}:{self.guest.id}')
+
+    def test_get_authenticated_guest_should_not_query_when_cached(self):
+        # Given: cached guest principal
+        with self.assertNumQueries(1):
+            get_authenticated_guest(self.guest.id)
+
+        # When: get_authenticated_guest
+        # Then: no query for authentication fields
+        with self.assertNumQueries(0):
+            guest = get_authenticated_guest(self.guest.id)
+            self.assertEqual(guest.id, self.guest.id)
+            self.assertFalse(guest.is_blacklisted)
+            self.assertEqual(guest.member.id, self.member.id)
+            self.assertEqual(guest.member.member_status_id, MemberStatusEnum.NORMAL_MEMBER.value)
+        # And: other fields are loaded when accessed
+        with self.assertNumQueries(1):
+            self.assertEqual(guest.member.nickname, 'test')
+
+    def test_get_authenticated_guest_should_return_none_when_not_exists(self):
+        # Given: not exists guest id
+        # When: get_authenticated_guest
+        # Then: None
+        self.assertIsNone(get_authenticated_guest(0))
+
+    def test_get_authenticated_guest_should_be_invalidated_by_blacklist(self):
+        # Given: cached guest principal
+        get_authenticated_guest(self.guest.id)
+
+        # When: guest is blacklisted
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.is_blacklisted = True
+            self.guest.save()
+
+        # Then: blacklisted
+        self.assertTrue(get_authenticated_guest(self.guest.id).is_blacklisted)
+
+    def test_get_authenticated_guest_should_be_invalidated_by_member_status(self):
+        # Given: cached guest principal
+        get_authenticated_guest(self.guest.id)
+
+        # When: member status is changed
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.member_status_id = MemberStatusEnum.BLACK_MEMBER.value
+            self.member.save(update_fields=['member_status'])
+
+        # Then: member status is changed
+        self.assertEqual(
+            get_authenticated_guest(self.guest.id).member.member_status_id,
+            MemberStatusEnum.BLACK_MEMBER.value,
+        )
+
+    def test_get_authenticated_guest_should_not_be_invalidated_by_last_login(self):
+        # Given: cached guest principal
+        get_authenticated_guest(self.guest.id)
+
+        # When: only last_login is saved
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.member.save(update_fields=['last_login'])
+
+        # Then: no invalidation
+        self.assertEqual(len(callbacks), 0)
+        self.assertIsNotNone(self.redis.get(f'{GUEST_PRINCIPAL_KEY_PREFIX}:{self.guest.id}'))
+
+
+class GuestTokenRevocationMirrorTestCase(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.redis.delete(GUEST_TOKEN_REVOCATION_KEY)
+        self.mirror = GuestTokenRevocationMirror()
+
+    def test_is_revoked_should_compare_issued_at(self):
+        # Given: guest 1 tokens are revoked by other worker
+        issued_at = time.time()
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_guest_tokens([1])
+
+        # When: is_revoked
+        # Then: token issued before revocation is revoked
+        self.assertTrue(self.mirror.is_revoked(1, issued_at))
+        # And: token issued after revocation is not revoked
+        self.assertFalse(self.mirror.is_revoked(1, time.time() + GUEST_TOKEN_REVOCATION_CLOCK_SKEW_SECONDS + 1))
+        # And: other guest token is not revoked
+        self.assertFalse(self.mirror.is_revoked(2, issued_at))
+
+    def test_refresh_should_read_new_revocations_after_sync_interval(self):
+        # Given: synced mirror
+        issued_at = time.time()
+        self.mirror.refresh()
+        # And: revocation
+        self.redis.zadd(GUEST_TOKEN_REVOCATION_KEY, {1: time.time()})
+
+        # When: sync interval is not passed
+        # Then: not revoked yet
+        self.assertFalse(self.mirror.is_revoked(1, issued_at))
+
+        # When: sync interval is passed
+        self.mirror.synced_at -= GUEST_TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS
+
+        # Then: revoked
+        self.assertTrue(self.mirror.is_revoked(1, issued_at))
+
+    def test_is_revoked_should_be_true_when_redis_error(self):
+        # Given: redis error
+        with patch('member.services.get_redis_connection', side_effect=RedisError):
+            # When: is_revoked
+            # Then: revoked
+            self.assertTrue(self.mirror.is_revoked(1, time.time()))
+
+
+@override_settings(GUEST_TOKEN_CLAIMS_ENABLED=True)
+class GetGuestFromTokenClaimsTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(
+            username='test',
+            nickname='test',
+            member_status_id=MemberStatusEnum.NORMAL_MEMBER.value,
+        )
+        self.guest = Guest.objects.create(temp_nickname='guest-test', member=self.member)
+        get_redis_connection('default').delete(GUEST_TOKEN_REVOCATION_KEY)
+        guest_token_revocation_mirror.reset()
+        self.payload = jwt_payload_handler(self.guest)
+
+    def test_get_guest_from_token_claims_should_not_query(self):
+        # Given: token payload
+        # When: get_guest_from_token_claims
+        # Then: no query for authentication fields
+        with self.assertNumQueries(0):
+            guest = get_guest_from_token_claims(self.payload)
+            self.assertEqual(guest.id, self.guest.id)
+            self.assertFalse(guest.is_blacklisted)
+            self.assertEqual(guest.member.id, self.member.id)
+            self.assertEqual(guest.member.member_status_id, MemberStatusEnum.NORMAL_MEMBER.value)
+
+    def test_get_guest_from_token_claims_should_return_none_when_claims_not_exist(self):
+        # Given: token payload without claims
+        payload = {'guest_id': self.guest.id, 'member_id': self.member.id}
+
+        # When: get_guest_from_token_claims
+        # Then: None
+        self.assertIsNone(get_guest_from_token_claims(payload))
+
+    def test_get_guest_from_token_claims_should_return_none_when_blacklisted(self):
+        # Given: blacklisted token payload
+        payload = {**self.payload, 'is_blacklisted': True}
+
+        # When: get_guest_from_token_claims
+        # Then: None
+        self.assertIsNone(get_guest_from_token_claims(payload))
+
+    def test_get_guest_from_token_claims_should_return_none_when_guest_blacklisted(self):
+        # When: guest is blacklisted after token is issued
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.is_blacklisted = True
+            self.guest.save()
+
+        # Then: None
+        self.assertIsNone(get_guest_from_token_claims(self.payload))
+
+    def test_get_guest_from_token_claims_should_return_none_when_member_status_changed(self):
+        # When: member status is changed after token is issued
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.member_status_id = MemberStatusEnum.BLACK_MEMBER.value
+            self.member.save(update_fields=['member_status'])
+
+        # Then: None
+        self.assertIsNone(get_guest_from_token_claims(self.payload))
+
+    def test_guest_change_should_not_revoke_when_accessible(self):
+        # When: guest is saved without blacklist
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.temp_nickname = 'changed'
+            self.guest.save()
+
+        # Then: token claims are still used
+        self.assertIsNotNone(get_guest_from_token_claims(self.payload))
+
+
+class GetOrCreateIpGuestTestCase(TestCase):
+    def setUp(self):
+        self.ip = '111.111.111.111'
+        get_redis_connection('default').delete(f'{GUEST_IP_KEY_PREFIX}:{self.ip}')
+
+    def test_get_or_create_ip_guest_should_reuse_latest_memberless_guest(self):
+        # Given: memberless guests and member guest of ip
+        Guest.objects.create(temp_nickname='guest-1', ip=self.ip)
+        latest_guest = Guest.objects.create(temp_nickname='guest-2', ip=self.ip)
+        member = Member.objects.create_user(username='test', nickname='test')
+        Guest.objects.create(temp_nickname='guest-3', ip=self.ip, member=member)
+
+        # When: get_or_create_ip_guest
+        guest = get_or_create_ip_guest(self.ip)
+
+        # Then: latest memberless guest
+        self.assertEqual(guest.id, latest_guest.id)
+
+    def test_get_or_create_ip_guest_should_create_guest(self):
+        # Given: no guest of ip
+        # When: get_or_create_ip_guest
+        guest = get_or_create_ip_guest(self.ip)
+
+        # Then: guest is created
+        self.assertEqual(Guest.objects.get(ip=self.ip).id, guest.id)
+
+    def test_get_or_create_ip_guest_should_update_last_joined_at_once_a_day(self):
+        # Given: guest joined 2 days ago
+        guest = Guest.objects.create(temp_nickname='guest-1', ip=self.ip)
+        Guest.objects.filter(id=guest.id).update(last_joined_at=timezone.now() - timedelta(days=2))
+
+        # When: get_or_create_ip_guest
+        get_or_create_ip_guest(self.ip)
+
+        # Then: last_joined_at is updated
+        guest.refresh_from_db()
+        self.assertGreater(guest.last_joined_at, timezone.now() - timedelta(days=1))
+        # And: not updated again within a day
+        with self.assertNumQueries(1):
+            get_or_create_ip_guest(self.ip)
+
+    @override_settings(GUEST_IP_CACHE_ENABLED=True, GUEST_PRINCIPAL_CACHE_ENABLED=True)
+    def test_get_or_create_ip_guest_should_not_query_when_cached(self):
+        # Given: cached ip guest
+        guest = Guest.objects.create(temp_nickname='guest-1', ip=self.ip)
+        get_redis_connection('default').delete(f'{GUEST_PRINCIPAL_KEY_PREFIX}:{guest.id}')
+        get_or_create_ip_guest(self.ip)
+        get_or_create_ip_guest(self.ip)
+
+        # When: get_or_create_ip_guest
+        # Then: no query
+        with self.assertNumQueries(0):
+            self.assertEqual(get_or_create_ip_guest(self.ip).id, guest.id)
+
+    @override_settings(GUEST_IP_CACHE_ENABLED=True)
+    def test_get_or_create_ip_guest_should_not_reuse_cached_guest_linked_to_member(self):
+        # Given: cached ip guest
+        guest = Guest.objects.create(temp_nickname='guest-1', ip=self.ip)
+        get_or_create_ip_guest(self.ip)
+        # And: guest is linked to member
+        guest.member = Member.objects.create_user(username='test', nickname='test')
+        guest.save()
+
+        # When: get_or_create_ip_guest
+        new_guest = get_or_create_ip_guest(self.ip)
+
+        # Then: new guest is created
+        self.assertNotEqual(new_guest.id, guest.id)
+        self.assertIsNone(new_guest.member_id)
+
+
+@override_settings(GUEST_TOKEN_RATE_LIMIT_ENABLED=True)
+class IsGuestTokenRateLimitedTestCase(TestCase):
+    def setUp(self):
+        self.ip = '111.111.111.111'
+        self.redis = get_redis_connection('default')
+        for key in self.redis.keys(f'{GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX}:*'):
+            self.redis.delete(key)
+
+    def test_is_guest_token_rate_limited(self):
+        # Given: requests up to limit
+        for _ in range(GUEST_TOKEN_RATE_LIMIT_COUNT):
+            self.assertFalse(is_guest_token_rate_limited(self.ip))
+
+        # When: request over limit
+        # Then: rate limited
+        self.assertTrue(is_guest_token_rate_limited(self.ip))
+        # And: other ip is not rate limited
+        self.assertFalse(is_guest_token_rate_limited('222.222.222.222'))
+
+    def test_is_guest_token_rate_limited_should_be_false_when_redis_error(self):
+        # Given: redis error
+        with patch('member.services.get_redis_connection', side_effect=RedisError):
+            # When: is_guest_token_rate_limited
+            # Then: not rate limited
+            self.assertFalse(is_guest_token_rate_limited(self.ip))
+
+
+class PurgeStaleGuestsTestCase(TestCase):
+    def _create_guest(self, temp_nickname: str, is_stale: bool = True, **kwargs) -> Guest:
+        guest = Guest.objects.create(temp_nickname=temp_nickname, **kwargs)
+        if is_stale:
+            Guest.objects.filter(
+                id=guest.id,
+            ).update(
+                last_joined_at=timezone.now() - GUEST_STALE_PERIOD - timedelta(days=1),
+            )
+        return guest
+
+    def test_purge_stale_guests(self):
+        # Given: stale memberless guests
+        stale_guests = [self._create_guest(f'stale-{i}') for i in range(5)]
+        # And: recent guest
+        recent_guest = self._create_guest('recent', is_stale=False)
+        # And: stale member guest
+        member_guest = self._create_guest('member', member=Member.objects.create_user(username='test', nickname='test'))
+        # And: stale guest with point
+        point_guest = self._create_guest('point')
+        GuestPoint.objects.create(guest=point_guest, point=100, reason='test 포인트 지급')
+
+        # When: purge_stale_guests by 2
+        purged_count = purge_stale_guests(batch_size=2)
+
+        # Then: only unreferenced stale memberless guests are purged
+        self.assertEqual(purged_count, len(stale_guests))
+        self.assertFalse(Guest.objects.filter(id__in=[guest.id for guest in stale_guests]).exists())
+        self.assertEqual(
+            Guest.objects.filter(id__in=[recent_guest.id, member_guest.id, point_guest.id]).count(),
+            3,
+        )
+
+    def test_purge_stale_guests_should_stop_at_max_batch_count(self):
+        # Given: stale memberless guests
+        for i in range(5):
+            self._create_guest(f'stale-{i}')
+
+        # When: purge_stale_guests by 2 with max batch count 1
+        purged_count = purge_stale_guests(batch_size=2, max_batch_count=1)
+
+        # Then: only one batch is purged
+        self.assertEqual(purged_count, 2)
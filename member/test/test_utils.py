@@ -1,17 +1,31 @@
 import json
+import time
 from datetime import datetime
 from unittest.mock import (
     Mock,
     patch,
 )
 
+import jwt
+from common.common_testcase_helpers.http_stub_server import (
+    HttpStubServer,
+    StubResponse,
+)
+from cryptography.hazmat.primitives.asymmetric import rsa
 from django.conf import settings
-from django.test import TestCase
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django_redis import get_redis_connection
+from jwt.algorithms import RSAAlgorithm
 from member.exceptions import LoginFailedException, SocialLoginTokenErrorException
 from member.utils.social_utils import (
     GoogleSocialLoginModule,
+    JsonWebKeySet,
     KakaoSocialLoginModule,
     NaverSocialLoginModule,
+    SOCIAL_SIGN_UP_PROFILE_KEY_PREFIX,
     SocialLoginHandler,
     SocialLoginModule,
 )
@@ -42,9 +56,9 @@ class ExampleSocialLoginModule(SocialLoginModule):
 
 
 class TestSocialLoginModule(TestCase):
-    @patch('member.utils.social_utils.requests.post')
+    @patch('member.utils.social_utils.http_client.post')
     def test_get_access_token_by_code_success(self, mock_post):
-        # Given: Mock the response from requests.post
+        # Given: Mock the response from http_client.post
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = '{"access_token": "fake_access_token"}'
@@ -56,9 +70,9 @@ class TestSocialLoginModule(TestCase):
         # Then: Assert that the access token is returned correctly
         self.assertEqual(access_token, "fake_access_token")
 
-    @patch('member.utils.social_utils.requests.post')
+    @patch('member.utils.social_utils.http_client.post')
     def test_get_access_token_by_code_failure(self, mock_post):
-        # Given: Mock the response from requests.post
+        # Given: Mock the response from http_client.post
         mock_response = Mock()
         mock_response.status_code = 400  # Simulate a failure status code
         mock_post.return_value = mock_response
@@ -67,9 +81,9 @@ class TestSocialLoginModule(TestCase):
         with self.assertRaises(LoginFailedException):
             ExampleSocialLoginModule().get_access_token_by_code('code')
 
-    @patch('member.utils.social_utils.requests.post')
+    @patch('member.utils.social_utils.http_client.post')
     def test_get_access_token_by_code_missing_token(self, mock_post):
-        # Given: Mock the response from requests.post
+        # Given: Mock the response from http_client.post
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = '{"some_other_field": "value"}'  # Missing 'access_token'
@@ -307,9 +321,9 @@ class TestKakaoSocialLoginModule(TestCase):
         # Then: None should be returned as 'profile' or 'nickname' is missing
         self.assertEqual(name, None)
 
-    @patch('member.utils.social_utils.requests.get')
+    @patch('member.utils.social_utils.http_client.get')
     def test_get_user_info_with_access_token_successful(self, mock_requests_get):
-        # Given: Mock successful response from the requests.get method
+        # Given: Mock successful response from the http_client.get method
         access_token = 'valid_access_token'
         mock_response = Mock()
         mock_response.status_code = 200
@@ -340,9 +354,9 @@ class TestKakaoSocialLoginModule(TestCase):
         self.assertEqual(user_info['name'], 'JohnDoe')
         self.assertIsNone(user_info['nickname'])
 
-    @patch('member.utils.social_utils.requests.get')
+    @patch('member.utils.social_utils.http_client.get')
     def test_get_user_info_with_access_token_failed(self, mock_requests_get):
-        # Given: Mock failed response from the requests.get method
+        # Given: Mock failed response from the http_client.get method
         access_token = 'invalid_access_token'
         mock_response = Mock()
         mock_response.status_code = 401  # Unauthorized
@@ -509,9 +523,9 @@ class TestNaverSocialLoginModule(TestCase):
         # Then: None should be returned as missing
         self.assertEqual(name, None)
 
-    @patch('member.utils.social_utils.requests.get')
+    @patch('member.utils.social_utils.http_client.get')
     def test_get_user_info_with_access_token_successful(self, mock_requests_get):
-        # Given: Mock successful response from the requests.get method
+        # Given: Mock successful response from the http_client.get method
         access_token = 'valid_access_token'
         mock_response = Mock()
         mock_response.status_code = 200
@@ -540,9 +554,9 @@ class TestNaverSocialLoginModule(TestCase):
         self.assertEqual(user_info['name'], 'JohnDoe')
         self.assertIsNone(user_info['nickname'])
 
-    @patch('member.utils.social_utils.requests.get')
+    @patch('member.utils.social_utils.http_client.get')
     def test_get_user_info_with_access_token_failed(self, mock_requests_get):
-        # Given: Mock failed response from the requests.get method
+        # Given: Mock failed response from the http_client.get method
         access_token = 'invalid_access_token'
         mock_response = Mock()
         mock_response.status_code = 401  # Unauthorized
@@ -597,9 +611,9 @@ class TestGoogleSocialLoginModule(TestCase):
         # Expected:
         self.assertEqual(self.social_login_module.username_prefix, 'google_')
 
-    @patch('member.utils.social_utils.requests.get')
+    @patch('member.utils.social_utils.http_client.get')
     def test_get_user_info_with_access_token_successful(self, mock_requests_get):
-        # Given: Mock successful response from the requests.get method
+        # Given: Mock successful response from the http_client.get method
         access_token = 'valid_access_token'
         mock_response = Mock()
         mock_response.status_code = 200
@@ -621,9 +635,9 @@ class TestGoogleSocialLoginModule(TestCase):
         self.assertEqual(user_info['name'], 'John Doe')
         self.assertIsNone(user_info['nickname'])
 
-    @patch('member.utils.social_utils.requests.get')
+    @patch('member.utils.social_utils.http_client.get')
     def test_get_user_info_with_access_token_failed(self, mock_requests_get):
-        # Given: Mock failed response from the requests.get method
+        # Given: Mock failed response from the http_client.get method
         access_token = 'invalid_access_token'
         mock_response = Mock()
         mock_response.status_code = 401  # Unauthorized
@@ -634,6 +648,29 @@ class TestGoogleSocialLoginModule(TestCase):
         with self.assertRaises(LoginFailedException):
             self.social_login_module.get_user_info_with_access_token(access_token)
 
+    def test_get_user_info_with_access_token_with_stub_server(self):
+        with HttpStubServer() as stub_server:
+            # Given: google user info api
+            stub_server.add_responses('GET', '/userinfo', StubResponse(200, {'sub': '12345', 'name': 'John Doe'}))
+            self.social_login_module._request_user_info_path = stub_server.get_url('/userinfo')
+
+            # When: Calling the get_user_info_with_access_token method
+            user_info = self.social_login_module.get_user_info_with_access_token('valid_access_token')
+
+        # Then: The expected user information should be returned
+        self.assertEqual(user_info['id'], 'google_12345')
+        self.assertEqual(stub_server.get_requests('GET', '/userinfo')[0].query, 'access_token=valid_access_token')
+
+    def test_get_user_info_with_access_token_should_raise_error_when_connection_failed(self):
+        # Given: closed server
+        with HttpStubServer() as stub_server:
+            self.social_login_module._request_user_info_path = stub_server.get_url('/userinfo')
+
+        # When: Calling the get_user_info_with_access_token method
+        # Then: It should raise a LoginFailedException
+        with self.assertRaises(LoginFailedException):
+            self.social_login_module.get_user_info_with_access_token('valid_access_token')
+
 
 class TestSocialLoginHandler(TestCase):
     def setUp(self):
@@ -656,3 +693,201 @@ class TestSocialLoginHandler(TestCase):
         # Then:
         mock_get_access_token_by_code.once_called_with('valid_code')
         mock_get_user_info_with_access_token.once_called_with('valid_access_token')
+
+
+JWKS_TEST_KEY = 'member:social_jwks:test'
+
+
+def _create_jwk(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({'kid': kid, 'alg': 'RS256', 'use': 'sig'})
+    return private_key, jwk
+
+
+def _create_id_token(private_key, kid: str, **claims) -> str:
+    now = int(time.time())
+    payload = {
+        'iss': 'https://accounts.google.com',
+        'aud': settings.GOOGLE_CLIENT_ID,
+        'sub': '12345',
+        'name': 'John Doe',
+        'iat': now,
+        'exp': now + 60,
+        **claims,
+    }
+    token = jwt.encode(payload, private_key, algorithm='RS256', headers={'kid': kid})
+    return token.decode() if isinstance(token, bytes) else token
+
+
+class TestJsonWebKeySet(TestCase):
+    def setUp(self):
+        get_redis_connection('default').delete(JWKS_TEST_KEY)
+        self.stub_server = HttpStubServer().__enter__()
+        self.private_key1, self.jwk1 = _create_jwk('kid1')
+        self.private_key2, self.jwk2 = _create_jwk('kid2')
+
+    def tearDown(self):
+        self.stub_server.__exit__(None, None, None)
+
+    def test_get_public_key_should_cache_jwks(self):
+        # Given: jwks api with max-age
+        self.stub_server.add_responses(
+            'GET', '/certs', StubResponse(200, {'keys': [self.jwk1]}, headers={'Cache-Control': 'public, max-age=100'}),
+        )
+        json_web_key_set = JsonWebKeySet(self.stub_server.get_url('/certs'), JWKS_TEST_KEY)
+
+        # When: get public key twice
+        public_keys = [json_web_key_set.get_public_key('kid1') for _ in range(2)]
+
+        # Then: jwks is requested once
+        self.assertIsNotNone(public_keys[0])
+        self.assertEqual(len(self.stub_server.get_requests('GET', '/certs')), 1)
+        # And: cached in redis for max-age
+        self.assertTrue(0 < get_redis_connection('default').ttl(JWKS_TEST_KEY) <= 100)
+        # And: other process loads jwks from redis
+        self.assertIsNotNone(JsonWebKeySet(self.stub_server.get_url('/certs'), JWKS_TEST_KEY).get_public_key('kid1'))
+        self.assertEqual(len(self.stub_server.get_requests('GET', '/certs')), 1)
+
+    @patch('member.utils.social_utils.JWKS_KID_MISS_REFRESH_INTERVAL_SECONDS', 0)
+    def test_get_public_key_should_refresh_jwks_when_kid_is_missing(self):
+        # Given: keys are rotated
+        self.stub_server.add_responses(
+            'GET', '/certs',
+            StubResponse(200, {'keys': [self.jwk1]}),
+            StubResponse(200, {'keys': [self.jwk1, self.jwk2]}),
+        )
+        json_web_key_set = JsonWebKeySet(self.stub_server.get_url('/certs'), JWKS_TEST_KEY)
+        json_web_key_set.get_public_key('kid1')
+
+        # When: get public key of new kid
+        public_key = json_web_key_set.get_public_key('kid2')
+
+        # Then: jwks is refreshed
+        self.assertIsNotNone(public_key)
+        self.assertEqual(len(self.stub_server.get_requests('GET', '/certs')), 2)
+
+    def test_get_public_key_should_not_refresh_jwks_repeatedly_when_kid_is_unknown(self):
+        # Given: cached jwks
+        self.stub_server.add_responses('GET', '/certs', StubResponse(200, {'keys': [self.jwk1]}))
+        json_web_key_set = JsonWebKeySet(self.stub_server.get_url('/certs'), JWKS_TEST_KEY)
+        json_web_key_set.get_public_key('kid1')
+
+        # When: get public key of unknown kid twice
+        public_keys = [json_web_key_set.get_public_key('unknown') for _ in range(2)]
+
+        # Then: jwks is not requested again within refresh interval
+        self.assertEqual(public_keys, [None, None])
+        self.assertEqual(len(self.stub_server.get_requests('GET', '/certs')), 1)
+
+
+@override_settings(GOOGLE_ID_TOKEN_VERIFICATION_ENABLED=True)
+class TestGoogleIdTokenVerification(TestCase):
+    def setUp(self):
+        self.stub_server = HttpStubServer().__enter__()
+        self.private_key, jwk = _create_jwk('kid1')
+        self.stub_server.add_responses('GET', '/certs', StubResponse(200, {'keys': [jwk]}))
+        json_web_key_set = JsonWebKeySet(self.stub_server.get_url('/certs'), JWKS_TEST_KEY)
+        get_redis_connection('default').delete(JWKS_TEST_KEY)
+        patcher = patch('member.utils.social_utils.google_json_web_key_set', json_web_key_set)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.social_login_module = GoogleSocialLoginModule()
+        self.social_login_module._request_access_token_path = self.stub_server.get_url('/token')
+        self.social_login_module._request_user_info_path = self.stub_server.get_url('/userinfo')
+
+    def tearDown(self):
+        self.stub_server.__exit__(None, None, None)
+
+    def test_get_user_info_by_code_should_verify_id_token_locally(self):
+        # Given: id token signed by google
+        id_token = _create_id_token(self.private_key, 'kid1')
+
+        # When: login with id token
+        user_info = self.social_login_module.get_user_info_by_code(id_token)
+
+        # Then: user info from claims
+        self.assertEqual(user_info['id'], 'google_12345')
+        self.assertEqual(user_info['name'], 'John Doe')
+        self.assertIsNone(user_info['email'])
+        # And: token and userinfo api are not requested
+        self.assertEqual(self.stub_server.get_requests('POST', '/token'), [])
+        self.assertEqual(self.stub_server.get_requests('GET', '/userinfo'), [])
+
+    def test_get_user_info_by_code_should_use_id_token_of_token_response(self):
+        # Given: token response with id token
+        self.stub_server.add_responses(
+            'POST', '/token',
+            StubResponse(200, {'access_token': 'access_token', 'id_token': _create_id_token(self.private_key, 'kid1')}),
+        )
+
+        # When: login with code
+        user_info = self.social_login_module.get_user_info_by_code('code')
+
+        # Then: userinfo api is not requested
+        self.assertEqual(user_info['id'], 'google_12345')
+        self.assertEqual(self.stub_server.get_requests('GET', '/userinfo'), [])
+
+    def test_get_user_info_by_code_should_raise_error_when_id_token_is_invalid(self):
+        # Given: id tokens of other audience, expired, other issuer, unknown kid
+        invalid_id_tokens = [
+            _create_id_token(self.private_key, 'kid1', aud='other_client_id'),
+            _create_id_token(self.private_key, 'kid1', exp=int(time.time()) - 10),
+            _create_id_token(self.private_key, 'kid1', iss='https://example.com'),
+            _create_id_token(self.private_key, 'unknown'),
+        ]
+
+        for invalid_id_token in invalid_id_tokens:
+            # When: login with invalid id token
+            # Then: login failed
+            with self.assertRaises(LoginFailedException):
+                self.social_login_module.get_user_info_by_code(invalid_id_token)
+
+
+@override_settings(SOCIAL_SIGN_UP_PROFILE_CACHE_ENABLED=True)
+class TestSocialLoginHandlerSignUpProfile(TestCase):
+    def setUp(self):
+        redis = get_redis_connection('default')
+        for key in redis.scan_iter(f'{SOCIAL_SIGN_UP_PROFILE_KEY_PREFIX}:*'):
+            redis.delete(key)
+        self.social_login_handler = SocialLoginHandler(KakaoSocialLoginModule())
+        self.user_info = {
+            'id': 'kakao_12345',
+            'gender': 'male',
+            'phone': '010-1234-5678',
+            'birth': datetime(2000, 1, 1),
+            'email': None,
+            'name': 'John Doe',
+            'nickname': None,
+        }
+
+    @patch('member.utils.social_utils.KakaoSocialLoginModule.get_user_info_by_code')
+    def test_validate_should_not_use_saved_profile(self, mock_get_user_info_by_code):
+        # Given: saved sign up profile of code
+        mock_get_user_info_by_code.return_value = self.user_info
+        self.social_login_handler.save_sign_up_profile('code', self.user_info)
+
+        # When: validate same code
+        self.social_login_handler.validate('code')
+
+        # Then: provider is called
+        mock_get_user_info_by_code.assert_called_once_with('code')
+
+    @patch('member.utils.social_utils.KakaoSocialLoginModule.get_user_info_by_code')
+    def test_validate_for_sign_up_should_use_saved_profile_once(self, mock_get_user_info_by_code):
+        # Given: saved sign up profile of code
+        mock_get_user_info_by_code.side_effect = LoginFailedException()
+        self.social_login_handler.save_sign_up_profile('code', self.user_info)
+
+        # When: validate_for_sign_up with same code
+        user_info = self.social_login_handler.validate_for_sign_up('code')
+
+        # Then: saved profile without provider call
+        self.assertEqual(user_info, self.user_info)
+        mock_get_user_info_by_code.assert_not_called()
+
+        # When: validate_for_sign_up with same code again
+        # Then: provider is called because saved profile is used once
+        with self.assertRaises(LoginFailedException):
+            self.social_login_handler.validate_for_sign_up('code')
+        mock_get_user_info_by_code.assert_called_once_with('code')
@@ -6,11 +6,21 @@ from unittest.mock import (
 import jwt
 from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
 from common.common_utils.error_utils import generate_pydantic_error_detail
+from common.common_utils.token_utils import get_jwt_guest_token
 from django.core.cache import cache
-from django.test import TestCase
+from django.db import connection
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django_redis import get_redis_connection
 from member.consts import (
+    GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX,
+    GUEST_TOKEN_REVOCATION_KEY,
     MemberCreationExceptionMessage,
+    MemberStatusEnum,
     NICKNAME_MAX_LENGTH,
     NICKNAME_MIN_LENGTH,
     PASSWORD_MAX_LENGTH,
@@ -25,6 +35,7 @@ from member.models import (
     Member,
     MemberJobExperience,
 )
+from member.services import guest_token_revocation_mirror
 from pydantic import ValidationError
 
 
@@ -858,6 +869,32 @@ class GetOrCreateGuestTokenViewTestCase(TestCase):
         mock_get_jwt_guest_token.called_once_with(guest)
         mock_get_jwt_refresh_token.called_once_with(guest)
 
+    @override_settings(GUEST_TOKEN_RATE_LIMIT_ENABLED=True)
+    @patch('member.services.GUEST_TOKEN_RATE_LIMIT_COUNT', 1)
+    def test_guest_token_rate_limit_should_ignore_client_supplied_x_forwarded_for(self):
+        # Given: rate limit bucket of proxy appended ip is empty
+        redis = get_redis_connection('default')
+        for key in redis.scan_iter(f'{GUEST_TOKEN_RATE_LIMIT_KEY_PREFIX}:1.2.3.4:*'):
+            redis.delete(key)
+
+        # When: Guest Token Request twice with rotated client supplied X-Forwarded-For
+        responses = [
+            self.client.post(reverse('member:guest_token'), HTTP_X_FORWARDED_FOR=f'5.6.7.{i}, 1.2.3.4')
+            for i in range(2)
+        ]
+
+        # Then: second request is limited by proxy appended ip
+        self.assertEqual([response.status_code for response in responses], [200, 429])
+
+    @patch('member.views.is_guest_token_rate_limited', Mock(return_value=True))
+    def test_guest_token_rate_limited(self):
+        # When: Guest Token Request over rate limit
+        response = self.client.post(reverse('member:guest_token'))
+
+        # Then: Error 429
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.data['error_code'], 'guest-token-rate-limit-exceeded')
+
     @patch('member.views.get_jwt_refresh_token')
     @patch('member.views.get_jwt_guest_token')
     @patch('member.views.get_request_ip')
@@ -889,3 +926,55 @@ class GetOrCreateGuestTokenViewTestCase(TestCase):
         guest = Guest.objects.get(ip='111.111.111.111')
         mock_get_jwt_guest_token.called_once_with(guest)
         mock_get_jwt_refresh_token.called_once_with(guest)
+
+
+class DefaultAuthenticationTestCase(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(
+            username='test',
+            nickname='test',
+            member_status_id=MemberStatusEnum.NORMAL_MEMBER.value,
+        )
+        self.guest = Guest.objects.create(temp_nickname='guest-test', member=self.member)
+        self.url = reverse('project:my_project_bookmark')
+
+    def test_authenticate_once_per_request(self):
+        # Given: member token
+        token = get_jwt_guest_token(self.guest)
+
+        # When: 로그인이 필요한 API 를 요청합니다.
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_AUTHORIZATION=f'JWT {token}')
+
+        # Then: 미들웨어와 DRF 가 인증 결과를 공유해 비회원을 한 번만 조회합니다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            len([query for query in context.captured_queries if Guest._meta.db_table in query['sql']]),
+            1,
+        )
+
+    @override_settings(GUEST_TOKEN_CLAIMS_ENABLED=True)
+    def test_authenticate_should_not_query_guest_with_token_claims(self):
+        # Given: member token with claims
+        get_redis_connection('default').delete(GUEST_TOKEN_REVOCATION_KEY)
+        guest_token_revocation_mirror.reset()
+        token = get_jwt_guest_token(self.guest)
+
+        # When: 로그인이 필요한 API 를 요청합니다.
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_AUTHORIZATION=f'JWT {token}')
+
+        # Then: 토큰의 인증 정보로 인증해 비회원을 조회하지 않습니다.
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in context.captured_queries if Guest._meta.db_table in query['sql']])
+
+    def test_authenticate_should_raise_error_when_guest_not_exists(self):
+        # Given: token of deleted guest
+        token = get_jwt_guest_token(self.guest)
+        Guest.objects.filter(id=self.guest.id).delete()
+
+        # When: 로그인이 필요한 API 를 요청합니다.
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f'JWT {token}')
+
+        # Then: Error 401
+        self.assertEqual(response.status_code, 401)
@@ -1,18 +1,43 @@
+import hashlib
 import json
+import re
+import threading
+import time
 from abc import (
     ABC,
     abstractmethod,
 )
 from datetime import datetime
-from typing import Optional
+from typing import (
+    Dict,
+    Optional,
+)
 from urllib.parse import unquote
 
-import requests
+import jwt
+from common.common_utils.http_utils import http_client
 from django.conf import settings
+from django_redis import get_redis_connection
+from jwt.algorithms import RSAAlgorithm
 from member.exceptions import (
     LoginFailedException,
     SocialLoginTokenErrorException,
 )
+from redis.exceptions import RedisError
+from requests import RequestException
+
+# member.consts 가 이 모듈을 import 하므로 소셜 로그인 상수는 이 모듈에 둡니다.
+# 회원이 없어 로그인에 실패한 프로필을 같은 code 의 회원가입에서 한 번만 사용합니다. (redis)
+SOCIAL_SIGN_UP_PROFILE_KEY_PREFIX = 'member:social_sign_up_profile'
+SOCIAL_SIGN_UP_PROFILE_TIMEOUT_SECONDS = 60 * 5
+# Google ID token 서명 공개키 (redis, process 메모리)
+GOOGLE_JWKS_URL = 'https://www.googleapis.com/oauth2/v3/certs'
+GOOGLE_JWKS_KEY = 'member:social_jwks:google'
+GOOGLE_ID_TOKEN_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+# 응답에 Cache-Control max-age 가 없을 때 JWKS 를 캐시하는 시간
+JWKS_DEFAULT_TIMEOUT_SECONDS = 60 * 60
+# 캐시에 없는 kid 로 JWKS 를 다시 받아오는 최소 간격 (위조된 kid 로 JWKS 를 반복 요청하지 않도록 합니다.)
+JWKS_KID_MISS_REFRESH_INTERVAL_SECONDS = 60
 
 
 class SocialLoginModule(ABC):
@@ -57,25 +82,34 @@ class SocialLoginModule(ABC):
     def get_user_info_with_access_token(self, access_token: str) -> dict:
         pass
 
-    def get_access_token_by_code(self, code: str) -> str:
-        access_data = requests.post(
-            self.request_access_token_path,
-            data={
-                'grant_type': 'authorization_code',
-                'client_id': self.client_id,
-                'client_secret': self.secret,
-                'redirect_uri': self.redirect_uri,
-                'code': unquote(code)
-            }
-        )
+    def get_token_response_by_code(self, code: str) -> dict:
+        try:
+            access_data = http_client.post(
+                self.request_access_token_path,
+                data={
+                    'grant_type': 'authorization_code',
+                    'client_id': self.client_id,
+                    'client_secret': self.secret,
+                    'redirect_uri': self.redirect_uri,
+                    'code': unquote(code)
+                }
+            )
+        except RequestException:
+            raise LoginFailedException()
         if access_data.status_code != 200:
             raise LoginFailedException()
+        return json.loads(access_data.text)
 
+    def get_access_token_by_code(self, code: str) -> str:
         try:
-            return json.loads(access_data.text)['access_token']
+            return self.get_token_response_by_code(code)['access_token']
         except KeyError:
             raise SocialLoginTokenErrorException()
 
+    def get_user_info_by_code(self, code: str) -> dict:
+        access_token = self.get_access_token_by_code(code)
+        return self.get_user_info_with_access_token(access_token)
+
 
 class KakaoSocialLoginModule(SocialLoginModule):
     def __init__(self):
@@ -159,10 +193,13 @@ class KakaoSocialLoginModule(SocialLoginModule):
         headers = {
             'Authorization': 'Bearer ' + access_token
         }
-        data = requests.get(
-            self.request_user_info_path,
-            headers=headers
-        )
+        try:
+            data = http_client.get(
+                self.request_user_info_path,
+                headers=headers
+            )
+        except RequestException:
+            raise LoginFailedException()
         if data.status_code != 200:
             raise LoginFailedException()
         else:
@@ -242,10 +279,13 @@ class NaverSocialLoginModule(SocialLoginModule):
         headers = {
             'Authorization': 'Bearer ' + access_token
         }
-        data = requests.get(
-            self.request_user_info_path,
-            headers=headers
-        )
+        try:
+            data = http_client.get(
+                self.request_user_info_path,
+                headers=headers
+            )
+        except RequestException:
+            raise LoginFailedException()
         if data.status_code != 200:
             raise LoginFailedException()
 
@@ -261,6 +301,78 @@ class NaverSocialLoginModule(SocialLoginModule):
         }
 
 
+class JsonWebKeySet(object):
+    """
+    ID token 서명을 검증할 JWKS 공개키를 process 메모리와 redis 에 캐시합니다.
+    캐시가 만료되었거나 토큰의 kid 가 캐시에 없으면 JWKS 를 다시 받아옵니다.
+    """
+    def __init__(self, jwks_url: str, cache_key: str):
+        self.jwks_url = jwks_url
+        self.cache_key = cache_key
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.public_key_by_kid: Dict[str, object] = {}
+        self.expires_at = 0.0
+        self.fetched_at: Optional[float] = None
+
+    def _set_keys(self, jwks: dict, timeout_seconds: float) -> None:
+        self.public_key_by_kid = {
+            jwk['kid']: RSAAlgorithm.from_jwk(json.dumps(jwk))
+            for jwk in jwks.get('keys', [])
+            if jwk.get('kty') == 'RSA' and jwk.get('kid')
+        }
+        self.expires_at = time.time() + timeout_seconds
+
+    def _load_from_redis(self) -> bool:
+        try:
+            pipeline = get_redis_connection('default').pipeline()
+            pipeline.get(self.cache_key)
+            pipeline.ttl(self.cache_key)
+            cached_jwks, ttl = pipeline.execute()
+        except RedisError:
+            return False
+        if cached_jwks is None or ttl <= 0:
+            return False
+        self._set_keys(json.loads(cached_jwks), ttl)
+        return True
+
+    def _fetch(self) -> None:
+        self.fetched_at = time.monotonic()
+        try:
+            response = http_client.get(self.jwks_url)
+        except RequestException:
+            return
+        if response.status_code != 200:
+            return
+        max_age = re.search(r'max-age=(\d+)', response.headers.get('Cache-Control', ''))
+        timeout_seconds = int(max_age.group(1)) if max_age else JWKS_DEFAULT_TIMEOUT_SECONDS
+        jwks = response.json()
+        self._set_keys(jwks, timeout_seconds)
+        try:
+            get_redis_connection('default').set(self.cache_key, json.dumps(jwks), ex=timeout_seconds)
+        except RedisError:
+            pass
+
+    def get_public_key(self, kid: str) -> Optional[object]:
+        with self.lock:
+            if time.time() >= self.expires_at:
+                # 다른 worker 가 받아둔 JWKS 가 있으면 사용합니다.
+                if not self._load_from_redis():
+                    self._fetch()
+            elif kid not in self.public_key_by_kid and (
+                self.fetched_at is None
+                or time.monotonic() - self.fetched_at >= JWKS_KID_MISS_REFRESH_INTERVAL_SECONDS
+            ):
+                # provider 가 키를 교체했을 수 있습니다.
+                self._fetch()
+            return self.public_key_by_kid.get(kid)
+
+
+google_json_web_key_set = JsonWebKeySet(GOOGLE_JWKS_URL, GOOGLE_JWKS_KEY)
+
+
 class GoogleSocialLoginModule(SocialLoginModule):
     def __init__(self):
         self._request_access_token_path = 'https://oauth2.googleapis.com/token'
@@ -295,12 +407,15 @@ class GoogleSocialLoginModule(SocialLoginModule):
         return self._username_prefix
 
     def get_user_info_with_access_token(self, access_token: str) -> dict:
-        data = requests.get(
-            self.request_user_info_path,
-            params={
-                'access_token': access_token
-            }
-        )
+        try:
+            data = http_client.get(
+                self.request_user_info_path,
+                params={
+                    'access_token': access_token
+                }
+            )
+        except RequestException:
+            raise LoginFailedException()
         if data.status_code != 200:
             raise LoginFailedException()
 
@@ -316,11 +431,104 @@ class GoogleSocialLoginModule(SocialLoginModule):
             'nickname': None,
         }
 
+    @staticmethod
+    def _is_id_token(token: str) -> bool:
+        try:
+            return jwt.get_unverified_header(token).get('alg') == 'RS256'
+        except jwt.InvalidTokenError:
+            return False
+
+    def get_user_info_with_id_token(self, id_token: str) -> dict:
+        """
+        Google 이 서명한 ID token 을 캐시된 JWKS 공개키로 검증하고 claims 로 회원 정보를 만듭니다.
+        """
+        try:
+            kid = jwt.get_unverified_header(id_token).get('kid')
+        except jwt.InvalidTokenError:
+            raise LoginFailedException()
+        public_key = google_json_web_key_set.get_public_key(kid)
+        if not public_key:
+            raise LoginFailedException()
+        try:
+            claims = jwt.decode(id_token, public_key, algorithms=['RS256'], audience=self.client_id)
+        except jwt.InvalidTokenError:
+            raise LoginFailedException()
+        if claims.get('iss') not in GOOGLE_ID_TOKEN_ISSUERS:
+            raise LoginFailedException()
+
+        return {
+            'id': self.username_prefix + str(claims['sub']),
+            'gender': None,
+            'phone': None,
+            'birth': None,
+            'email': None,
+            'name': claims.get('name'),
+            'nickname': None,
+        }
+
+    def get_user_info_by_code(self, code: str) -> dict:
+        """
+        ID token 을 받으면 로컬에서 검증해 provider 를 호출하지 않고,
+        인가 code 를 받으면 token 응답의 ID token 을 검증해 userinfo 호출을 생략합니다.
+        """
+        if not settings.GOOGLE_ID_TOKEN_VERIFICATION_ENABLED:
+            return super().get_user_info_by_code(code)
+        if self._is_id_token(code):
+            return self.get_user_info_with_id_token(code)
+
+        token_response = self.get_token_response_by_code(code)
+        if token_response.get('id_token'):
+            return self.get_user_info_with_id_token(token_response['id_token'])
+        try:
+            access_token = token_response['access_token']
+        except KeyError:
+            raise SocialLoginTokenErrorException()
+        return self.get_user_info_with_access_token(access_token)
+
 
 class SocialLoginHandler:
     def __init__(self, social_module: SocialLoginModule):
         self.social_module = social_module
 
+    def _get_sign_up_profile_key(self, code: str) -> str:
+        return f'{SOCIAL_SIGN_UP_PROFILE_KEY_PREFIX}:{self.social_module.username_prefix}{hashlib.sha256(code.encode()).hexdigest()}'
+
     def validate(self, code: str) -> dict:
-        access_token = self.social_module.get_access_token_by_code(code)
-        return self.social_module.get_user_info_with_access_token(access_token)
+        return self.social_module.get_user_info_by_code(code)
+
+    def save_sign_up_profile(self, code: str, profile: dict) -> None:
+        """
+        회원이 없어 로그인에 실패한 프로필을 같은 code 의 회원가입에서 한 번 사용할 수 있도록 저장합니다.
+        """
+        if not settings.SOCIAL_SIGN_UP_PROFILE_CACHE_ENABLED:
+            return
+        try:
+            get_redis_connection('default').set(
+                self._get_sign_up_profile_key(code),
+                json.dumps({**profile, 'birth': profile['birth'].isoformat() if profile.get('birth') else None}),
+                ex=SOCIAL_SIGN_UP_PROFILE_TIMEOUT_SECONDS,
+            )
+        except RedisError:
+            pass
+
+    def _pop_sign_up_profile(self, code: str) -> Optional[dict]:
+        # GETDEL 로 꺼내므로 같은 code 로 다시 요청하면 provider 를 다시 호출합니다.
+        try:
+            saved_profile = get_redis_connection('default').getdel(self._get_sign_up_profile_key(code))
+        except RedisError:
+            return None
+        if saved_profile is None:
+            return None
+        profile = json.loads(saved_profile)
+        profile['birth'] = datetime.fromisoformat(profile['birth']) if profile['birth'] else None
+        return profile
+
+    def validate_for_sign_up(self, code: str) -> dict:
+        """
+        로그인에 사용된 code 로 회원가입하면 이미 사용된 code 를 provider 에 다시 보내지 않고 저장된 프로필을 사용합니다.
+        """
+        if settings.SOCIAL_SIGN_UP_PROFILE_CACHE_ENABLED:
+            profile = self._pop_sign_up_profile(code)
+            if profile is not None:
+                return profile
+        return self.validate(code)
@@ -46,6 +46,7 @@ from member.dtos.response_dtos import (
 )
 from member.exceptions import (
     AlreadyMemberExistsErrorException,
+    GuestTokenRateLimitExceededException,
     InvalidRefreshTokenErrorException,
     InvalidValueForSignUpFieldErrorException,
     LoginFailedException,
@@ -65,6 +66,8 @@ from member.services import (
     check_email_exists,
     check_nickname_exists,
     check_username_exists,
+    get_or_create_ip_guest,
+    is_guest_token_rate_limited,
 )
 from member.tasks import send_one_time_token_email
 from member.validators.sign_up_validators import SignUpPayloadValidator
@@ -295,15 +298,9 @@ class SignUpValidationView(APIView):
 class GetOrCreateGuestTokenView(APIView):
     def post(self, request):
         ip = get_request_ip(request)
-        guest = Guest.objects.filter(
-            ip=ip,
-            member__isnull=True,
-        ).last()
-        if not guest:
-            guest = Guest.objects.create(
-                ip=ip,
-                temp_nickname=f'비회원{generate_random_string_digits(8)}'
-            )
+        if is_guest_token_rate_limited(ip):
+            raise GuestTokenRateLimitExceededException()
+        guest = get_or_create_ip_guest(ip)
         guest_token_get_or_create_response = GuestTokenGetOrCreateResponse(
             access_token=get_jwt_guest_token(guest),
             refresh_token=get_jwt_refresh_token(guest),
@@ -1,14 +1,15 @@
 from abc import ABC
 from typing import Optional
 
-import requests
 from common.common_utils.encrpt_utils import encrypt_integer
+from common.common_utils.http_utils import http_client
 from django.conf import settings
 from django.urls import reverse
 from payment.exceptions import (
     KakaoPayCancelError,
     KakaoPaySuccessError,
 )
+from requests import RequestException
 
 
 class KakaoPay:
@@ -57,7 +58,10 @@ class KakaoPay:
             'cancel_url': self.handler.cancel_url,
             'fail_url': self.handler.fail_url,
         }
-        res = requests.post(self.kakao_pay_ready_url, headers=self.headers, json=data)
+        try:
+            res = http_client.post(self.kakao_pay_ready_url, headers=self.headers, json=data)
+        except RequestException:
+            raise KakaoPaySuccessError()
         return res.json()
 
     def approve_payment(self, tid: str, pg_token: str, order_id: str, guest_id: str) -> dict:
@@ -94,7 +98,10 @@ class KakaoPay:
             'partner_user_id': guest_id,
             'pg_token': pg_token,
         }
-        res = requests.post(self.kakao_pay_approve_url, headers=self.headers, json=data)
+        try:
+            res = http_client.post(self.kakao_pay_approve_url, headers=self.headers, json=data)
+        except RequestException:
+            raise KakaoPaySuccessError()
         response = res.json()
         if res.status_code == 400:
             extras = response.get('extras')
@@ -166,7 +173,10 @@ class KakaoPay:
             'cancel_tax_free_amount': cancel_tax_free_price,
             'payload': payload,
         }
-        res = requests.post(self.kakao_pay_cancel_url, headers=self.headers, json=data)
+        try:
+            res = http_client.post(self.kakao_pay_cancel_url, headers=self.headers, json=data)
+        except RequestException:
+            raise KakaoPayCancelError()
         response = res.json()
         if res.status_code == 400:
             extras = response.get('extras')
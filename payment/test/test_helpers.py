@@ -4,6 +4,10 @@ from unittest.mock import (
     patch,
 )
 
+from common.common_testcase_helpers.http_stub_server import (
+    HttpStubServer,
+    StubResponse,
+)
 from django.test import TestCase
 from payment.exceptions import (
     KakaoPayCancelError,
@@ -53,7 +57,7 @@ class KakaoPayMethodTestCase(TestCase):
     def setUp(self):
         self.kakao_pay_handler = KakaoPayProductHandler(order_id=1)
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_ready_to_pay(self, mock_kakao_pay_ready):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
@@ -64,7 +68,7 @@ class KakaoPayMethodTestCase(TestCase):
         quantity = '1'
         total_amount = '1000'
         tax_free_amount = '0'
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         mock_response.json.return_value = {
             'tid': 'T469b847306d7b2dc394',
@@ -91,7 +95,7 @@ class KakaoPayMethodTestCase(TestCase):
         self.assertEqual(response['ios_app_scheme'], 'kakaotalk://kakaopay/pg?url=https://online-pay.kakao.com/pay/mockup/1d61e5d04016bd94c9ed54406bb51f1194e3772ce297a097fdb3e3604fc42e46')
         self.assertEqual(response['created_at'], '2023-05-21T15:20:55')
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_approve_payment_when_success(self, mock_kakao_pay_ready):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
@@ -100,7 +104,7 @@ class KakaoPayMethodTestCase(TestCase):
         guest_id = 'test_guest_id'
         pg_token = 'test_pg_token'
         tid = 'test_tid'
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         # And: status code 200
         mock_response.status_code = 200
@@ -153,7 +157,7 @@ class KakaoPayMethodTestCase(TestCase):
             'approved_at': '2023-05-21T15:25:31'
         })
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_approve_payment_when_fail_and_400_extra_message_exists(self, mock_kakao_pay_ready):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
@@ -162,7 +166,7 @@ class KakaoPayMethodTestCase(TestCase):
         guest_id = 'test_guest_id'
         pg_token = 'test_pg_token'
         tid = 'test_tid'
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         # And: status code 400
         mock_response.status_code = 400
@@ -182,7 +186,7 @@ class KakaoPayMethodTestCase(TestCase):
 
         self.assertEqual(e.exception.detail, '진행중인 거래가 있습니다. 잠시 후 다시 시도해 주세요.')
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_approve_payment_when_fail_and_not_200(self, mock_kakao_pay_ready):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
@@ -191,7 +195,7 @@ class KakaoPayMethodTestCase(TestCase):
         guest_id = 'test_guest_id'
         pg_token = 'test_pg_token'
         tid = 'test_tid'
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         # And: status code 499
         mock_response.status_code = 499
@@ -211,12 +215,12 @@ class KakaoPayMethodTestCase(TestCase):
 
         self.assertEqual(e.exception.detail, '카카오페이 결제에 실패하였습니다.')
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_cancel_payment(self,
                             mock_request):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         # And: status code 200
         mock_response.status_code = 200
@@ -282,12 +286,12 @@ class KakaoPayMethodTestCase(TestCase):
             mock_response.json.return_value
         )
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_cancel_payment_failed_400_with_extra_message(self,
                                                           mock_request):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         # And: status code 400
         mock_response.status_code = 400
@@ -315,12 +319,12 @@ class KakaoPayMethodTestCase(TestCase):
             '원거래없음'
         )
 
-    @patch('payment.helpers.kakaopay_helpers.requests.post')
+    @patch('payment.helpers.kakaopay_helpers.http_client.post')
     def test_cancel_payment_failed_not_400_with_extra_message(self,
                                                               mock_request):
         # Given: kakao pay 객체 생성
         kakao_pay = KakaoPay(self.kakao_pay_handler)
-        # And: requests.post의 반환값(즉, Response 객체)를 모킹합니다.
+        # And: http_client.post의 반환값(즉, Response 객체)를 모킹합니다.
         mock_response = MagicMock()
         # And: status code 499
         mock_response.status_code = 499
@@ -347,3 +351,36 @@ class KakaoPayMethodTestCase(TestCase):
             e.exception.detail,
             '카카오페이 결제 취소에 실패하였습니다.'
         )
+
+
+class KakaoPayStubServerTestCase(TestCase):
+    def setUp(self):
+        self.kakao_pay = KakaoPay(KakaoPayProductHandler(order_id=1))
+
+    def test_approve_payment(self):
+        with HttpStubServer() as stub_server:
+            # Given: kakao pay approve api
+            stub_server.add_responses('POST', '/approve', StubResponse(200, {'aid': 'A1', 'tid': 'T1'}))
+            self.kakao_pay.kakao_pay_approve_url = stub_server.get_url('/approve')
+
+            # When: 결제 승인
+            response = self.kakao_pay.approve_payment('T1', 'pg_token', 'order_id', 'guest_id')
+
+        # Then: 승인 응답
+        self.assertEqual(response, {'aid': 'A1', 'tid': 'T1'})
+        # And: secret key 와 승인 정보로 요청합니다.
+        stub_request = stub_server.get_requests('POST', '/approve')[0]
+        self.assertEqual(stub_request.headers['Authorization'], self.kakao_pay.headers['Authorization'])
+        self.assertEqual(stub_request.json()['pg_token'], 'pg_token')
+
+    def test_approve_payment_should_raise_error_when_timeout(self):
+        with HttpStubServer() as stub_server:
+            # Given: 응답이 늦은 kakao pay approve api
+            stub_server.add_responses('POST', '/approve', StubResponse(200, delay_seconds=0.5))
+            self.kakao_pay.kakao_pay_approve_url = stub_server.get_url('/approve')
+
+            # When: 결제 승인
+            # Then: 결제 실패
+            with patch('payment.helpers.kakaopay_helpers.http_client.timeout', (1, 0.1)):
+                with self.assertRaises(KakaoPaySuccessError):
+                    self.kakao_pay.approve_payment('T1', 'pg_token', 'order_id', 'guest_id')
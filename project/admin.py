@@ -1,3 +1,5 @@
+from typing import List
+
 from django.contrib import admin
 from project.forms.admin_forms import (
     ProjectAdminForm,
@@ -14,9 +16,56 @@ from project.models import (
     ProjectRecruitment,
     ProjectRecruitmentJob,
 )
+from project.services.project_card_services import invalidate_project_card_fragments
+from project.services.project_filter_index_services import publish_project_filter_index_changes
+from project.services.project_list_cache_services import bump_project_list_version
+from project.services.project_search_services import refresh_project_search_documents
+from project.services.project_services import (
+    update_latest_project_recruitment_job_arrays,
+    update_projects_latest_recruited_at,
+)
+
+
+class ProjectListChangeAdminMixin(object):
+    """
+    목록 카드에 영향을 주는 모델이 admin 에서 변경되면 프로젝트 목록 버전을 올리고 카드 캐시를 삭제합니다.
+    """
+    @staticmethod
+    def get_changed_project_id(obj) -> int:
+        return obj.id
+
+    @staticmethod
+    def _publish_project_list_change(project_ids: List[int]) -> None:
+        bump_project_list_version()
+        invalidate_project_card_fragments(project_ids)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._publish_project_list_change([self.get_changed_project_id(obj)])
+
+    def delete_model(self, request, obj):
+        # 삭제 후에는 obj 의 pk 가 비워지므로 먼저 프로젝트 id 를 구합니다.
+        project_ids = [self.get_changed_project_id(obj)]
+        super().delete_model(request, obj)
+        self._publish_project_list_change(project_ids)
+
+    def delete_queryset(self, request, queryset):
+        project_ids = [self.get_changed_project_id(obj) for obj in queryset]
+        super().delete_queryset(request, queryset)
+        self._publish_project_list_change(project_ids)
+
+
+class ProjectSearchDocumentAdminMixin(ProjectListChangeAdminMixin):
+    """
+    모집/모집 직무가 admin 에서 변경되면 프로젝트 검색 문서도 다시 만듭니다.
+    """
+    @staticmethod
+    def _publish_project_list_change(project_ids: List[int]) -> None:
+        ProjectListChangeAdminMixin._publish_project_list_change(project_ids)
+        refresh_project_search_documents(project_ids)
 
 
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(ProjectListChangeAdminMixin, admin.ModelAdmin):
     list_display = [
         'title',
         'current_recruit_status',
@@ -30,6 +79,18 @@ class ProjectAdmin(admin.ModelAdmin):
     ]
     form = ProjectAdminForm
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        update_latest_project_recruitment_job_arrays(form.instance)
+        publish_project_filter_index_changes([form.instance.id])
+        # 최신 모집 직무(m2m)까지 저장된 뒤에 검색 문서를 만듭니다.
+        refresh_project_search_documents([form.instance.id])
+
+    def delete_model(self, request, obj):
+        project_id = obj.id
+        super().delete_model(request, obj)
+        publish_project_filter_index_changes([project_id])
+
 
 class ProjectCategoryAdmin(admin.ModelAdmin):
     list_display = [
@@ -50,7 +111,7 @@ class ProjectManagementPermissionAdmin(admin.ModelAdmin):
     ]
 
 
-class ProjectRecruitmentAdmin(admin.ModelAdmin):
+class ProjectRecruitmentAdmin(ProjectSearchDocumentAdminMixin, admin.ModelAdmin):
     list_display = [
         'id',
         'project',
@@ -58,8 +119,18 @@ class ProjectRecruitmentAdmin(admin.ModelAdmin):
         'recruit_status',
     ]
 
+    @staticmethod
+    def get_changed_project_id(obj) -> int:
+        return obj.project_id
+
+    @staticmethod
+    def _publish_project_list_change(project_ids: List[int]) -> None:
+        # 모집이 추가/삭제되면 목록 정렬에 쓰는 최근 모집 일시를 다시 계산합니다.
+        update_projects_latest_recruited_at(project_ids)
+        ProjectSearchDocumentAdminMixin._publish_project_list_change(project_ids)
 
-class ProjectRecruitmentJobAdmin(admin.ModelAdmin):
+
+class ProjectRecruitmentJobAdmin(ProjectSearchDocumentAdminMixin, admin.ModelAdmin):
     list_display = [
         'id',
         'project_recruitment',
@@ -69,6 +140,10 @@ class ProjectRecruitmentJobAdmin(admin.ModelAdmin):
         'recruit_status',
     ]
 
+    @staticmethod
+    def get_changed_project_id(obj) -> int:
+        return obj.project_recruitment.project_id
+
 
 class ProjectRecruitApplicationAdmin(admin.ModelAdmin):
     list_display = [
@@ -77,6 +152,19 @@ class ProjectRecruitApplicationAdmin(admin.ModelAdmin):
         'member',
         'request_status',
     ]
+    # 모집 직무/신청의 __str__ 이 모집과 직무를 참조하므로 목록에서 한 번에 join 합니다.
+    list_select_related = [
+        'project_recruitment_job__project_recruitment',
+        'member',
+    ]
+    readonly_fields = [
+        'project_recruitment',
+    ]
+
+    def save_model(self, request, obj, form, change):
+        # 신청함 조회용 프로젝트 모집은 모집 직무의 모집을 따릅니다.
+        obj.project_recruitment_id = obj.project_recruitment_job.project_recruitment_id
+        super().save_model(request, obj, form, change)
 
 
 class ProjectMemberManagementAdmin(admin.ModelAdmin):
@@ -85,3 +85,61 @@ class ProjectMemberManagementLeftStatus(StrValueLabel):
 class ProjectJobSearchOperator(StrValueLabel):
     AND = ('AND', 'AND')
     OR = ('OR', 'OR')
+
+
+class ProjectHomeFacet(StrValueLabel):
+    CATEGORY = ('CATEGORY', '카테고리')
+    JOB = ('JOB', '직무 및 직군 카테고리')
+    EXPERIENCE = ('EXPERIENCE', '경력 구분')
+    CURRENT_RECRUIT_STATUS = ('CURRENT_RECRUIT_STATUS', '모집 상태')
+
+
+class ProjectListSortType(StrValueLabel):
+    LATEST = ('LATEST', '최신순')
+    RELEVANCE = ('RELEVANCE', '검색 정확도순')
+
+
+# 목록 카드에 노출하는 프로젝트 설명 길이
+PROJECT_SIMPLE_DESCRIPTION_LENGTH = 100
+
+# 한국어 형태소 분석기가 없으므로 공백 단위로 토큰화 합니다.
+PROJECT_SEARCH_CONFIG = 'simple'
+
+# 프로젝트 필터 인덱스 변경 스트림 (redis stream)
+PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY = 'project:filter_index:changes'
+PROJECT_FILTER_INDEX_CHANGE_STREAM_MAXLEN = 10000
+# 변경 스트림 유실에 대비해 worker 필터 인덱스를 주기적으로 전체 재구성합니다.
+PROJECT_FILTER_INDEX_MAX_AGE_SECONDS = 60 * 10
+
+# 홈 목록 응답 캐시 (redis)
+# 프로젝트/모집/모집 직무가 변경되면 목록 버전을 올려 이전 버전의 캐시를 한 번에 무효화합니다.
+PROJECT_LIST_VERSION_KEY = 'project:list:version'
+HOME_PROJECT_LIST_CACHE_KEY_PREFIX = 'project:home_list'
+HOME_PROJECT_LIST_CACHE_TIMEOUT_SECONDS = 60 * 5
+
+# 프로젝트 카드 캐시 (redis)
+PROJECT_CARD_FRAGMENT_KEY_PREFIX = 'project:card'
+PROJECT_CARD_FRAGMENT_TIMEOUT_SECONDS = 60 * 60
+PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY = 'project:card:stats:hit'
+PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY = 'project:card:stats:miss'
+
+# 활성 프로젝트 캐시 (redis)
+ACTIVE_PROJECT_KEY_PREFIX = 'project:active'
+ACTIVE_PROJECT_TIMEOUT_SECONDS = 60 * 60
+
+# 회원별 프로젝트 관계(북마크/리더/참여 프로젝트 id 집합) 캐시 (redis)
+MEMBER_PROJECT_RELATIONS_KEY_PREFIX = 'project:member_relations'
+MEMBER_PROJECT_RELATIONS_TIMEOUT_SECONDS = 60 * 60
+
+# 프로젝트 북마크 수 증감 버퍼 (redis hash, project_id -> delta)
+# 북마크 요청은 증감만 기록하고, celery 주기 작업이 Project.bookmark_count 에 한 번에 반영합니다.
+PROJECT_BOOKMARK_COUNT_DELTA_KEY = 'project:bookmark_count:delta'
+# 버퍼 반영은 한 번에 하나만 실행되도록 잠급니다. 잠금 시간은 반영 한 번보다 충분히 길어야 합니다.
+PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_KEY = 'project:bookmark_count:flush_lock'
+PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_TIMEOUT_SECONDS = 60 * 5
+
+# 오프라인 북마크 동기화 한 번에 받을 수 있는 최대 토글 수
+PROJECT_BOOKMARK_SYNC_MAX_SIZE = 100
+
+# 모집 신청 일괄 승인/거절 한 번에 받을 수 있는 최대 신청 수
+PROJECT_RECRUIT_APPLICATION_DECISION_MAX_SIZE = 100
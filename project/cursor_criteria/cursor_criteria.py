@@ -3,12 +3,26 @@ from common.common_criteria.cursor_criteria import CursorCriteria
 
 class HomeProjectListCursorCriteria(CursorCriteria):
     cursor_keys = [
+        'rearrangement_time__lt',
+        'id__lt',
+    ]
+
+
+class HomeProjectSearchCursorCriteria(CursorCriteria):
+    cursor_keys = [
+        'search_score__lt',
         'id__lt',
-        'rearrangement_time__lte',
     ]
 
 
 class MyProjectBookmarkListCursorCriteria(CursorCriteria):
     cursor_keys = [
         'updated_at__lt',
+        'id__lt',
+    ]
+
+
+class ProjectRecruitApplicationListCursorCriteria(CursorCriteria):
+    cursor_keys = [
+        'id__lt',
     ]
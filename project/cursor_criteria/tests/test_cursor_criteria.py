@@ -4,16 +4,24 @@ from datetime import (
 from unittest.mock import patch
 
 from common.common_testcase_helpers.testcase_helpers import SampleModel
+from django.db.models import (
+    F,
+    Q,
+)
 from django.test import TestCase
-from project.cursor_criteria.cursor_criteria import HomeProjectListCursorCriteria
+from project.cursor_criteria.cursor_criteria import (
+    HomeProjectListCursorCriteria,
+    HomeProjectSearchCursorCriteria,
+    MyProjectBookmarkListCursorCriteria,
+)
 
 
 class HomeProjectListCursorCriteriaTests(TestCase):
     def test_is_valid_decoded_cursor_valid(self):
         # Given: valid cursor
         cursor = {
+            'rearrangement_time__lt': '2021-08-01T12:00:00+00:00',
             'id__lt': 123,
-            'rearrangement_time__lte': '2021-08-01T12:00:00+00:00',
         }
         # Expect: True
         self.assertEqual(
@@ -49,8 +57,8 @@ class HomeProjectListCursorCriteriaTests(TestCase):
         self.assertEqual(result, 'encoded_string')
         # And: data_to_urlsafe_base64 called with expected dict
         expected_dict = {
+            'rearrangement_time__lt': '2021-08-01T12:00:01+09:00',  # Assumes date formatting in valid_keys handling
             'id__lt': 1,
-            'rearrangement_time__lte': '2021-08-01T12:00:01+09:00',  # Assumes date formatting in valid_keys handling
         }
         # And: data_to_urlsafe_base64 called with expected dict
         mock_data_to_urlsafe_base64.assert_called_once_with(expected_dict)
@@ -72,3 +80,47 @@ class HomeProjectListCursorCriteriaTests(TestCase):
             e.exception.args[0],
             'Attribute \'rearrangement_time\' not found in \'SampleModel\'',
         )
+
+
+class HomeProjectSearchCursorCriteriaTests(TestCase):
+    def test_get_filtering_q_with_empty_cursor(self):
+        # Given: empty cursor
+        cursor = {}
+
+        # When: get_filtering_q
+        q = HomeProjectSearchCursorCriteria.get_filtering_q(cursor)
+
+        # Then: empty Q
+        self.assertEqual(q, Q())
+
+    def test_get_filtering_q_should_compare_row_value(self):
+        # Given: valid cursor
+        cursor = {
+            'search_score__lt': 0.5,
+            'id__lt': 10,
+        }
+
+        # When: get_filtering_q
+        q = HomeProjectSearchCursorCriteria.get_filtering_q(cursor)
+
+        # Then: (search_score, id) < (0.5, 10)
+        row_value_comparison = q.children[0]
+        self.assertEqual(row_value_comparison.operator, '<')
+        self.assertEqual(row_value_comparison.lhs, [F('search_score'), F('id')])
+        self.assertEqual([value.value for value in row_value_comparison.rhs], [0.5, 10])
+
+    def test_get_ordering_data(self):
+        # Expect: search_score desc, id desc
+        self.assertEqual(
+            HomeProjectSearchCursorCriteria.get_ordering_data(),
+            ['-search_score', '-id'],
+        )
+
+
+class MyProjectBookmarkListCursorCriteriaTests(TestCase):
+    def test_get_ordering_data(self):
+        # Expect: updated_at desc, id desc
+        self.assertEqual(
+            MyProjectBookmarkListCursorCriteria.get_ordering_data(),
+            ['-updated_at', '-id'],
+        )
@@ -1,15 +1,37 @@
 from typing import (
+    Dict,
     List,
     Optional,
+    Set,
 )
 
 from job.dtos.model_dtos import ProjectJobAvailabilities
+from project.consts import (
+    ProjectCurrentRecruitStatus,
+    ProjectJobExperienceType,
+)
 from pydantic import (
     BaseModel,
     Field,
 )
 
 
+class ProjectCardFragment(BaseModel):
+    """
+    회원과 무관한 목록 카드 내용입니다. 프로젝트 id 별로 redis 에 직렬화해 두고 여러 목록에서 재사용합니다.
+    """
+    id: int = Field(..., description='Project ID')
+    category_id: Optional[int] = Field(None, description='Project category id')
+    title: str = Field(..., description='Project title')
+    simple_description: str = Field(..., description='Project simple description')
+    jobs: List[ProjectJobAvailabilities] = Field(..., description='Project jobs')
+    experience: str = Field(..., description='프로젝트 들어올 수 있는 경력 수준')
+    hours_per_week: Optional[int] = Field(None, description='주당 집중 시간')
+    current_recruit_status: str = Field(..., description='현재 모집 상태')
+    image: Optional[str] = Field(None, description='프로젝트 이미지')
+    recent_recruited_at: Optional[str] = Field(None, description='최근 모집한 날짜')
+
+
 class ProjectListItem(BaseModel):
     id: int = Field(..., description='Project ID')
     category_id: Optional[int] = Field(None, description='Project category id')
@@ -41,7 +63,85 @@ class MyProjectBookmarkListItem(BaseModel):
     recent_recruited_at: Optional[str] = Field(None, description='최근 모집한 날짜')
 
 
+class MemberProjectRelations(BaseModel):
+    bookmarked_project_ids: Set[int] = Field(default_factory=set, description='북마크한 프로젝트 ID 집합')
+    led_project_ids: Set[int] = Field(default_factory=set, description='리더인 프로젝트 ID 집합')
+    participated_project_ids: Set[int] = Field(default_factory=set, description='참여 중인 프로젝트 ID 집합')
+
+
+class ProjectRecruitApplicationItem(BaseModel):
+    id: int = Field(..., description='모집 신청 ID')
+    job_id: int = Field(..., description='지원 직무 ID')
+    member_id: int = Field(..., description='신청 멤버 ID')
+    nickname: Optional[str] = Field(None, description='신청 멤버 닉네임')
+    profile_image: Optional[str] = Field(None, description='신청 멤버 프로필 이미지')
+    request_message: str = Field(..., description='신청 메시지')
+    request_status: str = Field(..., description='신청 상태')
+    created_at: str = Field(..., description='신청 일시')
+
+
 class ProjectOngoingInfo(BaseModel):
     success: int = Field(description='Success')
     working: int = Field(description='Working')
     leaved: int = Field(description='Leaved')
+
+
+class ProjectFacetIdCount(BaseModel):
+    id: int = Field(..., description='필터 ID')
+    count: int = Field(..., description='프로젝트 수')
+
+
+class ProjectFacetValueCount(BaseModel):
+    value: str = Field(..., description='필터 값')
+    count: int = Field(..., description='프로젝트 수')
+
+
+class HomeProjectFacetCounts(BaseModel):
+    total_count: int = Field(..., description='조건에 맞는 전체 프로젝트 수')
+    categories: List[ProjectFacetIdCount] = Field(..., description='카테고리별 프로젝트 수')
+    jobs: List[ProjectFacetIdCount] = Field(..., description='직무별 프로젝트 수')
+    job_categories: List[ProjectFacetIdCount] = Field(..., description='직군 카테고리별 프로젝트 수')
+    experiences: List[ProjectFacetValueCount] = Field(..., description='경력 구분별 프로젝트 수')
+    current_recruit_statuses: List[ProjectFacetValueCount] = Field(..., description='모집 상태별 프로젝트 수')
+
+    @staticmethod
+    def _to_id_counts(count_by_id: Dict[Optional[int], int]) -> List[ProjectFacetIdCount]:
+        return [
+            ProjectFacetIdCount(id=facet_id, count=count)
+            for facet_id, count in sorted(count_by_id.items())
+            if facet_id is not None and count
+        ]
+
+    @classmethod
+    def of(cls,
+           total_count: int,
+           count_by_category_id: Dict[Optional[int], int],
+           count_by_job_id: Dict[int, int],
+           count_by_job_category_id: Dict[int, int],
+           count_by_experience: Dict[str, int],
+           count_by_current_recruit_status: Dict[str, int]):
+        # 모집 상태 필터의 RECRUITING 은 추가 모집중을 포함합니다.
+        recruiting_count = (
+            count_by_current_recruit_status.get(ProjectCurrentRecruitStatus.RECRUITING.value, 0)
+            + count_by_current_recruit_status.get(ProjectCurrentRecruitStatus.ADDITIONAL_RECRUITING.value, 0)
+        )
+        return cls(
+            total_count=total_count,
+            categories=cls._to_id_counts(count_by_category_id),
+            jobs=cls._to_id_counts(count_by_job_id),
+            job_categories=cls._to_id_counts(count_by_job_category_id),
+            experiences=[
+                ProjectFacetValueCount(value=value, count=count_by_experience.get(value, 0))
+                for value, _ in ProjectJobExperienceType.choices()
+            ],
+            current_recruit_statuses=[
+                ProjectFacetValueCount(
+                    value=ProjectCurrentRecruitStatus.RECRUITING.value,
+                    count=recruiting_count,
+                ),
+                ProjectFacetValueCount(
+                    value=ProjectCurrentRecruitStatus.RECRUITED.value,
+                    count=count_by_current_recruit_status.get(ProjectCurrentRecruitStatus.RECRUITED.value, 0),
+                ),
+            ],
+        )
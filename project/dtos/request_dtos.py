@@ -1,4 +1,5 @@
 from typing import (
+    Dict,
     List,
     Optional,
     Self,
@@ -9,8 +10,12 @@ from common.common_utils import string_to_list
 from common.common_utils.error_utils import generate_pydantic_error_detail
 from django.http import QueryDict
 from project.consts import (
+    PROJECT_BOOKMARK_SYNC_MAX_SIZE,
+    PROJECT_RECRUIT_APPLICATION_DECISION_MAX_SIZE,
     ProjectJobExperienceType,
     ProjectJobSearchOperator,
+    ProjectListSortType,
+    ProjectRecruitApplicationStatus,
 )
 from pydantic import (
     BaseModel,
@@ -33,6 +38,7 @@ class HomeProjectListRequest(BaseModel):
     min_duration_month: Optional[int] = Field(None, description='최소 프로젝트 기간(개월)')
     max_duration_month: Optional[int] = Field(None, description='최대 프로젝트 기간(개월)')
     current_recruit_status: Optional[str] = Field(None, description='현재 모집 상태')
+    sort: Optional[str] = Field(ProjectListSortType.LATEST.value, description='정렬 기준')
 
     @field_validator(
         'category_ids',
@@ -80,6 +86,18 @@ class HomeProjectListRequest(BaseModel):
         except ValueError:
             raise ValueError(ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label)
 
+    @field_validator(
+        'sort',
+        mode='before'
+    )
+    def check_sort_value(cls, v):
+        if v is None:
+            return ProjectListSortType.LATEST.value
+        try:
+            return ProjectListSortType(v).value
+        except ValueError:
+            raise ValueError(ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label)
+
     @field_validator(
         'experience',
         mode='before'
@@ -193,8 +211,12 @@ class HomeProjectListRequest(BaseModel):
             min_duration_month=request.get('min_duration_month'),
             max_duration_month=request.get('max_duration_month'),
             current_recruit_status=request.get('current_recruit_status'),
+            sort=request.get('sort', ProjectListSortType.LATEST.value),
         )
 
+    def is_relevance_search(self) -> bool:
+        return bool(self.title) and self.sort == ProjectListSortType.RELEVANCE.value
+
 
 class CreateProjectJob(BaseModel):
     job_id: int = Field(description='프로젝트 직군 ID')
@@ -272,3 +294,107 @@ class ProjectJobRecruitApplyRequest(BaseModel):
         return cls(
             **request,
         )
+
+
+class ProjectBookmarkToggle(BaseModel):
+    project_id: int = Field(description='프로젝트 ID')
+    is_bookmarked: bool = Field(description='북마크 여부')
+
+
+class ProjectBookmarkSyncRequest(BaseModel):
+    bookmarks: List[ProjectBookmarkToggle] = Field(description='오프라인에서 발생한 북마크 토글 리스트 (발생 순서)')
+
+    @field_validator(
+        'bookmarks',
+        mode='after'
+    )
+    def check_bookmarks_size(cls, v):
+        if not len(v):
+            raise ValueError(ErrorMessage.INVALID_MINIMUM_ITEM_SIZE.label.format(1))
+        if len(v) > PROJECT_BOOKMARK_SYNC_MAX_SIZE:
+            raise ValueError(ErrorMessage.INVALID_MAXIMUM_LENGTH.label)
+        return v
+
+    @classmethod
+    def of(cls, request: QueryDict):
+        return cls(
+            **request,
+        )
+
+    def get_is_bookmarked_by_project_id(self) -> Dict[int, bool]:
+        # 같은 프로젝트를 여러 번 토글했다면 마지막 토글만 반영합니다.
+        return {
+            bookmark.project_id: bookmark.is_bookmarked
+            for bookmark in self.bookmarks
+        }
+
+
+class ProjectRecruitApplicationListRequest(BaseModel):
+    project_recruitment_id: Optional[int] = Field(None, description='프로젝트 모집 ID, 없으면 최근 모집')
+    job_id: Optional[int] = Field(None, description='직무 ID')
+    request_status: str = Field(ProjectRecruitApplicationStatus.IN_REVIEW.value, description='신청 상태')
+
+    @field_validator(
+        'request_status',
+        mode='before'
+    )
+    def check_request_status_value(cls, v):
+        if v is None:
+            return ProjectRecruitApplicationStatus.IN_REVIEW.value
+        try:
+            return ProjectRecruitApplicationStatus(v).value
+        except ValueError:
+            raise ValueError(ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label)
+
+    @classmethod
+    def of(cls, request: QueryDict):
+        return cls(
+            project_recruitment_id=request.get('project_recruitment_id'),
+            job_id=request.get('job_id'),
+            request_status=request.get('request_status'),
+        )
+
+
+class ProjectRecruitApplicationDecision(BaseModel):
+    application_id: int = Field(description='모집 신청 ID')
+    request_status: str = Field(description='결정한 신청 상태 (ACCEPTED, REJECTED)')
+
+    @field_validator(
+        'request_status',
+        mode='before'
+    )
+    def check_request_status_value(cls, v):
+        if v not in {
+            ProjectRecruitApplicationStatus.ACCEPTED.value,
+            ProjectRecruitApplicationStatus.REJECTED.value,
+        }:
+            raise ValueError(ErrorMessage.INVALID_INPUT_ERROR_MESSAGE.label)
+        return v
+
+
+class ProjectRecruitApplicationDecisionRequest(BaseModel):
+    decisions: List[ProjectRecruitApplicationDecision] = Field(description='모집 신청별 승인/거절 리스트')
+
+    @field_validator(
+        'decisions',
+        mode='after'
+    )
+    def check_decisions_size(cls, v):
+        if not len(v):
+            raise ValueError(ErrorMessage.INVALID_MINIMUM_ITEM_SIZE.label.format(1))
+        if len(v) > PROJECT_RECRUIT_APPLICATION_DECISION_MAX_SIZE:
+            raise ValueError(ErrorMessage.INVALID_MAXIMUM_LENGTH.label)
+        return v
+
+    @classmethod
+    def of(cls, request: QueryDict):
+        return cls(
+            **request,
+        )
+
+    def get_request_status_by_application_id(self) -> Dict[int, str]:
+        # 같은 신청에 여러 결정이 있다면 마지막 결정만 반영합니다.
+        return {
+            decision.application_id: decision.request_status
+            for decision in self.decisions
+        }
@@ -5,8 +5,10 @@ from common.dtos.response_dtos import CursorPaginatorResponse
 from job.dtos.model_dtos import ProjectJobAvailabilities
 from member.dtos.model_dtos import MemberInfoBlock
 from project.dtos.model_dtos import (
+    HomeProjectFacetCounts,
     MyProjectBookmarkListItem,
     ProjectListItem,
+    ProjectRecruitApplicationItem,
 )
 from pydantic import (
     BaseModel,
@@ -23,6 +25,10 @@ class GetMyProjectBookmarkListResponse(CursorPaginatorResponse):
     data: conlist(MyProjectBookmarkListItem) = Field(..., description="MyProjectBookmarkListItem 의 정보를 담은 리스트")
 
 
+class HomeProjectFacetCountResponse(HomeProjectFacetCounts):
+    pass
+
+
 class ProjectCreationResponse(BaseModel):
     id: int = Field(description='Project ID')
 
@@ -67,3 +73,18 @@ class ProjectBookmarkCreationResponse(BaseModel):
 
 class ProjectBookmarkDeletionResponse(BaseModel):
     message: str = Field(description='Result Message')
+
+
+class ProjectBookmarkSyncResponse(BaseModel):
+    message: str = Field(description='Result Message')
+    bookmarked_project_ids: conlist(int) = Field(description='요청한 프로젝트 중 북마크된 프로젝트 ID 리스트')
+
+
+class ProjectRecruitApplicationListResponse(CursorPaginatorResponse):
+    data: conlist(ProjectRecruitApplicationItem) = Field(..., description="ProjectRecruitApplicationItem 의 정보를 담은 리스트")
+
+
+class ProjectRecruitApplicationDecisionResponse(BaseModel):
+    message: str = Field(description='Result Message')
+    accepted_application_ids: conlist(int) = Field(description='승인된 모집 신청 ID 리스트')
+    rejected_application_ids: conlist(int) = Field(description='거절된 모집 신청 ID 리스트')
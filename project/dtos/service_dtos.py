@@ -20,3 +20,8 @@ class ProjectCreationData(BaseModel):
     hours_per_week: int = Field(description='Hours per week')
     duration_month: int = Field(description='Duration month')
     jobs: List[CreateProjectJob] = Field(description='프로젝트 직군 ID 리스트 및 요구 인원 수')
+
+
+class ProjectRecruitApplicationDecisionResult(BaseModel):
+    accepted_application_ids: List[int] = Field(default_factory=list, description='승인된 모집 신청 ID 리스트')
+    rejected_application_ids: List[int] = Field(default_factory=list, description='거절된 모집 신청 ID 리스트')
@@ -59,3 +59,9 @@ class ProjectBookmarkCreationErrorException(CommonAPIException):
     status_code = 400
     default_detail = '북마크 생성 중 오류가 발생했습니다.'
     default_code = 'project-bookmark-creation-unknown-error'
+
+
+class ProjectRecruitApplicationPermissionDeniedException(CommonAPIException):
+    status_code = 403
+    default_detail = '모집 신청을 관리할 권한이 없습니다.'
+    default_code = 'project-recruit-application-permission-denied-error'
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from project.models import Project
+from project.services.project_services import update_projects_latest_recruited_at
+
+
+class Command(BaseCommand):
+    help = 'Backfill project latest_recruited_at from the latest project recruitment'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        project_ids = list(
+            Project.objects.order_by(
+                'id',
+            ).values_list(
+                'id',
+                flat=True,
+            )
+        )
+        for i in range(0, len(project_ids), batch_size):
+            update_projects_latest_recruited_at(project_ids[i:i + batch_size])
+        self.stdout.write(self.style.SUCCESS(f'Successfully backfilled latest_recruited_at of {len(project_ids)} projects'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from project.services.recruit_application_services import fill_recruit_applications_project_recruitment
+
+
+class Command(BaseCommand):
+    help = (
+        'Backfill project recruitment of recruit applications from their project recruitment job. '
+        'Run once after the deploy that adds the column, for applications created by the previous version.'
+    )
+
+    def handle(self, *args, **kwargs):
+        filled_count = fill_recruit_applications_project_recruitment()
+        self.stdout.write(self.style.SUCCESS(f'Successfully backfilled project recruitment of {filled_count} recruit applications'))
@@ -0,0 +1,73 @@
+import tracemalloc
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.models import QuerySet
+from member.models import Member
+from project.models import Project
+from project.services.project_card_services import get_project_card_qs
+
+
+class Command(BaseCommand):
+    help = 'Benchmark bytes transferred and memory per page of project list queries (full row vs card projection)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=20)
+        parser.add_argument('--description-length', type=int, default=20000)
+
+    @staticmethod
+    def _get_transferred_bytes(qs: QuerySet) -> int:
+        sql, params = qs.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COALESCE(SUM(OCTET_LENGTH(t::text)), 0) FROM ({sql}) t', params)
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _get_peak_memory(qs: QuerySet) -> int:
+        tracemalloc.start()
+        try:
+            list(qs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def _write_result(self, name: str, full_qs: QuerySet, card_qs: QuerySet) -> None:
+        full_bytes = self._get_transferred_bytes(full_qs)
+        card_bytes = self._get_transferred_bytes(card_qs)
+        full_memory = self._get_peak_memory(full_qs)
+        card_memory = self._get_peak_memory(card_qs)
+        self.stdout.write(
+            f'{name}: bytes {full_bytes} -> {card_bytes}, '
+            f'memory {full_memory} -> {card_memory}'
+        )
+
+    def handle(self, *args, **kwargs):
+        size = kwargs['size']
+        description_length = kwargs['description_length']
+
+        # 벤치마크용 데이터는 측정 후 rollback 합니다.
+        with transaction.atomic():
+            member = Member.objects.create_user(username=f'benchmark-{uuid.uuid4().hex}')
+            projects = Project.objects.bulk_create([
+                Project(
+                    title=f'benchmark {i}',
+                    description='가' * description_length,
+                    created_member=member,
+                )
+                for i in range(size)
+            ])
+            project_qs = Project.objects.filter(
+                id__in=[project.id for project in projects],
+            ).order_by(
+                '-rearrangement_time',
+                '-id',
+            )
+            self._write_result('home', project_qs, get_project_card_qs(project_qs))
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully benchmarked project card query with page size {size}'))
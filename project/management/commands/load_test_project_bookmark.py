@@ -0,0 +1,97 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable,
+    List,
+)
+
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+from member.models import Member
+from project.models import (
+    Project,
+    ProjectBookmark,
+)
+from project.services.bookmark_services import (
+    BookmarkService,
+    flush_project_bookmark_count_deltas,
+)
+
+
+class Command(BaseCommand):
+    help = 'Load test bookmark throughput on one hot project (delta buffer vs recount on project row)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--members', type=int, default=200)
+        parser.add_argument('--workers', type=int, default=16)
+
+    @staticmethod
+    @transaction.atomic
+    def _bookmark_with_recount(member_id: int, project_id: int) -> None:
+        # 증감 버퍼 이전 방식: 프로젝트 row 를 저장하며 북마크 수를 다시 셉니다.
+        ProjectBookmark.objects.get_or_create(member_id=member_id, project_id=project_id)
+        project = Project.objects.select_for_update().get(id=project_id)
+        project.bookmark_count = ProjectBookmark.objects.filter(project_id=project_id, is_deleted=False).count()
+        project.save()
+
+    @staticmethod
+    def _bookmark_with_delta(member_id: int, project_id: int) -> None:
+        BookmarkService(member_id).create_bookmark(project_id)
+
+    @staticmethod
+    def _run(bookmark: Callable[[int, int], None], member_ids: List[int], project_id: int, workers: int) -> float:
+        def _bookmark(member_id: int) -> None:
+            try:
+                bookmark(member_id, project_id)
+            finally:
+                if workers > 1:
+                    connection.close()
+
+        started_at = time.perf_counter()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_bookmark, member_ids))
+        else:
+            for member_id in member_ids:
+                _bookmark(member_id)
+        return time.perf_counter() - started_at
+
+    def _write_result(self, name: str, count: int, elapsed: float, bookmark_count: int) -> None:
+        self.stdout.write(
+            f'{name}: {count} bookmarks in {elapsed:.3f}s ({count / elapsed:.1f}/s), bookmark_count {bookmark_count}'
+        )
+
+    def handle(self, *args, **kwargs):
+        member_count = kwargs['members']
+        workers = kwargs['workers']
+
+        # 여러 worker 가 서로 다른 connection 으로 조회해야 하므로 데이터를 커밋하고 마지막에 삭제합니다.
+        prefix = f'load-{uuid.uuid4().hex[:8]}'
+        members = Member.objects.bulk_create([
+            Member(username=f'{prefix}-{i}') for i in range(member_count)
+        ])
+        member_ids = [member.id for member in members]
+        projects = [
+            Project.objects.create(title=f'{prefix} {name}', created_member_id=member_ids[0])
+            for name in ['recount', 'delta']
+        ]
+        try:
+            recount_project, delta_project = projects
+            elapsed = self._run(self._bookmark_with_recount, member_ids, recount_project.id, workers)
+            recount_project.refresh_from_db()
+            self._write_result('recount', member_count, elapsed, recount_project.bookmark_count)
+
+            elapsed = self._run(self._bookmark_with_delta, member_ids, delta_project.id, workers)
+            flush_project_bookmark_count_deltas()
+            delta_project.refresh_from_db()
+            self._write_result('delta', member_count, elapsed, delta_project.bookmark_count)
+        finally:
+            ProjectBookmark.objects.filter(project__in=projects).delete()
+            Project.objects.filter(id__in=[project.id for project in projects]).delete()
+            Member.objects.filter(id__in=member_ids).delete()
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully load tested bookmark with {member_count} members and {workers} workers'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from project.models import Project
+from project.services.project_search_services import refresh_project_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild project search documents'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        project_ids = list(
+            Project.objects.filter(
+                is_deleted=False,
+            ).order_by(
+                'id',
+            ).values_list(
+                'id',
+                flat=True,
+            )
+        )
+        for i in range(0, len(project_ids), batch_size):
+            refresh_project_search_documents(project_ids[i:i + batch_size])
+        self.stdout.write(self.style.SUCCESS(f'Successfully rebuilt {len(project_ids)} project search documents'))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from project.models import Project
+from project.services.bookmark_services import (
+    flush_project_bookmark_count_deltas,
+    reconcile_project_bookmark_counts,
+)
+from project.services.project_services import invalidate_active_projects
+
+
+class Command(BaseCommand):
+    help = 'Recount active bookmarks and fix Project.bookmark_count in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        # 버퍼에 남은 증감을 먼저 반영해야 다시 센 값 위에 증감이 한 번 더 더해지지 않습니다.
+        invalidate_active_projects(flush_project_bookmark_count_deltas())
+
+        project_ids = list(
+            Project.objects.order_by(
+                'id',
+            ).values_list(
+                'id',
+                flat=True,
+            )
+        )
+        fixed_count = 0
+        for i in range(0, len(project_ids), batch_size):
+            fixed_project_ids = reconcile_project_bookmark_counts(project_ids[i:i + batch_size])
+            invalidate_active_projects(fixed_project_ids)
+            fixed_count += len(fixed_project_ids)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully reconciled bookmark counts of {len(project_ids)} projects ({fixed_count} fixed)'
+            )
+        )
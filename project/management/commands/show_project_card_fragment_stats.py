@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from project.services.project_card_services import get_project_card_fragment_hit_counts
+
+
+class Command(BaseCommand):
+    help = 'Show hit ratio of project card fragment cache'
+
+    def handle(self, *args, **kwargs):
+        hit_count, miss_count = get_project_card_fragment_hit_counts()
+        total_count = hit_count + miss_count
+        hit_ratio = hit_count / total_count if total_count else 0
+        self.stdout.write(
+            self.style.SUCCESS(f'project card fragment: hit {hit_count}, miss {miss_count}, hit ratio {hit_ratio:.2%}')
+        )
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.10 on 2026-10-18 09:32
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0023_projectcategory_icon_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSearchDocument',
+            fields=[
+                ('project', models.OneToOneField(help_text='프로젝트', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_document', serialize=False, to='project.project', verbose_name='프로젝트')),
+                ('document', models.TextField(help_text='검색 문서 (제목, 내용, 카테고리, 직무 표시명)', verbose_name='검색 문서')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, help_text='전문 검색 벡터', null=True, verbose_name='전문 검색 벡터')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정 일시', verbose_name='수정 일시')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='projectsearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='search_vector_gin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectsearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['document'], name='search_document_gin_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.10 on 2026-10-18 09:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0024_projectsearchdocument'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-rearrangement_time', '-id'], name='project_active_rearrange_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectbookmark',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['member', '-updated_at', '-id'], name='bookmark_member_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.1.10 on 2026-10-18 09:39
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def forward(apps, schema_editor):
+    Project = apps.get_model('project', 'Project')
+    ProjectLatestRecruitmentJob = Project.latest_project_recruitment_jobs.through
+
+    job_ids_by_project_id = {}
+    job_category_ids_by_project_id = {}
+    for project_id, job_id, job_category_id in ProjectLatestRecruitmentJob.objects.values_list(
+        'project_id',
+        'job_id',
+        'job__category_id',
+    ).iterator():
+        job_ids_by_project_id.setdefault(project_id, set()).add(job_id)
+        if job_category_id is not None:
+            job_category_ids_by_project_id.setdefault(project_id, set()).add(job_category_id)
+
+    projects = []
+    for project_id, job_ids in job_ids_by_project_id.items():
+        projects.append(
+            Project(
+                id=project_id,
+                latest_project_recruitment_job_ids=sorted(job_ids),
+                latest_project_recruitment_job_category_ids=sorted(
+                    job_category_ids_by_project_id.get(project_id, set())
+                ),
+            )
+        )
+    Project.objects.bulk_update(
+        projects,
+        ['latest_project_recruitment_job_ids', 'latest_project_recruitment_job_category_ids'],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0025_project_active_rearrange_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='latest_project_recruitment_job_category_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveIntegerField(), blank=True, default=list, help_text='최신 프로젝트 모집 직군 카테고리 id 목록 (직군 필터용 비정규화)', size=None, verbose_name='최신 프로젝트 모집 직군 카테고리 id 목록'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='latest_project_recruitment_job_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveIntegerField(), blank=True, default=list, help_text='최신 프로젝트 모집 직무 id 목록 (직무 필터용 비정규화)', size=None, verbose_name='최신 프로젝트 모집 직무 id 목록'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['latest_project_recruitment_job_ids'], name='latest_job_ids_gin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['latest_project_recruitment_job_category_ids'], name='latest_job_cat_ids_gin_idx'),
+        ),
+        migrations.RunPython(forward, migrations.RunPython.noop),
+    ]
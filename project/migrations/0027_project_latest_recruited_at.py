@@ -0,0 +1,18 @@
+# Generated by Django 4.1.10 on 2026-10-18 09:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0026_project_latest_project_recruitment_job_arrays'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='latest_recruited_at',
+            field=models.DateTimeField(blank=True, help_text='최신 프로젝트 모집 일시', null=True, verbose_name='최신 프로젝트 모집 일시'),
+        ),
+    ]
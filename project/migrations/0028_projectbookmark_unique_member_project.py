@@ -0,0 +1,34 @@
+# Generated by Django 4.1.10 on 2026-10-18 10:26
+
+from django.db import migrations, models
+
+# (member, project) 별로 활성 북마크, 최근 수정 순으로 하나만 남기고 중복을 삭제합니다.
+DELETE_DUPLICATED_BOOKMARKS_SQL = '''
+DELETE FROM project_projectbookmark bookmark
+USING (
+    SELECT
+        id,
+        ROW_NUMBER() OVER (
+            PARTITION BY member_id, project_id
+            ORDER BY is_deleted, updated_at DESC, id DESC
+        ) AS row_number
+    FROM project_projectbookmark
+) ranked
+WHERE bookmark.id = ranked.id
+  AND ranked.row_number > 1
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0027_project_latest_recruited_at'),
+    ]
+
+    operations = [
+        migrations.RunSQL(DELETE_DUPLICATED_BOOKMARKS_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='projectbookmark',
+            constraint=models.UniqueConstraint(fields=('member', 'project'), name='unique_bookmark_member_project'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.1.10 on 2026-10-18 10:31
+
+from django.db import migrations, models
+
+# (모집 직무, 회원) 별로 가장 최근 검토중 신청만 남기고 나머지는 취소 처리합니다.
+CANCEL_DUPLICATED_IN_REVIEW_APPLICATIONS_SQL = '''
+UPDATE project_projectrecruitapplication application
+SET request_status = 'CANCELED', request_status_updated_at = NOW(), updated_at = NOW()
+FROM (
+    SELECT
+        id,
+        ROW_NUMBER() OVER (
+            PARTITION BY project_recruitment_job_id, member_id
+            ORDER BY id DESC
+        ) AS row_number
+    FROM project_projectrecruitapplication
+    WHERE request_status = 'IN_REVIEW'
+) ranked
+WHERE application.id = ranked.id
+  AND ranked.row_number > 1
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0028_projectbookmark_unique_member_project'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CANCEL_DUPLICATED_IN_REVIEW_APPLICATIONS_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='projectrecruitapplication',
+            constraint=models.UniqueConstraint(condition=models.Q(('request_status', 'IN_REVIEW')), fields=('project_recruitment_job', 'member'), name='unique_in_review_recruit_application'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.10 on 2026-10-18 10:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0029_projectrecruitapplication_unique_in_review'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectrecruitapplication',
+            index=models.Index(fields=['project_recruitment_job', 'request_status', '-id'], include=('member', 'created_at'), name='recruit_application_inbox_idx'),
+        ),
+    ]
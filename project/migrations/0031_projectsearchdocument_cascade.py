@@ -0,0 +1,18 @@
+# Generated by Django 4.1.10 on 2026-10-18 11:07
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0030_projectrecruitapplication_inbox_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='projectsearchdocument',
+            name='project',
+            field=models.OneToOneField(help_text='프로젝트', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='project.project', verbose_name='프로젝트'),
+        ),
+    ]
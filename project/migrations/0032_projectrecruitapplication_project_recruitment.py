@@ -0,0 +1,37 @@
+# Generated by Django 4.1.10 on 2026-10-18 11:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 기존 신청의 프로젝트 모집을 모집 직무에서 채웁니다.
+FILL_RECRUIT_APPLICATION_PROJECT_RECRUITMENT_SQL = '''
+UPDATE project_projectrecruitapplication application
+SET project_recruitment_id = recruitment_job.project_recruitment_id
+FROM project_projectrecruitmentjob recruitment_job
+WHERE recruitment_job.id = application.project_recruitment_job_id
+  AND application.project_recruitment_id IS NULL
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0031_projectsearchdocument_cascade'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='projectrecruitapplication',
+            name='recruit_application_inbox_idx',
+        ),
+        migrations.AddField(
+            model_name='projectrecruitapplication',
+            name='project_recruitment',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='프로젝트 모집 (모집 신청함 조회용 비정규화)', null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='project.projectrecruitment'),
+        ),
+        migrations.RunSQL(FILL_RECRUIT_APPLICATION_PROJECT_RECRUITMENT_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='projectrecruitapplication',
+            index=models.Index(fields=['project_recruitment', 'request_status', '-id'], name='recruit_application_inbox_idx'),
+        ),
+    ]
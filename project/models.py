@@ -1,4 +1,6 @@
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from member.models import Member
 from project.consts import (
@@ -174,11 +176,31 @@ class Project(models.Model):
         help_text='최신 프로젝트 모집',
         verbose_name='최신 프로젝트 모집',
     )
+    latest_recruited_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='최신 프로젝트 모집 일시',
+        verbose_name='최신 프로젝트 모집 일시',
+    )
     latest_project_recruitment_jobs = models.ManyToManyField(
         'job.Job',
         related_name='latest_project_recruitment_jobs',
         help_text='최신 프로젝트 모집 직무들',
     )
+    latest_project_recruitment_job_ids = ArrayField(
+        models.PositiveIntegerField(),
+        default=list,
+        blank=True,
+        help_text='최신 프로젝트 모집 직무 id 목록 (직무 필터용 비정규화)',
+        verbose_name='최신 프로젝트 모집 직무 id 목록',
+    )
+    latest_project_recruitment_job_category_ids = ArrayField(
+        models.PositiveIntegerField(),
+        default=list,
+        blank=True,
+        help_text='최신 프로젝트 모집 직군 카테고리 id 목록 (직군 필터용 비정규화)',
+        verbose_name='최신 프로젝트 모집 직군 카테고리 id 목록',
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text='생성 일시',
@@ -220,6 +242,61 @@ class Project(models.Model):
                 name='title_gin_idx',
                 opclasses=['gin_trgm_ops'],
             ),
+            GinIndex(
+                fields=['latest_project_recruitment_job_ids'],
+                name='latest_job_ids_gin_idx',
+            ),
+            GinIndex(
+                fields=['latest_project_recruitment_job_category_ids'],
+                name='latest_job_cat_ids_gin_idx',
+            ),
+            models.Index(
+                fields=['-rearrangement_time', '-id'],
+                name='project_active_rearrange_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
+
+
+class ProjectSearchDocument(models.Model):
+    project = models.OneToOneField(
+        Project,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name='search_document',
+        help_text='프로젝트',
+        verbose_name='프로젝트',
+    )
+    document = models.TextField(
+        help_text='검색 문서 (제목, 내용, 카테고리, 직무 표시명)',
+        verbose_name='검색 문서',
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        blank=True,
+        help_text='전문 검색 벡터',
+        verbose_name='전문 검색 벡터',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text='수정 일시',
+        verbose_name='수정 일시',
+    )
+
+    def __str__(self):
+        return f'{self.project_id}'
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=['search_vector'],
+                name='search_vector_gin_idx',
+            ),
+            GinIndex(
+                fields=['document'],
+                name='search_document_gin_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
         ]
 
 
@@ -357,6 +434,14 @@ class ProjectRecruitApplication(models.Model):
         on_delete=models.DO_NOTHING,
         help_text='프로젝트 모집 직무',
     )
+    project_recruitment = models.ForeignKey(
+        ProjectRecruitment,
+        null=True,
+        blank=True,
+        db_index=False,
+        on_delete=models.DO_NOTHING,
+        help_text='프로젝트 모집 (모집 신청함 조회용 비정규화)',
+    )
     member = models.ForeignKey(
         Member,
         on_delete=models.DO_NOTHING,
@@ -391,6 +476,23 @@ class ProjectRecruitApplication(models.Model):
                 f'멤버:{self.member_id}\n'
                 f'공고상태:{self.request_status}')
 
+    class Meta:
+        constraints = [
+            # 같은 모집 직무에 검토중인 신청은 회원당 하나만 존재합니다.
+            models.UniqueConstraint(
+                fields=['project_recruitment_job', 'member'],
+                name='unique_in_review_recruit_application',
+                condition=models.Q(request_status=ProjectRecruitApplicationStatus.IN_REVIEW.value),
+            ),
+        ]
+        indexes = [
+            # 리더 신청함의 (모집, 상태) 별 id 역순 keyset 조회를 모집 직무 수와 무관하게 인덱스 순서대로 처리합니다.
+            models.Index(
+                fields=['project_recruitment', 'request_status', '-id'],
+                name='recruit_application_inbox_idx',
+            ),
+        ]
+
 
 class ProjectMemberManagement(models.Model):
     project = models.ForeignKey(
@@ -526,3 +628,18 @@ class ProjectBookmark(models.Model):
     def __str__(self):
         return (f'프로젝트:{self.project_id}\n'
                 f'멤버:{self.member_id}')
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['member', '-updated_at', '-id'],
+                name='bookmark_member_updated_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['member', 'project'],
+                name='unique_bookmark_member_project',
+            ),
+        ]
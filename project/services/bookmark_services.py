@@ -1,15 +1,40 @@
+import uuid
+from collections import Counter
 from typing import (
+    Dict,
+    List,
     Optional,
     Union,
 )
 
 from django.contrib.auth.models import AnonymousUser
 from django.db import (
+    DatabaseError,
+    connection,
     transaction,
 )
-from django.db.models import QuerySet
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import (
+    Coalesce,
+    Greatest,
+)
 from django.utils import timezone
+from django_redis import get_redis_connection
 from member.models import Member
+from project.consts import (
+    PROJECT_BOOKMARK_COUNT_DELTA_KEY,
+    PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_KEY,
+    PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_TIMEOUT_SECONDS,
+)
 from project.exceptions import (
     ProjectBookmarkCreationErrorException,
     ProjectBookmarkMemberNotFoundException,
@@ -18,18 +43,187 @@ from project.models import (
     Project,
     ProjectBookmark,
 )
+from project.services.member_relation_services import (
+    get_member_project_relations,
+    invalidate_member_project_relations,
+)
+from redis.exceptions import (
+    RedisError,
+    ResponseError,
+)
+
+
+def _apply_project_bookmark_count_deltas(delta_by_project_id: Dict[int, int]) -> None:
+    """
+    북마크 수 증감을 UPDATE 한 번으로 반영합니다. 집계가 어긋나도 0 미만으로 내려가지 않습니다.
+    """
+    delta_by_project_id = {project_id: delta for project_id, delta in delta_by_project_id.items() if delta}
+    if not delta_by_project_id:
+        return
+    Project.objects.filter(
+        id__in=delta_by_project_id.keys(),
+    ).update(
+        bookmark_count=Greatest(
+            F('bookmark_count') + Case(
+                *[When(id=project_id, then=Value(delta)) for project_id, delta in delta_by_project_id.items()],
+                default=Value(0),
+            ),
+            Value(0),
+        ),
+    )
+
+
+def add_project_bookmark_count_delta(project_id: int, delta: int) -> None:
+    """
+    커밋 이후 북마크 수 증감을 redis 버퍼에 기록합니다. 프로젝트 row 를 잠그지 않습니다.
+    redis 를 사용할 수 없으면 DB 에 바로 반영합니다.
+    """
+    if not delta:
+        return
+
+    def _add():
+        try:
+            get_redis_connection('default').hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, project_id, delta)
+        except RedisError:
+            _apply_project_bookmark_count_deltas({project_id: delta})
+
+    transaction.on_commit(_add)
 
 
-def update_project_bookmark_count(project_id: int) -> None:
+def flush_project_bookmark_count_deltas() -> List[int]:
+    """
+    redis 버퍼의 북마크 수 증감을 Project.bookmark_count 에 반영하고 반영한 프로젝트 id 를 반환합니다.
+    잠금을 얻은 한 실행만 버퍼를 RENAME 으로 가져오므로 같은 증감을 두 번 반영하지 않고,
+    이전 실행이 RENAME 과 반영 사이에 중단되어 남긴 flushing 버퍼도 함께 반영합니다.
+    반영에 실패하면 가져온 증감을 버퍼에 되돌립니다.
+    """
+    redis = get_redis_connection('default')
+    flush_lock = redis.lock(PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_KEY, timeout=PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_TIMEOUT_SECONDS)
+    if not flush_lock.acquire(blocking=False):
+        # 다른 실행이 반영중입니다.
+        return []
     try:
-        project = Project.objects.get(id=project_id)
-        project.bookmark_count = ProjectBookmark.objects.filter(
-            project_id=project_id,
-            is_deleted=False,
-        ).count()
-        project.save()
-    except Project.DoesNotExist:
-        return None
+        return _flush_project_bookmark_count_deltas(redis)
+    finally:
+        flush_lock.release()
+
+
+def _flush_project_bookmark_count_deltas(redis) -> List[int]:
+    # 잠금을 얻었으므로 남아있는 flushing 버퍼는 중단된 실행이 남긴 것입니다.
+    flushing_keys = list(redis.scan_iter(f'{PROJECT_BOOKMARK_COUNT_DELTA_KEY}:flushing:*'))
+    flushing_key = f'{PROJECT_BOOKMARK_COUNT_DELTA_KEY}:flushing:{uuid.uuid4().hex}'
+    try:
+        redis.rename(PROJECT_BOOKMARK_COUNT_DELTA_KEY, flushing_key)
+        flushing_keys.append(flushing_key)
+    except ResponseError:
+        # 버퍼가 비어 있습니다.
+        pass
+    if not flushing_keys:
+        return []
+
+    delta_by_project_id = Counter()
+    for key in flushing_keys:
+        for project_id, delta in redis.hgetall(key).items():
+            delta_by_project_id[int(project_id)] += int(delta)
+    try:
+        with transaction.atomic():
+            _apply_project_bookmark_count_deltas(delta_by_project_id)
+    except DatabaseError:
+        pipeline = redis.pipeline(transaction=False)
+        for project_id, delta in delta_by_project_id.items():
+            pipeline.hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, project_id, delta)
+        pipeline.delete(*flushing_keys)
+        pipeline.execute()
+        raise
+    redis.delete(*flushing_keys)
+    return list(delta_by_project_id)
+
+
+def reconcile_project_bookmark_counts(project_ids: List[int]) -> List[int]:
+    """
+    활성 북마크 수를 다시 세어 어긋난 프로젝트만 UPDATE 한 번으로 맞추고, 맞춘 프로젝트 id 를 반환합니다.
+    """
+    if not project_ids:
+        return []
+    active_bookmark_count = Coalesce(
+        Subquery(
+            ProjectBookmark.objects.filter(
+                project_id=OuterRef('id'),
+                is_deleted=False,
+            ).values(
+                'project_id',
+            ).annotate(
+                count=Count('id'),
+            ).values(
+                'count',
+            )
+        ),
+        0,
+    )
+    mismatched_project_ids = list(
+        Project.objects.filter(
+            id__in=project_ids,
+        ).annotate(
+            active_bookmark_count=active_bookmark_count,
+        ).exclude(
+            bookmark_count=F('active_bookmark_count'),
+        ).values_list(
+            'id',
+            flat=True,
+        )
+    )
+    if mismatched_project_ids:
+        Project.objects.filter(
+            id__in=mismatched_project_ids,
+        ).update(
+            bookmark_count=active_bookmark_count,
+        )
+    return mismatched_project_ids
+
+
+_ACTIVATE_BOOKMARKS_SQL = f'''
+INSERT INTO {ProjectBookmark._meta.db_table} (member_id, project_id, is_deleted, deleted_at, created_at, updated_at)
+SELECT %(member_id)s, project.id, FALSE, NULL, %(now)s, %(now)s
+FROM {Project._meta.db_table} project
+WHERE project.id = ANY(%(project_ids)s)
+ON CONFLICT (member_id, project_id) DO UPDATE
+SET is_deleted = FALSE, deleted_at = NULL, updated_at = EXCLUDED.updated_at
+WHERE {ProjectBookmark._meta.db_table}.is_deleted
+RETURNING project_id
+'''
+
+_DEACTIVATE_BOOKMARKS_SQL = f'''
+UPDATE {ProjectBookmark._meta.db_table}
+SET is_deleted = TRUE, deleted_at = %(now)s, updated_at = %(now)s
+WHERE member_id = %(member_id)s
+  AND project_id = ANY(%(project_ids)s)
+  AND NOT is_deleted
+RETURNING project_id
+'''
+
+
+def _execute_bookmark_statement(sql: str, member_id: int, project_ids: List[int]) -> List[int]:
+    if not project_ids:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {'member_id': member_id, 'project_ids': list(project_ids), 'now': timezone.now()})
+        return [project_id for project_id, in cursor.fetchall()]
+
+
+def _activate_bookmarks(member_id: int, project_ids: List[int]) -> List[int]:
+    """
+    INSERT ... ON CONFLICT DO UPDATE 한 문장으로 북마크를 생성하거나 되살립니다.
+    (member, project) unique 제약으로 동시에 요청해도 중복이 생기지 않으며,
+    새로 생성되었거나 되살아난 북마크의 project_id 만 반환합니다. 존재하지 않는 프로젝트는 무시합니다.
+    """
+    return _execute_bookmark_statement(_ACTIVATE_BOOKMARKS_SQL, member_id, project_ids)
+
+
+def _deactivate_bookmarks(member_id: int, project_ids: List[int]) -> List[int]:
+    """
+    UPDATE 한 문장으로 활성 북마크를 삭제 처리하고, 삭제된 북마크의 project_id 만 반환합니다.
+    """
+    return _execute_bookmark_statement(_DEACTIVATE_BOOKMARKS_SQL, member_id, project_ids)
 
 
 class BookmarkService(object):
@@ -47,31 +241,40 @@ class BookmarkService(object):
         )
 
     @transaction.atomic
-    def create_bookmark(self, project_id: int) -> ProjectBookmark:
-        try:
-            project = Project.objects.get(id=project_id)
-            bookmark, is_created = ProjectBookmark.objects.get_or_create(
-                member_id=self.member_id,
-                project_id=project.id,
-            )
-            bookmark.is_deleted = False
-            bookmark.deleted_at = None
-            bookmark.save()
-            update_project_bookmark_count(project.id)
-        except Project.DoesNotExist:
+    def create_bookmark(self, project_id: int) -> None:
+        if _activate_bookmarks(self.member_id, [project_id]):
+            add_project_bookmark_count_delta(project_id, 1)
+            invalidate_member_project_relations([self.member_id])
+            return
+        # 이미 북마크한 경우가 아니라면 프로젝트가 존재하지 않습니다.
+        if not Project.objects.filter(id=project_id).exists():
             raise ProjectBookmarkCreationErrorException()
-        return bookmark
 
     @transaction.atomic
     def delete_bookmark(self, project_id: int) -> None:
-        ProjectBookmark.objects.filter(
-            member_id=self.member_id,
-            project_id=project_id,
-        ).update(
-            is_deleted=True,
-            deleted_at=timezone.now(),
+        if _deactivate_bookmarks(self.member_id, [project_id]):
+            add_project_bookmark_count_delta(project_id, -1)
+            invalidate_member_project_relations([self.member_id])
+
+    @transaction.atomic
+    def sync_bookmarks(self, is_bookmarked_by_project_id: Dict[int, bool]) -> None:
+        """
+        오프라인에서 쌓인 프로젝트별 최종 북마크 여부를 활성화/삭제 두 문장으로 반영합니다.
+        """
+        activated_project_ids = _activate_bookmarks(
+            self.member_id,
+            [project_id for project_id, is_bookmarked in is_bookmarked_by_project_id.items() if is_bookmarked],
+        )
+        deactivated_project_ids = _deactivate_bookmarks(
+            self.member_id,
+            [project_id for project_id, is_bookmarked in is_bookmarked_by_project_id.items() if not is_bookmarked],
         )
-        update_project_bookmark_count(project_id)
+        for project_id in activated_project_ids:
+            add_project_bookmark_count_delta(project_id, 1)
+        for project_id in deactivated_project_ids:
+            add_project_bookmark_count_delta(project_id, -1)
+        if activated_project_ids or deactivated_project_ids:
+            invalidate_member_project_relations([self.member_id])
 
 
 def get_member_bookmarked_project_ids(member: Optional[Union[Member, AnonymousUser]], project_ids: list[int]) -> set[int]:
@@ -82,13 +285,4 @@ def get_member_bookmarked_project_ids(member: Optional[Union[Member, AnonymousUs
     if not project_ids:
         return set()
 
-    return set(
-        ProjectBookmark.objects.filter(
-            member=member,
-            project_id__in=project_ids,
-            is_deleted=False,
-        ).values_list(
-            'project_id',
-            flat=True
-        )
-    )
+    return get_member_project_relations(member.id).bookmarked_project_ids.intersection(project_ids)
@@ -0,0 +1,139 @@
+from typing import (
+    List,
+    Optional,
+)
+
+from common.common_utils.redis_cache_utils import (
+    get_cached_values_with_generations,
+    invalidate_cached_values,
+    set_cached_values_if_generation_unchanged,
+)
+from common.common_utils.request_memo_utils import get_request_memo
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Case,
+    CharField,
+    Value,
+    When,
+)
+from django_redis import get_redis_connection
+from project.consts import (
+    MEMBER_PROJECT_RELATIONS_KEY_PREFIX,
+    MEMBER_PROJECT_RELATIONS_TIMEOUT_SECONDS,
+)
+from project.dtos.model_dtos import MemberProjectRelations
+from project.models import (
+    ProjectBookmark,
+    ProjectMemberManagement,
+)
+from redis.exceptions import RedisError
+
+_BOOKMARKED = 'bookmarked'
+_LED = 'led'
+_PARTICIPATED = 'participated'
+
+
+def _get_member_project_relations_key(member_id: int) -> str:
+    return f'{MEMBER_PROJECT_RELATIONS_KEY_PREFIX}:{member_id}'
+
+
+def _get_member_project_relations_from_db(member_id: int) -> MemberProjectRelations:
+    bookmark_qs = ProjectBookmark.objects.filter(
+        member_id=member_id,
+        is_deleted=False,
+    ).annotate(
+        relation=Value(_BOOKMARKED, output_field=CharField()),
+    ).values_list(
+        'project_id',
+        'relation',
+    )
+    project_member_management_qs = ProjectMemberManagement.objects.filter(
+        member_id=member_id,
+        left_status__isnull=True,
+    ).annotate(
+        relation=Case(
+            When(is_leader=True, then=Value(_LED)),
+            default=Value(_PARTICIPATED),
+            output_field=CharField(),
+        ),
+    ).values_list(
+        'project_id',
+        'relation',
+    )
+
+    member_project_relations = MemberProjectRelations()
+    for project_id, relation in bookmark_qs.union(project_member_management_qs, all=True):
+        if relation == _BOOKMARKED:
+            member_project_relations.bookmarked_project_ids.add(project_id)
+            continue
+        if relation == _LED:
+            member_project_relations.led_project_ids.add(project_id)
+        member_project_relations.participated_project_ids.add(project_id)
+    return member_project_relations
+
+
+def _get_cached_member_project_relations(member_id: int) -> MemberProjectRelations:
+    if not settings.MEMBER_PROJECT_RELATIONS_CACHE_ENABLED:
+        return _get_member_project_relations_from_db(member_id)
+    key = _get_member_project_relations_key(member_id)
+    try:
+        redis = get_redis_connection('default')
+        [cached_member_project_relations], [generation] = get_cached_values_with_generations(redis, [key])
+    except RedisError:
+        return _get_member_project_relations_from_db(member_id)
+    if cached_member_project_relations is not None:
+        return MemberProjectRelations.model_validate_json(cached_member_project_relations)
+
+    member_project_relations = _get_member_project_relations_from_db(member_id)
+    try:
+        set_cached_values_if_generation_unchanged(
+            redis,
+            [(key, generation, member_project_relations.model_dump_json())],
+            MEMBER_PROJECT_RELATIONS_TIMEOUT_SECONDS,
+        )
+    except RedisError:
+        pass
+    return member_project_relations
+
+
+def get_member_project_relations(member_id: Optional[int]) -> MemberProjectRelations:
+    """
+    회원이 북마크/리드/참여 중인 프로젝트 id 집합을 반환합니다.
+    redis 에 캐시하고 없으면 DB 에서 쿼리 한 번으로 다시 만들며, 같은 요청 안에서는 한 번만 조회합니다.
+    """
+    if not member_id:
+        return MemberProjectRelations()
+    request_memo = get_request_memo()
+    memo_key = _get_member_project_relations_key(member_id)
+    if request_memo is not None and memo_key in request_memo:
+        return request_memo[memo_key]
+
+    member_project_relations = _get_cached_member_project_relations(member_id)
+    if request_memo is not None:
+        request_memo[memo_key] = member_project_relations
+    return member_project_relations
+
+
+def invalidate_member_project_relations(member_ids: List[int]) -> None:
+    """
+    요청 메모에서는 즉시, redis 캐시에서는 커밋 이후 회원의 프로젝트 관계를 삭제합니다.
+    북마크, 팀원/리더 변경 시 호출되며 다음 조회에서 다시 만들어집니다.
+    """
+    if not member_ids:
+        return
+    request_memo = get_request_memo()
+    if request_memo is not None:
+        for member_id in member_ids:
+            request_memo.pop(_get_member_project_relations_key(member_id), None)
+
+    def _invalidate():
+        try:
+            invalidate_cached_values(
+                get_redis_connection('default'),
+                [_get_member_project_relations_key(member_id) for member_id in member_ids],
+            )
+        except RedisError:
+            pass
+
+    transaction.on_commit(_invalidate)
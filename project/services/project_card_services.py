@@ -0,0 +1,245 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from common.common_utils import format_utc
+from common.common_utils.redis_cache_utils import (
+    get_cached_values_with_generations,
+    invalidate_cached_values,
+    set_cached_values_if_generation_unchanged,
+)
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import transaction
+from django.db.models import (
+    OuterRef,
+    QuerySet,
+)
+from django.db.models.functions import (
+    JSONObject,
+    Left,
+)
+from django_redis import get_redis_connection
+from job.dtos.model_dtos import (
+    ProjectJobAvailabilities,
+    ProjectJobRecruitInfo,
+)
+from member.models import Member
+from project.consts import (
+    PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY,
+    PROJECT_CARD_FRAGMENT_KEY_PREFIX,
+    PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY,
+    PROJECT_CARD_FRAGMENT_TIMEOUT_SECONDS,
+    PROJECT_SIMPLE_DESCRIPTION_LENGTH,
+    ProjectRecruitmentStatus,
+)
+from project.dtos.model_dtos import (
+    MemberProjectRelations,
+    MyProjectBookmarkListItem,
+    ProjectCardFragment,
+    ProjectListItem,
+)
+from project.models import (
+    Project,
+    ProjectRecruitmentJob,
+)
+from project.services.member_relation_services import get_member_project_relations
+from redis.exceptions import RedisError
+
+# ProjectListItem, MyProjectBookmarkListItem 및 목록 cursor 에 필요한 컬럼
+PROJECT_CARD_FIELDS = (
+    'id',
+    'category',
+    'title',
+    'job_experience_type',
+    'current_recruit_status',
+    'main_image',
+    'hours_per_week',
+    'latest_recruited_at',
+    'rearrangement_time',
+)
+
+
+def get_project_card_qs(qs: QuerySet[Project]) -> QuerySet[Project]:
+    """
+    목록 카드에 필요한 컬럼만 조회하고 description 은 SQL 에서 잘라 simple_description 으로 annotate 합니다.
+    """
+    return qs.only(
+        *PROJECT_CARD_FIELDS,
+    ).annotate(
+        simple_description=Left('description', PROJECT_SIMPLE_DESCRIPTION_LENGTH),
+    )
+
+
+def _get_project_card_fragment_key(project_id: int) -> str:
+    return f'{PROJECT_CARD_FRAGMENT_KEY_PREFIX}:{project_id}'
+
+
+def _get_project_card_fragments_from_db(project_ids: List[int]) -> Dict[int, ProjectCardFragment]:
+    projects = get_project_card_qs(
+        Project.objects.filter(
+            id__in=project_ids,
+        )
+    ).annotate(
+        job_recruits=ArraySubquery(
+            ProjectRecruitmentJob.objects.filter(
+                project_recruitment__project_id=OuterRef('id'),
+                project_recruitment__recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
+            ).order_by(
+                'id',
+            ).values(
+                json=JSONObject(
+                    job_id='job_id',
+                    job_name='job__name',
+                    job_display_name='job__display_name',
+                    total_limit='total_limit',
+                    current_recruited='current_recruited',
+                    recruit_status='recruit_status',
+                ),
+            ),
+        ),
+    )
+    return {
+        project.id: ProjectCardFragment(
+            id=project.id,
+            category_id=project.category_id,
+            title=project.title,
+            simple_description=project.simple_description,
+            jobs=[
+                ProjectJobAvailabilities.from_recruit_info(ProjectJobRecruitInfo(**job_recruit))
+                for job_recruit in project.job_recruits or []
+            ],
+            experience=project.job_experience_type,
+            hours_per_week=project.hours_per_week,
+            current_recruit_status=project.current_recruit_status,
+            image=project.main_image,
+            recent_recruited_at=format_utc(project.latest_recruited_at) if project.latest_recruited_at else None,
+        )
+        for project in projects
+    }
+
+
+def get_project_card_fragments(project_ids: List[int]) -> Dict[int, ProjectCardFragment]:
+    """
+    프로젝트 카드 내용을 redis MGET 한 번으로 조회하고, 없는 프로젝트만 DB 에서 조회해 redis 에 저장합니다.
+    조회 결과는 hit/miss 카운터에 누적됩니다.
+    """
+    if not project_ids:
+        return {}
+    if not settings.PROJECT_CARD_FRAGMENT_CACHE_ENABLED:
+        return _get_project_card_fragments_from_db(project_ids)
+
+    keys = [_get_project_card_fragment_key(project_id) for project_id in project_ids]
+    try:
+        redis = get_redis_connection('default')
+        cached_fragments, generations = get_cached_values_with_generations(redis, keys)
+    except RedisError:
+        return _get_project_card_fragments_from_db(project_ids)
+
+    fragment_by_project_id = {
+        project_id: ProjectCardFragment.model_validate_json(cached_fragment)
+        for project_id, cached_fragment in zip(project_ids, cached_fragments)
+        if cached_fragment is not None
+    }
+    missed_project_ids = [project_id for project_id in project_ids if project_id not in fragment_by_project_id]
+    missed_fragment_by_project_id = _get_project_card_fragments_from_db(missed_project_ids) if missed_project_ids else {}
+    fragment_by_project_id.update(missed_fragment_by_project_id)
+
+    try:
+        pipeline = redis.pipeline(transaction=False)
+        set_cached_values_if_generation_unchanged(
+            pipeline,
+            [
+                (key, generation, missed_fragment_by_project_id[project_id].model_dump_json())
+                for project_id, key, generation in zip(project_ids, keys, generations)
+                if project_id in missed_fragment_by_project_id
+            ],
+            PROJECT_CARD_FRAGMENT_TIMEOUT_SECONDS,
+        )
+        pipeline.incrby(PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY, len(project_ids) - len(missed_project_ids))
+        pipeline.incrby(PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY, len(missed_project_ids))
+        pipeline.execute()
+    except RedisError:
+        pass
+    return fragment_by_project_id
+
+
+def invalidate_project_card_fragments(project_ids: List[int]) -> None:
+    """
+    커밋 이후 프로젝트 카드 내용을 삭제합니다. 다음 목록 조회에서 DB 로부터 다시 만들어집니다.
+    """
+    if not project_ids:
+        return
+
+    def _invalidate():
+        try:
+            invalidate_cached_values(
+                get_redis_connection('default'),
+                [_get_project_card_fragment_key(project_id) for project_id in project_ids],
+            )
+        except RedisError:
+            pass
+
+    transaction.on_commit(_invalidate)
+
+
+def get_project_card_fragment_hit_counts() -> Tuple[int, int]:
+    """
+    누적된 프로젝트 카드 캐시 (hit, miss) 수를 반환합니다.
+    """
+    hit_count, miss_count = get_redis_connection('default').mget(
+        [PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY, PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY]
+    )
+    return int(hit_count or 0), int(miss_count or 0)
+
+
+class ProjectCardAssembler(object):
+    """
+    프로젝트 id 목록으로 목록 카드를 조립합니다.
+    카드 내용은 get_project_card_fragments 로, 회원의 북마크/리더/참여 여부는 회원별 프로젝트 관계 집합으로 판단합니다.
+    """
+    def __init__(self, member: Optional[Union[Member, AnonymousUser]]):
+        self.member_id = member.id if member and member.is_authenticated else None
+
+    def get_member_project_relations(self) -> MemberProjectRelations:
+        return get_member_project_relations(self.member_id)
+
+    def get_project_list_items(self, project_ids: List[int]) -> List[ProjectListItem]:
+        if not project_ids:
+            return []
+        fragment_by_project_id = get_project_card_fragments(project_ids)
+        member_project_relations = self.get_member_project_relations()
+        return [
+            ProjectListItem(
+                **fragment_by_project_id[project_id].model_dump(),
+                is_bookmarked=project_id in member_project_relations.bookmarked_project_ids,
+            )
+            for project_id in project_ids
+            if project_id in fragment_by_project_id
+        ]
+
+    def get_my_project_bookmark_list_items(self, project_ids: List[int]) -> List[MyProjectBookmarkListItem]:
+        if not project_ids:
+            return []
+        fragment_by_project_id = get_project_card_fragments(project_ids)
+        member_project_relations = self.get_member_project_relations()
+        my_project_bookmark_list_items = []
+        for project_id in project_ids:
+            if project_id not in fragment_by_project_id:
+                continue
+            is_leader = project_id in member_project_relations.led_project_ids
+            my_project_bookmark_list_items.append(
+                MyProjectBookmarkListItem(
+                    **fragment_by_project_id[project_id].model_dump(),
+                    is_bookmarked=True,
+                    is_leader=is_leader,
+                    is_member_manageable=is_leader,
+                    is_participated=project_id in member_project_relations.participated_project_ids,
+                )
+            )
+        return my_project_bookmark_list_items
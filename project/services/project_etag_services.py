@@ -0,0 +1,63 @@
+import hashlib
+from typing import Optional
+
+from django.db.models import (
+    Count,
+    Max,
+)
+from project.models import (
+    Project,
+    ProjectRecruitment,
+)
+
+
+def _make_etag(*parts) -> str:
+    return '"{}"'.format(hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest())
+
+
+def _get_project_recruitment_version(project_id: int) -> tuple:
+    """
+    프로젝트 모집/모집 직무의 마지막 수정 일시와 개수를 집계 쿼리 한 번으로 조회합니다.
+    """
+    project_recruitment_version = ProjectRecruitment.objects.filter(
+        project_id=project_id,
+    ).aggregate(
+        recruitment_updated_at=Max('updated_at'),
+        recruitment_job_updated_at=Max('projectrecruitmentjob__updated_at'),
+        recruitment_job_count=Count('projectrecruitmentjob'),
+    )
+    return (
+        project_recruitment_version['recruitment_updated_at'],
+        project_recruitment_version['recruitment_job_updated_at'],
+        project_recruitment_version['recruitment_job_count'],
+    )
+
+
+def get_project_detail_etag(project: Project, is_bookmarked: bool, leader_info_block_json: Optional[str]) -> Optional[str]:
+    """
+    프로젝트 상세 응답의 버전 토큰입니다.
+    리더 정보 블록은 캐시된 JSON 으로만 확인하므로 캐시가 없으면 None 을 반환합니다. (비교하지 않고 응답을 새로 만듭니다.)
+    """
+    if leader_info_block_json is None:
+        return None
+    return _make_etag(
+        'project_detail',
+        project.id,
+        project.updated_at.isoformat(),
+        project.bookmark_count,
+        *_get_project_recruitment_version(project.id),
+        is_bookmarked,
+        hashlib.sha1(leader_info_block_json.encode()).hexdigest(),
+    )
+
+
+def get_project_recruit_eligible_etag(project: Project) -> str:
+    """
+    프로젝트 모집 가능 여부 응답의 버전 토큰입니다. 회원과 무관합니다.
+    """
+    return _make_etag(
+        'project_recruit_eligible',
+        project.id,
+        project.updated_at.isoformat(),
+        *_get_project_recruitment_version(project.id),
+    )
@@ -0,0 +1,107 @@
+from typing import (
+    Dict,
+    Optional,
+)
+
+from django.db.models import (
+    Count,
+    F,
+    Func,
+    PositiveIntegerField,
+    QuerySet,
+)
+from project.consts import ProjectHomeFacet
+from project.dtos.model_dtos import HomeProjectFacetCounts
+from project.dtos.request_dtos import HomeProjectListRequest
+from project.models import Project
+from project.services.project_filter_index_services import get_filter_indexed_home_project_facet_counts
+from project.services.project_search_services import get_searched_project_qs
+from project.services.project_services import get_filtered_project_qs
+
+
+def _get_facet_filtered_project_qs(home_project_list_request: HomeProjectListRequest,
+                                   exclude_facet: Optional[str] = None) -> QuerySet[Project]:
+    # 검색 정확도순 목록과 같은 프로젝트를 세도록, 제목 ILIKE 대신 목록과 같은 검색 조건을 사용합니다.
+    is_relevance_search = home_project_list_request.is_relevance_search()
+    is_job_excluded = exclude_facet == ProjectHomeFacet.JOB.value
+    project_qs = get_filtered_project_qs(
+        title=None if is_relevance_search else home_project_list_request.title,
+        category_ids=(
+            None if exclude_facet == ProjectHomeFacet.CATEGORY.value
+            else home_project_list_request.category_ids
+        ),
+        job_ids=None if is_job_excluded else home_project_list_request.job_ids,
+        job_category_ids=None if is_job_excluded else home_project_list_request.job_category_ids,
+        jobs_operator=home_project_list_request.jobs_operator,
+        experience=(
+            None if exclude_facet == ProjectHomeFacet.EXPERIENCE.value
+            else home_project_list_request.experience
+        ),
+        min_hours_per_week=home_project_list_request.min_hours_per_week,
+        max_hours_per_week=home_project_list_request.max_hours_per_week,
+        min_duration_month=home_project_list_request.min_duration_month,
+        max_duration_month=home_project_list_request.max_duration_month,
+        current_recruit_status=(
+            None if exclude_facet == ProjectHomeFacet.CURRENT_RECRUIT_STATUS.value
+            else home_project_list_request.current_recruit_status
+        ),
+    )
+    if is_relevance_search:
+        project_qs = get_searched_project_qs(project_qs, home_project_list_request.title)
+    return project_qs
+
+
+def _get_count_by_value(qs: QuerySet[Project], field: str) -> Dict[object, int]:
+    return {
+        facet_value['value']: facet_value['count']
+        for facet_value in qs.order_by().values(
+            value=F(field),
+        ).annotate(
+            count=Count('id'),
+        )
+    }
+
+
+def _get_count_by_array_value(qs: QuerySet[Project], field: str) -> Dict[int, int]:
+    return {
+        facet_value['value']: facet_value['count']
+        for facet_value in qs.order_by().annotate(
+            value=Func(F(field), function='unnest', output_field=PositiveIntegerField()),
+        ).values(
+            'value',
+        ).annotate(
+            count=Count('id'),
+        )
+    }
+
+
+def get_home_project_facet_counts_from_db(home_project_list_request: HomeProjectListRequest) -> HomeProjectFacetCounts:
+    job_facet_qs = _get_facet_filtered_project_qs(home_project_list_request, ProjectHomeFacet.JOB.value)
+    return HomeProjectFacetCounts.of(
+        total_count=_get_facet_filtered_project_qs(home_project_list_request).count(),
+        count_by_category_id=_get_count_by_value(
+            _get_facet_filtered_project_qs(home_project_list_request, ProjectHomeFacet.CATEGORY.value),
+            'category_id',
+        ),
+        count_by_job_id=_get_count_by_array_value(job_facet_qs, 'latest_project_recruitment_job_ids'),
+        count_by_job_category_id=_get_count_by_array_value(job_facet_qs, 'latest_project_recruitment_job_category_ids'),
+        count_by_experience=_get_count_by_value(
+            _get_facet_filtered_project_qs(home_project_list_request, ProjectHomeFacet.EXPERIENCE.value),
+            'job_experience_type',
+        ),
+        count_by_current_recruit_status=_get_count_by_value(
+            _get_facet_filtered_project_qs(home_project_list_request, ProjectHomeFacet.CURRENT_RECRUIT_STATUS.value),
+            'current_recruit_status',
+        ),
+    )
+
+
+def get_home_project_facet_counts(home_project_list_request: HomeProjectListRequest) -> HomeProjectFacetCounts:
+    """
+    홈 필터 facet 값마다 자신을 제외한 나머지 조건을 만족하는 프로젝트 수를 반환합니다.
+    worker 필터 인덱스를 우선 사용하고, 사용할 수 없으면 DB 에서 집계합니다.
+    """
+    facet_counts = get_filter_indexed_home_project_facet_counts(home_project_list_request)
+    if facet_counts is not None:
+        return facet_counts
+    return get_home_project_facet_counts_from_db(home_project_list_request)
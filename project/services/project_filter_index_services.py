@@ -0,0 +1,418 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from typing import (
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.conf import settings
+from django.db import transaction
+from django_redis import get_redis_connection
+from project.consts import (
+    PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY,
+    PROJECT_FILTER_INDEX_CHANGE_STREAM_MAXLEN,
+    PROJECT_FILTER_INDEX_MAX_AGE_SECONDS,
+    ProjectCurrentRecruitStatus,
+    ProjectHomeFacet,
+    ProjectJobSearchOperator,
+)
+from project.cursor_criteria.cursor_criteria import HomeProjectListCursorCriteria
+from project.dtos.model_dtos import HomeProjectFacetCounts
+from project.dtos.request_dtos import HomeProjectListRequest
+from project.models import Project
+from redis.exceptions import RedisError
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+SCALAR_FACET_FIELDS = (
+    'category_id',
+    'job_experience_type',
+    'current_recruit_status',
+    'hours_per_week',
+    'duration_month',
+)
+ARRAY_FACET_FIELDS = (
+    'latest_project_recruitment_job_ids',
+    'latest_project_recruitment_job_category_ids',
+)
+FILTER_INDEX_PROJECT_FIELDS = ('id', 'rearrangement_time') + SCALAR_FACET_FIELDS + ARRAY_FACET_FIELDS
+
+FilterIndexSortKey = Tuple[int, int]
+
+
+def publish_project_filter_index_changes(project_ids: List[int]) -> None:
+    """
+    커밋 이후 변경된 프로젝트 id 를 변경 스트림에 남깁니다.
+    각 worker 의 필터 인덱스는 다음 조회에서 스트림을 읽어 해당 프로젝트만 다시 반영합니다.
+    """
+    if not project_ids:
+        return
+
+    def _publish():
+        try:
+            pipeline = get_redis_connection('default').pipeline()
+            for project_id in project_ids:
+                pipeline.xadd(
+                    PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY,
+                    {'project_id': project_id},
+                    maxlen=PROJECT_FILTER_INDEX_CHANGE_STREAM_MAXLEN,
+                    approximate=True,
+                )
+            pipeline.execute()
+        except RedisError:
+            # 유실된 변경은 조회 시 행 검증 혹은 주기적인 전체 재구성으로 반영됩니다.
+            pass
+
+    transaction.on_commit(_publish)
+
+
+def _parse_stream_id(stream_id: str) -> Tuple[int, int]:
+    milliseconds, sequence = stream_id.split('-')
+    return int(milliseconds), int(sequence)
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class ProjectFilterIndex(object):
+    """
+    worker 메모리에 활성 프로젝트의 필터 값마다 프로젝트 id bitset 을 유지합니다.
+    bitset 의 n 번째 bit 는 id 가 n 인 프로젝트이며, 정렬은 (rearrangement_time, id) 내림차순 key 목록으로 유지합니다.
+    """
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.is_built = False
+        self.built_at = 0.0
+        self.last_stream_id = '0-0'
+        self.all_bits = 0
+        self.rows: Dict[int, dict] = {}
+        self.bits_by_field: Dict[str, DefaultDict[object, int]] = {
+            field: defaultdict(int) for field in SCALAR_FACET_FIELDS + ARRAY_FACET_FIELDS
+        }
+        self.sort_keys: List[FilterIndexSortKey] = []
+
+    @staticmethod
+    def _get_sort_key(rearrangement_time: datetime, project_id: int) -> FilterIndexSortKey:
+        return -((rearrangement_time - EPOCH) // timedelta(microseconds=1)), -project_id
+
+    @staticmethod
+    def _get_row(project: Project) -> dict:
+        return {field: getattr(project, field) for field in FILTER_INDEX_PROJECT_FIELDS}
+
+    def _add(self, row: dict) -> None:
+        project_id = row['id']
+        bit = 1 << project_id
+        self.rows[project_id] = row
+        self.all_bits |= bit
+        for field in SCALAR_FACET_FIELDS:
+            self.bits_by_field[field][row[field]] |= bit
+        for field in ARRAY_FACET_FIELDS:
+            for value in row[field]:
+                self.bits_by_field[field][value] |= bit
+        bisect.insort(self.sort_keys, self._get_sort_key(row['rearrangement_time'], project_id))
+
+    def _remove(self, project_id: int) -> None:
+        row = self.rows.pop(project_id, None)
+        if row is None:
+            return
+        mask = ~(1 << project_id)
+        self.all_bits &= mask
+        for field in SCALAR_FACET_FIELDS + ARRAY_FACET_FIELDS:
+            values = row[field] if field in ARRAY_FACET_FIELDS else [row[field]]
+            bits_by_value = self.bits_by_field[field]
+            for value in values:
+                bits_by_value[value] &= mask
+                if not bits_by_value[value]:
+                    del bits_by_value[value]
+        sort_key = self._get_sort_key(row['rearrangement_time'], project_id)
+        index = bisect.bisect_left(self.sort_keys, sort_key)
+        if index < len(self.sort_keys) and self.sort_keys[index] == sort_key:
+            del self.sort_keys[index]
+
+    def _build(self, redis) -> None:
+        # 적재 중 커밋된 변경을 놓치지 않도록 스트림 위치를 먼저 기록합니다.
+        last_entries = redis.xrevrange(PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY, count=1)
+        self.reset()
+        self.last_stream_id = _decode(last_entries[0][0]) if last_entries else '0-0'
+        for row in Project.objects.filter(is_deleted=False).values(*FILTER_INDEX_PROJECT_FIELDS).iterator():
+            self._add(row)
+        self.is_built = True
+        self.built_at = time.monotonic()
+
+    def _apply_changes(self, entries: list) -> None:
+        project_ids = {int(_decode(fields[b'project_id'])) for _, fields in entries}
+        for project_id in project_ids:
+            self._remove(project_id)
+        for row in Project.objects.filter(
+            id__in=project_ids,
+            is_deleted=False,
+        ).values(*FILTER_INDEX_PROJECT_FIELDS):
+            self._add(row)
+        self.last_stream_id = _decode(entries[-1][0])
+
+    def refresh(self) -> bool:
+        """
+        변경 스트림을 읽어 인덱스를 최신으로 맞춥니다.
+        스트림을 읽을 수 없으면 False 를 반환합니다.
+        """
+        with self.lock:
+            try:
+                redis = get_redis_connection('default')
+                if not self.is_built or time.monotonic() - self.built_at > PROJECT_FILTER_INDEX_MAX_AGE_SECONDS:
+                    self._build(redis)
+                    return True
+
+                pipeline = redis.pipeline()
+                pipeline.xrange(PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY, count=1)
+                pipeline.xrange(PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY, min=f'({self.last_stream_id}')
+                first_entries, entries = pipeline.execute()
+                if (
+                    first_entries
+                    and self.last_stream_id != '0-0'
+                    and _parse_stream_id(_decode(first_entries[0][0])) > _parse_stream_id(self.last_stream_id)
+                ):
+                    # 마지막으로 읽은 위치가 maxlen 으로 잘려나갔으므로 전체 재구성합니다.
+                    self._build(redis)
+                elif entries:
+                    self._apply_changes(entries)
+            except RedisError:
+                return False
+        return True
+
+    def _get_union_bits(self, field: str, values: list) -> int:
+        bits = 0
+        bits_by_value = self.bits_by_field[field]
+        for value in values:
+            bits |= bits_by_value.get(value, 0)
+        return bits
+
+    def _get_intersection_bits(self, field: str, values: list) -> int:
+        bits = self.all_bits
+        bits_by_value = self.bits_by_field[field]
+        for value in values:
+            bits &= bits_by_value.get(value, 0)
+        return bits
+
+    def _get_jobs_bits(self, job_ids: List[int], job_category_ids: List[int], jobs_operator: str) -> int:
+        field_values = [
+            (field, values)
+            for field, values in zip(ARRAY_FACET_FIELDS, (job_ids, job_category_ids))
+            if values
+        ]
+        if not field_values:
+            return self.all_bits
+        if jobs_operator == ProjectJobSearchOperator.OR.value:
+            bits = 0
+            for field, values in field_values:
+                bits |= self._get_union_bits(field, values)
+            return bits
+        if jobs_operator == ProjectJobSearchOperator.AND.value:
+            bits = self.all_bits
+            for field, values in field_values:
+                bits &= self._get_intersection_bits(field, values)
+            return bits
+        return self.all_bits
+
+    def _get_range_bits(self, field: str, min_value: Optional[int], max_value: Optional[int]) -> int:
+        # get_filtered_project_qs 와 동일하게 한쪽 범위만 있으면 값이 없는 프로젝트도 포함합니다.
+        if not min_value and not max_value:
+            return self.all_bits
+        bits = 0
+        for value, value_bits in self.bits_by_field[field].items():
+            if value is None:
+                if not (min_value and max_value):
+                    bits |= value_bits
+                continue
+            if min_value and value < min_value:
+                continue
+            if max_value and value > max_value:
+                continue
+            bits |= value_bits
+        return bits
+
+    def get_filtered_bits(self,
+                          home_project_list_request: HomeProjectListRequest,
+                          exclude_facet: Optional[str] = None) -> int:
+        """
+        exclude_facet 을 넘기면 해당 facet 조건을 제외합니다. (facet 별 건수 계산용)
+        """
+        bits = self.all_bits
+        if home_project_list_request.category_ids and exclude_facet != ProjectHomeFacet.CATEGORY.value:
+            bits &= self._get_union_bits('category_id', home_project_list_request.category_ids)
+        if exclude_facet != ProjectHomeFacet.JOB.value:
+            bits &= self._get_jobs_bits(
+                home_project_list_request.job_ids,
+                home_project_list_request.job_category_ids,
+                home_project_list_request.jobs_operator,
+            )
+        if home_project_list_request.experience and exclude_facet != ProjectHomeFacet.EXPERIENCE.value:
+            bits &= self._get_union_bits('job_experience_type', [home_project_list_request.experience])
+        if exclude_facet != ProjectHomeFacet.CURRENT_RECRUIT_STATUS.value:
+            if home_project_list_request.current_recruit_status == ProjectCurrentRecruitStatus.RECRUITING.value:
+                bits &= self._get_union_bits(
+                    'current_recruit_status',
+                    [ProjectCurrentRecruitStatus.RECRUITING.value, ProjectCurrentRecruitStatus.ADDITIONAL_RECRUITING.value],
+                )
+            elif home_project_list_request.current_recruit_status == ProjectCurrentRecruitStatus.RECRUITED.value:
+                bits &= self._get_union_bits('current_recruit_status', [ProjectCurrentRecruitStatus.RECRUITED.value])
+        bits &= self._get_range_bits(
+            'hours_per_week',
+            home_project_list_request.min_hours_per_week,
+            home_project_list_request.max_hours_per_week,
+        )
+        bits &= self._get_range_bits(
+            'duration_month',
+            home_project_list_request.min_duration_month,
+            home_project_list_request.max_duration_month,
+        )
+        return bits
+
+    def _get_count_by_value(self, field: str, bits: int) -> Dict[object, int]:
+        return {
+            value: (bits & value_bits).bit_count()
+            for value, value_bits in self.bits_by_field[field].items()
+        }
+
+    def get_facet_counts(self, home_project_list_request: HomeProjectListRequest) -> Optional[HomeProjectFacetCounts]:
+        """
+        facet 값마다 자신을 제외한 나머지 조건을 만족하는 프로젝트 수를 계산합니다.
+        인덱스를 최신으로 맞출 수 없으면 None 을 반환합니다.
+        """
+        if not self.refresh():
+            return None
+
+        with self.lock:
+            job_bits = self.get_filtered_bits(home_project_list_request, ProjectHomeFacet.JOB.value)
+            return HomeProjectFacetCounts.of(
+                total_count=self.get_filtered_bits(home_project_list_request).bit_count(),
+                count_by_category_id=self._get_count_by_value(
+                    'category_id',
+                    self.get_filtered_bits(home_project_list_request, ProjectHomeFacet.CATEGORY.value),
+                ),
+                count_by_job_id=self._get_count_by_value('latest_project_recruitment_job_ids', job_bits),
+                count_by_job_category_id=self._get_count_by_value('latest_project_recruitment_job_category_ids', job_bits),
+                count_by_experience=self._get_count_by_value(
+                    'job_experience_type',
+                    self.get_filtered_bits(home_project_list_request, ProjectHomeFacet.EXPERIENCE.value),
+                ),
+                count_by_current_recruit_status=self._get_count_by_value(
+                    'current_recruit_status',
+                    self.get_filtered_bits(home_project_list_request, ProjectHomeFacet.CURRENT_RECRUIT_STATUS.value),
+                ),
+            )
+
+    def get_sorted_project_ids(self,
+                               bits: int,
+                               cursor_sort_key: Optional[FilterIndexSortKey],
+                               limit: int) -> List[int]:
+        """
+        cursor 이후 정렬 key 순으로 bitset 에 포함된 프로젝트 id 를 limit 개까지 반환합니다.
+        """
+        if not bits:
+            return []
+        # int 의 shift 는 최대 id 에 비례하므로, bytes 로 한 번 바꿔 id 마다 O(1) 로 확인합니다.
+        bit_bytes = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+        start = bisect.bisect_right(self.sort_keys, cursor_sort_key) if cursor_sort_key else 0
+        project_ids = []
+        for index in range(start, len(self.sort_keys)):
+            project_id = -self.sort_keys[index][1]
+            byte_index = project_id >> 3
+            if byte_index < len(bit_bytes) and bit_bytes[byte_index] >> (project_id & 7) & 1:
+                project_ids.append(project_id)
+                if len(project_ids) >= limit:
+                    break
+        return project_ids
+
+    def get_projects_page(self,
+                          home_project_list_request: HomeProjectListRequest,
+                          decoded_next_cursor: dict,
+                          size: int) -> Optional[Tuple[List[Project], bool, Optional[str]]]:
+        """
+        get_objects_with_cursor_pagination 과 같은 (projects, has_more, next_cursor) 를 반환합니다.
+        인덱스를 최신으로 맞출 수 없거나 조회한 프로젝트가 인덱스와 다르면 None 을 반환합니다.
+        """
+        cursor_sort_key = None
+        if decoded_next_cursor:
+            try:
+                cursor_sort_key = self._get_sort_key(
+                    datetime.fromisoformat(decoded_next_cursor['rearrangement_time__lt']),
+                    int(decoded_next_cursor['id__lt']),
+                )
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        if not self.refresh():
+            return None
+
+        with self.lock:
+            project_ids = self.get_sorted_project_ids(
+                self.get_filtered_bits(home_project_list_request),
+                cursor_sort_key,
+                size + 1,
+            )
+            rows_by_project_id = {project_id: self.rows[project_id] for project_id in project_ids}
+
+        projects_by_id = Project.objects.only(
+            *FILTER_INDEX_PROJECT_FIELDS,
+            'is_deleted',
+        ).in_bulk(project_ids)
+        projects = []
+        for project_id in project_ids:
+            project = projects_by_id.get(project_id)
+            if project is None or project.is_deleted or self._get_row(project) != rows_by_project_id[project_id]:
+                # 변경 스트림에 반영되지 않은 변경이므로 다음 조회에서 전체 재구성합니다.
+                with self.lock:
+                    self.is_built = False
+                return None
+            projects.append(project)
+
+        has_more = bool(len(projects) > size)
+        paginated_projects = projects[:size]
+        return (
+            paginated_projects,
+            has_more,
+            (
+                HomeProjectListCursorCriteria.get_encoded_base64_cursor_data(paginated_projects[-1])
+                if has_more else None
+            ),
+        )
+
+
+project_filter_index = ProjectFilterIndex()
+
+
+def get_filter_indexed_home_projects(home_project_list_request: HomeProjectListRequest,
+                                     decoded_next_cursor: dict,
+                                     size: int) -> Optional[Tuple[List[Project], bool, Optional[str]]]:
+    """
+    제목 검색이 없는 홈 목록을 worker 필터 인덱스로 조회합니다.
+    None 이면 get_filtered_project_qs 로 조회합니다.
+    """
+    if not settings.PROJECT_FILTER_INDEX_ENABLED or home_project_list_request.title:
+        return None
+    return project_filter_index.get_projects_page(home_project_list_request, decoded_next_cursor, size)
+
+
+def get_filter_indexed_home_project_facet_counts(
+        home_project_list_request: HomeProjectListRequest) -> Optional[HomeProjectFacetCounts]:
+    """
+    제목 검색이 없는 홈 facet 건수를 worker 필터 인덱스로 계산합니다.
+    None 이면 DB 집계로 계산합니다.
+    """
+    if not settings.PROJECT_FILTER_INDEX_ENABLED or home_project_list_request.title:
+        return None
+    return project_filter_index.get_facet_counts(home_project_list_request)
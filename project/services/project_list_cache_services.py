@@ -0,0 +1,110 @@
+import hashlib
+import json
+from typing import (
+    Optional,
+    Union,
+)
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import (
+    HOME_PROJECT_LIST_CACHE_KEY_PREFIX,
+    HOME_PROJECT_LIST_CACHE_TIMEOUT_SECONDS,
+    PROJECT_LIST_VERSION_KEY,
+)
+from project.dtos.request_dtos import HomeProjectListRequest
+from project.services.bookmark_services import get_member_bookmarked_project_ids
+from redis.exceptions import RedisError
+
+
+def bump_project_list_version() -> None:
+    """
+    커밋 이후 프로젝트 목록 버전을 올립니다.
+    캐시 키에 버전이 포함되므로 이전 버전의 목록 캐시는 더 이상 조회되지 않고 만료됩니다.
+    """
+    def _bump():
+        try:
+            get_redis_connection('default').incr(PROJECT_LIST_VERSION_KEY)
+        except RedisError:
+            pass
+
+    transaction.on_commit(_bump)
+
+
+def _get_home_project_list_cache_key(version: int,
+                                     home_project_list_request: HomeProjectListRequest,
+                                     decoded_next_cursor: Optional[dict],
+                                     size: int) -> str:
+    normalized_request = {
+        field: sorted(value) if isinstance(value, list) else value
+        for field, value in home_project_list_request.model_dump().items()
+    }
+    normalized = json.dumps(
+        {
+            'request': normalized_request,
+            'cursor': decoded_next_cursor or None,
+            'size': size,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return f'{HOME_PROJECT_LIST_CACHE_KEY_PREFIX}:{version}:{hashlib.sha1(normalized.encode()).hexdigest()}'
+
+
+class HomeProjectListCache(object):
+    """
+    회원과 무관한 홈 목록 응답(is_bookmarked 는 모두 False)을 목록 버전별로 캐시합니다.
+    로그인 회원에게는 캐시된 응답에 자신의 북마크 여부만 덧씌워 반환합니다.
+    """
+    def __init__(self, home_project_list_request: HomeProjectListRequest, decoded_next_cursor: Optional[dict], size: int):
+        self.home_project_list_request = home_project_list_request
+        self.decoded_next_cursor = decoded_next_cursor
+        self.size = size
+        self.cache_key = None
+
+    def get(self) -> Optional[dict]:
+        if not settings.PROJECT_LIST_CACHE_ENABLED:
+            return None
+        try:
+            redis = get_redis_connection('default')
+            version = int(redis.get(PROJECT_LIST_VERSION_KEY) or 0)
+            self.cache_key = _get_home_project_list_cache_key(
+                version,
+                self.home_project_list_request,
+                self.decoded_next_cursor,
+                self.size,
+            )
+            cached = redis.get(self.cache_key)
+        except RedisError:
+            return None
+        if cached is None:
+            return None
+        return json.loads(cached)
+
+    def set(self, response_data: dict) -> None:
+        if not self.cache_key:
+            return
+        try:
+            get_redis_connection('default').set(
+                self.cache_key,
+                json.dumps({
+                    **response_data,
+                    'data': [{**project, 'is_bookmarked': False} for project in response_data['data']],
+                }),
+                ex=HOME_PROJECT_LIST_CACHE_TIMEOUT_SECONDS,
+            )
+        except RedisError:
+            pass
+
+    @staticmethod
+    def overlay_is_bookmarked(response_data: dict, member: Optional[Union[Member, AnonymousUser]]) -> dict:
+        bookmarked_project_ids = get_member_bookmarked_project_ids(
+            member,
+            [project['id'] for project in response_data['data']],
+        )
+        for project in response_data['data']:
+            project['is_bookmarked'] = project['id'] in bookmarked_project_ids
+        return response_data
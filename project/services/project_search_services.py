@@ -0,0 +1,94 @@
+from typing import List
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import (
+    F,
+    FloatField,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Cast
+from project.consts import PROJECT_SEARCH_CONFIG
+from project.models import (
+    Project,
+    ProjectSearchDocument,
+)
+
+
+def _get_project_search_keywords(project: Project) -> str:
+    keywords = []
+    if project.category:
+        keywords.append(project.category.display_name)
+    keywords.extend(job.display_name for job in project.latest_project_recruitment_jobs.all())
+    return ' '.join(keywords)
+
+
+def _get_project_search_vector(project: Project) -> SearchVector:
+    return (
+        SearchVector(Value(project.title, output_field=TextField()), config=PROJECT_SEARCH_CONFIG, weight='A')
+        + SearchVector(Value(_get_project_search_keywords(project), output_field=TextField()), config=PROJECT_SEARCH_CONFIG, weight='B')
+        + SearchVector(Value(project.description, output_field=TextField()), config=PROJECT_SEARCH_CONFIG, weight='C')
+    )
+
+
+def refresh_project_search_documents(project_ids: List[int]) -> None:
+    """
+    프로젝트의 제목, 내용, 카테고리, 최신 모집 직무 표시명으로 검색 문서를 갱신합니다.
+    프로젝트 혹은 모집 직무가 변경되는 곳에서 변경된 프로젝트만 호출합니다.
+    """
+    if not project_ids:
+        return
+
+    projects = Project.objects.select_related(
+        'category',
+    ).prefetch_related(
+        'latest_project_recruitment_jobs',
+    ).filter(
+        id__in=project_ids,
+    )
+    for project in projects:
+        ProjectSearchDocument.objects.update_or_create(
+            project_id=project.id,
+            defaults={
+                'document': ' '.join(
+                    [project.title, _get_project_search_keywords(project), project.description]
+                ),
+            },
+        )
+        ProjectSearchDocument.objects.filter(
+            project_id=project.id,
+        ).update(
+            search_vector=_get_project_search_vector(project),
+        )
+
+
+def get_searched_project_qs(qs: QuerySet[Project], keyword: str) -> QuerySet[Project]:
+    """
+    전문 검색 혹은 trigram 단어 유사도로 일치하는 프로젝트만 남깁니다.
+    """
+    return qs.filter(
+        Q(search_document__search_vector=SearchQuery(keyword, config=PROJECT_SEARCH_CONFIG))
+        | Q(search_document__document__trigram_word_similar=keyword)
+    )
+
+
+def get_ranked_project_qs(qs: QuerySet[Project], keyword: str) -> QuerySet[Project]:
+    """
+    전문 검색 혹은 trigram 단어 유사도로 일치하는 프로젝트에 search_score 를 annotate 합니다.
+    search_score 는 cursor 로 그대로 왕복할 수 있도록 double precision 으로 변환합니다.
+    """
+    search_query = SearchQuery(keyword, config=PROJECT_SEARCH_CONFIG)
+    return get_searched_project_qs(qs, keyword).annotate(
+        search_score=Cast(
+            SearchRank(F('search_document__search_vector'), search_query)
+            + TrigramWordSimilarity(keyword, 'search_document__document'),
+            output_field=FloatField(),
+        ),
+    )
@@ -1,4 +1,7 @@
+import hashlib
+import json
 from collections import defaultdict
+from datetime import date
 from typing import (
     DefaultDict,
     List,
@@ -7,17 +10,30 @@ from typing import (
     Set,
 )
 
+from common.common_utils.redis_cache_utils import (
+    get_cached_values_with_generations,
+    invalidate_cached_values,
+    set_cached_values_if_generation_unchanged,
+)
+from common.common_utils.request_memo_utils import get_request_memo
+from django.conf import settings
 from django.db import (
     DatabaseError,
     transaction,
 )
 from django.db.models import (
     Max,
+    Model,
+    OuterRef,
     Q,
-    QuerySet
+    QuerySet,
+    Subquery,
 )
 from django.db.models.functions import Coalesce
+from django_redis import get_redis_connection
 from project.consts import (
+    ACTIVE_PROJECT_KEY_PREFIX,
+    ACTIVE_PROJECT_TIMEOUT_SECONDS,
     ProjectCurrentRecruitStatus,
     ProjectJobSearchOperator,
     ProjectManagementPermissionBehavior,
@@ -35,6 +51,11 @@ from project.models import (
     ProjectRecruitment,
     ProjectRecruitmentJob,
 )
+from project.services.project_card_services import invalidate_project_card_fragments
+from project.services.project_filter_index_services import publish_project_filter_index_changes
+from project.services.project_list_cache_services import bump_project_list_version
+from project.services.project_search_services import refresh_project_search_documents
+from redis.exceptions import RedisError
 
 
 def get_active_project_qs() -> QuerySet[Project]:
@@ -66,25 +87,26 @@ def get_filtered_project_qs(title: Optional[str],
         q &= Q(category_id__in=category_ids)
     if job_ids and job_category_ids:
         if jobs_operator == ProjectJobSearchOperator.OR.value:
-            q &= (Q(latest_project_recruitment_jobs__in=job_ids) | Q(latest_project_recruitment_jobs__category__in=job_category_ids))
+            q &= (
+                Q(latest_project_recruitment_job_ids__overlap=job_ids)
+                | Q(latest_project_recruitment_job_category_ids__overlap=job_category_ids)
+            )
         elif jobs_operator == ProjectJobSearchOperator.AND.value:
-            for job_id in job_ids:
-                qs = qs.filter(latest_project_recruitment_jobs=job_id)
-            for job_category_id in job_category_ids:
-                qs = qs.filter(latest_project_recruitment_jobs__category=job_category_id)
+            q &= (
+                Q(latest_project_recruitment_job_ids__contains=job_ids)
+                & Q(latest_project_recruitment_job_category_ids__contains=job_category_ids)
+            )
     else:
         if job_ids:
             if jobs_operator == ProjectJobSearchOperator.OR.value:
-                q &= Q(latest_project_recruitment_jobs__in=job_ids)
+                q &= Q(latest_project_recruitment_job_ids__overlap=job_ids)
             elif jobs_operator == ProjectJobSearchOperator.AND.value:
-                for job_id in job_ids:
-                    qs = qs.filter(latest_project_recruitment_jobs=job_id)
+                q &= Q(latest_project_recruitment_job_ids__contains=job_ids)
         if job_category_ids:
             if jobs_operator == ProjectJobSearchOperator.OR.value:
-                q &= Q(latest_project_recruitment_jobs__category__in=job_category_ids)
+                q &= Q(latest_project_recruitment_job_category_ids__overlap=job_category_ids)
             elif jobs_operator == ProjectJobSearchOperator.AND.value:
-                for job_category_id in job_category_ids:
-                    qs = qs.filter(latest_project_recruitment_jobs__category=job_category_id)
+                q &= Q(latest_project_recruitment_job_category_ids__contains=job_category_ids)
     if experience:
         q &= Q(job_experience_type=experience)
 
@@ -121,14 +143,58 @@ def get_filtered_project_qs(title: Optional[str],
         if max_duration_month:
             q &= (Q(duration_month__lte=max_duration_month) | Q(duration_month__isnull=True))
 
-    if job_category_ids:
-        qs = qs.prefetch_related('latest_project_recruitment_jobs__category').distinct()
-    elif job_ids:
-        qs = qs.prefetch_related('latest_project_recruitment_jobs').distinct()
-
     return qs.filter(q)
 
 
+def set_latest_project_recruitment_job_arrays(project: Project) -> None:
+    """
+    latest_project_recruitment_jobs 기준으로 직무 필터용 id 배열을 다시 계산합니다.
+    저장은 호출하는 곳에서 update_fields 에 포함해 진행합니다.
+    """
+    job_ids = set()
+    job_category_ids = set()
+    for job_id, job_category_id in project.latest_project_recruitment_jobs.values_list('id', 'category_id'):
+        job_ids.add(job_id)
+        if job_category_id is not None:
+            job_category_ids.add(job_category_id)
+    project.latest_project_recruitment_job_ids = sorted(job_ids)
+    project.latest_project_recruitment_job_category_ids = sorted(job_category_ids)
+
+
+def update_latest_project_recruitment_job_arrays(project: Project) -> None:
+    set_latest_project_recruitment_job_arrays(project)
+    project.save(
+        update_fields=[
+            'latest_project_recruitment_job_ids',
+            'latest_project_recruitment_job_category_ids',
+        ]
+    )
+
+
+def update_projects_latest_recruited_at(project_ids: List[int]) -> None:
+    """
+    프로젝트별 가장 최근 모집의 생성 일시로 latest_recruited_at 을 다시 계산합니다.
+    모집이 없으면 null 입니다.
+    """
+    if not project_ids:
+        return
+    Project.objects.filter(
+        id__in=project_ids,
+    ).update(
+        latest_recruited_at=Subquery(
+            ProjectRecruitment.objects.filter(
+                project_id=OuterRef('id'),
+            ).order_by(
+                '-created_at',
+            ).values(
+                'created_at',
+            )[:1]
+        ),
+    )
+    # update 는 post_save signal 을 보내지 않으므로 직접 무효화합니다.
+    invalidate_active_projects(project_ids)
+
+
 def create_project_member_management(project: Project,
                                      member_id: int,
                                      is_leader=False,
@@ -171,7 +237,16 @@ def create_project_recruitment_and_update_project(project: Project, member_id: i
         created_member_id=member_id
     )
     project.latest_project_recruitment = project_recruitment
-    project.save(update_fields=['latest_project_recruitment'])
+    project.latest_recruited_at = project_recruitment.created_at
+    set_latest_project_recruitment_job_arrays(project)
+    project.save(
+        update_fields=[
+            'latest_project_recruitment',
+            'latest_recruited_at',
+            'latest_project_recruitment_job_ids',
+            'latest_project_recruitment_job_category_ids',
+        ]
+    )
     return project_recruitment
 
 
@@ -233,6 +308,9 @@ class ProjectCreationService(object):
                 [project_recruitment_job.job_id
                  for project_recruitment_job in project_recruitment_jobs]
             )
+            self._refresh_project_search_document()
+            self._publish_project_filter_index_change()
+            self._publish_project_list_change()
 
     def _create_project_member_management(self):
         return create_project_member_management(self.project, self.member_id, is_leader=True)
@@ -256,6 +334,17 @@ class ProjectCreationService(object):
 
     def _update_latest_project_recruitment_jobs(self, job_ids: List[Type[int]]) -> None:
         self.project.latest_project_recruitment_jobs.add(*job_ids)
+        update_latest_project_recruitment_job_arrays(self.project)
+
+    def _refresh_project_search_document(self) -> None:
+        refresh_project_search_documents([self.project.id])
+
+    def _publish_project_filter_index_change(self) -> None:
+        publish_project_filter_index_changes([self.project.id])
+
+    def _publish_project_list_change(self) -> None:
+        bump_project_list_version()
+        invalidate_project_card_fragments([self.project.id])
 
 
 def get_active_project_categories() -> List[ProjectCategory]:
@@ -266,9 +355,28 @@ def get_active_project_categories() -> List[ProjectCategory]:
     )
 
 
-def get_active_project(project_id: int) -> Optional[Project]:
+def _get_active_project_schema_version() -> str:
+    # 캐시하는 필드의 이름/타입으로 버전을 만들어, 스키마가 다른 배포(blue/green)끼리 캐시를 공유하지 않게 합니다.
+    field_signature = ','.join(
+        f'{model._meta.label}.{field.attname}:{field.get_internal_type()}'
+        for model in (Project, ProjectRecruitment)
+        for field in model._meta.concrete_fields
+    )
+    return hashlib.sha1(field_signature.encode()).hexdigest()[:8]
+
+
+_ACTIVE_PROJECT_SCHEMA_VERSION = _get_active_project_schema_version()
+
+
+def _get_active_project_key(project_id: int) -> str:
+    return f'{ACTIVE_PROJECT_KEY_PREFIX}:{_ACTIVE_PROJECT_SCHEMA_VERSION}:{project_id}'
+
+
+def _get_active_project_from_db(project_id: int) -> Optional[Project]:
     try:
-        return Project.objects.get(
+        return Project.objects.select_related(
+            'latest_project_recruitment',
+        ).get(
             id=project_id,
             is_deleted=False,
         )
@@ -276,6 +384,107 @@ def get_active_project(project_id: int) -> Optional[Project]:
         pass
 
 
+def _get_model_field_values(instance: Model) -> dict:
+    field_values = {}
+    for field in instance._meta.concrete_fields:
+        value = field.value_from_object(instance)
+        field_values[field.attname] = value.isoformat() if isinstance(value, date) else value
+    return field_values
+
+
+def _get_model_from_field_values(model: Type[Model], field_values: dict) -> Model:
+    fields = model._meta.concrete_fields
+    return model.from_db(
+        'default',
+        [field.attname for field in fields],
+        [field.to_python(field_values[field.attname]) for field in fields],
+    )
+
+
+def _dump_active_project(project: Project) -> str:
+    latest_project_recruitment = project.latest_project_recruitment
+    return json.dumps({
+        'project': _get_model_field_values(project),
+        'latest_project_recruitment': (
+            _get_model_field_values(latest_project_recruitment) if latest_project_recruitment else None
+        ),
+    })
+
+
+def _load_active_project(cached_project: bytes) -> Project:
+    cached_field_values = json.loads(cached_project)
+    project = _get_model_from_field_values(Project, cached_field_values['project'])
+    project.latest_project_recruitment = (
+        _get_model_from_field_values(ProjectRecruitment, cached_field_values['latest_project_recruitment'])
+        if cached_field_values['latest_project_recruitment'] else None
+    )
+    return project
+
+
+def _get_cached_active_project(project_id: int) -> Optional[Project]:
+    if not settings.ACTIVE_PROJECT_CACHE_ENABLED:
+        return _get_active_project_from_db(project_id)
+    key = _get_active_project_key(project_id)
+    try:
+        redis = get_redis_connection('default')
+        [cached_project], [generation] = get_cached_values_with_generations(redis, [key])
+    except RedisError:
+        return _get_active_project_from_db(project_id)
+    if cached_project is not None:
+        return _load_active_project(cached_project)
+
+    project = _get_active_project_from_db(project_id)
+    if project:
+        try:
+            set_cached_values_if_generation_unchanged(
+                redis,
+                [(key, generation, _dump_active_project(project))],
+                ACTIVE_PROJECT_TIMEOUT_SECONDS,
+            )
+        except RedisError:
+            pass
+    return project
+
+
+def get_active_project(project_id: int) -> Optional[Project]:
+    """
+    삭제되지 않은 프로젝트를 latest_project_recruitment 와 함께 조회합니다.
+    redis 에 캐시하고, 같은 요청 안에서는 한 번만 조회합니다.
+    """
+    request_memo = get_request_memo()
+    memo_key = _get_active_project_key(project_id)
+    if request_memo is not None and memo_key in request_memo:
+        return request_memo[memo_key]
+
+    project = _get_cached_active_project(project_id)
+    if request_memo is not None:
+        request_memo[memo_key] = project
+    return project
+
+
+def invalidate_active_projects(project_ids: List[int]) -> None:
+    """
+    요청 메모에서는 즉시, redis 캐시에서는 커밋 이후 활성 프로젝트를 삭제합니다.
+    """
+    if not project_ids:
+        return
+    request_memo = get_request_memo()
+    if request_memo is not None:
+        for project_id in project_ids:
+            request_memo.pop(_get_active_project_key(project_id), None)
+
+    def _invalidate():
+        try:
+            invalidate_cached_values(
+                get_redis_connection('default'),
+                [_get_active_project_key(project_id) for project_id in project_ids],
+            )
+        except RedisError:
+            pass
+
+    transaction.on_commit(_invalidate)
+
+
 def get_projects_leader_ids(project_ids: List[int]) -> DefaultDict[int, Set[int]]:
     leader_ids_by_project_id = defaultdict(set)
 
@@ -0,0 +1,253 @@
+from collections import Counter
+from functools import cached_property
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.utils import timezone
+from member.services import (
+    invalidate_member_info_blocks,
+    refresh_members_project_stats,
+)
+from project.consts import (
+    ProjectManagementPermissionBehavior,
+    ProjectRecruitApplicationStatus,
+    ProjectRecruitmentStatus,
+)
+from project.dtos.service_dtos import ProjectRecruitApplicationDecisionResult
+from project.exceptions import (
+    ProjectNotFoundErrorException,
+    ProjectRecruitApplicationPermissionDeniedException,
+)
+from project.models import (
+    Project,
+    ProjectMemberManagement,
+    ProjectRecruitApplication,
+    ProjectRecruitmentJob,
+)
+from project.services.member_relation_services import invalidate_member_project_relations
+from project.services.project_card_services import invalidate_project_card_fragments
+from project.services.project_list_cache_services import bump_project_list_version
+from project.services.project_permission_services import get_project_permissions
+from project.services.project_services import get_active_project
+
+
+def _get_remaining_capacity(project_recruitment_job: ProjectRecruitmentJob) -> Optional[int]:
+    # None 이면 인원 제한이 없습니다.
+    if project_recruitment_job.recruit_status != ProjectRecruitmentStatus.RECRUITING.value:
+        return 0
+    if not project_recruitment_job.total_limit:
+        return None
+    return max(project_recruitment_job.total_limit - project_recruitment_job.current_recruited, 0)
+
+
+def fill_recruit_applications_project_recruitment() -> int:
+    """
+    프로젝트 모집이 비어 있는 신청에 모집 직무의 프로젝트 모집을 채우고, 채운 신청 수를 반환합니다.
+    """
+    return ProjectRecruitApplication.objects.filter(
+        project_recruitment__isnull=True,
+    ).update(
+        project_recruitment_id=Subquery(
+            ProjectRecruitmentJob.objects.filter(
+                id=OuterRef('project_recruitment_job_id'),
+            ).values('project_recruitment_id')[:1]
+        ),
+    )
+
+
+class ProjectRecruitApplicationService(object):
+    """
+    프로젝트 모집 권한이 있는 회원(리더)이 모집 신청을 조회하고 일괄 승인/거절합니다.
+    """
+    def __init__(self, project_id: int, member_id: int):
+        self.project_id = project_id
+        self.member_id = member_id
+
+    @cached_property
+    def project(self) -> Optional[Project]:
+        return get_active_project(self.project_id)
+
+    def validate_manageable(self) -> None:
+        if not self.project:
+            raise ProjectNotFoundErrorException()
+        permissions = get_project_permissions(self.member_id, [self.project_id])[self.project_id]
+        if ProjectManagementPermissionBehavior.PROJECT_RECRUIT.value not in permissions:
+            raise ProjectRecruitApplicationPermissionDeniedException()
+
+    def get_recruit_application_qs(self,
+                                   project_recruitment_id: Optional[int],
+                                   request_status: str,
+                                   job_id: Optional[int] = None) -> QuerySet[ProjectRecruitApplication]:
+        """
+        모집 신청함 한 페이지에 필요한 컬럼만 모집 직무/회원과 join 해 조회합니다.
+        모집을 지정하지 않으면 최근 모집의 신청을 조회합니다.
+        """
+        recruit_application_qs = ProjectRecruitApplication.objects.select_related(
+            'project_recruitment_job',
+            'member',
+        ).filter(
+            project_recruitment_id=project_recruitment_id or self.project.latest_project_recruitment_id,
+            project_recruitment__project_id=self.project_id,
+            request_status=request_status,
+        ).only(
+            'id',
+            'request_message',
+            'request_status',
+            'created_at',
+            'project_recruitment_job__job_id',
+            'member__nickname',
+            'member__profile_image_url',
+        )
+        if job_id:
+            recruit_application_qs = recruit_application_qs.filter(project_recruitment_job__job_id=job_id)
+        return recruit_application_qs
+
+    @transaction.atomic
+    def decide_recruit_applications(self,
+                                    request_status_by_application_id: Dict[int, str]) -> ProjectRecruitApplicationDecisionResult:
+        """
+        검토중인 신청의 상태 변경, 팀원 생성, 모집 직무 인원 증가를 신청 수와 무관하게 고정된 쿼리 수로 처리합니다.
+        신청과 모집 직무 row 를 잠근 뒤 남은 인원만큼만 신청 id 순으로 승인하고, 초과한 신청은 검토중으로 남깁니다.
+        이미 프로젝트 팀원인 회원의 신청도 팀원이 중복으로 생성되지 않도록 검토중으로 남깁니다.
+        """
+        recruit_applications = list(
+            ProjectRecruitApplication.objects.select_for_update(
+                of=('self',),
+            ).select_related(
+                'project_recruitment_job',
+            ).filter(
+                id__in=request_status_by_application_id.keys(),
+                project_recruitment_job__project_recruitment__project_id=self.project_id,
+                request_status=ProjectRecruitApplicationStatus.IN_REVIEW.value,
+            ).annotate(
+                is_project_member=Exists(
+                    ProjectMemberManagement.objects.filter(
+                        project_id=self.project_id,
+                        member_id=OuterRef('member_id'),
+                    )
+                ),
+            ).only(
+                'id',
+                'member_id',
+                'project_recruitment_job__job_id',
+            ).order_by(
+                'id',
+            )
+        )
+        accepting_applications = []
+        accepting_member_ids = set()
+        for recruit_application in recruit_applications:
+            if request_status_by_application_id[recruit_application.id] != ProjectRecruitApplicationStatus.ACCEPTED.value:
+                continue
+            # 한 회원이 여러 직무에 신청한 경우 신청 id 가 가장 앞선 신청만 승인합니다.
+            if recruit_application.is_project_member or recruit_application.member_id in accepting_member_ids:
+                continue
+            accepting_applications.append(recruit_application)
+            accepting_member_ids.add(recruit_application.member_id)
+        rejected_application_ids = [
+            recruit_application.id for recruit_application in recruit_applications
+            if request_status_by_application_id[recruit_application.id] == ProjectRecruitApplicationStatus.REJECTED.value
+        ]
+
+        accepted_applications = self._reserve_recruitment_jobs(accepting_applications)
+        now = timezone.now()
+        if accepted_applications:
+            ProjectRecruitApplication.objects.filter(
+                id__in=[recruit_application.id for recruit_application in accepted_applications],
+            ).update(
+                request_status=ProjectRecruitApplicationStatus.ACCEPTED.value,
+                request_status_updated_at=now,
+                updated_at=now,
+            )
+            ProjectMemberManagement.objects.bulk_create([
+                ProjectMemberManagement(
+                    project_id=self.project_id,
+                    member_id=recruit_application.member_id,
+                    job_id=recruit_application.project_recruitment_job.job_id,
+                    project_recruit_application_id=recruit_application.id,
+                )
+                for recruit_application in accepted_applications
+            ])
+            accepted_member_ids = [recruit_application.member_id for recruit_application in accepted_applications]
+            # bulk_create 는 post_save signal 을 보내지 않으므로 직접 갱신합니다.
+            refresh_members_project_stats(accepted_member_ids)
+            invalidate_member_info_blocks(accepted_member_ids)
+            invalidate_project_card_fragments([self.project_id])
+            bump_project_list_version()
+            invalidate_member_project_relations(accepted_member_ids)
+        if rejected_application_ids:
+            ProjectRecruitApplication.objects.filter(
+                id__in=rejected_application_ids,
+            ).update(
+                request_status=ProjectRecruitApplicationStatus.REJECTED.value,
+                request_status_updated_at=now,
+                updated_at=now,
+            )
+        return ProjectRecruitApplicationDecisionResult(
+            accepted_application_ids=[recruit_application.id for recruit_application in accepted_applications],
+            rejected_application_ids=rejected_application_ids,
+        )
+
+    @staticmethod
+    def _reserve_recruitment_jobs(accepting_applications: List[ProjectRecruitApplication]) -> List[ProjectRecruitApplication]:
+        # 모집 직무 row 를 id 순으로 잠가 동시에 승인해도 총 제한 인원을 넘지 않습니다.
+        if not accepting_applications:
+            return []
+        project_recruitment_job_by_id = {
+            project_recruitment_job.id: project_recruitment_job
+            for project_recruitment_job in ProjectRecruitmentJob.objects.select_for_update().filter(
+                id__in={
+                    recruit_application.project_recruitment_job_id
+                    for recruit_application in accepting_applications
+                },
+            ).only(
+                'id',
+                'total_limit',
+                'current_recruited',
+                'recruit_status',
+            ).order_by(
+                'id',
+            )
+        }
+        remaining_capacity_by_job_id = {
+            project_recruitment_job_id: _get_remaining_capacity(project_recruitment_job)
+            for project_recruitment_job_id, project_recruitment_job in project_recruitment_job_by_id.items()
+        }
+        accepted_applications = []
+        accepted_count_by_job_id = Counter()
+        for recruit_application in accepting_applications:
+            project_recruitment_job_id = recruit_application.project_recruitment_job_id
+            remaining_capacity = remaining_capacity_by_job_id[project_recruitment_job_id]
+            if remaining_capacity is not None and accepted_count_by_job_id[project_recruitment_job_id] >= remaining_capacity:
+                continue
+            accepted_applications.append(recruit_application)
+            accepted_count_by_job_id[project_recruitment_job_id] += 1
+
+        if accepted_count_by_job_id:
+            ProjectRecruitmentJob.objects.filter(
+                id__in=accepted_count_by_job_id.keys(),
+            ).update(
+                current_recruited=F('current_recruited') + Case(
+                    *[
+                        When(id=project_recruitment_job_id, then=Value(accepted_count))
+                        for project_recruitment_job_id, accepted_count in accepted_count_by_job_id.items()
+                    ],
+                    default=Value(0),
+                ),
+                updated_at=timezone.now(),
+            )
+        return accepted_applications
@@ -7,9 +7,20 @@ from unittest.mock import (
 )
 
 from django.contrib.auth.models import AnonymousUser
+from django.db import (
+    DatabaseError,
+    IntegrityError,
+    connection,
+)
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django_redis import get_redis_connection
 from freezegun import freeze_time
 from member.models import Member
+from project.consts import (
+    PROJECT_BOOKMARK_COUNT_DELTA_KEY,
+    PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_KEY,
+)
 from project.exceptions import (
     ProjectBookmarkCreationErrorException,
     ProjectBookmarkMemberNotFoundException,
@@ -20,7 +31,9 @@ from project.models import (
 )
 from project.services.bookmark_services import (
     BookmarkService,
+    flush_project_bookmark_count_deltas,
     get_member_bookmarked_project_ids,
+    reconcile_project_bookmark_counts,
 )
 
 
@@ -114,10 +127,22 @@ class ProjectBookmarkTests(TestCase):
 
 class BookmarkServiceTestCase(TestCase):
     def setUp(self):
+        redis = get_redis_connection('default')
+        redis.delete(PROJECT_BOOKMARK_COUNT_DELTA_KEY, PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_KEY)
+        for key in redis.scan_iter(f'{PROJECT_BOOKMARK_COUNT_DELTA_KEY}:flushing:*'):
+            redis.delete(key)
         self.member = Member.objects.create_user(username='test', nickname='test')
         self.project = Project.objects.create(title='Project', created_member_id=self.member.id)
         self.service = BookmarkService(member_id=self.member.id)
 
+    def _get_delta(self) -> int:
+        return int(get_redis_connection('default').hget(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project.id) or 0)
+
+    @staticmethod
+    def _get_statements(context: CaptureQueriesContext) -> list[str]:
+        # transaction.atomic 의 SAVEPOINT 는 제외합니다.
+        return [query['sql'] for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+
     def test_get_my_active_bookmarks(self):
         # Given: member가 북마크를 가지고 있을 때
         ProjectBookmark.objects.get_or_create(member=self.member, project=self.project, is_deleted=False)
@@ -129,26 +154,63 @@ class BookmarkServiceTestCase(TestCase):
         self.assertEqual(len(bookmarks), 1)
         self.assertEqual(bookmarks[0].project_id, self.project.id)
 
-    @patch('project.services.bookmark_services.update_project_bookmark_count')
-    @patch('project.services.bookmark_services.ProjectBookmark.save')
-    @patch('project.services.bookmark_services.ProjectBookmark.objects.get_or_create')
-    def test_create_bookmark_success(self, mock_get_or_create, mock_save, mock_update_project_bookmark_count):
-        # Given: get_or_create가 정상적으로 작동하여 북마크가 생성되거나 가져와집니다.
-        mock_bookmark = ProjectBookmark(member_id=self.member.id, project_id=self.project.id)
-        mock_get_or_create.return_value = (mock_bookmark, True)
-
+    def test_create_bookmark_success(self):
+        # Given: 북마크가 없는 프로젝트
         # When: create_bookmark 메서드를 호출합니다.
-        bookmark = self.service.create_bookmark(project_id=self.project.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.create_bookmark(project_id=self.project.id)
 
         # Then: 북마크가 정상적으로 생성되고, 삭제되지 않았음을 확인합니다.
-        mock_get_or_create.assert_called_once_with(
-            member_id=self.member.id,
-            project_id=self.project.id,
-        )
-        mock_save.assert_called_once()
-        mock_update_project_bookmark_count.assert_called_once_with(self.project.id)
+        bookmark = ProjectBookmark.objects.get(member=self.member, project=self.project)
         self.assertEqual(bookmark.is_deleted, False)
         self.assertEqual(bookmark.deleted_at, None)
+        # And: 북마크 수 증감 +1 이 버퍼에 기록됩니다.
+        self.assertEqual(self._get_delta(), 1)
+
+    def test_create_bookmark_should_not_add_delta_when_already_bookmarked(self):
+        # Given: 이미 북마크한 프로젝트
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.create_bookmark(project_id=self.project.id)
+
+        # When: create_bookmark 메서드를 다시 호출합니다.
+        # Then: upsert 와 프로젝트 존재 확인만 실행됩니다.
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as context:
+            self.service.create_bookmark(project_id=self.project.id)
+        self.assertEqual(len(self._get_statements(context)), 2)
+
+        # And: 북마크는 하나이고 북마크 수 증감은 +1 그대로입니다.
+        self.assertEqual(ProjectBookmark.objects.filter(member=self.member, project=self.project).count(), 1)
+        self.assertEqual(self._get_delta(), 1)
+
+    def test_create_bookmark_should_run_single_statement(self):
+        # Given: 북마크가 없는 프로젝트
+        # When: create_bookmark 메서드를 호출합니다.
+        # Then: INSERT ... ON CONFLICT 한 문장만 실행됩니다.
+        with CaptureQueriesContext(connection) as context:
+            self.service.create_bookmark(project_id=self.project.id)
+        statements = self._get_statements(context)
+        self.assertEqual(len(statements), 1)
+        self.assertIn('ON CONFLICT', statements[0])
+
+    def test_project_bookmark_should_be_unique(self):
+        # Given: 북마크
+        ProjectBookmark.objects.create(member=self.member, project=self.project)
+
+        # When/Then: 같은 회원, 프로젝트의 북마크를 다시 생성하면 IntegrityError 가 발생합니다.
+        with self.assertRaises(IntegrityError):
+            ProjectBookmark.objects.create(member=self.member, project=self.project)
+
+    def test_create_bookmark_should_restore_deleted_bookmark(self):
+        # Given: 삭제된 북마크
+        ProjectBookmark.objects.create(member=self.member, project=self.project, is_deleted=True)
+
+        # When: create_bookmark 메서드를 호출합니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.create_bookmark(project_id=self.project.id)
+
+        # Then: 북마크가 되살아나고 북마크 수 증감 +1 이 기록됩니다.
+        self.assertFalse(ProjectBookmark.objects.get(member=self.member, project=self.project).is_deleted)
+        self.assertEqual(self._get_delta(), 1)
 
     def test_create_bookmark_failure_due_to_project_not_exists(self):
         # When/Then: create_bookmark 메서드를 호출하면 ProjectBookmarkCreationErrorException이 발생해야 합니다.
@@ -156,25 +218,136 @@ class BookmarkServiceTestCase(TestCase):
             self.service.create_bookmark(project_id=0)
 
     @freeze_time('2021-01-01')
-    @patch('project.services.bookmark_services.update_project_bookmark_count')
-    @patch('project.services.bookmark_services.ProjectBookmark.objects.filter')
-    def test_delete_bookmark_success(self, mock_filter, mock_update_project_bookmark_count):
-        # Given: filter 메서드가 호출되면 mock된 쿼리셋이 반환됩니다.
-        mock_query_set = mock_filter.return_value
+    def test_delete_bookmark_success(self):
+        # Given: 북마크
+        bookmark = ProjectBookmark.objects.create(member=self.member, project=self.project)
 
-        # When: delete_bookmark 메서드를 호출합니다.
-        self.service.delete_bookmark(project_id=self.project.id)
+        # When: delete_bookmark 메서드를 두 번 호출합니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete_bookmark(project_id=self.project.id)
+            self.service.delete_bookmark(project_id=self.project.id)
 
         # Then: 해당 북마크가 삭제되었음을 확인합니다.
-        mock_filter.assert_called_once_with(
-            member_id=self.member.id,
-            project_id=self.project.id,
+        bookmark.refresh_from_db()
+        self.assertTrue(bookmark.is_deleted)
+        self.assertEqual(bookmark.deleted_at, datetime(2021, 1, 1, 0, 0, tzinfo=timezone.utc))
+        # And: 북마크 수 증감은 한 번만 -1 입니다.
+        self.assertEqual(self._get_delta(), -1)
+
+    def test_sync_bookmarks(self):
+        # Given: 북마크한 project, 삭제된 북마크의 project2, 북마크하지 않은 project3
+        project2 = Project.objects.create(title='Project 2', created_member_id=self.member.id)
+        project3 = Project.objects.create(title='Project 3', created_member_id=self.member.id)
+        ProjectBookmark.objects.create(member=self.member, project=self.project)
+        ProjectBookmark.objects.create(member=self.member, project=project2, is_deleted=True)
+
+        # When: project 북마크 해제, project2, project3 북마크, 존재하지 않는 프로젝트 북마크를 동기화합니다.
+        # Then: 활성화, 삭제 두 문장만 실행됩니다.
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as context:
+            self.service.sync_bookmarks({self.project.id: False, project2.id: True, project3.id: True, 0: True})
+        self.assertEqual(len(self._get_statements(context)), 2)
+
+        # And: 최종 북마크 여부가 반영됩니다.
+        self.assertEqual(
+            set(self.service.get_my_active_bookmarks().values_list('project_id', flat=True)),
+            {project2.id, project3.id},
         )
-        mock_query_set.update.assert_called_once_with(
-            is_deleted=True,
-            deleted_at=datetime(2021, 1, 1, 0, 0, tzinfo=timezone.utc),
+        # And: 바뀐 북마크만큼 증감이 기록됩니다.
+        delta_by_project_id = get_redis_connection('default').hgetall(PROJECT_BOOKMARK_COUNT_DELTA_KEY)
+        self.assertEqual(
+            {int(project_id): int(delta) for project_id, delta in delta_by_project_id.items()},
+            {self.project.id: -1, project2.id: 1, project3.id: 1},
         )
-        mock_update_project_bookmark_count.assert_called_once_with(self.project.id)
+
+    def test_flush_project_bookmark_count_deltas(self):
+        # Given: 북마크 수 증감 +2
+        member2 = Member.objects.create_user(username='test2', nickname='test2')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.create_bookmark(project_id=self.project.id)
+            BookmarkService(member_id=member2.id).create_bookmark(project_id=self.project.id)
+
+        # When: flush_project_bookmark_count_deltas
+        project_ids = flush_project_bookmark_count_deltas()
+
+        # Then: bookmark_count 에 반영되고 버퍼는 비워집니다.
+        self.assertEqual(project_ids, [self.project.id])
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.bookmark_count, 2)
+        self.assertEqual(self._get_delta(), 0)
+        # And: 다시 실행하면 반영할 증감이 없습니다.
+        self.assertEqual(flush_project_bookmark_count_deltas(), [])
+
+    def test_flush_project_bookmark_count_deltas_should_apply_leftover_flushing_deltas(self):
+        # Given: 이전 실행이 RENAME 후 중단되어 남은 flushing 버퍼 +2
+        redis = get_redis_connection('default')
+        leftover_key = f'{PROJECT_BOOKMARK_COUNT_DELTA_KEY}:flushing:leftover'
+        redis.hincrby(leftover_key, self.project.id, 2)
+        # And: 새 증감 +1
+        redis.hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project.id, 1)
+
+        # When: flush_project_bookmark_count_deltas
+        project_ids = flush_project_bookmark_count_deltas()
+
+        # Then: 남은 증감도 함께 반영하고 flushing 버퍼를 지웁니다.
+        self.assertEqual(project_ids, [self.project.id])
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.bookmark_count, 3)
+        self.assertFalse(redis.exists(leftover_key))
+
+    def test_flush_project_bookmark_count_deltas_should_skip_when_locked(self):
+        # Given: 다른 실행이 반영중입니다.
+        redis = get_redis_connection('default')
+        redis.hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project.id, 1)
+        flush_lock = redis.lock(PROJECT_BOOKMARK_COUNT_FLUSH_LOCK_KEY, timeout=10)
+        flush_lock.acquire(blocking=False)
+
+        # When: flush_project_bookmark_count_deltas
+        try:
+            project_ids = flush_project_bookmark_count_deltas()
+        finally:
+            flush_lock.release()
+
+        # Then: 버퍼를 가져가지 않습니다.
+        self.assertEqual(project_ids, [])
+        self.assertEqual(self._get_delta(), 1)
+
+    def test_flush_project_bookmark_count_deltas_should_not_be_negative(self):
+        # Given: 집계가 어긋나 북마크 수보다 큰 감소
+        get_redis_connection('default').hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project.id, -3)
+
+        # When: flush_project_bookmark_count_deltas
+        flush_project_bookmark_count_deltas()
+
+        # Then: 0 입니다.
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.bookmark_count, 0)
+
+    def test_flush_project_bookmark_count_deltas_should_restore_deltas_when_failed(self):
+        # Given: 북마크 수 증감 +1
+        get_redis_connection('default').hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project.id, 1)
+
+        # When: DB 반영에 실패합니다.
+        with patch(
+            'project.services.bookmark_services._apply_project_bookmark_count_deltas',
+            side_effect=DatabaseError,
+        ), self.assertRaises(DatabaseError):
+            flush_project_bookmark_count_deltas()
+
+        # Then: 증감이 버퍼에 되돌아갑니다.
+        self.assertEqual(self._get_delta(), 1)
+
+    def test_reconcile_project_bookmark_counts(self):
+        # Given: 집계가 어긋난 프로젝트
+        ProjectBookmark.objects.create(member=self.member, project=self.project)
+        project2 = Project.objects.create(title='Project2', created_member_id=self.member.id)
+
+        # When: reconcile_project_bookmark_counts
+        project_ids = reconcile_project_bookmark_counts([self.project.id, project2.id])
+
+        # Then: 어긋난 프로젝트만 맞춥니다.
+        self.assertEqual(project_ids, [self.project.id])
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.bookmark_count, 1)
 
     def test_validate_member_failure(self):
         # Given: member_id가 유효하지 않은 경우를 설정합니다.
@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from common.common_utils.request_memo_utils import (
+    end_request_memo,
+    start_request_memo,
+)
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import MEMBER_PROJECT_RELATIONS_KEY_PREFIX
+from project.models import (
+    Project,
+    ProjectBookmark,
+    ProjectMemberManagement,
+)
+from project.services import member_relation_services
+from project.services.bookmark_services import BookmarkService
+from project.services.member_relation_services import (
+    get_member_project_relations,
+    invalidate_member_project_relations,
+)
+
+
+class GetMemberProjectRelationsTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.job = create_job_for_testcase('job')
+        self.projects = [
+            Project.objects.create(title=f'Project {i}', created_member_id=self.member.id)
+            for i in range(4)
+        ]
+        ProjectBookmark.objects.create(member=self.member, project=self.projects[0])
+        ProjectBookmark.objects.create(member=self.member, project=self.projects[3], is_deleted=True)
+        ProjectMemberManagement.objects.create(project=self.projects[1], member=self.member, job=self.job, is_leader=True)
+        ProjectMemberManagement.objects.create(project=self.projects[2], member=self.member, job=self.job)
+        get_redis_connection('default').delete(f'{MEMBER_PROJECT_RELATIONS_KEY_PREFIX}:{self.member.id}')
+
+    def test_get_member_project_relations(self):
+        # Given: 북마크, 리더, 참여 프로젝트
+        # When: get_member_project_relations
+        # Then: 쿼리 한 번으로 조회합니다.
+        with self.assertNumQueries(1):
+            member_project_relations = get_member_project_relations(self.member.id)
+
+        # And: 삭제된 북마크는 제외되고 리더는 참여에도 포함됩니다.
+        self.assertEqual(member_project_relations.bookmarked_project_ids, {self.projects[0].id})
+        self.assertEqual(member_project_relations.led_project_ids, {self.projects[1].id})
+        self.assertEqual(member_project_relations.participated_project_ids, {self.projects[1].id, self.projects[2].id})
+
+    def test_get_member_project_relations_should_not_query_when_not_member(self):
+        # When: 비회원
+        # Then: 쿼리하지 않습니다.
+        with self.assertNumQueries(0):
+            member_project_relations = get_member_project_relations(None)
+        self.assertEqual(member_project_relations.bookmarked_project_ids, set())
+
+    def test_get_member_project_relations_should_query_once_in_request(self):
+        # Given: 요청 메모
+        token = start_request_memo()
+        try:
+            get_member_project_relations(self.member.id)
+
+            # When: 같은 요청 안에서 다시 조회합니다.
+            # Then: 쿼리하지 않습니다.
+            with self.assertNumQueries(0):
+                get_member_project_relations(self.member.id)
+        finally:
+            end_request_memo(token)
+
+    @override_settings(MEMBER_PROJECT_RELATIONS_CACHE_ENABLED=True)
+    def test_get_member_project_relations_should_use_cache(self):
+        # Given: 캐시된 관계
+        get_member_project_relations(self.member.id)
+
+        # When: 다시 조회합니다.
+        # Then: 쿼리하지 않습니다.
+        with self.assertNumQueries(0):
+            member_project_relations = get_member_project_relations(self.member.id)
+        self.assertEqual(member_project_relations.bookmarked_project_ids, {self.projects[0].id})
+
+    @override_settings(MEMBER_PROJECT_RELATIONS_CACHE_ENABLED=True)
+    def test_get_member_project_relations_should_rebuild_after_bookmark(self):
+        # Given: 캐시된 관계
+        get_member_project_relations(self.member.id)
+
+        # When: project3 를 다시 북마크하고 project0 북마크를 해제합니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            BookmarkService(self.member.id).create_bookmark(self.projects[3].id)
+            BookmarkService(self.member.id).delete_bookmark(self.projects[0].id)
+
+        # Then: 다시 만들어진 관계에 반영됩니다.
+        self.assertEqual(get_member_project_relations(self.member.id).bookmarked_project_ids, {self.projects[3].id})
+
+    @override_settings(MEMBER_PROJECT_RELATIONS_CACHE_ENABLED=True)
+    def test_get_member_project_relations_should_rebuild_after_membership_change(self):
+        # Given: 캐시된 관계
+        get_member_project_relations(self.member.id)
+
+        # When: project0 에 리더로 참여합니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectMemberManagement.objects.create(
+                project=self.projects[0],
+                member=self.member,
+                job=self.job,
+                is_leader=True,
+            )
+
+        # Then: 다시 만들어진 관계에 반영됩니다.
+        self.assertEqual(
+            get_member_project_relations(self.member.id).led_project_ids,
+            {self.projects[0].id, self.projects[1].id},
+        )
+
+    @override_settings(MEMBER_PROJECT_RELATIONS_CACHE_ENABLED=True)
+    def test_get_member_project_relations_should_not_cache_when_invalidated_while_querying(self):
+        # Given: DB 조회 직후 다른 요청의 변경이 커밋되어 무효화됩니다.
+        get_member_project_relations_from_db = member_relation_services._get_member_project_relations_from_db
+
+        def _get_member_project_relations_from_db_then_invalidate(member_id):
+            member_project_relations = get_member_project_relations_from_db(member_id)
+            with self.captureOnCommitCallbacks(execute=True):
+                ProjectBookmark.objects.create(member=self.member, project=self.projects[2])
+                invalidate_member_project_relations([member_id])
+            return member_project_relations
+
+        # When: 조회합니다.
+        with patch.object(
+            member_relation_services,
+            '_get_member_project_relations_from_db',
+            side_effect=_get_member_project_relations_from_db_then_invalidate,
+        ):
+            get_member_project_relations(self.member.id)
+
+        # Then: 오래된 관계는 캐시되지 않고 다음 조회에서 변경이 반영됩니다.
+        self.assertIsNone(get_redis_connection('default').get(f'{MEMBER_PROJECT_RELATIONS_KEY_PREFIX}:{self.member.id}'))
+        self.assertEqual(
+            get_member_project_relations(self.member.id).bookmarked_project_ids,
+            {self.projects[0].id, self.projects[2].id},
+        )
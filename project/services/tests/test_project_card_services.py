@@ -0,0 +1,247 @@
+from unittest.mock import patch
+
+from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from common.common_utils import format_utc
+from django.contrib.auth.models import AnonymousUser
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import (
+    PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY,
+    PROJECT_CARD_FRAGMENT_KEY_PREFIX,
+    PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY,
+)
+from project.models import (
+    Project,
+    ProjectBookmark,
+    ProjectMemberManagement,
+    ProjectRecruitment,
+    ProjectRecruitmentJob,
+)
+from project.services import project_card_services
+from project.services.project_card_services import (
+    ProjectCardAssembler,
+    get_project_card_fragment_hit_counts,
+    get_project_card_fragments,
+    get_project_card_qs,
+    invalidate_project_card_fragments,
+)
+from project.services.project_services import create_project_recruitment_and_update_project
+
+
+class GetProjectCardQsTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project = Project.objects.create(
+            title='Project',
+            description='가나다' * 1000,
+            hours_per_week=10,
+            created_member_id=self.member.id,
+        )
+
+    def test_get_project_card_qs_should_cut_description_in_sql(self):
+        # Given: project with long description
+        # When: get_project_card_qs
+        project = get_project_card_qs(Project.objects.filter(id=self.project.id)).get()
+
+        # Then: simple_description is first 100 characters
+        self.assertEqual(project.simple_description, self.project.description[:100])
+        # And: description is not loaded
+        self.assertIn('description', project.get_deferred_fields())
+
+    def test_get_project_card_qs_should_not_query_card_fields_again(self):
+        # Given: card project
+        project = get_project_card_qs(Project.objects.filter(id=self.project.id)).get()
+
+        # When: access card fields
+        # Then: no more query
+        with self.assertNumQueries(0):
+            project.category_id
+            project.title
+            project.job_experience_type
+            project.current_recruit_status
+            project.main_image
+            project.hours_per_week
+            project.rearrangement_time
+
+
+class ProjectCardAssemblerTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.job = create_job_for_testcase('job')
+        self.projects = [
+            Project.objects.create(
+                title=f'Project {i}',
+                created_member_id=self.member.id,
+            )
+            for i in range(3)
+        ]
+        for project in self.projects:
+            project_recruitment = create_project_recruitment_and_update_project(project, self.member.id)
+            ProjectRecruitmentJob.objects.create(
+                project_recruitment=project_recruitment,
+                job=self.job,
+                total_limit=1,
+                current_recruited=1,
+                created_member_id=self.member.id,
+            )
+        ProjectBookmark.objects.create(member=self.member, project=self.projects[0])
+        ProjectMemberManagement.objects.create(
+            project=self.projects[0],
+            member=self.member,
+            job=self.job,
+            is_leader=True,
+        )
+        ProjectMemberManagement.objects.create(
+            project=self.projects[1],
+            member=self.member,
+            job=self.job,
+        )
+
+    def _get_project_ids(self):
+        return [project.id for project in self.projects]
+
+    def test_get_project_list_items(self):
+        # Given: project ids
+        project_ids = self._get_project_ids()
+
+        # When: get_project_list_items
+        # Then: card and member relation queries only
+        with self.assertNumQueries(2):
+            project_list_items = ProjectCardAssembler(self.member).get_project_list_items(project_ids)
+
+        # And: items keep project id order
+        self.assertEqual([project_list_item.id for project_list_item in project_list_items], project_ids)
+        # And: jobs, recent_recruited_at and is_bookmarked are hydrated
+        self.assertTrue(project_list_items[0].is_bookmarked)
+        self.assertFalse(project_list_items[1].is_bookmarked)
+        self.assertEqual(
+            [(job.id, job.is_available) for job in project_list_items[2].jobs],
+            [(self.job.id, False)],
+        )
+        self.assertEqual(
+            project_list_items[2].recent_recruited_at,
+            format_utc(ProjectRecruitment.objects.get(project=self.projects[2]).created_at),
+        )
+
+    def test_get_project_list_items_should_not_be_bookmarked_when_anonymous(self):
+        # Given: project ids
+        project_ids = self._get_project_ids()
+
+        # When: get_project_list_items with anonymous user
+        # Then: card query only
+        with self.assertNumQueries(1):
+            project_list_items = ProjectCardAssembler(AnonymousUser()).get_project_list_items(project_ids)
+
+        # And: nothing is bookmarked
+        self.assertFalse(any(project_list_item.is_bookmarked for project_list_item in project_list_items))
+
+    def test_get_my_project_bookmark_list_items(self):
+        # Given: project ids
+        project_ids = self._get_project_ids()
+
+        # When: get_my_project_bookmark_list_items
+        # Then: card and member relation queries only
+        with self.assertNumQueries(2):
+            my_project_bookmark_list_items = ProjectCardAssembler(
+                self.member
+            ).get_my_project_bookmark_list_items(project_ids)
+
+        # And: member relations are hydrated
+        self.assertEqual(
+            {
+                item.id: (item.is_leader, item.is_member_manageable, item.is_participated)
+                for item in my_project_bookmark_list_items
+            },
+            {
+                self.projects[0].id: (True, True, True),
+                self.projects[1].id: (False, False, True),
+                self.projects[2].id: (False, False, False),
+            },
+        )
+
+    def test_get_project_list_items_should_not_query_when_empty(self):
+        # Given: no projects
+        # When: get_project_list_items
+        # Then: no query
+        with self.assertNumQueries(0):
+            self.assertEqual(ProjectCardAssembler(self.member).get_project_list_items([]), [])
+
+
+@override_settings(PROJECT_CARD_FRAGMENT_CACHE_ENABLED=True)
+class GetProjectCardFragmentsTest(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.redis.delete(PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY, PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY)
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project1 = Project.objects.create(title='Project 1', created_member_id=self.member.id)
+        self.project2 = Project.objects.create(title='Project 2', created_member_id=self.member.id)
+        self.project_ids = [self.project1.id, self.project2.id]
+        self.redis.delete(*[f'{PROJECT_CARD_FRAGMENT_KEY_PREFIX}:{project_id}' for project_id in self.project_ids])
+
+    def test_get_project_card_fragments_should_query_only_misses(self):
+        # Given: project1 card is cached
+        get_project_card_fragments([self.project1.id])
+
+        # When: get_project_card_fragments
+        with self.assertNumQueries(1) as context:
+            fragment_by_project_id = get_project_card_fragments(self.project_ids)
+
+        # Then: only project2 is loaded from db
+        self.assertIn(f'IN ({self.project2.id})', context.captured_queries[0]['sql'])
+        self.assertEqual(fragment_by_project_id[self.project1.id].title, 'Project 1')
+        self.assertEqual(fragment_by_project_id[self.project2.id].title, 'Project 2')
+        # And: hit and miss counts are accumulated
+        self.assertEqual(get_project_card_fragment_hit_counts(), (1, 2))
+
+    def test_get_project_card_fragments_should_not_query_when_all_cached(self):
+        # Given: cached cards
+        get_project_card_fragments(self.project_ids)
+
+        # When: get_project_card_fragments
+        # Then: no query
+        with self.assertNumQueries(0):
+            fragment_by_project_id = get_project_card_fragments(self.project_ids)
+        self.assertEqual(list(fragment_by_project_id), self.project_ids)
+
+    def test_invalidate_project_card_fragments(self):
+        # Given: cached cards
+        get_project_card_fragments(self.project_ids)
+        # And: project1 is changed
+        Project.objects.filter(id=self.project1.id).update(title='Changed')
+
+        # When: invalidate_project_card_fragments
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_project_card_fragments([self.project1.id])
+
+        # Then: project1 card is loaded again
+        fragment_by_project_id = get_project_card_fragments(self.project_ids)
+        self.assertEqual(fragment_by_project_id[self.project1.id].title, 'Changed')
+        self.assertEqual(fragment_by_project_id[self.project2.id].title, 'Project 2')
+
+    def test_get_project_card_fragments_should_not_cache_when_invalidated_while_querying(self):
+        # Given: project1 is changed and invalidated right after the db query
+        get_project_card_fragments_from_db = project_card_services._get_project_card_fragments_from_db
+
+        def _get_project_card_fragments_from_db_then_invalidate(project_ids):
+            fragment_by_project_id = get_project_card_fragments_from_db(project_ids)
+            with self.captureOnCommitCallbacks(execute=True):
+                Project.objects.filter(id=self.project1.id).update(title='Changed')
+                invalidate_project_card_fragments([self.project1.id])
+            return fragment_by_project_id
+
+        # When: get_project_card_fragments
+        with patch.object(
+            project_card_services,
+            '_get_project_card_fragments_from_db',
+            side_effect=_get_project_card_fragments_from_db_then_invalidate,
+        ):
+            get_project_card_fragments(self.project_ids)
+
+        # Then: stale project1 card is not cached, project2 card is
+        self.assertIsNone(self.redis.get(f'{PROJECT_CARD_FRAGMENT_KEY_PREFIX}:{self.project1.id}'))
+        self.assertIsNotNone(self.redis.get(f'{PROJECT_CARD_FRAGMENT_KEY_PREFIX}:{self.project2.id}'))
+        self.assertEqual(get_project_card_fragments(self.project_ids)[self.project1.id].title, 'Changed')
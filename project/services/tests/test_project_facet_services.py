@@ -0,0 +1,230 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django_redis import get_redis_connection
+from job.models import (
+    Job,
+    JobCategory,
+)
+from member.models import Member
+from project.consts import (
+    PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY,
+    ProjectCurrentRecruitStatus,
+    ProjectJobExperienceType,
+    ProjectJobSearchOperator,
+    ProjectListSortType,
+)
+from project.dtos.model_dtos import (
+    ProjectFacetIdCount,
+    ProjectFacetValueCount,
+)
+from project.dtos.request_dtos import HomeProjectListRequest
+from project.models import (
+    Project,
+    ProjectCategory,
+)
+from project.services.project_facet_services import (
+    get_home_project_facet_counts,
+    get_home_project_facet_counts_from_db,
+)
+from project.services.project_filter_index_services import ProjectFilterIndex
+from project.services.project_search_services import refresh_project_search_documents
+from project.services.project_services import update_latest_project_recruitment_job_arrays
+
+
+class HomeProjectFacetCountsTestCase(TestCase):
+    def setUp(self):
+        get_redis_connection('default').delete(PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY)
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.category1 = ProjectCategory.objects.create(display_name='재미/흥미', name='FUN')
+        self.category2 = ProjectCategory.objects.create(display_name='재테크', name='EARN')
+        self.web = JobCategory.objects.create(display_name='웹', name='Web')
+        self.infra = JobCategory.objects.create(display_name='인프라', name='Infra')
+        self.backend = Job.objects.create(category=self.web, display_name='백엔드', name='backend')
+        self.frontend = Job.objects.create(category=self.web, display_name='프론트엔드', name='frontend')
+        self.devops = Job.objects.create(category=self.infra, display_name='데브옵스', name='devops')
+
+        self.project1 = self._create_project(
+            self.category1, [self.backend, self.devops], ProjectCurrentRecruitStatus.RECRUITING.value,
+        )
+        self.project2 = self._create_project(
+            self.category2, [self.frontend], ProjectCurrentRecruitStatus.ADDITIONAL_RECRUITING.value,
+        )
+        self.project3 = self._create_project(
+            self.category1, [self.backend], ProjectCurrentRecruitStatus.RECRUITED.value,
+            job_experience_type=ProjectJobExperienceType.ONLY_EXPERIENCE.value,
+        )
+        self._create_project(
+            self.category1, [self.backend], ProjectCurrentRecruitStatus.RECRUITING.value, is_deleted=True,
+        )
+
+    def _create_project(self, category, jobs, current_recruit_status,
+                        job_experience_type=ProjectJobExperienceType.ALL.value, is_deleted=False) -> Project:
+        project = Project.objects.create(
+            title='project',
+            category=category,
+            job_experience_type=job_experience_type,
+            current_recruit_status=current_recruit_status,
+            created_member=self.member,
+            is_deleted=is_deleted,
+        )
+        project.latest_project_recruitment_jobs.set(jobs)
+        update_latest_project_recruitment_job_arrays(project)
+        return project
+
+    @staticmethod
+    def _get_request(**kwargs) -> HomeProjectListRequest:
+        params = {
+            'title': None,
+            'category_ids': [],
+            'job_ids': [],
+            'job_category_ids': [],
+            'jobs_operator': ProjectJobSearchOperator.OR.value,
+            'experience': None,
+            'min_hours_per_week': None,
+            'max_hours_per_week': None,
+            'min_duration_month': None,
+            'max_duration_month': None,
+            'current_recruit_status': None,
+        }
+        params.update(kwargs)
+        return HomeProjectListRequest(**params)
+
+    def test_get_home_project_facet_counts_from_db_without_filter(self):
+        # Given: no filter
+        home_project_list_request = self._get_request()
+
+        # When: get_home_project_facet_counts_from_db
+        facet_counts = get_home_project_facet_counts_from_db(home_project_list_request)
+
+        # Then: counts of active projects
+        self.assertEqual(facet_counts.total_count, 3)
+        self.assertEqual(
+            facet_counts.categories,
+            [
+                ProjectFacetIdCount(id=self.category1.id, count=2),
+                ProjectFacetIdCount(id=self.category2.id, count=1),
+            ],
+        )
+        self.assertEqual(
+            facet_counts.jobs,
+            [
+                ProjectFacetIdCount(id=self.backend.id, count=2),
+                ProjectFacetIdCount(id=self.frontend.id, count=1),
+                ProjectFacetIdCount(id=self.devops.id, count=1),
+            ],
+        )
+        self.assertEqual(
+            facet_counts.job_categories,
+            [
+                ProjectFacetIdCount(id=self.web.id, count=3),
+                ProjectFacetIdCount(id=self.infra.id, count=1),
+            ],
+        )
+        self.assertEqual(
+            facet_counts.experiences,
+            [
+                ProjectFacetValueCount(value=ProjectJobExperienceType.ALL.value, count=2),
+                ProjectFacetValueCount(value=ProjectJobExperienceType.ONLY_EXPERIENCE.value, count=1),
+            ],
+        )
+        # And: RECRUITING includes ADDITIONAL_RECRUITING
+        self.assertEqual(
+            facet_counts.current_recruit_statuses,
+            [
+                ProjectFacetValueCount(value=ProjectCurrentRecruitStatus.RECRUITING.value, count=2),
+                ProjectFacetValueCount(value=ProjectCurrentRecruitStatus.RECRUITED.value, count=1),
+            ],
+        )
+
+    def test_get_home_project_facet_counts_from_db_should_exclude_own_facet(self):
+        # Given: category1 filter
+        home_project_list_request = self._get_request(category_ids=[self.category1.id])
+
+        # When: get_home_project_facet_counts_from_db
+        facet_counts = get_home_project_facet_counts_from_db(home_project_list_request)
+
+        # Then: total count is filtered
+        self.assertEqual(facet_counts.total_count, 2)
+        # And: category facet ignores category filter
+        self.assertEqual(
+            facet_counts.categories,
+            [
+                ProjectFacetIdCount(id=self.category1.id, count=2),
+                ProjectFacetIdCount(id=self.category2.id, count=1),
+            ],
+        )
+        # And: other facets are filtered by category
+        self.assertEqual(
+            facet_counts.jobs,
+            [
+                ProjectFacetIdCount(id=self.backend.id, count=2),
+                ProjectFacetIdCount(id=self.devops.id, count=1),
+            ],
+        )
+
+    def test_get_home_project_facet_counts_from_db_should_match_relevance_search(self):
+        # Given: keyword only in project2 description
+        Project.objects.filter(id=self.project2.id).update(description='django backend')
+        refresh_project_search_documents([self.project1.id, self.project2.id, self.project3.id])
+        home_project_list_request = self._get_request(title='django', sort=ProjectListSortType.RELEVANCE.value)
+
+        # When: get_home_project_facet_counts_from_db
+        facet_counts = get_home_project_facet_counts_from_db(home_project_list_request)
+
+        # Then: counts of projects matched like relevance search list, not title ILIKE
+        self.assertEqual(facet_counts.total_count, 1)
+        self.assertEqual(facet_counts.categories, [ProjectFacetIdCount(id=self.category2.id, count=1)])
+        self.assertEqual(facet_counts.jobs, [ProjectFacetIdCount(id=self.frontend.id, count=1)])
+
+    def test_filter_index_facet_counts_should_match_db(self):
+        # Given: filter index
+        project_filter_index = ProjectFilterIndex()
+        home_project_list_requests = [
+            self._get_request(),
+            self._get_request(category_ids=[self.category1.id]),
+            self._get_request(job_ids=[self.backend.id], job_category_ids=[self.infra.id]),
+            self._get_request(job_ids=[self.backend.id, self.devops.id], jobs_operator='AND'),
+            self._get_request(experience=ProjectJobExperienceType.ALL.value),
+            self._get_request(current_recruit_status=ProjectCurrentRecruitStatus.RECRUITING.value),
+        ]
+
+        for home_project_list_request in home_project_list_requests:
+            # When: get_facet_counts
+            facet_counts = project_filter_index.get_facet_counts(home_project_list_request)
+
+            # Then: same as db aggregate
+            self.assertEqual(facet_counts, get_home_project_facet_counts_from_db(home_project_list_request))
+
+    @patch('project.services.project_facet_services.get_home_project_facet_counts_from_db')
+    @patch('project.services.project_facet_services.get_filter_indexed_home_project_facet_counts')
+    def test_get_home_project_facet_counts_should_use_filter_index(self,
+                                                                   mock_get_filter_indexed_home_project_facet_counts,
+                                                                   mock_get_home_project_facet_counts_from_db):
+        # Given: filter index facet counts
+        home_project_list_request = self._get_request()
+        mock_get_filter_indexed_home_project_facet_counts.return_value = 'facet_counts'
+
+        # When: get_home_project_facet_counts
+        facet_counts = get_home_project_facet_counts(home_project_list_request)
+
+        # Then: db aggregate is not used
+        self.assertEqual(facet_counts, 'facet_counts')
+        mock_get_home_project_facet_counts_from_db.assert_not_called()
+
+    @patch('project.services.project_facet_services.get_home_project_facet_counts_from_db')
+    @patch('project.services.project_facet_services.get_filter_indexed_home_project_facet_counts')
+    def test_get_home_project_facet_counts_should_fallback_to_db(self,
+                                                                 mock_get_filter_indexed_home_project_facet_counts,
+                                                                 mock_get_home_project_facet_counts_from_db):
+        # Given: filter index unavailable
+        home_project_list_request = self._get_request()
+        mock_get_filter_indexed_home_project_facet_counts.return_value = None
+        mock_get_home_project_facet_counts_from_db.return_value = 'facet_counts'
+
+        # When: get_home_project_facet_counts
+        facet_counts = get_home_project_facet_counts(home_project_list_request)
+
+        # Then: db aggregate is used
+        self.assertEqual(facet_counts, 'facet_counts')
+        mock_get_home_project_facet_counts_from_db.assert_called_once_with(home_project_list_request)
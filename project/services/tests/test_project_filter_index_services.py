@@ -0,0 +1,256 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from common.common_utils.decode_utils import urlsafe_base64_to_data
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+from django_redis import get_redis_connection
+from job.models import (
+    Job,
+    JobCategory,
+)
+from member.models import Member
+from project.consts import (
+    PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY,
+    ProjectCurrentRecruitStatus,
+    ProjectJobExperienceType,
+    ProjectJobSearchOperator,
+)
+from project.dtos.request_dtos import HomeProjectListRequest
+from project.models import (
+    Project,
+    ProjectCategory,
+)
+from project.services.project_filter_index_services import (
+    ProjectFilterIndex,
+    get_filter_indexed_home_projects,
+    publish_project_filter_index_changes,
+)
+from project.services.project_services import (
+    get_filtered_project_qs,
+    update_latest_project_recruitment_job_arrays,
+)
+from redis.exceptions import ConnectionError
+
+
+class ProjectFilterIndexTestCase(TestCase):
+    def setUp(self):
+        get_redis_connection('default').delete(PROJECT_FILTER_INDEX_CHANGE_STREAM_KEY)
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.category1 = ProjectCategory.objects.create(display_name='재미/흥미', name='FUN')
+        self.category2 = ProjectCategory.objects.create(display_name='재테크', name='EARN')
+        self.web = JobCategory.objects.create(display_name='웹', name='Web')
+        self.infra = JobCategory.objects.create(display_name='인프라', name='Infra')
+        self.backend = Job.objects.create(category=self.web, display_name='백엔드', name='backend')
+        self.frontend = Job.objects.create(category=self.web, display_name='프론트엔드', name='frontend')
+        self.devops = Job.objects.create(category=self.infra, display_name='데브옵스', name='devops')
+
+        now = timezone.now()
+        self.project1 = self._create_project(
+            now, self.category1, [self.backend, self.devops],
+            ProjectCurrentRecruitStatus.RECRUITING.value, hours_per_week=10, duration_month=6,
+        )
+        self.project2 = self._create_project(
+            now - timedelta(hours=1), self.category2, [self.frontend],
+            ProjectCurrentRecruitStatus.RECRUITED.value, hours_per_week=20, duration_month=None,
+        )
+        self.project3 = self._create_project(
+            now - timedelta(hours=2), self.category1, [self.backend, self.frontend],
+            ProjectCurrentRecruitStatus.ADDITIONAL_RECRUITING.value, hours_per_week=None, duration_month=12,
+        )
+        # 동일 rearrangement_time 은 id 내림차순으로 정렬됩니다.
+        self.project4 = self._create_project(
+            now - timedelta(hours=2), self.category2, [],
+            ProjectCurrentRecruitStatus.RECRUITING.value, hours_per_week=5, duration_month=3,
+            job_experience_type=ProjectJobExperienceType.ONLY_EXPERIENCE.value,
+        )
+        self.deleted_project = self._create_project(
+            now, self.category1, [self.backend],
+            ProjectCurrentRecruitStatus.RECRUITING.value, hours_per_week=10, duration_month=6,
+            is_deleted=True,
+        )
+        self.project_filter_index = ProjectFilterIndex()
+
+    def _create_project(self, rearrangement_time, category, jobs, current_recruit_status,
+                        hours_per_week, duration_month,
+                        job_experience_type=ProjectJobExperienceType.ALL.value, is_deleted=False) -> Project:
+        project = Project.objects.create(
+            title='project',
+            category=category,
+            job_experience_type=job_experience_type,
+            current_recruit_status=current_recruit_status,
+            hours_per_week=hours_per_week,
+            duration_month=duration_month,
+            created_member=self.member,
+            is_deleted=is_deleted,
+        )
+        Project.objects.filter(id=project.id).update(rearrangement_time=rearrangement_time)
+        project.refresh_from_db()
+        project.latest_project_recruitment_jobs.set(jobs)
+        update_latest_project_recruitment_job_arrays(project)
+        return project
+
+    @staticmethod
+    def _get_request(**kwargs) -> HomeProjectListRequest:
+        params = {
+            'title': None,
+            'category_ids': [],
+            'job_ids': [],
+            'job_category_ids': [],
+            'jobs_operator': ProjectJobSearchOperator.OR.value,
+            'experience': None,
+            'min_hours_per_week': None,
+            'max_hours_per_week': None,
+            'min_duration_month': None,
+            'max_duration_month': None,
+            'current_recruit_status': None,
+        }
+        params.update(kwargs)
+        return HomeProjectListRequest(**params)
+
+    def _get_indexed_project_ids(self, home_project_list_request: HomeProjectListRequest) -> list:
+        projects, _, _ = self.project_filter_index.get_projects_page(home_project_list_request, {}, 100)
+        return [project.id for project in projects]
+
+    def test_get_projects_page_should_match_get_filtered_project_qs(self):
+        # Given: filter combinations
+        home_project_list_requests = [
+            self._get_request(),
+            self._get_request(category_ids=[self.category1.id]),
+            self._get_request(job_ids=[self.backend.id, self.frontend.id]),
+            self._get_request(job_ids=[self.backend.id, self.frontend.id], jobs_operator='AND'),
+            self._get_request(job_category_ids=[self.infra.id], job_ids=[self.frontend.id]),
+            self._get_request(job_category_ids=[self.web.id], job_ids=[self.devops.id], jobs_operator='AND'),
+            self._get_request(experience=ProjectJobExperienceType.ONLY_EXPERIENCE.value),
+            self._get_request(current_recruit_status=ProjectCurrentRecruitStatus.RECRUITING.value),
+            self._get_request(current_recruit_status=ProjectCurrentRecruitStatus.RECRUITED.value),
+            self._get_request(min_hours_per_week=8),
+            self._get_request(max_hours_per_week=10),
+            self._get_request(min_hours_per_week=8, max_hours_per_week=15),
+            self._get_request(min_duration_month=4, max_duration_month=12),
+            self._get_request(max_duration_month=6, category_ids=[self.category1.id, self.category2.id]),
+        ]
+
+        for home_project_list_request in home_project_list_requests:
+            # When: get_projects_page
+            indexed_project_ids = self._get_indexed_project_ids(home_project_list_request)
+
+            # Then: same projects and ordering as get_filtered_project_qs
+            filtered_project_ids = list(
+                get_filtered_project_qs(
+                    title=None,
+                    category_ids=home_project_list_request.category_ids,
+                    job_ids=home_project_list_request.job_ids,
+                    job_category_ids=home_project_list_request.job_category_ids,
+                    jobs_operator=home_project_list_request.jobs_operator,
+                    experience=home_project_list_request.experience,
+                    min_hours_per_week=home_project_list_request.min_hours_per_week,
+                    max_hours_per_week=home_project_list_request.max_hours_per_week,
+                    min_duration_month=home_project_list_request.min_duration_month,
+                    max_duration_month=home_project_list_request.max_duration_month,
+                    current_recruit_status=home_project_list_request.current_recruit_status,
+                ).order_by('-rearrangement_time', '-id').values_list('id', flat=True)
+            )
+            self.assertEqual(indexed_project_ids, filtered_project_ids, home_project_list_request)
+
+    def test_get_projects_page_should_walk_with_next_cursor(self):
+        # Given: page size 1
+        home_project_list_request = self._get_request()
+        decoded_next_cursor = {}
+        project_ids = []
+
+        # When: walk all pages
+        while True:
+            projects, has_more, next_cursor = self.project_filter_index.get_projects_page(
+                home_project_list_request, decoded_next_cursor, 1,
+            )
+            project_ids.extend(project.id for project in projects)
+            if not has_more:
+                break
+            decoded_next_cursor = urlsafe_base64_to_data(next_cursor)
+
+        # Then: every active project once in rearrangement order
+        self.assertEqual(
+            project_ids,
+            [self.project1.id, self.project2.id, self.project4.id, self.project3.id],
+        )
+
+    def test_get_sorted_project_ids_should_walk_bits_in_sort_key_order(self):
+        # Given: sort keys of ids across byte boundaries and bits without id 8
+        self.project_filter_index.sort_keys = [(-3, -1), (-2, -8), (-1, -9), (0, -100)]
+        bits = (1 << 1) | (1 << 9) | (1 << 100)
+
+        # When: get_sorted_project_ids
+        # Then: ids in bits are returned in sort key order
+        self.assertEqual(self.project_filter_index.get_sorted_project_ids(bits, None, 10), [1, 9, 100])
+        # And: from cursor with limit
+        self.assertEqual(self.project_filter_index.get_sorted_project_ids(bits, (-3, -1), 1), [9])
+        # And: empty bits
+        self.assertEqual(self.project_filter_index.get_sorted_project_ids(0, None, 10), [])
+
+    def test_refresh_should_apply_change_stream(self):
+        # Given: built index
+        self.project_filter_index.refresh()
+        # And: project2 deleted and new project created
+        Project.objects.filter(id=self.project2.id).update(is_deleted=True)
+        new_project = self._create_project(
+            timezone.now() + timedelta(hours=1), self.category2, [self.devops],
+            ProjectCurrentRecruitStatus.RECRUITING.value, hours_per_week=1, duration_month=1,
+        )
+        # And: changes published after commit
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_project_filter_index_changes([self.project2.id, new_project.id])
+
+        # When: refresh
+        with patch.object(self.project_filter_index, '_build') as mock_build:
+            self.assertTrue(self.project_filter_index.refresh())
+
+        # Then: applied without full rebuild
+        mock_build.assert_not_called()
+        self.assertEqual(
+            self._get_indexed_project_ids(self._get_request(job_ids=[self.devops.id])),
+            [new_project.id, self.project1.id],
+        )
+        self.assertNotIn(self.project2.id, self._get_indexed_project_ids(self._get_request()))
+
+    def test_get_projects_page_should_return_none_when_project_changed_without_stream(self):
+        # Given: built index
+        self.project_filter_index.refresh()
+        # And: project1 changed without change stream
+        Project.objects.filter(id=self.project1.id).update(hours_per_week=40)
+
+        # When: get_projects_page
+        page = self.project_filter_index.get_projects_page(self._get_request(), {}, 20)
+
+        # Then: stale index falls back
+        self.assertIsNone(page)
+        # And: rebuilt on next request
+        self.assertEqual(
+            self._get_indexed_project_ids(self._get_request(min_hours_per_week=30, max_hours_per_week=40)),
+            [self.project1.id],
+        )
+
+    @patch('project.services.project_filter_index_services.get_redis_connection')
+    def test_get_projects_page_should_return_none_when_change_stream_unavailable(self, mock_get_redis_connection):
+        # Given: redis unavailable
+        mock_get_redis_connection.side_effect = ConnectionError()
+
+        # When: get_projects_page
+        page = self.project_filter_index.get_projects_page(self._get_request(), {}, 20)
+
+        # Then: falls back
+        self.assertIsNone(page)
+
+    @override_settings(PROJECT_FILTER_INDEX_ENABLED=True)
+    def test_get_filter_indexed_home_projects_should_return_none_with_title(self):
+        # Given: title search
+        home_project_list_request = self._get_request(title='project')
+
+        # When: get_filter_indexed_home_projects
+        page = get_filter_indexed_home_projects(home_project_list_request, {}, 20)
+
+        # Then: falls back to get_filtered_project_qs
+        self.assertIsNone(page)
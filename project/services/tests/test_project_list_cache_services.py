@@ -0,0 +1,112 @@
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import (
+    HOME_PROJECT_LIST_CACHE_KEY_PREFIX,
+    PROJECT_LIST_VERSION_KEY,
+)
+from project.dtos.request_dtos import HomeProjectListRequest
+from project.models import (
+    Project,
+    ProjectBookmark,
+)
+from project.services.project_list_cache_services import (
+    HomeProjectListCache,
+    bump_project_list_version,
+)
+
+
+@override_settings(PROJECT_LIST_CACHE_ENABLED=True)
+class HomeProjectListCacheTest(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.redis.delete(PROJECT_LIST_VERSION_KEY, *self.redis.keys(f'{HOME_PROJECT_LIST_CACHE_KEY_PREFIX}:*'))
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project1 = Project.objects.create(title='Project 1', created_member_id=self.member.id)
+        self.project2 = Project.objects.create(title='Project 2', created_member_id=self.member.id)
+        self.response_data = {
+            'data': [
+                {'id': self.project1.id, 'is_bookmarked': True},
+                {'id': self.project2.id, 'is_bookmarked': False},
+            ],
+            'next_cursor': None,
+            'has_more': False,
+        }
+
+    def test_bump_project_list_version_should_incr_after_commit(self):
+        # When: bump_project_list_version
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            bump_project_list_version()
+            # Then: not bumped before commit
+            self.assertIsNone(self.redis.get(PROJECT_LIST_VERSION_KEY))
+
+        # And: bumped after commit
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(int(self.redis.get(PROJECT_LIST_VERSION_KEY)), 1)
+
+    def test_set_should_store_response_without_member_bookmarks(self):
+        # Given: cache miss
+        home_project_list_cache = HomeProjectListCache(HomeProjectListRequest.of({}), None, 20)
+        self.assertIsNone(home_project_list_cache.get())
+
+        # When: set
+        home_project_list_cache.set(self.response_data)
+
+        # Then: cached response is not bookmarked
+        cached_response_data = HomeProjectListCache(HomeProjectListRequest.of({}), None, 20).get()
+        self.assertEqual(
+            [project['is_bookmarked'] for project in cached_response_data['data']],
+            [False, False],
+        )
+
+    def test_get_should_normalize_request(self):
+        # Given: cached response of category_ids 1,2
+        home_project_list_cache = HomeProjectListCache(HomeProjectListRequest.of({'category_ids': '1,2'}), None, 20)
+        home_project_list_cache.get()
+        home_project_list_cache.set(self.response_data)
+
+        # When: get with category_ids 2,1
+        # Then: same cache is used
+        self.assertIsNotNone(HomeProjectListCache(HomeProjectListRequest.of({'category_ids': '2,1'}), None, 20).get())
+        # And: different size is not cached
+        self.assertIsNone(HomeProjectListCache(HomeProjectListRequest.of({'category_ids': '1,2'}), None, 10).get())
+
+    def test_get_should_miss_after_version_bumped(self):
+        # Given: cached response
+        home_project_list_cache = HomeProjectListCache(HomeProjectListRequest.of({}), None, 20)
+        home_project_list_cache.get()
+        home_project_list_cache.set(self.response_data)
+
+        # When: project list version bumped
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_project_list_version()
+
+        # Then: cache miss
+        self.assertIsNone(HomeProjectListCache(HomeProjectListRequest.of({}), None, 20).get())
+
+    @override_settings(PROJECT_LIST_CACHE_ENABLED=False)
+    def test_get_should_return_none_when_disabled(self):
+        # Given: cache disabled
+        home_project_list_cache = HomeProjectListCache(HomeProjectListRequest.of({}), None, 20)
+
+        # When: set and get
+        home_project_list_cache.set(self.response_data)
+
+        # Then: cache miss
+        self.assertIsNone(home_project_list_cache.get())
+
+    def test_overlay_is_bookmarked(self):
+        # Given: member bookmarked project2
+        ProjectBookmark.objects.create(member=self.member, project=self.project2)
+
+        # When: overlay_is_bookmarked
+        response_data = HomeProjectListCache.overlay_is_bookmarked(self.response_data, self.member)
+
+        # Then: is_bookmarked of member
+        self.assertEqual(
+            [project['is_bookmarked'] for project in response_data['data']],
+            [False, True],
+        )
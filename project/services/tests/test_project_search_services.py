@@ -0,0 +1,129 @@
+from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from common.common_testcase_helpers.project.testcase_helpers import create_project_category_for_testcase
+from django.test import TestCase
+from member.models import Member
+from project.models import (
+    Project,
+    ProjectSearchDocument,
+)
+from project.services.project_search_services import (
+    get_ranked_project_qs,
+    refresh_project_search_documents,
+)
+from project.services.project_services import get_active_project_qs
+
+
+class RefreshProjectSearchDocumentsTests(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.category = create_project_category_for_testcase('스터디')
+        self.backend = create_job_for_testcase('backend')
+        self.project = Project.objects.create(
+            title='사이드 프로젝트',
+            description='함께 만들어요',
+            category=self.category,
+            created_member_id=self.member.id,
+        )
+        self.project.latest_project_recruitment_jobs.add(self.backend)
+
+    def test_refresh_project_search_documents_should_create_document(self):
+        # Given: project without search document
+        self.assertFalse(ProjectSearchDocument.objects.filter(project=self.project).exists())
+
+        # When: refresh_project_search_documents
+        refresh_project_search_documents([self.project.id])
+
+        # Then: document contains title, category, job display name and description
+        search_document = ProjectSearchDocument.objects.get(project=self.project)
+        self.assertEqual(search_document.document, '사이드 프로젝트 스터디 backend 함께 만들어요')
+        # And: search_vector is filled
+        self.assertIsNotNone(search_document.search_vector)
+
+    def test_refresh_project_search_documents_should_update_document(self):
+        # Given: project with search document
+        refresh_project_search_documents([self.project.id])
+        # And: project title changed
+        self.project.title = '새로운 제목'
+        self.project.save()
+
+        # When: refresh_project_search_documents
+        refresh_project_search_documents([self.project.id])
+
+        # Then: document is updated
+        self.assertEqual(ProjectSearchDocument.objects.count(), 1)
+        self.assertEqual(
+            ProjectSearchDocument.objects.get(project=self.project).document,
+            '새로운 제목 스터디 backend 함께 만들어요',
+        )
+
+    def test_refresh_project_search_documents_with_empty_project_ids(self):
+        # Given: empty project_ids
+        # When: refresh_project_search_documents
+        refresh_project_search_documents([])
+
+        # Then: nothing is created
+        self.assertFalse(ProjectSearchDocument.objects.exists())
+
+    def test_project_delete_should_delete_search_document(self):
+        # Given: project with search document
+        refresh_project_search_documents([self.project.id])
+
+        # When: hard delete project
+        self.project.delete()
+
+        # Then: search document is deleted together
+        self.assertFalse(ProjectSearchDocument.objects.exists())
+
+
+class GetRankedProjectQsTests(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.backend = create_job_for_testcase('backend')
+        self.project1 = Project.objects.create(
+            title='django study',
+            description='backend api',
+            created_member_id=self.member.id,
+        )
+        self.project2 = Project.objects.create(
+            title='flutter app',
+            description='we need django backend',
+            created_member_id=self.member.id,
+        )
+        self.project3 = Project.objects.create(
+            title='design',
+            description='figma',
+            created_member_id=self.member.id,
+        )
+        refresh_project_search_documents([self.project1.id, self.project2.id, self.project3.id])
+
+    def test_get_ranked_project_qs_should_match_title_and_description(self):
+        # Given: keyword in project1 title and project2 description
+        keyword = 'django'
+
+        # When: get_ranked_project_qs
+        projects = list(get_ranked_project_qs(get_active_project_qs(), keyword).order_by('-search_score', '-id'))
+
+        # Then: project1, project2 are matched
+        self.assertEqual([project.id for project in projects], [self.project1.id, self.project2.id])
+        # And: title match is ranked higher
+        self.assertGreater(projects[0].search_score, projects[1].search_score)
+
+    def test_get_ranked_project_qs_should_return_empty_when_not_matched(self):
+        # Given: keyword not in any project
+        keyword = 'kotlin'
+
+        # When: get_ranked_project_qs
+        projects = list(get_ranked_project_qs(get_active_project_qs(), keyword))
+
+        # Then: nothing matched
+        self.assertEqual(projects, [])
+
+    def test_get_ranked_project_qs_search_score_should_round_trip_as_cursor(self):
+        # Given: ranked projects
+        project = get_ranked_project_qs(get_active_project_qs(), 'django').order_by('-search_score', '-id').first()
+
+        # When: filter by same search_score
+        qs = get_ranked_project_qs(get_active_project_qs(), 'django').filter(search_score=project.search_score)
+
+        # Then: same project is found
+        self.assertIn(project.id, qs.values_list('id', flat=True))
@@ -6,8 +6,17 @@ from unittest.mock import (
 
 from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
 from common.common_testcase_helpers.project.testcase_helpers import create_project_category_for_testcase
+from common.common_utils.request_memo_utils import (
+    end_request_memo,
+    start_request_memo,
+)
 from django.db import DatabaseError
-from django.test import TestCase
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+from django_redis import get_redis_connection
 from job.models import Job, JobCategory
 from member.models import Member
 from project.consts import (
@@ -16,6 +25,7 @@ from project.consts import (
     ProjectJobSearchOperator,
     ProjectManagementPermissionBehavior,
     ProjectMemberManagementLeftStatus,
+    ProjectRecruitmentStatus,
 )
 from project.dtos.request_dtos import CreateProjectJob
 from project.dtos.service_dtos import ProjectCreationData
@@ -28,6 +38,7 @@ from project.models import (
     ProjectRecruitment,
     ProjectRecruitmentJob,
 )
+from project.services import project_services
 from project.services.project_services import (
     ProjectCreationService,
     create_project_management_permissions,
@@ -40,6 +51,9 @@ from project.services.project_services import (
     get_maximum_project_recruit_times,
     get_projects_leader_ids,
     get_projects_participated_member_ids,
+    invalidate_active_projects,
+    update_latest_project_recruitment_job_arrays,
+    update_projects_latest_recruited_at,
 )
 
 
@@ -97,6 +111,7 @@ class ProjectFilterTestCase(TestCase):
             is_deleted=False,
         )
         self.project1.latest_project_recruitment_jobs.set([self.backend_job, self.devops_job, self.frontend_job])
+        update_latest_project_recruitment_job_arrays(self.project1)
 
         self.project2 = Project.objects.create(
             title='Another Project',
@@ -109,6 +124,7 @@ class ProjectFilterTestCase(TestCase):
             is_deleted=False,
         )
         self.project2.latest_project_recruitment_jobs.set([self.frontend_job])
+        update_latest_project_recruitment_job_arrays(self.project2)
 
     def test_filter_by_title(self):
         # Given: Title filter
@@ -273,7 +289,7 @@ class ProjectFilterTestCase(TestCase):
     def test_filter_by_job_category_id_with_job_ids_by_and(self):
         # Given: Job category ID and Job ID filter with AND operator
         job_category_ids = [self.infra_categories.id]
-        job_ids = [self.backend_job]
+        job_ids = [self.backend_job.id]
         jobs_operator = ProjectJobSearchOperator.AND.value
 
         # When: Filtering projects
@@ -295,6 +311,35 @@ class ProjectFilterTestCase(TestCase):
         self.assertEqual(qs.count(), 1)
         self.assertEqual(qs.first(), self.project1)
 
+    def test_filter_by_job_ids_and_job_category_ids_should_not_join_recruitment_jobs(self):
+        # Given: Job category ID and Job ID filter with AND operator
+        job_category_ids = [self.web_job_categories.id, self.infra_categories.id]
+        job_ids = [self.backend_job.id, self.frontend_job.id]
+        jobs_operator = ProjectJobSearchOperator.AND.value
+
+        # When: Filtering projects
+        qs = get_filtered_project_qs(
+            title=None,
+            category_ids=None,
+            job_ids=job_ids,
+            job_category_ids=job_category_ids,
+            jobs_operator=jobs_operator,
+            experience=None,
+            min_hours_per_week=None,
+            max_hours_per_week=None,
+            min_duration_month=None,
+            max_duration_month=None,
+            current_recruit_status=None
+        )
+
+        # Then: single array containment predicates without join and distinct
+        sql = str(qs.query)
+        self.assertNotIn('JOIN', sql)
+        self.assertNotIn('DISTINCT', sql)
+        self.assertIn('@>', sql)
+        # And: project1 is returned once
+        self.assertEqual(list(qs), [self.project1])
+
     def test_filter_by_job_category_id_with_job_ids_by_or(self):
         # Given: Create another job
         nothing_job = Job.objects.create(
@@ -314,6 +359,7 @@ class ProjectFilterTestCase(TestCase):
             is_deleted=False,
         )
         project3.latest_project_recruitment_jobs.set([nothing_job])
+        update_latest_project_recruitment_job_arrays(project3)
         # And: Job category ID and Job ID filter with OR operator
         job_category_ids = [self.infra_categories.id]
         job_ids = [nothing_job.id]
@@ -811,6 +857,95 @@ class TestGetMaximumProjectRecruitTimes(TestCase):
         self.assertEqual(max_times_project_recruit, 3)
 
 
+class UpdateLatestProjectRecruitmentJobArraysTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.job_category = JobCategory.objects.create(display_name='웹', name='Web')
+        self.backend = Job.objects.create(category=self.job_category, display_name='백엔드', name='backend')
+        self.frontend = Job.objects.create(category=self.job_category, display_name='프론트엔드', name='frontend')
+        self.etc = Job.objects.create(category=None, display_name='기타', name='etc')
+        self.project = Project.objects.create(
+            title='Project',
+            created_member_id=self.member.id,
+        )
+
+    def test_update_latest_project_recruitment_job_arrays(self):
+        # Given: latest_project_recruitment_jobs
+        self.project.latest_project_recruitment_jobs.set([self.frontend, self.backend, self.etc])
+
+        # When: update_latest_project_recruitment_job_arrays
+        update_latest_project_recruitment_job_arrays(self.project)
+
+        # Then: job ids are sorted
+        self.project.refresh_from_db()
+        self.assertEqual(
+            self.project.latest_project_recruitment_job_ids,
+            sorted([self.backend.id, self.frontend.id, self.etc.id]),
+        )
+        # And: job category ids are unique without null category
+        self.assertEqual(self.project.latest_project_recruitment_job_category_ids, [self.job_category.id])
+
+    def test_update_latest_project_recruitment_job_arrays_without_jobs(self):
+        # Given: project with job arrays but without latest_project_recruitment_jobs
+        self.project.latest_project_recruitment_job_ids = [self.backend.id]
+        self.project.latest_project_recruitment_job_category_ids = [self.job_category.id]
+        self.project.save()
+
+        # When: update_latest_project_recruitment_job_arrays
+        update_latest_project_recruitment_job_arrays(self.project)
+
+        # Then: job arrays are emptied
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.latest_project_recruitment_job_ids, [])
+        self.assertEqual(self.project.latest_project_recruitment_job_category_ids, [])
+
+
+class UpdateProjectsLatestRecruitedAtTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project = Project.objects.create(
+            title='Project',
+            created_member_id=self.member.id,
+        )
+
+    def test_update_projects_latest_recruited_at(self):
+        # Given: two recruitments
+        project_recruitments = [
+            ProjectRecruitment.objects.create(
+                project=self.project,
+                times_project_recruit=times_project_recruit,
+                created_member_id=self.member.id,
+            )
+            for times_project_recruit in (1, 2)
+        ]
+
+        # When: update_projects_latest_recruited_at
+        update_projects_latest_recruited_at([self.project.id])
+
+        # Then: created_at of latest recruitment
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.latest_recruited_at, project_recruitments[1].created_at)
+
+        # When: latest recruitment is deleted
+        project_recruitments[1].delete()
+        update_projects_latest_recruited_at([self.project.id])
+
+        # Then: created_at of remaining recruitment
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.latest_recruited_at, project_recruitments[0].created_at)
+
+    def test_update_projects_latest_recruited_at_without_recruitment(self):
+        # Given: project with latest_recruited_at but without recruitment
+        Project.objects.filter(id=self.project.id).update(latest_recruited_at=timezone.now())
+
+        # When: update_projects_latest_recruited_at
+        update_projects_latest_recruited_at([self.project.id])
+
+        # Then: null
+        self.project.refresh_from_db()
+        self.assertIsNone(self.project.latest_recruited_at)
+
+
 class CreateProjectRecruitmentTest(TestCase):
     def setUp(self):
         self.member = Member.objects.create_user(username='test', nickname='test')
@@ -994,6 +1129,18 @@ class ProjectCreationServiceTest(TestCase):
         self.assertEqual(project.latest_project_recruitment.times_project_recruit, 1)
         self.assertEqual(project.latest_project_recruitment.created_member.id, self.member.id)
 
+    @patch('project.services.project_services.bump_project_list_version')
+    def test_project_creation_service_generate_project_should_bump_project_list_version(self,
+                                                                                        mock_bump_project_list_version):
+        # Given: member_id, project_creation_data
+        project_creation_service = ProjectCreationService(self.member.id, self.project_creation_data)
+
+        # When: generate_project
+        project_creation_service.generate_project()
+
+        # Then: project list version is bumped
+        mock_bump_project_list_version.assert_called_once_with()
+
     @patch('project.services.project_services.Project.objects')
     def test_create_project_method(self, mock_object):
         # Given: member_id, project_creation_data
@@ -1106,6 +1253,9 @@ class ProjectCreationServiceTest(TestCase):
             set(project.latest_project_recruitment_jobs.values_list('id', flat=True)),
             {self.backend.id, self.frontend.id},
         )
+        # And: should be updated latest_project_recruitment_job_ids
+        project.refresh_from_db()
+        self.assertEqual(project.latest_project_recruitment_job_ids, sorted([self.backend.id, self.frontend.id]))
 
     @patch('project.services.project_services.ProjectCreationService._create_project')
     @patch('project.services.project_services.ProjectCreationService._set_project')
@@ -1210,6 +1360,136 @@ class GetActiveProjectTest(TestCase):
         self.assertEqual(active_project, None)
 
 
+@override_settings(ACTIVE_PROJECT_CACHE_ENABLED=True)
+class GetActiveProjectCacheTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project = Project.objects.create(
+            title='Project',
+            created_member_id=self.member.id,
+        )
+        self.project_recruitment = create_project_recruitment_and_update_project(self.project, self.member.id)
+        self.redis = get_redis_connection('default')
+        self.active_project_key = project_services._get_active_project_key(self.project.id)
+        self.redis.delete(self.active_project_key)
+
+    def test_get_active_project_should_not_query_when_cached(self):
+        # Given: cached project
+        get_active_project(self.project.id)
+
+        # When: get_active_project
+        # Then: no query with latest_project_recruitment
+        with self.assertNumQueries(0):
+            active_project = get_active_project(self.project.id)
+            self.assertEqual(active_project.latest_project_recruitment.id, self.project_recruitment.id)
+
+    def test_get_active_project_should_rebuild_same_fields_from_cache(self):
+        # Given: project with array and datetime fields
+        Project.objects.filter(id=self.project.id).update(latest_recruited_at=timezone.now())
+        project = project_services._get_active_project_from_db(self.project.id)
+        # And: cached project
+        get_active_project(self.project.id)
+
+        # When: get_active_project
+        with self.assertNumQueries(0):
+            active_project = get_active_project(self.project.id)
+
+        # Then: same field values with project from db
+        self.assertEqual(
+            [getattr(active_project, field.attname) for field in Project._meta.concrete_fields],
+            [getattr(project, field.attname) for field in Project._meta.concrete_fields],
+        )
+        self.assertEqual(
+            [getattr(active_project.latest_project_recruitment, field.attname)
+             for field in ProjectRecruitment._meta.concrete_fields],
+            [getattr(project.latest_project_recruitment, field.attname)
+             for field in ProjectRecruitment._meta.concrete_fields],
+        )
+        # And: cached project is not new instance
+        self.assertFalse(active_project._state.adding)
+
+    def test_get_active_project_should_cache_without_latest_project_recruitment(self):
+        # Given: project without recruitment
+        project = Project.objects.create(title='Project 2', created_member_id=self.member.id)
+        self.redis.delete(project_services._get_active_project_key(project.id))
+        get_active_project(project.id)
+
+        # When: get_active_project
+        # Then: no query
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_active_project(project.id).latest_project_recruitment)
+
+    def test_get_active_project_should_not_cache_when_invalidated_while_querying(self):
+        # Given: project recruitment is finished right after the db query
+        get_active_project_from_db = project_services._get_active_project_from_db
+
+        def _get_active_project_from_db_then_finish_recruitment(project_id):
+            project = get_active_project_from_db(project_id)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.project_recruitment.recruit_status = ProjectRecruitmentStatus.RECRUIT_FINISH.value
+                self.project_recruitment.save()
+            return project
+
+        # When: get_active_project
+        with patch.object(
+            project_services,
+            '_get_active_project_from_db',
+            side_effect=_get_active_project_from_db_then_finish_recruitment,
+        ):
+            get_active_project(self.project.id)
+
+        # Then: stale project is not cached
+        self.assertIsNone(self.redis.get(self.active_project_key))
+        self.assertEqual(
+            get_active_project(self.project.id).latest_project_recruitment.recruit_status,
+            ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+        )
+
+    def test_get_active_project_should_be_invalidated_when_project_saved(self):
+        # Given: cached project
+        get_active_project(self.project.id)
+
+        # When: project is saved
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.title = 'Changed'
+            self.project.save()
+
+        # Then: changed project
+        self.assertEqual(get_active_project(self.project.id).title, 'Changed')
+
+    def test_get_active_project_should_be_invalidated_when_project_recruitment_saved(self):
+        # Given: cached project
+        get_active_project(self.project.id)
+
+        # When: project recruitment is saved
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project_recruitment.recruit_status = ProjectRecruitmentStatus.RECRUIT_FINISH.value
+            self.project_recruitment.save()
+
+        # Then: changed project recruitment
+        self.assertEqual(
+            get_active_project(self.project.id).latest_project_recruitment.recruit_status,
+            ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+        )
+
+    @override_settings(ACTIVE_PROJECT_CACHE_ENABLED=False)
+    def test_get_active_project_should_query_once_in_request(self):
+        # Given: request memo
+        token = start_request_memo()
+        try:
+            # When: get_active_project twice
+            # Then: one query
+            with self.assertNumQueries(1):
+                self.assertIs(get_active_project(self.project.id), get_active_project(self.project.id))
+
+            # And: memo is dropped when project is invalidated
+            invalidate_active_projects([self.project.id])
+            with self.assertNumQueries(1):
+                get_active_project(self.project.id)
+        finally:
+            end_request_memo(token)
+
+
 class GetProjectsLeaderIdsTest(TestCase):
 
     @patch('project.services.project_services.ProjectMemberManagement.objects.filter')
@@ -0,0 +1,340 @@
+from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from member.models import (
+    Member,
+    MemberProjectStats,
+)
+from project.consts import (
+    ProjectManagementPermissionBehavior,
+    ProjectRecruitApplicationStatus,
+    ProjectRecruitmentStatus,
+    ProjectStatus,
+)
+from project.exceptions import (
+    ProjectNotFoundErrorException,
+    ProjectRecruitApplicationPermissionDeniedException,
+)
+from project.models import (
+    Project,
+    ProjectMemberManagement,
+    ProjectRecruitApplication,
+    ProjectRecruitmentJob,
+)
+from project.services.project_services import (
+    create_project_management_permissions,
+    create_project_recruitment_and_update_project,
+)
+from project.services.recruit_application_services import ProjectRecruitApplicationService
+
+
+class ProjectRecruitApplicationServiceTest(TestCase):
+    def setUp(self):
+        self.leader = Member.objects.create_user(username='leader', nickname='leader')
+        self.job1 = create_job_for_testcase('job1')
+        self.job2 = create_job_for_testcase('job2')
+        self.project = Project.objects.create(title='Project', created_member_id=self.leader.id)
+        create_project_management_permissions(
+            self.project,
+            self.leader.id,
+            [ProjectManagementPermissionBehavior.PROJECT_RECRUIT],
+        )
+        self.project_recruitment = create_project_recruitment_and_update_project(self.project, self.leader.id)
+        self.project_recruitment_job1 = ProjectRecruitmentJob.objects.create(
+            project_recruitment=self.project_recruitment,
+            job=self.job1,
+            total_limit=2,
+            current_recruited=0,
+            created_member_id=self.leader.id,
+        )
+        self.project_recruitment_job2 = ProjectRecruitmentJob.objects.create(
+            project_recruitment=self.project_recruitment,
+            job=self.job2,
+            total_limit=None,
+            current_recruited=0,
+            created_member_id=self.leader.id,
+        )
+        self.service = ProjectRecruitApplicationService(self.project.id, self.leader.id)
+        self.applicant_count = 0
+
+    def _create_recruit_applications(self, project_recruitment_job: ProjectRecruitmentJob, count: int):
+        recruit_applications = []
+        for _ in range(count):
+            self.applicant_count += 1
+            recruit_applications.append(
+                ProjectRecruitApplication.objects.create(
+                    project_recruitment_job=project_recruitment_job,
+                    project_recruitment_id=project_recruitment_job.project_recruitment_id,
+                    member=Member.objects.create_user(
+                        username=f'applicant{self.applicant_count}',
+                        nickname=f'applicant{self.applicant_count}',
+                    ),
+                    request_message=f'message {self.applicant_count}',
+                )
+            )
+        return recruit_applications
+
+    @staticmethod
+    def _count_queries(func, *args) -> int:
+        with CaptureQueriesContext(connection) as context:
+            func(*args)
+        return len([query for query in context.captured_queries if 'SAVEPOINT' not in query['sql']])
+
+    def test_validate_manageable(self):
+        # Given: leader with recruit permission
+        # When: validate_manageable
+        # Then: no error
+        self.service.validate_manageable()
+
+    def test_validate_manageable_should_raise_error_when_no_permission(self):
+        # Given: member without recruit permission
+        member = Member.objects.create_user(username='member', nickname='member')
+
+        # When: validate_manageable
+        # Then: permission denied
+        with self.assertRaises(ProjectRecruitApplicationPermissionDeniedException):
+            ProjectRecruitApplicationService(self.project.id, member.id).validate_manageable()
+
+    def test_validate_manageable_should_raise_error_when_project_not_found(self):
+        # Given: deleted project
+        Project.objects.filter(id=self.project.id).update(is_deleted=True)
+
+        # When: validate_manageable
+        # Then: project not found
+        with self.assertRaises(ProjectNotFoundErrorException):
+            ProjectRecruitApplicationService(self.project.id, self.leader.id).validate_manageable()
+
+    def test_get_recruit_application_qs(self):
+        # Given: in review applications of job1, job2 and rejected application of job1
+        recruit_applications1 = self._create_recruit_applications(self.project_recruitment_job1, 2)
+        recruit_applications2 = self._create_recruit_applications(self.project_recruitment_job2, 1)
+        ProjectRecruitApplication.objects.filter(
+            id=recruit_applications1[0].id,
+        ).update(
+            request_status=ProjectRecruitApplicationStatus.REJECTED.value,
+        )
+        # And: validated project
+        self.service.validate_manageable()
+
+        # When: get_recruit_application_qs of latest recruitment
+        # Then: one query for applications, jobs and members
+        with self.assertNumQueries(1):
+            recruit_applications = list(
+                self.service.get_recruit_application_qs(
+                    None,
+                    ProjectRecruitApplicationStatus.IN_REVIEW.value,
+                ).order_by('-id')
+            )
+            [
+                (recruit_application.project_recruitment_job.job_id, recruit_application.member.nickname)
+                for recruit_application in recruit_applications
+            ]
+
+        # And: only in review applications
+        self.assertEqual(
+            [recruit_application.id for recruit_application in recruit_applications],
+            [recruit_applications2[0].id, recruit_applications1[1].id],
+        )
+        # And: filtered by job
+        self.assertEqual(
+            list(
+                self.service.get_recruit_application_qs(
+                    self.project_recruitment.id,
+                    ProjectRecruitApplicationStatus.IN_REVIEW.value,
+                    self.job1.id,
+                ).values_list('id', flat=True)
+            ),
+            [recruit_applications1[1].id],
+        )
+
+    def test_decide_recruit_applications(self):
+        # Given: in review applications
+        recruit_applications1 = self._create_recruit_applications(self.project_recruitment_job1, 2)
+        recruit_applications2 = self._create_recruit_applications(self.project_recruitment_job2, 2)
+
+        # When: accept job1 applications and job2 first application, reject job2 second application
+        decision_result = self.service.decide_recruit_applications({
+            recruit_applications1[0].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+            recruit_applications1[1].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+            recruit_applications2[0].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+            recruit_applications2[1].id: ProjectRecruitApplicationStatus.REJECTED.value,
+        })
+
+        # Then: decided
+        self.assertEqual(
+            decision_result.accepted_application_ids,
+            [recruit_applications1[0].id, recruit_applications1[1].id, recruit_applications2[0].id],
+        )
+        self.assertEqual(decision_result.rejected_application_ids, [recruit_applications2[1].id])
+        self.assertEqual(
+            ProjectRecruitApplication.objects.get(id=recruit_applications2[1].id).request_status,
+            ProjectRecruitApplicationStatus.REJECTED.value,
+        )
+        # And: project members are created
+        self.assertEqual(
+            set(
+                ProjectMemberManagement.objects.filter(
+                    project=self.project,
+                ).values_list('member_id', 'job_id', 'project_recruit_application_id')
+            ),
+            {
+                (recruit_applications1[0].member_id, self.job1.id, recruit_applications1[0].id),
+                (recruit_applications1[1].member_id, self.job1.id, recruit_applications1[1].id),
+                (recruit_applications2[0].member_id, self.job2.id, recruit_applications2[0].id),
+            },
+        )
+        # And: current_recruited is increased
+        self.project_recruitment_job1.refresh_from_db()
+        self.project_recruitment_job2.refresh_from_db()
+        self.assertEqual(self.project_recruitment_job1.current_recruited, 2)
+        self.assertEqual(self.project_recruitment_job2.current_recruited, 1)
+
+    def test_decide_recruit_applications_should_refresh_member_project_stats(self):
+        # Given: in review application of working project
+        Project.objects.filter(id=self.project.id).update(project_status=ProjectStatus.WORKING.value)
+        recruit_applications = self._create_recruit_applications(self.project_recruitment_job1, 1)
+
+        # When: accept application
+        self.service.decide_recruit_applications({
+            recruit_applications[0].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+        })
+
+        # Then: project stats of accepted member is refreshed
+        self.assertEqual(
+            MemberProjectStats.objects.get(member_id=recruit_applications[0].member_id).working_count,
+            1,
+        )
+
+    def test_decide_recruit_applications_should_not_accept_project_member_again(self):
+        # Given: applications of one member to job1 and job2
+        recruit_applications = self._create_recruit_applications(self.project_recruitment_job1, 1)
+        member = recruit_applications[0].member
+        recruit_applications.append(
+            ProjectRecruitApplication.objects.create(
+                project_recruitment_job=self.project_recruitment_job2,
+                member=member,
+                request_message='message',
+            )
+        )
+        # And: application of member who is already in project
+        project_member_applications = self._create_recruit_applications(self.project_recruitment_job2, 1)
+        ProjectMemberManagement.objects.create(
+            project=self.project,
+            member_id=project_member_applications[0].member_id,
+            job=self.job2,
+        )
+
+        # When: accept all applications
+        decision_result = self.service.decide_recruit_applications({
+            recruit_application.id: ProjectRecruitApplicationStatus.ACCEPTED.value
+            for recruit_application in recruit_applications + project_member_applications
+        })
+
+        # Then: only first application of member is accepted
+        self.assertEqual(decision_result.accepted_application_ids, [recruit_applications[0].id])
+        # And: memberships are not duplicated
+        self.assertEqual(ProjectMemberManagement.objects.filter(project=self.project, member=member).count(), 1)
+        self.assertEqual(
+            ProjectMemberManagement.objects.filter(
+                project=self.project,
+                member_id=project_member_applications[0].member_id,
+            ).count(),
+            1,
+        )
+
+    def test_decide_recruit_applications_should_not_exceed_total_limit(self):
+        # Given: job1 has one remaining seat
+        ProjectRecruitmentJob.objects.filter(id=self.project_recruitment_job1.id).update(current_recruited=1)
+        recruit_applications = self._create_recruit_applications(self.project_recruitment_job1, 2)
+
+        # When: accept two applications
+        decision_result = self.service.decide_recruit_applications({
+            recruit_application.id: ProjectRecruitApplicationStatus.ACCEPTED.value
+            for recruit_application in recruit_applications
+        })
+
+        # Then: only first application is accepted
+        self.assertEqual(decision_result.accepted_application_ids, [recruit_applications[0].id])
+        # And: second application is still in review
+        self.assertEqual(
+            ProjectRecruitApplication.objects.get(id=recruit_applications[1].id).request_status,
+            ProjectRecruitApplicationStatus.IN_REVIEW.value,
+        )
+        self.project_recruitment_job1.refresh_from_db()
+        self.assertEqual(self.project_recruitment_job1.current_recruited, 2)
+
+    def test_decide_recruit_applications_should_not_accept_when_recruit_finished(self):
+        # Given: job2 recruit is finished
+        ProjectRecruitmentJob.objects.filter(
+            id=self.project_recruitment_job2.id,
+        ).update(
+            recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+        )
+        recruit_applications = self._create_recruit_applications(self.project_recruitment_job2, 1)
+
+        # When: accept application
+        decision_result = self.service.decide_recruit_applications({
+            recruit_applications[0].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+        })
+
+        # Then: not accepted
+        self.assertEqual(decision_result.accepted_application_ids, [])
+        self.assertFalse(ProjectMemberManagement.objects.filter(project=self.project).exists())
+
+    def test_decide_recruit_applications_should_skip_decided_or_other_project_applications(self):
+        # Given: rejected application
+        recruit_applications = self._create_recruit_applications(self.project_recruitment_job1, 1)
+        ProjectRecruitApplication.objects.filter(
+            id=recruit_applications[0].id,
+        ).update(
+            request_status=ProjectRecruitApplicationStatus.REJECTED.value,
+        )
+        # And: application of other project
+        other_project = Project.objects.create(title='Other', created_member_id=self.leader.id)
+        other_project_recruitment_job = ProjectRecruitmentJob.objects.create(
+            project_recruitment=create_project_recruitment_and_update_project(other_project, self.leader.id),
+            job=self.job1,
+            created_member_id=self.leader.id,
+        )
+        other_recruit_applications = self._create_recruit_applications(other_project_recruitment_job, 1)
+
+        # When: accept applications
+        decision_result = self.service.decide_recruit_applications({
+            recruit_applications[0].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+            other_recruit_applications[0].id: ProjectRecruitApplicationStatus.ACCEPTED.value,
+        })
+
+        # Then: nothing is decided
+        self.assertEqual(decision_result.accepted_application_ids, [])
+        self.assertEqual(
+            ProjectRecruitApplication.objects.get(id=other_recruit_applications[0].id).request_status,
+            ProjectRecruitApplicationStatus.IN_REVIEW.value,
+        )
+
+    def test_decide_recruit_applications_should_not_depend_on_batch_size(self):
+        # Given: 2 applications and 20 applications
+        small_recruit_applications = self._create_recruit_applications(self.project_recruitment_job2, 2)
+        ProjectRecruitmentJob.objects.filter(id=self.project_recruitment_job1.id).update(total_limit=None)
+        large_recruit_applications = (
+            self._create_recruit_applications(self.project_recruitment_job1, 10)
+            + self._create_recruit_applications(self.project_recruitment_job2, 10)
+        )
+
+        def _decide(recruit_applications):
+            self.service.decide_recruit_applications({
+                recruit_application.id: (
+                    ProjectRecruitApplicationStatus.ACCEPTED.value
+                    if i % 2 else ProjectRecruitApplicationStatus.REJECTED.value
+                )
+                for i, recruit_application in enumerate(recruit_applications)
+            })
+
+        # When: decide small and large batch
+        small_query_count = self._count_queries(_decide, small_recruit_applications)
+        large_query_count = self._count_queries(_decide, large_recruit_applications)
+
+        # Then: same number of queries
+        # (신청 잠금, 모집 직무 잠금, 모집 직무 인원, 승인, 팀원 생성, 회원 프로젝트 통계 4, 거절)
+        self.assertEqual(small_query_count, 10)
+        self.assertEqual(large_query_count, small_query_count)
@@ -0,0 +1,35 @@
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+from project.models import (
+    Project,
+    ProjectBookmark,
+    ProjectMemberManagement,
+    ProjectRecruitment,
+)
+from project.services.member_relation_services import invalidate_member_project_relations
+from project.services.project_services import invalidate_active_projects
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_active_project_on_project_change(sender, instance, **kwargs):
+    invalidate_active_projects([instance.id])
+
+
+@receiver(post_save, sender=ProjectRecruitment)
+@receiver(post_delete, sender=ProjectRecruitment)
+def invalidate_active_project_on_project_recruitment_change(sender, instance, **kwargs):
+    # 활성 프로젝트 캐시는 latest_project_recruitment 를 함께 저장합니다.
+    invalidate_active_projects([instance.project_id])
+
+
+@receiver(post_save, sender=ProjectMemberManagement)
+@receiver(post_delete, sender=ProjectMemberManagement)
+@receiver(post_save, sender=ProjectBookmark)
+@receiver(post_delete, sender=ProjectBookmark)
+def invalidate_member_project_relations_on_change(sender, instance, **kwargs):
+    # BookmarkService 의 upsert 는 signal 을 보내지 않으므로 서비스에서 직접 삭제합니다.
+    invalidate_member_project_relations([instance.member_id])
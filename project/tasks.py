@@ -0,0 +1,10 @@
+from config.celery import app
+from project.services.bookmark_services import flush_project_bookmark_count_deltas
+from project.services.project_services import invalidate_active_projects
+
+
+@app.task
+def flush_project_bookmark_counts() -> int:
+    project_ids = flush_project_bookmark_count_deltas()
+    invalidate_active_projects(project_ids)
+    return len(project_ids)
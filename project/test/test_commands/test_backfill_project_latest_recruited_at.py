@@ -0,0 +1,46 @@
+from datetime import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from member.models import Member
+from project.models import (
+    Project,
+    ProjectRecruitment,
+)
+
+
+class BackfillProjectLatestRecruitedAtCommandTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project1 = Project.objects.create(
+            title='Project 1',
+            created_member_id=self.member.id,
+        )
+        for times_project_recruit, created_at in [(1, datetime(2021, 1, 1, 10, 0, 0)), (2, datetime(2021, 1, 2, 0, 0, 0))]:
+            project_recruitment = ProjectRecruitment.objects.create(
+                project_id=self.project1.id,
+                times_project_recruit=times_project_recruit,
+                created_member_id=self.member.id,
+            )
+            project_recruitment.created_at = created_at
+            project_recruitment.save()
+        self.project2 = Project.objects.create(
+            title='Project 2',
+            created_member_id=self.member.id,
+        )
+
+    def test_backfill_project_latest_recruited_at_command(self):
+        # Given: output
+        out = StringIO()
+
+        # When: 커맨드를 실행합니다.
+        call_command('backfill_project_latest_recruited_at', batch_size=1, stdout=out)
+
+        # Then: 가장 최근 모집 일시가 저장됩니다. (UTC 변환으로 인해 2021-01-01T15:00:00Z)
+        self.project1.refresh_from_db()
+        self.assertEqual(self.project1.latest_recruited_at.isoformat(), '2021-01-01T15:00:00+00:00')
+        # And: 모집이 없는 프로젝트는 비어 있습니다.
+        self.project2.refresh_from_db()
+        self.assertIsNone(self.project2.latest_recruited_at)
+        self.assertIn('Successfully backfilled latest_recruited_at of 2 projects', out.getvalue())
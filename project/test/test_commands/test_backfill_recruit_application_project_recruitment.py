@@ -0,0 +1,47 @@
+from io import StringIO
+
+from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from django.core.management import call_command
+from django.test import TestCase
+from member.models import Member
+from project.models import (
+    Project,
+    ProjectRecruitApplication,
+    ProjectRecruitment,
+    ProjectRecruitmentJob,
+)
+
+
+class BackfillRecruitApplicationProjectRecruitmentCommandTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project = Project.objects.create(
+            title='Project',
+            created_member_id=self.member.id,
+        )
+        self.project_recruitment = ProjectRecruitment.objects.create(
+            project=self.project,
+            times_project_recruit=1,
+            created_member_id=self.member.id,
+        )
+        self.project_recruitment_job = ProjectRecruitmentJob.objects.create(
+            project_recruitment=self.project_recruitment,
+            job=create_job_for_testcase('job'),
+            created_member_id=self.member.id,
+        )
+        self.recruit_application = ProjectRecruitApplication.objects.create(
+            project_recruitment_job=self.project_recruitment_job,
+            member=self.member,
+        )
+
+    def test_backfill_recruit_application_project_recruitment_command(self):
+        # Given: 프로젝트 모집이 비어 있는 신청
+        out = StringIO()
+
+        # When: 커맨드를 실행합니다.
+        call_command('backfill_recruit_application_project_recruitment', stdout=out)
+
+        # Then: 모집 직무의 프로젝트 모집이 채워집니다.
+        self.recruit_application.refresh_from_db()
+        self.assertEqual(self.recruit_application.project_recruitment_id, self.project_recruitment.id)
+        self.assertIn('Successfully backfilled project recruitment of 1 recruit applications', out.getvalue())
@@ -0,0 +1,21 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from project.models import Project
+
+
+class BenchmarkProjectCardQueryCommandTest(TestCase):
+    def test_benchmark_project_card_query_command(self):
+        # Given: output
+        out = StringIO()
+
+        # When: benchmark_project_card_query
+        call_command('benchmark_project_card_query', '--size', '3', '--description-length', '1000', stdout=out)
+
+        # Then: home result is written
+        output = out.getvalue()
+        self.assertIn('home: bytes', output)
+        self.assertIn('Successfully benchmarked project card query with page size 3', output)
+        # And: benchmark data is rolled back
+        self.assertFalse(Project.objects.exists())
@@ -0,0 +1,33 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import PROJECT_BOOKMARK_COUNT_DELTA_KEY
+from project.models import (
+    Project,
+    ProjectBookmark,
+)
+
+
+class LoadTestProjectBookmarkCommandTest(TestCase):
+    def setUp(self):
+        get_redis_connection('default').delete(PROJECT_BOOKMARK_COUNT_DELTA_KEY)
+
+    def test_load_test_project_bookmark_command(self):
+        # Given: output
+        out = StringIO()
+
+        # When: 한 worker 로 실행합니다.
+        call_command('load_test_project_bookmark', '--members', '3', '--workers', '1', stdout=out)
+
+        # Then: recount 와 delta 결과가 출력됩니다.
+        output = out.getvalue()
+        self.assertIn('recount: 3 bookmarks', output)
+        self.assertIn('delta: 3 bookmarks', output)
+        self.assertIn('Successfully load tested bookmark with 3 members and 1 workers', output)
+        # And: 부하 테스트 데이터는 삭제됩니다.
+        self.assertFalse(Project.objects.exists())
+        self.assertFalse(ProjectBookmark.objects.exists())
+        self.assertFalse(Member.objects.filter(username__startswith='load-').exists())
@@ -0,0 +1,42 @@
+from django.core.management import call_command
+from django.test import TestCase
+from member.models import Member
+from project.models import (
+    Project,
+    ProjectSearchDocument,
+)
+
+
+class RebuildProjectSearchDocumentsCommandTest(TestCase):
+    def setUp(self):
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project1 = Project.objects.create(
+            title='Project 1',
+            description='description 1',
+            created_member_id=self.member.id,
+        )
+        self.project2 = Project.objects.create(
+            title='Project 2',
+            description='description 2',
+            created_member_id=self.member.id,
+        )
+        self.deleted_project = Project.objects.create(
+            title='Deleted Project',
+            description='deleted',
+            created_member_id=self.member.id,
+            is_deleted=True,
+        )
+
+    def test_rebuild_project_search_documents_command(self):
+        # When: 커맨드를 실행합니다.
+        call_command('rebuild_project_search_documents', batch_size=1)
+
+        # Then: 삭제되지 않은 프로젝트의 검색 문서만 생성됩니다.
+        self.assertEqual(
+            set(ProjectSearchDocument.objects.values_list('project_id', flat=True)),
+            {self.project1.id, self.project2.id},
+        )
+        self.assertEqual(
+            ProjectSearchDocument.objects.get(project=self.project1).document,
+            'Project 1  description 1',
+        )
@@ -0,0 +1,38 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import PROJECT_BOOKMARK_COUNT_DELTA_KEY
+from project.models import (
+    Project,
+    ProjectBookmark,
+)
+
+
+class ReconcileProjectBookmarkCountsCommandTest(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.redis.delete(PROJECT_BOOKMARK_COUNT_DELTA_KEY)
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project1 = Project.objects.create(title='Project 1', created_member_id=self.member.id)
+        self.project2 = Project.objects.create(title='Project 2', created_member_id=self.member.id)
+        ProjectBookmark.objects.create(member=self.member, project=self.project1)
+
+    def test_reconcile_project_bookmark_counts_command(self):
+        # Given: 버퍼에 남은 증감
+        self.redis.hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project2.id, 1)
+        out = StringIO()
+
+        # When: 커맨드를 실행합니다.
+        call_command('reconcile_project_bookmark_counts', batch_size=1, stdout=out)
+
+        # Then: 활성 북마크 수로 맞춰집니다.
+        self.project1.refresh_from_db()
+        self.project2.refresh_from_db()
+        self.assertEqual(self.project1.bookmark_count, 1)
+        self.assertEqual(self.project2.bookmark_count, 0)
+        # And: 버퍼가 비워집니다.
+        self.assertFalse(self.redis.exists(PROJECT_BOOKMARK_COUNT_DELTA_KEY))
+        self.assertIn('Successfully reconciled bookmark counts of 2 projects (2 fixed)', out.getvalue())
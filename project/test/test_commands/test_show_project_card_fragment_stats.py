@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django_redis import get_redis_connection
+from project.consts import (
+    PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY,
+    PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY,
+)
+
+
+class ShowProjectCardFragmentStatsCommandTest(TestCase):
+    def setUp(self):
+        redis = get_redis_connection('default')
+        redis.set(PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY, 3)
+        redis.set(PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY, 1)
+
+    def tearDown(self):
+        get_redis_connection('default').delete(PROJECT_CARD_FRAGMENT_HIT_COUNT_KEY, PROJECT_CARD_FRAGMENT_MISS_COUNT_KEY)
+
+    def test_show_project_card_fragment_stats_command(self):
+        # Given: output
+        out = StringIO()
+
+        # When: show_project_card_fragment_stats
+        call_command('show_project_card_fragment_stats', stdout=out)
+
+        # Then: hit ratio is written
+        self.assertIn('hit 3, miss 1, hit ratio 75.00%', out.getvalue())
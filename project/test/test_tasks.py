@@ -0,0 +1,26 @@
+from django.test import TestCase
+from django_redis import get_redis_connection
+from member.models import Member
+from project.consts import PROJECT_BOOKMARK_COUNT_DELTA_KEY
+from project.models import Project
+from project.tasks import flush_project_bookmark_counts
+
+
+class FlushProjectBookmarkCountsTaskTest(TestCase):
+    def setUp(self):
+        self.redis = get_redis_connection('default')
+        self.redis.delete(PROJECT_BOOKMARK_COUNT_DELTA_KEY)
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project = Project.objects.create(title='Project', created_member_id=self.member.id)
+
+    def test_flush_project_bookmark_counts(self):
+        # Given: 버퍼에 쌓인 증감
+        self.redis.hincrby(PROJECT_BOOKMARK_COUNT_DELTA_KEY, self.project.id, 2)
+
+        # When: flush_project_bookmark_counts
+        flushed_count = flush_project_bookmark_counts()
+
+        # Then: 프로젝트 북마크 수에 반영됩니다.
+        self.assertEqual(flushed_count, 1)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.bookmark_count, 2)
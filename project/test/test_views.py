@@ -1,4 +1,3 @@
-from collections import defaultdict
 from datetime import datetime
 from unittest.mock import (
     MagicMock,
@@ -11,26 +10,40 @@ from common.common_consts.common_error_messages import (
 )
 from common.common_exceptions import CommonAPIException
 from common.common_testcase_helpers.job.testcase_helpers import create_job_for_testcase
+from common.common_testcase_helpers.project.testcase_helpers import get_project_card_fragment_for_testcase
 from common.common_utils import format_utc
+from common.common_utils.encode_utils import data_to_urlsafe_base64
 from common.common_utils.error_utils import generate_pydantic_error_detail
+from django.test import override_settings
 from django.urls import reverse
+from django_redis import get_redis_connection
 from freezegun import freeze_time
 from job.dtos.model_dtos import (
     ProjectJobAvailabilities,
     ProjectJobRecruitInfo,
     RecruitResult,
 )
+from member.consts import MEMBER_INFO_BLOCK_KEY_PREFIX
 from member.dtos.model_dtos import MemberInfoBlock
 from member.exceptions import LoginRequiredException
 from member.models import Member
 from project.consts import (
+    HOME_PROJECT_LIST_CACHE_KEY_PREFIX,
+    PROJECT_CARD_FRAGMENT_KEY_PREFIX,
+    PROJECT_LIST_VERSION_KEY,
     ProjectCurrentRecruitStatus,
     ProjectDetailStatus,
     ProjectJobExperienceType,
     ProjectJobSearchOperator,
+    ProjectListSortType,
+    ProjectManagementPermissionBehavior,
+    ProjectRecruitApplicationStatus,
     ProjectRecruitmentStatus,
 )
-from project.dtos.model_dtos import ProjectOngoingInfo
+from project.dtos.model_dtos import (
+    MemberProjectRelations,
+    ProjectOngoingInfo,
+)
 from project.dtos.request_dtos import (
     CreateProjectJob,
     CreateProjectRequest,
@@ -40,11 +53,17 @@ from project.models import (
     Project,
     ProjectBookmark,
     ProjectCategory,
+    ProjectMemberManagement,
     ProjectRecruitApplication,
     ProjectRecruitment,
     ProjectRecruitmentJob,
 )
-from project.views import GetMyProjectBookmarkAPIView
+from project.services.project_filter_index_services import project_filter_index
+from project.services.project_search_services import refresh_project_search_documents
+from project.services.project_services import (
+    create_project_management_permissions,
+    create_project_recruitment_and_update_project,
+)
 from pydantic import ValidationError
 from rest_framework import status
 from rest_framework.test import (
@@ -85,49 +104,59 @@ class HomeProjectListAPIViewTests(APITestCase):
         )
         self.project3_recruitment.created_at = datetime(2021, 1, 1, 10, 0, 0)
         self.project3_recruitment.save()
+        self.project3.latest_recruited_at = ProjectRecruitment.objects.get(id=self.project3_recruitment.id).created_at
+        self.project3.save()
         self.job1 = create_job_for_testcase('job1')
 
-    @patch('project.views.get_current_active_project_job_recruitments')
+    @patch('project.views.ProjectCardAssembler.get_member_project_relations')
+    @patch('project.services.project_card_services.get_project_card_fragments')
     @patch('project.views.get_objects_with_cursor_pagination')
-    @patch('project.views.get_member_bookmarked_project_ids')
     @patch('project.views.get_filtered_project_qs')
     def test_get_projects_with_bookmarked_project(self,
                                                   mock_get_filtered_project_qs,
-                                                  mock_get_member_bookmarked_project_ids,
                                                   mock_get_objects_with_cursor_pagination,
-                                                  mock_get_current_active_project_job_recruitments):
+                                                  mock_get_project_card_fragments,
+                                                  mock_get_member_project_relations):
         # Given: Setup return values for mocked filtered project qs
-        mock_get_filtered_project_qs.return_value = [self.project3, self.project2]
+        mock_get_filtered_project_qs.return_value = Project.objects.filter(id__in=[self.project3.id, self.project2.id])
         # And: Setup return values for mocked services
         mock_get_objects_with_cursor_pagination.return_value = (
             [self.project3, self.project2],
             True,
             'next_cursor_encoded'
         )
-        mock_get_current_active_project_job_recruitments.return_value = {
-            self.project3.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=2,
-                    recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
-                )
-            ],
-            self.project2.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=5,
-                    recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
-                )
-            ],
+        mock_get_project_card_fragments.return_value = {
+            self.project3.id: get_project_card_fragment_for_testcase(
+                self.project3,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=2,
+                        recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
+                    )
+                ],
+            ),
+            self.project2.id: get_project_card_fragment_for_testcase(
+                self.project2,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=5,
+                        recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+                    )
+                ],
+            ),
         }
         # And: project3 is bookmarked
-        mock_get_member_bookmarked_project_ids.return_value = {self.project3.id}
+        mock_get_member_project_relations.return_value = MemberProjectRelations(
+            bookmarked_project_ids={self.project3.id},
+        )
 
         # When: Make GET request with size 2
         response = self.client.get(self.url, {'size': 2})
@@ -197,47 +226,55 @@ class HomeProjectListAPIViewTests(APITestCase):
             }
         )
 
-    @patch('project.views.get_current_active_project_job_recruitments')
+    @patch('project.views.ProjectCardAssembler.get_member_project_relations')
+    @patch('project.services.project_card_services.get_project_card_fragments')
     @patch('project.views.get_objects_with_cursor_pagination')
-    @patch('project.views.get_member_bookmarked_project_ids')
     @patch('project.views.get_filtered_project_qs')
     def test_get_projects_when_job_total_limit_is_null(self,
                                                        mock_get_filtered_project_qs,
-                                                       mock_get_member_bookmarked_project_ids,
                                                        mock_get_objects_with_cursor_pagination,
-                                                       mock_get_current_active_project_job_recruitments):
+                                                       mock_get_project_card_fragments,
+                                                       mock_get_member_project_relations):
         # Given: Setup return values for mocked filtered project qs
-        mock_get_filtered_project_qs.return_value = [self.project3, self.project2]
+        mock_get_filtered_project_qs.return_value = Project.objects.filter(id__in=[self.project3.id, self.project2.id])
         # And: Setup return values for mocked services
         mock_get_objects_with_cursor_pagination.return_value = (
             [self.project3, self.project2],
             True,
             'next_cursor_encoded'
         )
-        mock_get_current_active_project_job_recruitments.return_value = {
-            self.project3.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=None,
-                    current_recruited=2,
-                    recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
-                )
-            ],
-            self.project2.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=None,
-                    current_recruited=5,
-                    recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
-                )
-            ],
+        mock_get_project_card_fragments.return_value = {
+            self.project3.id: get_project_card_fragment_for_testcase(
+                self.project3,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=None,
+                        current_recruited=2,
+                        recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
+                    )
+                ],
+            ),
+            self.project2.id: get_project_card_fragment_for_testcase(
+                self.project2,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=None,
+                        current_recruited=5,
+                        recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+                    )
+                ],
+            ),
         }
         # And: project3 is bookmarked
-        mock_get_member_bookmarked_project_ids.return_value = {self.project3.id}
+        mock_get_member_project_relations.return_value = MemberProjectRelations(
+            bookmarked_project_ids={self.project3.id},
+        )
 
         # When: Make GET request with size 2
         response = self.client.get(self.url, {'size': 2})
@@ -330,6 +367,205 @@ class HomeProjectListAPIViewTests(APITestCase):
             }
         )
 
+    def test_get_projects_with_relevance_sort_should_rank_by_search_score(self):
+        # Given: project1 title and project2 description contains keyword
+        self.project1.title = 'django study'
+        self.project1.save()
+        self.project2.description = 'django backend'
+        self.project2.save()
+        refresh_project_search_documents([self.project1.id, self.project2.id, self.project3.id])
+
+        # When: Make GET request with relevance sort and size 1
+        response = self.client.get(self.url, {'title': 'django', 'sort': ProjectListSortType.RELEVANCE.value, 'size': 1})
+
+        # Then: title matched project1 is first
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([project['id'] for project in response.json()['data']], [self.project1.id])
+        self.assertTrue(response.json()['has_more'])
+
+        # When: Make GET request with next_cursor
+        response = self.client.get(
+            self.url,
+            {
+                'title': 'django',
+                'sort': ProjectListSortType.RELEVANCE.value,
+                'size': 1,
+                'next_cursor': response.json()['next_cursor'],
+            }
+        )
+
+        # Then: project2 is next and no more projects
+        self.assertEqual([project['id'] for project in response.json()['data']], [self.project2.id])
+        self.assertFalse(response.json()['has_more'])
+
+    def test_get_projects_with_relevance_sort_should_fail_with_latest_cursor(self):
+        # Given: latest sort cursor
+        next_cursor = data_to_urlsafe_base64({'rearrangement_time__lt': '2021-01-01T00:00:00+09:00', 'id__lt': 1})
+
+        # When: Make GET request with relevance sort
+        response = self.client.get(
+            self.url,
+            {'title': 'django', 'sort': ProjectListSortType.RELEVANCE.value, 'next_cursor': next_cursor}
+        )
+
+        # Then: Error 500 Invalid next_cursor
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @override_settings(PROJECT_FILTER_INDEX_ENABLED=True)
+    @patch('project.views.get_objects_with_cursor_pagination')
+    def test_get_projects_should_use_filter_index(self, mock_get_objects_with_cursor_pagination):
+        # Given: empty filter index
+        project_filter_index.reset()
+
+        # When: Make GET request with category filter
+        response = self.client.get(self.url, {'category_ids': str(self.category.id), 'size': 2})
+
+        # Then: projects are resolved from filter index
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([project['id'] for project in response.json()['data']], [self.project3.id])
+        self.assertFalse(response.json()['has_more'])
+        mock_get_objects_with_cursor_pagination.assert_not_called()
+        project_filter_index.reset()
+
+    def test_get_projects_should_hydrate_cards(self):
+        # Given: 사용자가 로그인 상태인 경우
+        self.client.force_login(self.member1)
+        # And: project3 is bookmarked
+        ProjectBookmark.objects.create(member=self.member1, project=self.project3)
+        # And: project1 is recruiting job1
+        project1_recruitment = create_project_recruitment_and_update_project(self.project1, self.member2.id)
+        ProjectRecruitmentJob.objects.create(
+            project_recruitment=project1_recruitment,
+            job=self.job1,
+            total_limit=3,
+            created_member_id=self.member2.id,
+        )
+
+        # When: Make GET request
+        # Then: session, member, page, card and member relation queries only
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url, {'size': 3})
+
+        # And: cards are hydrated
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data_by_project_id = {project['id']: project for project in response.json()['data']}
+        self.assertTrue(data_by_project_id[self.project3.id]['is_bookmarked'])
+        self.assertEqual(data_by_project_id[self.project3.id]['recent_recruited_at'], '2021-01-01T01:00:00Z')
+        self.assertFalse(data_by_project_id[self.project1.id]['is_bookmarked'])
+        self.assertEqual(
+            data_by_project_id[self.project1.id]['jobs'],
+            [{'id': self.job1.id, 'display_name': self.job1.display_name, 'is_available': True}],
+        )
+        self.assertEqual(
+            data_by_project_id[self.project1.id]['recent_recruited_at'],
+            format_utc(project1_recruitment.created_at),
+        )
+        self.assertEqual(data_by_project_id[self.project2.id]['jobs'], [])
+
+    @override_settings(PROJECT_CARD_FRAGMENT_CACHE_ENABLED=True)
+    def test_get_projects_should_use_project_card_cache(self):
+        # Given: anonymous request caches project cards
+        get_redis_connection('default').delete(
+            *[f'{PROJECT_CARD_FRAGMENT_KEY_PREFIX}:{project.id}' for project in [self.project1, self.project2, self.project3]]
+        )
+        response = self.client.get(self.url, {'size': 3})
+
+        # When: Make GET request again
+        # Then: only page query
+        with self.assertNumQueries(1):
+            cached_response = self.client.get(self.url, {'size': 3})
+
+        # And: same response
+        self.assertEqual(cached_response.json(), response.json())
+
+    @override_settings(PROJECT_LIST_CACHE_ENABLED=True)
+    def test_get_projects_should_use_cached_response_with_member_bookmarks(self):
+        # Given: empty home list cache
+        redis = get_redis_connection('default')
+        redis.delete(PROJECT_LIST_VERSION_KEY, *redis.keys(f'{HOME_PROJECT_LIST_CACHE_KEY_PREFIX}:*'))
+        # And: anonymous request caches the page
+        anonymous_response = self.client.get(self.url, {'size': 3})
+        # And: member1 bookmarked project3
+        ProjectBookmark.objects.create(member=self.member1, project=self.project3)
+        self.client.force_login(self.member1)
+
+        # When: Make GET request
+        # Then: session, member and bookmark queries only
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {'size': 3})
+
+        # And: cached page with member bookmarks
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data'][0]['id'], self.project3.id)
+        self.assertTrue(response.json()['data'][0]['is_bookmarked'])
+        self.assertEqual(
+            [{**project, 'is_bookmarked': False} for project in response.json()['data']],
+            anonymous_response.json()['data'],
+        )
+        redis.delete(*redis.keys(f'{HOME_PROJECT_LIST_CACHE_KEY_PREFIX}:*'))
+
+
+class HomeProjectFacetCountAPIViewTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('project:home_facets')
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.category = ProjectCategory.objects.create(
+            display_name='카테고리 테스트',
+            name='category_test',
+        )
+        self.project1 = Project.objects.create(
+            title='Project 1',
+            category=self.category,
+            current_recruit_status=ProjectCurrentRecruitStatus.RECRUITING.value,
+            job_experience_type=ProjectJobExperienceType.ALL.value,
+            created_member_id=self.member.id,
+        )
+        self.project2 = Project.objects.create(
+            title='Project 2',
+            current_recruit_status=ProjectCurrentRecruitStatus.RECRUITED.value,
+            job_experience_type=ProjectJobExperienceType.ALL.value,
+            created_member_id=self.member.id,
+        )
+
+    def test_get_facet_counts(self):
+        # When: Make GET request with recruit status filter
+        response = self.client.get(
+            self.url,
+            {'current_recruit_status': ProjectCurrentRecruitStatus.RECRUITING.value},
+        )
+
+        # Then: counts are filtered except for own facet
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                'total_count': 1,
+                'categories': [{'id': self.category.id, 'count': 1}],
+                'jobs': [],
+                'job_categories': [],
+                'experiences': [
+                    {'value': ProjectJobExperienceType.ALL.value, 'count': 1},
+                    {'value': ProjectJobExperienceType.ONLY_EXPERIENCE.value, 'count': 0},
+                ],
+                'current_recruit_statuses': [
+                    {'value': ProjectCurrentRecruitStatus.RECRUITING.value, 'count': 1},
+                    {'value': ProjectCurrentRecruitStatus.RECRUITED.value, 'count': 1},
+                ],
+            }
+        )
+
+    def test_get_facet_counts_should_raise_error_when_request_param_is_invalid(self):
+        # When: Make GET request with invalid category_ids
+        response = self.client.get(self.url, {'category_ids': 'a'})
+
+        # Then: Error 400
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()['error_code'],
+            InvalidInputResponseErrorStatus.INVALID_INPUT_HOME_LIST_PARAM_ERROR_400.value,
+        )
+
 
 class CreateProjectAPIViewTests(APITestCase):
     def setUp(self):
@@ -595,6 +831,7 @@ class ProjectDetailAPIViewTests(APITestCase):
                 created_member_id=self.member.id,
             )
         self.project1.latest_project_recruitment = project_recruitment
+        self.project1.latest_recruited_at = project_recruitment.created_at
         self.project1.save()
         # And: Mock get_current_active_project_job_recruitments
         mock_get_current_active_project_job_recruitments.return_value = {
@@ -726,6 +963,55 @@ class ProjectDetailAPIViewTests(APITestCase):
             }
         )
 
+    @override_settings(MEMBER_INFO_BLOCK_CACHE_ENABLED=True)
+    def test_get_should_return_not_modified_when_etag_matched(self):
+        # Given: leader info block is not cached
+        get_redis_connection('default').delete(f'{MEMBER_INFO_BLOCK_KEY_PREFIX}:{self.member.id}')
+        # And: first response
+        response = self.client.get(self._get_url(self.project1.id))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        # When: Get request with If-None-Match
+        with patch('project.views.get_member_info_block') as mock_get_member_info_block, \
+                patch('project.views.get_current_active_project_job_recruitments') as mock_get_current_active_project_job_recruitments:
+            response = self.client.get(self._get_url(self.project1.id), HTTP_IF_NONE_MATCH=etag)
+
+        # Then: Not modified
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        # And: member info block and job availability are not loaded
+        mock_get_member_info_block.assert_not_called()
+        mock_get_current_active_project_job_recruitments.assert_not_called()
+
+    @override_settings(MEMBER_INFO_BLOCK_CACHE_ENABLED=True)
+    def test_get_should_return_ok_when_bookmark_changed(self):
+        # Given: first response of login member
+        get_redis_connection('default').delete(f'{MEMBER_INFO_BLOCK_KEY_PREFIX}:{self.member.id}')
+        self.client.force_login(self.member)
+        etag = self.client.get(self._get_url(self.project1.id))['ETag']
+        # And: member bookmarked project
+        ProjectBookmark.objects.create(member=self.member, project=self.project1)
+
+        # When: Get request with If-None-Match
+        response = self.client.get(self._get_url(self.project1.id), HTTP_IF_NONE_MATCH=etag)
+
+        # Then: new response
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()['is_bookmarked'])
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_get_should_return_ok_when_leader_info_block_not_cached(self):
+        # Given: member info block cache is disabled
+        etag = self.client.get(self._get_url(self.project1.id))['ETag']
+
+        # When: Get request with If-None-Match
+        response = self.client.get(self._get_url(self.project1.id), HTTP_IF_NONE_MATCH=etag)
+
+        # Then: response is made again
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], etag)
+
 
 class ProjectRecruitEligibleAPIViewTests(APITestCase):
     def setUp(self):
@@ -920,6 +1206,53 @@ class ProjectRecruitEligibleAPIViewTests(APITestCase):
             }
         )
 
+    def test_get_project_recruit_eligible_should_return_not_modified_when_etag_matched(self):
+        # Given: Login
+        self.client.force_login(self.member)
+        # And: first response
+        etag = self.client.get(
+            reverse('project:project_recruit_eligible', kwargs={'project_id': self.project.id}),
+        )['ETag']
+
+        # When: Get request with If-None-Match
+        with patch('project.views.get_current_active_project_job_recruitments') as mock_get_current_active_project_job_recruitments:
+            response = self.client.get(
+                reverse('project:project_recruit_eligible', kwargs={'project_id': self.project.id}),
+                HTTP_IF_NONE_MATCH=etag,
+            )
+
+        # Then: Not modified without job availability query
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_get_current_active_project_job_recruitments.assert_not_called()
+
+    def test_get_project_recruit_eligible_should_return_ok_when_recruitment_job_changed(self):
+        # Given: Login
+        self.client.force_login(self.member)
+        # And: recruitment job
+        project_recruitment_job = ProjectRecruitmentJob.objects.create(
+            project_recruitment=self.project_recruitment,
+            job=self.job1,
+            total_limit=1,
+            created_member_id=self.member.id,
+        )
+        # And: first response
+        etag = self.client.get(
+            reverse('project:project_recruit_eligible', kwargs={'project_id': self.project.id}),
+        )['ETag']
+        # And: recruitment job is full
+        project_recruitment_job.current_recruited = 1
+        project_recruitment_job.save()
+
+        # When: Get request with If-None-Match
+        response = self.client.get(
+            reverse('project:project_recruit_eligible', kwargs={'project_id': self.project.id}),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        # Then: new response
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.json()['is_available'])
+
 
 class ProjectJobRecruitApplyAPIViewTests(APITestCase):
     def setUp(self):
@@ -1225,6 +1558,221 @@ class ProjectActiveRecruitSelfApplicationAPIViewTests(APITestCase):
         mock_project_recruit_service.return_value.get_latest_member_recruit_application.assert_called_once()
 
 
+class ProjectRecruitApplicationListAPIViewTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.leader = Member.objects.create_user(username='leader', nickname='leader')
+        self.applicant1 = Member.objects.create_user(username='applicant1', nickname='applicant1')
+        self.applicant2 = Member.objects.create_user(username='applicant2', nickname='applicant2')
+        self.job = create_job_for_testcase('job')
+        self.project = Project.objects.create(title='Project', created_member_id=self.leader.id)
+        create_project_management_permissions(
+            self.project,
+            self.leader.id,
+            [ProjectManagementPermissionBehavior.PROJECT_RECRUIT],
+        )
+        self.project_recruitment_job = ProjectRecruitmentJob.objects.create(
+            project_recruitment=create_project_recruitment_and_update_project(self.project, self.leader.id),
+            job=self.job,
+            total_limit=2,
+            created_member_id=self.leader.id,
+        )
+        self.recruit_application1 = ProjectRecruitApplication.objects.create(
+            project_recruitment_job=self.project_recruitment_job,
+            project_recruitment_id=self.project_recruitment_job.project_recruitment_id,
+            member=self.applicant1,
+            request_message='message 1',
+        )
+        self.recruit_application2 = ProjectRecruitApplication.objects.create(
+            project_recruitment_job=self.project_recruitment_job,
+            project_recruitment_id=self.project_recruitment_job.project_recruitment_id,
+            member=self.applicant2,
+            request_message='message 2',
+        )
+        self.url = reverse('project:project_recruit_applications', kwargs={'project_id': self.project.id})
+
+    def test_get_recruit_applications_with_cursor(self):
+        # Given: leader login
+        self.client.force_login(self.leader)
+
+        # When: 한 건씩 두 페이지를 조회합니다.
+        first_response = self.client.get(self.url, {'size': 1})
+        second_response = self.client.get(self.url, {'size': 1, 'next_cursor': first_response.json()['next_cursor']})
+
+        # Then: 최근 신청부터 조회됩니다.
+        self.assertEqual(first_response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            first_response.json(),
+            {
+                'data': [
+                    {
+                        'id': self.recruit_application2.id,
+                        'job_id': self.job.id,
+                        'member_id': self.applicant2.id,
+                        'nickname': 'applicant2',
+                        'profile_image': None,
+                        'request_message': 'message 2',
+                        'request_status': ProjectRecruitApplicationStatus.IN_REVIEW.value,
+                        'created_at': format_utc(self.recruit_application2.created_at),
+                    },
+                ],
+                'next_cursor': data_to_urlsafe_base64({'id__lt': self.recruit_application2.id}),
+                'has_more': True,
+            },
+        )
+        # And: 다음 페이지
+        self.assertEqual(
+            [recruit_application['id'] for recruit_application in second_response.json()['data']],
+            [self.recruit_application1.id],
+        )
+        self.assertFalse(second_response.json()['has_more'])
+
+    def test_get_recruit_applications_should_raise_error_when_invalid_request_status(self):
+        # Given: leader login
+        self.client.force_login(self.leader)
+
+        # When: 잘못된 신청 상태로 조회합니다.
+        response = self.client.get(self.url, {'request_status': 'INVALID'})
+
+        # Then: Error 400
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()['error_code'],
+            InvalidInputResponseErrorStatus.INVALID_RECRUIT_APPLICATION_LIST_PARAM_ERROR_400.value,
+        )
+
+    def test_get_recruit_applications_should_raise_error_when_not_leader(self):
+        # Given: applicant login
+        self.client.force_login(self.applicant1)
+
+        # When: 신청함을 조회합니다.
+        response = self.client.get(self.url)
+
+        # Then: Error 403
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.json()['error_code'], 'project-recruit-application-permission-denied-error')
+
+    def test_get_recruit_applications_raise_error_need_login(self):
+        # Given: Not login
+        # When: GET 요청을 보냅니다.
+        response = self.client.get(self.url)
+
+        # Then: Error 401
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProjectRecruitApplicationDecisionAPIViewTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.leader = Member.objects.create_user(username='leader', nickname='leader')
+        self.applicant1 = Member.objects.create_user(username='applicant1', nickname='applicant1')
+        self.applicant2 = Member.objects.create_user(username='applicant2', nickname='applicant2')
+        self.job = create_job_for_testcase('job')
+        self.project = Project.objects.create(title='Project', created_member_id=self.leader.id)
+        create_project_management_permissions(
+            self.project,
+            self.leader.id,
+            [ProjectManagementPermissionBehavior.PROJECT_RECRUIT],
+        )
+        self.project_recruitment_job = ProjectRecruitmentJob.objects.create(
+            project_recruitment=create_project_recruitment_and_update_project(self.project, self.leader.id),
+            job=self.job,
+            total_limit=2,
+            created_member_id=self.leader.id,
+        )
+        self.recruit_application1 = ProjectRecruitApplication.objects.create(
+            project_recruitment_job=self.project_recruitment_job,
+            member=self.applicant1,
+            request_message='message 1',
+        )
+        self.recruit_application2 = ProjectRecruitApplication.objects.create(
+            project_recruitment_job=self.project_recruitment_job,
+            member=self.applicant2,
+            request_message='message 2',
+        )
+        self.url = reverse('project:project_recruit_applications_decision', kwargs={'project_id': self.project.id})
+
+    def test_post_decide_recruit_applications(self):
+        # Given: leader login
+        self.client.force_login(self.leader)
+
+        # When: application1 승인, application2 거절
+        response = self.client.post(
+            self.url,
+            {
+                'decisions': [
+                    {'application_id': self.recruit_application1.id, 'request_status': 'ACCEPTED'},
+                    {'application_id': self.recruit_application2.id, 'request_status': 'REJECTED'},
+                ],
+            },
+            format='json',
+        )
+
+        # Then: 처리 결과
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.json(),
+            {
+                'message': '모집 신청이 처리되었습니다.',
+                'accepted_application_ids': [self.recruit_application1.id],
+                'rejected_application_ids': [self.recruit_application2.id],
+            },
+        )
+        # And: 팀원 생성 및 모집 인원 증가
+        self.assertTrue(
+            ProjectMemberManagement.objects.filter(
+                project=self.project,
+                member=self.applicant1,
+                project_recruit_application=self.recruit_application1,
+            ).exists()
+        )
+        self.project_recruitment_job.refresh_from_db()
+        self.assertEqual(self.project_recruitment_job.current_recruited, 1)
+
+    def test_post_decide_recruit_applications_should_raise_error_when_invalid_request_status(self):
+        # Given: leader login
+        self.client.force_login(self.leader)
+
+        # When: 승인/거절이 아닌 상태로 요청합니다.
+        response = self.client.post(
+            self.url,
+            {
+                'decisions': [
+                    {'application_id': self.recruit_application1.id, 'request_status': 'CANCELED'},
+                ],
+            },
+            format='json',
+        )
+
+        # Then: Error 400
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()['error_code'],
+            InvalidInputResponseErrorStatus.INVALID_RECRUIT_APPLICATION_DECISION_INPUT_ERROR_400.value,
+        )
+
+    def test_post_decide_recruit_applications_should_raise_error_when_not_leader(self):
+        # Given: applicant login
+        self.client.force_login(self.applicant1)
+
+        # When: 자신의 신청을 승인합니다.
+        response = self.client.post(
+            self.url,
+            {
+                'decisions': [
+                    {'application_id': self.recruit_application1.id, 'request_status': 'ACCEPTED'},
+                ],
+            },
+            format='json',
+        )
+
+        # Then: Error 403
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        # And: 신청은 검토중
+        self.recruit_application1.refresh_from_db()
+        self.assertEqual(self.recruit_application1.request_status, ProjectRecruitApplicationStatus.IN_REVIEW.value)
+
+
 class ProjectBookmarkAPIViewTests(APITestCase):
     def setUp(self):
         # Given: 테스트에 필요한 사용자 및 프로젝트 데이터 생성
@@ -1312,6 +1860,71 @@ class ProjectBookmarkAPIViewTests(APITestCase):
         mock_delete_bookmark.assert_called_once_with(self.project_id)
 
 
+class ProjectBookmarkSyncAPIViewTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('project:my_project_bookmark_sync')
+        self.member = Member.objects.create_user(username='test', nickname='test')
+        self.project1 = Project.objects.create(title='Project 1', created_member_id=self.member.id)
+        self.project2 = Project.objects.create(title='Project 2', created_member_id=self.member.id)
+
+    def test_post_sync_bookmarks(self):
+        # Given: login
+        self.client.force_login(self.member)
+        # And: project1 북마크
+        ProjectBookmark.objects.create(member=self.member, project=self.project1)
+
+        # When: project1 해제, project2 북마크 후 다시 해제, 다시 북마크를 동기화합니다.
+        response = self.client.post(
+            self.url,
+            {
+                'bookmarks': [
+                    {'project_id': self.project1.id, 'is_bookmarked': False},
+                    {'project_id': self.project2.id, 'is_bookmarked': True},
+                    {'project_id': self.project2.id, 'is_bookmarked': False},
+                    {'project_id': self.project2.id, 'is_bookmarked': True},
+                ],
+            },
+            format='json',
+        )
+
+        # Then: 마지막 토글이 반영됩니다.
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.json(),
+            {
+                'message': '북마크가 동기화되었습니다.',
+                'bookmarked_project_ids': [self.project2.id],
+            },
+        )
+        self.assertEqual(
+            list(ProjectBookmark.objects.filter(member=self.member, is_deleted=False).values_list('project_id', flat=True)),
+            [self.project2.id],
+        )
+
+    def test_post_sync_bookmarks_should_raise_error_when_empty(self):
+        # Given: login
+        self.client.force_login(self.member)
+
+        # When: 빈 토글 리스트로 요청합니다.
+        response = self.client.post(self.url, {'bookmarks': []}, format='json')
+
+        # Then: Error 400
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()['error_code'],
+            InvalidInputResponseErrorStatus.INVALID_BOOKMARK_SYNC_INPUT_ERROR_400.value,
+        )
+
+    def test_post_sync_bookmarks_raise_error_need_login(self):
+        # Given: Not login
+        # When: POST 요청을 보냅니다.
+        response = self.client.post(self.url, {'bookmarks': []}, format='json')
+
+        # Then: Error 401
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class GetMyProjectBookmarkAPIViewTests(APITestCase):
     def setUp(self):
         self.client = APIClient()
@@ -1332,95 +1945,67 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
         )
         self.job1 = create_job_for_testcase('job1')
 
-    def test_extract_project_from_bookmark_qs(self):
-        # Given: Set Bookmark data
-        project_1_bookmark = ProjectBookmark.objects.create(
-            member=self.member1,
-            project=self.project1,
-            is_deleted=False
-        )
-        project_2_bookmark = ProjectBookmark.objects.create(
-            member=self.member1,
-            project=self.project2,
-            is_deleted=False
-        )
-
-        # When: Call _extract_project_from_bookmark_qs
-        projects = GetMyProjectBookmarkAPIView._extract_project_from_bookmark_qs(ProjectBookmark.objects.all())
-
-        # Then: Get projects extracted from bookmark queryset
-        self.assertEqual(
-            {project.id for project in projects},
-            {project_1_bookmark.project.id, project_2_bookmark.project.id}
-        )
-
-    @patch('project.views.get_project_recent_recruited_at')
-    @patch('project.views.get_current_active_project_job_recruitments')
-    @patch('project.views.GetMyProjectBookmarkAPIView._extract_project_from_bookmark_qs')
+    @patch('project.views.ProjectCardAssembler.get_member_project_relations')
+    @patch('project.services.project_card_services.get_project_card_fragments')
     @patch('project.views.BookmarkService.get_my_active_bookmarks')
     def test_get_projects_with_bookmarked_project_when_success(self,
                                                                mock_get_my_active_bookmarks,
-                                                               mock_extract_project_from_bookmark_qs,
-                                                               mock_get_current_active_project_job_recruitments,
-                                                               mock_get_project_recent_recruited_at):
+                                                               mock_get_project_card_fragments,
+                                                               mock_get_member_project_relations):
         # Given: 사용자가 로그인 상태인 경우
         self.client.force_login(self.member1)
-        # And: Set Bookmark data
+        # And: Set Bookmark data (최근에 북마크한 프로젝트가 먼저 조회됩니다.)
         ProjectBookmark.objects.create(
             member=self.member1,
-            project=self.project1,
+            project=self.project2,
             is_deleted=False
         )
         ProjectBookmark.objects.create(
             member=self.member1,
-            project=self.project2,
+            project=self.project1,
             is_deleted=False
         )
         # And: Mock func
         mock_get_my_active_bookmarks.return_value = ProjectBookmark.objects.all()
-        mock_extract_project_from_bookmark_qs.return_value = [self.project1, self.project2]
-        mock_get_current_active_project_job_recruitments.return_value = {
-            self.project1.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=2,
-                    recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
-                )
-            ],
-            self.project2.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=5,
-                    recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
-                )
-            ],
-        }
-        mock_get_project_recent_recruited_at.return_value = {
-            self.project1.id: format_utc(self.project1.created_at),
-            self.project2.id: format_utc(self.project2.created_at),
+        self.project1.latest_recruited_at = self.project1.created_at
+        self.project2.latest_recruited_at = self.project2.created_at
+        mock_get_project_card_fragments.return_value = {
+            self.project1.id: get_project_card_fragment_for_testcase(
+                self.project1,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=2,
+                        recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
+                    )
+                ],
+            ),
+            self.project2.id: get_project_card_fragment_for_testcase(
+                self.project2,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=5,
+                        recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+                    )
+                ],
+            ),
         }
+        mock_get_member_project_relations.return_value = MemberProjectRelations()
 
         # When: Get request
         response = self.client.get(self.url)
 
         # Then: Called get_my_active_bookmarks
         mock_get_my_active_bookmarks.assert_called_once_with()
-        # And: Called _extract_project_from_bookmark_qs
-        mock_extract_project_from_bookmark_qs.assert_called()
-        # And: Called get_current_active_project_job_recruitments
-        mock_get_current_active_project_job_recruitments.assert_called_once_with(
-            [self.project1.id, self.project2.id]
-        )
-        # And: Called get_project_recent_recruited_at
-        mock_get_project_recent_recruited_at.assert_called_once_with(
-            [self.project1.id, self.project2.id]
-        )
+        # And: Called get_project_card_fragments with bookmarked project ids
+        mock_get_project_card_fragments.assert_called_once_with([self.project1.id, self.project2.id])
         # And: Get projects with bookmarked project
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertDictEqual(
@@ -1447,7 +2032,7 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
                         'is_leader': False,
                         'is_member_manageable': False,
                         'is_participated': False,
-                        'recent_recruited_at': mock_get_project_recent_recruited_at.return_value[self.project1.id]
+                        'recent_recruited_at': format_utc(self.project1.created_at)
                     },
                     {
                         'id': self.project2.id,
@@ -1469,7 +2054,7 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
                         'is_leader': False,
                         'is_member_manageable': False,
                         'is_participated': False,
-                        'recent_recruited_at': mock_get_project_recent_recruited_at.return_value[self.project2.id]
+                        'recent_recruited_at': format_utc(self.project2.created_at)
                     }
                 ],
                 'next_cursor': None,
@@ -1477,80 +2062,70 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
             }
         )
 
-    @patch('project.views.get_projects_leader_ids')
-    @patch('project.views.get_project_recent_recruited_at')
-    @patch('project.views.get_current_active_project_job_recruitments')
-    @patch('project.views.GetMyProjectBookmarkAPIView._extract_project_from_bookmark_qs')
+    @patch('project.views.ProjectCardAssembler.get_member_project_relations')
+    @patch('project.services.project_card_services.get_project_card_fragments')
     @patch('project.views.BookmarkService.get_my_active_bookmarks')
     def test_get_projects_with_bookmarked_project_should_success_when_leader_is_true(self,
                                                                                      mock_get_my_active_bookmarks,
-                                                                                     mock_extract_project_from_bookmark_qs,
-                                                                                     mock_get_current_active_project_job_recruitments,
-                                                                                     mock_get_project_recent_recruited_at,
-                                                                                     mock_get_projects_leader_ids):
+                                                                                     mock_get_project_card_fragments,
+                                                                                     mock_get_member_project_relations):
         # Given: 사용자가 로그인 상태인 경우
         self.client.force_login(self.member1)
-        # And: Set Bookmark data
+        # And: Set Bookmark data (최근에 북마크한 프로젝트가 먼저 조회됩니다.)
         ProjectBookmark.objects.create(
             member=self.member1,
-            project=self.project1,
+            project=self.project2,
             is_deleted=False
         )
         ProjectBookmark.objects.create(
             member=self.member1,
-            project=self.project2,
+            project=self.project1,
             is_deleted=False
         )
         # And: Mock func
         mock_get_my_active_bookmarks.return_value = ProjectBookmark.objects.all()
-        mock_extract_project_from_bookmark_qs.return_value = [self.project1, self.project2]
-        mock_get_current_active_project_job_recruitments.return_value = {
-            self.project1.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=2,
-                    recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
-                )
-            ],
-            self.project2.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=5,
-                    recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
-                )
-            ],
-        }
-        mock_get_project_recent_recruited_at.return_value = {
-            self.project1.id: format_utc(self.project1.created_at),
-            self.project2.id: format_utc(self.project2.created_at),
+        self.project1.latest_recruited_at = self.project1.created_at
+        self.project2.latest_recruited_at = self.project2.created_at
+        mock_get_project_card_fragments.return_value = {
+            self.project1.id: get_project_card_fragment_for_testcase(
+                self.project1,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=2,
+                        recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
+                    )
+                ],
+            ),
+            self.project2.id: get_project_card_fragment_for_testcase(
+                self.project2,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=5,
+                        recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+                    )
+                ],
+            ),
         }
-        projects_leader_ids = defaultdict(set)
-        projects_leader_ids[self.project1.id].add(self.member1.id)
-        mock_get_projects_leader_ids.return_value = projects_leader_ids
+        # And: member1 is leader of project1
+        mock_get_member_project_relations.return_value = MemberProjectRelations(
+            led_project_ids={self.project1.id},
+        )
 
         # When: Get request
         response = self.client.get(self.url)
 
         # Then: Called get_my_active_bookmarks
         mock_get_my_active_bookmarks.assert_called_once_with()
-        # And: Called _extract_project_from_bookmark_qs
-        mock_extract_project_from_bookmark_qs.assert_called()
-        # And: Called get_current_active_project_job_recruitments
-        mock_get_current_active_project_job_recruitments.assert_called_once_with(
-            [self.project1.id, self.project2.id]
-        )
-        # And: Called get_project_recent_recruited_at
-        mock_get_project_recent_recruited_at.assert_called_once_with(
-            [self.project1.id, self.project2.id]
-        )
-        # And: Called get_projects_leader_ids
-        mock_get_projects_leader_ids.assert_called_once_with([self.project1.id, self.project2.id])
+        # And: Called get_project_card_fragments with bookmarked project ids
+        mock_get_project_card_fragments.assert_called_once_with([self.project1.id, self.project2.id])
         # And: Get projects with bookmarked project
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertDictEqual(
@@ -1577,7 +2152,7 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
                         'is_leader': True,
                         'is_member_manageable': True,
                         'is_participated': False,
-                        'recent_recruited_at': mock_get_project_recent_recruited_at.return_value[self.project1.id]
+                        'recent_recruited_at': format_utc(self.project1.created_at)
                     },
                     {
                         'id': self.project2.id,
@@ -1599,7 +2174,7 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
                         'is_leader': False,
                         'is_member_manageable': False,
                         'is_participated': False,
-                        'recent_recruited_at': mock_get_project_recent_recruited_at.return_value[self.project2.id]
+                        'recent_recruited_at': format_utc(self.project2.created_at)
                     }
                 ],
                 'next_cursor': None,
@@ -1607,89 +2182,71 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
             }
         )
 
-    @patch('project.views.get_projects_participated_member_ids')
-    @patch('project.views.get_projects_leader_ids')
-    @patch('project.views.get_project_recent_recruited_at')
-    @patch('project.views.get_current_active_project_job_recruitments')
-    @patch('project.views.GetMyProjectBookmarkAPIView._extract_project_from_bookmark_qs')
+    @patch('project.views.ProjectCardAssembler.get_member_project_relations')
+    @patch('project.services.project_card_services.get_project_card_fragments')
     @patch('project.views.BookmarkService.get_my_active_bookmarks')
     def test_get_projects_with_bookmarked_project_should_success_when_is_participated_is_true(self,
                                                                                               mock_get_my_active_bookmarks,
-                                                                                              mock_extract_project_from_bookmark_qs,
-                                                                                              mock_get_current_active_project_job_recruitments,
-                                                                                              mock_get_project_recent_recruited_at,
-                                                                                              mock_get_projects_leader_ids,
-                                                                                              mock_get_projects_participated_member_ids):
+                                                                                              mock_get_project_card_fragments,
+                                                                                              mock_get_member_project_relations):
         # Given: 사용자가 로그인 상태인 경우
         self.client.force_login(self.member1)
-        # And: Set Bookmark data
+        # And: Set Bookmark data (최근에 북마크한 프로젝트가 먼저 조회됩니다.)
         ProjectBookmark.objects.create(
             member=self.member1,
-            project=self.project1,
+            project=self.project2,
             is_deleted=False
         )
         ProjectBookmark.objects.create(
             member=self.member1,
-            project=self.project2,
+            project=self.project1,
             is_deleted=False
         )
         # And: Mock func
         mock_get_my_active_bookmarks.return_value = ProjectBookmark.objects.all()
-        mock_extract_project_from_bookmark_qs.return_value = [self.project1, self.project2]
-        mock_get_current_active_project_job_recruitments.return_value = {
-            self.project1.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=2,
-                    recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
-                )
-            ],
-            self.project2.id: [
-                ProjectJobRecruitInfo(
-                    job_id=self.job1.id,
-                    job_name=self.job1.name,
-                    job_display_name=self.job1.display_name,
-                    total_limit=5,
-                    current_recruited=5,
-                    recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
-                )
-            ],
-        }
-        mock_get_project_recent_recruited_at.return_value = {
-            self.project1.id: format_utc(self.project1.created_at),
-            self.project2.id: format_utc(self.project2.created_at),
+        self.project1.latest_recruited_at = self.project1.created_at
+        self.project2.latest_recruited_at = self.project2.created_at
+        mock_get_project_card_fragments.return_value = {
+            self.project1.id: get_project_card_fragment_for_testcase(
+                self.project1,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=2,
+                        recruit_status=ProjectRecruitmentStatus.RECRUITING.value,
+                    )
+                ],
+            ),
+            self.project2.id: get_project_card_fragment_for_testcase(
+                self.project2,
+                [
+                    ProjectJobRecruitInfo(
+                        job_id=self.job1.id,
+                        job_name=self.job1.name,
+                        job_display_name=self.job1.display_name,
+                        total_limit=5,
+                        current_recruited=5,
+                        recruit_status=ProjectRecruitmentStatus.RECRUIT_FINISH.value,
+                    )
+                ],
+            ),
         }
-        # And: Mock leader project1
-        projects_leader_ids = defaultdict(set)
-        projects_leader_ids[self.project1.id].add(self.member1.id)
-        mock_get_projects_leader_ids.return_value = projects_leader_ids
-        # And: Mock member project1
-        projects_member_ids = defaultdict(set)
-        projects_member_ids[self.project1.id].add(self.member1.id)
-        mock_get_projects_participated_member_ids.return_value = projects_member_ids
+        # And: member1 is leader and member of project1
+        mock_get_member_project_relations.return_value = MemberProjectRelations(
+            led_project_ids={self.project1.id},
+            participated_project_ids={self.project1.id},
+        )
 
         # When: Get request
         response = self.client.get(self.url)
 
         # Then: Called get_my_active_bookmarks
         mock_get_my_active_bookmarks.assert_called_once_with()
-        # And: Called _extract_project_from_bookmark_qs
-        mock_extract_project_from_bookmark_qs.assert_called()
-        # And: Called get_current_active_project_job_recruitments
-        mock_get_current_active_project_job_recruitments.assert_called_once_with(
-            [self.project1.id, self.project2.id]
-        )
-        # And: Called get_project_recent_recruited_at
-        mock_get_project_recent_recruited_at.assert_called_once_with(
-            [self.project1.id, self.project2.id]
-        )
-        # And: Called get_projects_leader_ids
-        mock_get_projects_leader_ids.assert_called_once_with([self.project1.id, self.project2.id])
-        # And: Called mock_get_projects_participated_member_ids
-        mock_get_projects_participated_member_ids.assert_called_once_with([self.project1.id, self.project2.id])
+        # And: Called get_project_card_fragments with bookmarked project ids
+        mock_get_project_card_fragments.assert_called_once_with([self.project1.id, self.project2.id])
         # And: Get projects with bookmarked project
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertDictEqual(
@@ -1716,7 +2273,7 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
                         'is_leader': True,
                         'is_member_manageable': True,
                         'is_participated': True,
-                        'recent_recruited_at': mock_get_project_recent_recruited_at.return_value[self.project1.id]
+                        'recent_recruited_at': format_utc(self.project1.created_at)
                     },
                     {
                         'id': self.project2.id,
@@ -1738,10 +2295,38 @@ class GetMyProjectBookmarkAPIViewTests(APITestCase):
                         'is_leader': False,
                         'is_member_manageable': False,
                         'is_participated': False,
-                        'recent_recruited_at': mock_get_project_recent_recruited_at.return_value[self.project2.id]
+                        'recent_recruited_at': format_utc(self.project2.created_at)
                     }
                 ],
                 'next_cursor': None,
                 'has_more': False,
             }
         )
+
+    def test_get_projects_with_bookmarked_project_should_hydrate_cards(self):
+        # Given: 사용자가 로그인 상태인 경우
+        self.client.force_login(self.member1)
+        # And: Set Bookmark data
+        ProjectBookmark.objects.create(member=self.member1, project=self.project1)
+        ProjectBookmark.objects.create(member=self.member1, project=self.project2)
+        # And: member1 is leader of project1
+        ProjectMemberManagement.objects.create(
+            project=self.project1,
+            member=self.member1,
+            job=self.job1,
+            is_leader=True,
+        )
+
+        # When: Get request
+        # Then: session, member, bookmark page, card and member relation queries only
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+
+        # And: member relations are hydrated
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data_by_project_id = {project['id']: project for project in response.json()['data']}
+        self.assertTrue(data_by_project_id[self.project1.id]['is_leader'])
+        self.assertTrue(data_by_project_id[self.project1.id]['is_member_manageable'])
+        self.assertTrue(data_by_project_id[self.project1.id]['is_participated'])
+        self.assertFalse(data_by_project_id[self.project2.id]['is_leader'])
+        self.assertFalse(data_by_project_id[self.project2.id]['is_participated'])
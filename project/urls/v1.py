@@ -2,11 +2,15 @@ from django.urls import path
 from project.views import (
     CreateProjectAPIView,
     GetMyProjectBookmarkAPIView,
+    HomeProjectFacetCountAPIView,
     HomeProjectListAPIView,
     ProjectActiveRecruitSelfApplicationAPIView,
     ProjectBookmarkAPIView,
+    ProjectBookmarkSyncAPIView,
     ProjectDetailAPIView,
     ProjectJobRecruitApplyAPIView,
+    ProjectRecruitApplicationDecisionAPIView,
+    ProjectRecruitApplicationListAPIView,
     ProjectRecruitEligibleAPIView,
 )
 
@@ -22,11 +26,23 @@ urlpatterns = [
         name='project_active_recruit_applications_self',
     ),
     path('<int:project_id>/recruit/job/<int:job_id>/apply', ProjectJobRecruitApplyAPIView.as_view(), name='project_recruit_job_apply'),
+    path(
+        '<int:project_id>/recruit/applications',
+        ProjectRecruitApplicationListAPIView.as_view(),
+        name='project_recruit_applications',
+    ),
+    path(
+        '<int:project_id>/recruit/applications/decision',
+        ProjectRecruitApplicationDecisionAPIView.as_view(),
+        name='project_recruit_applications_decision',
+    ),
     path('<int:project_id>/recruit/eligible', ProjectRecruitEligibleAPIView.as_view(), name='project_recruit_eligible'),
     path('<int:project_id>', ProjectDetailAPIView.as_view(), name='project_detail'),
 
     path('<int:project_id>/bookmark', ProjectBookmarkAPIView.as_view(), name='project_bookmark'),
     path('my/bookmark', GetMyProjectBookmarkAPIView.as_view(), name='my_project_bookmark'),
+    path('my/bookmark/sync', ProjectBookmarkSyncAPIView.as_view(), name='my_project_bookmark_sync'),
 
     path('home', HomeProjectListAPIView.as_view(), name='home'),
+    path('home/facets', HomeProjectFacetCountAPIView.as_view(), name='home_facets'),
 ]
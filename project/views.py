@@ -1,10 +1,9 @@
-from typing import List
-
 from common.common_consts.common_error_messages import InvalidInputResponseErrorStatus
 from common.common_decorators.request_decorators import cursor_pagination
 from common.common_exceptions import PydanticAPIException
 from common.common_paginations.cursor_pagination_helpers import get_objects_with_cursor_pagination
 from common.common_utils import format_utc
+from common.common_utils.request_utils import is_etag_matched
 from job.dtos.model_dtos import ProjectJobAvailabilities
 from job.services.project_job_services import (
     ProjectJobRecruitService,
@@ -12,59 +11,74 @@ from job.services.project_job_services import (
     get_current_active_project_job_recruitments,
 )
 from member.permissions import IsMemberLogin
-from member.services import get_member_info_block
+from member.services import (
+    get_cached_member_info_block_json,
+    get_member_info_block,
+)
 from project.consts import (
     ProjectCurrentRecruitStatus,
     ProjectDetailStatus,
 )
 from project.cursor_criteria.cursor_criteria import (
     HomeProjectListCursorCriteria,
+    HomeProjectSearchCursorCriteria,
     MyProjectBookmarkListCursorCriteria,
+    ProjectRecruitApplicationListCursorCriteria,
 )
-from project.dtos.model_dtos import (
-    ProjectListItem,
-    MyProjectBookmarkListItem,
-)
+from project.dtos.model_dtos import ProjectRecruitApplicationItem
 from project.dtos.request_dtos import (
     CreateProjectJob,
     CreateProjectRequest,
     HomeProjectListRequest,
+    ProjectBookmarkSyncRequest,
     ProjectJobRecruitApplyRequest,
+    ProjectRecruitApplicationDecisionRequest,
+    ProjectRecruitApplicationListRequest,
 )
 from project.dtos.response_dtos import (
+    HomeProjectFacetCountResponse,
     HomeProjectListResponse,
     GetMyProjectBookmarkListResponse,
     ProjectActiveRecruitJobSelfApplicationResponse,
     ProjectBookmarkCreationResponse,
     ProjectBookmarkDeletionResponse,
+    ProjectBookmarkSyncResponse,
     ProjectCreationResponse,
     ProjectDetailResponse,
     ProjectJobRecruitApplyResponse,
+    ProjectRecruitApplicationDecisionResponse,
+    ProjectRecruitApplicationListResponse,
     ProjectRecruitEligibleResponse,
 )
 from project.dtos.service_dtos import ProjectCreationData
 from project.exceptions import ProjectNotFoundErrorException
-from project.models import (
-    Project,
-    ProjectBookmark,
-)
 from project.services.bookmark_services import (
     BookmarkService,
     get_member_bookmarked_project_ids,
 )
-from project.services.project_recruit_services import get_project_recent_recruited_at
+from project.services.project_card_services import ProjectCardAssembler
+from project.services.project_etag_services import (
+    get_project_detail_etag,
+    get_project_recruit_eligible_etag,
+)
+from project.services.project_facet_services import get_home_project_facet_counts
+from project.services.project_filter_index_services import get_filter_indexed_home_projects
+from project.services.project_list_cache_services import HomeProjectListCache
+from project.services.project_search_services import get_ranked_project_qs
 from project.services.project_services import (
     ProjectCreationService,
     get_active_project,
-    get_filtered_project_qs, get_projects_leader_ids, get_projects_participated_member_ids,
+    get_filtered_project_qs,
 )
+from project.services.recruit_application_services import ProjectRecruitApplicationService
 from pydantic import ValidationError
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 
 class HomeProjectListAPIView(APIView):
-    @cursor_pagination(default_size=20, cursor_criteria=[HomeProjectListCursorCriteria])
+    @cursor_pagination(default_size=20, cursor_criteria=[HomeProjectListCursorCriteria, HomeProjectSearchCursorCriteria])
     def get(self, request, decoded_next_cursor: dict, size: int):
         try:
             home_project_list_request = HomeProjectListRequest.of(request.query_params)
@@ -76,8 +90,25 @@ class HomeProjectListAPIView(APIView):
                 errors=e.errors(),
             )
 
+        is_relevance_search = home_project_list_request.is_relevance_search()
+        if is_relevance_search:
+            cursor_criteria = HomeProjectSearchCursorCriteria
+        else:
+            cursor_criteria = HomeProjectListCursorCriteria
+
+        if decoded_next_cursor and not cursor_criteria.is_valid_decoded_cursor(decoded_next_cursor):
+            raise APIException('Invalid next_cursor.')
+
+        home_project_list_cache = HomeProjectListCache(home_project_list_request, decoded_next_cursor, size)
+        cached_response_data = home_project_list_cache.get()
+        if cached_response_data is not None:
+            return Response(
+                HomeProjectListCache.overlay_is_bookmarked(cached_response_data, request.member),
+                status=200
+            )
+
         project_qs = get_filtered_project_qs(
-            title=home_project_list_request.title,
+            title=None if is_relevance_search else home_project_list_request.title,
             category_ids=home_project_list_request.category_ids,
             job_ids=home_project_list_request.job_ids,
             job_category_ids=home_project_list_request.job_category_ids,
@@ -89,46 +120,50 @@ class HomeProjectListAPIView(APIView):
             max_duration_month=home_project_list_request.max_duration_month,
             current_recruit_status=home_project_list_request.current_recruit_status,
         )
+        if is_relevance_search:
+            project_qs = get_ranked_project_qs(project_qs, home_project_list_request.title)
 
-        paginated_projects, has_more, next_cursor = get_objects_with_cursor_pagination(
-            project_qs,
-            HomeProjectListCursorCriteria,
-            decoded_next_cursor,
-            size,
-        )
-        job_recruits_by_project_id = get_current_active_project_job_recruitments(
-            [project.id for project in paginated_projects]
-        )
-        is_bookmarked_project_ids = get_member_bookmarked_project_ids(
-            request.member,
-            [project.id for project in paginated_projects]
-        )
-        recent_recruited_at_by_project_id = get_project_recent_recruited_at(
-            [project.id for project in paginated_projects]
+        paginated_page = None
+        if not is_relevance_search:
+            paginated_page = get_filter_indexed_home_projects(home_project_list_request, decoded_next_cursor, size)
+        if paginated_page is None:
+            paginated_page = get_objects_with_cursor_pagination(
+                project_qs.only('id', 'rearrangement_time'),
+                cursor_criteria,
+                decoded_next_cursor,
+                size,
+            )
+        paginated_projects, has_more, next_cursor = paginated_page
+        response_data = HomeProjectListResponse(
+            data=ProjectCardAssembler(request.member).get_project_list_items(
+                [project.id for project in paginated_projects]
+            ),
+            next_cursor=next_cursor,
+            has_more=has_more,
+        ).model_dump()
+        home_project_list_cache.set(response_data)
+        return Response(
+            response_data,
+            status=200
         )
+
+
+class HomeProjectFacetCountAPIView(APIView):
+    def get(self, request):
+        try:
+            home_project_list_request = HomeProjectListRequest.of(request.query_params)
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=InvalidInputResponseErrorStatus.INVALID_INPUT_HOME_LIST_PARAM_ERROR_400.label,
+                error_code=InvalidInputResponseErrorStatus.INVALID_INPUT_HOME_LIST_PARAM_ERROR_400.value,
+                errors=e.errors(),
+            )
+
+        facet_counts = get_home_project_facet_counts(home_project_list_request)
         return Response(
-            HomeProjectListResponse(
-                data=[
-                    ProjectListItem(
-                        id=project.id,
-                        category_id=project.category_id,
-                        title=project.title,
-                        simple_description=project.description[:100],
-                        jobs=[
-                            ProjectJobAvailabilities.from_recruit_info(job_recruit)
-                            for job_recruit in job_recruits_by_project_id.get(project.id, [])
-                        ],
-                        experience=project.job_experience_type,
-                        current_recruit_status=project.current_recruit_status,
-                        image=project.main_image,
-                        is_bookmarked=(project.id in is_bookmarked_project_ids),
-                        hours_per_week=project.hours_per_week,
-                        recent_recruited_at=recent_recruited_at_by_project_id.get(project.id),
-                    )
-                    for project in paginated_projects
-                ],
-                next_cursor=next_cursor,
-                has_more=has_more,
+            HomeProjectFacetCountResponse(
+                **facet_counts.model_dump(),
             ).model_dump(),
             status=200
         )
@@ -180,14 +215,24 @@ class ProjectDetailAPIView(APIView):
         project = get_active_project(project_id)
         if not project:
             raise ProjectNotFoundErrorException()
-        job_recruits_by_project_id = get_current_active_project_job_recruitments([project.id])
-        member_info_block = get_member_info_block(project.created_member_id)
         is_bookmarked = bool(
             get_member_bookmarked_project_ids(
                 request.member,
                 [project.id]
             )
         )
+        etag = get_project_detail_etag(
+            project,
+            is_bookmarked,
+            get_cached_member_info_block_json(project.created_member_id),
+        )
+        if etag and is_etag_matched(request, etag):
+            return Response(status=304, headers={'ETag': etag, 'Cache-Control': 'private, no-cache'})
+
+        job_recruits_by_project_id = get_current_active_project_job_recruitments([project.id])
+        member_info_block = get_member_info_block(project.created_member_id)
+        if not etag:
+            etag = get_project_detail_etag(project, is_bookmarked, member_info_block.model_dump_json())
         return Response(
             ProjectDetailResponse(
                 id=project.id,
@@ -207,13 +252,11 @@ class ProjectDetailAPIView(APIView):
                 leader_info=member_info_block,
                 bookmark_count=project.bookmark_count,
                 is_bookmarked=is_bookmarked,
-                recent_recruited_at=(
-                    (project.latest_project_recruitment and format_utc(project.latest_project_recruitment.created_at))
-                    or format_utc(project.created_at)
-                ),
+                recent_recruited_at=format_utc(project.latest_recruited_at or project.created_at),
                 first_recruited_at=format_utc(project.created_at),
             ).model_dump(),
-            status=200
+            status=200,
+            headers={'ETag': etag, 'Cache-Control': 'private, no-cache'},
         )
 
 
@@ -226,13 +269,18 @@ class ProjectRecruitEligibleAPIView(APIView):
         project = get_active_project(project_id)
         if not project:
             raise ProjectNotFoundErrorException()
+        etag = get_project_recruit_eligible_etag(project)
+        if is_etag_matched(request, etag):
+            return Response(status=304, headers={'ETag': etag, 'Cache-Control': 'private, no-cache'})
+
         if not ProjectCurrentRecruitStatus.is_recruiting(project.current_recruit_status):
             return Response(
                 ProjectRecruitEligibleResponse(
                     is_available=False,
                     jobs=None,
                 ).model_dump(),
-                status=200
+                status=200,
+                headers={'ETag': etag, 'Cache-Control': 'private, no-cache'},
             )
         job_recruits_by_project_id = get_current_active_project_job_recruitments([project.id])
         project_job_availabilities = [
@@ -244,7 +292,8 @@ class ProjectRecruitEligibleAPIView(APIView):
                 is_available=any(job.is_available for job in project_job_availabilities),
                 jobs=project_job_availabilities or None,
             ).model_dump(),
-            status=200
+            status=200,
+            headers={'ETag': etag, 'Cache-Control': 'private, no-cache'},
         )
 
 
@@ -309,6 +358,94 @@ class ProjectActiveRecruitSelfApplicationAPIView(APIView):
         )
 
 
+class ProjectRecruitApplicationListAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    @cursor_pagination(default_size=20, cursor_criteria=[ProjectRecruitApplicationListCursorCriteria])
+    def get(self, request, project_id: int, decoded_next_cursor: dict, size: int):
+        try:
+            project_recruit_application_list_request = ProjectRecruitApplicationListRequest.of(request.query_params)
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=InvalidInputResponseErrorStatus.INVALID_RECRUIT_APPLICATION_LIST_PARAM_ERROR_400.label,
+                error_code=InvalidInputResponseErrorStatus.INVALID_RECRUIT_APPLICATION_LIST_PARAM_ERROR_400.value,
+                errors=e.errors(),
+            )
+
+        project_recruit_application_service = ProjectRecruitApplicationService(
+            project_id=project_id,
+            member_id=request.member.id,
+        )
+        project_recruit_application_service.validate_manageable()
+        paginated_recruit_applications, has_more, next_cursor = get_objects_with_cursor_pagination(
+            project_recruit_application_service.get_recruit_application_qs(
+                project_recruitment_id=project_recruit_application_list_request.project_recruitment_id,
+                request_status=project_recruit_application_list_request.request_status,
+                job_id=project_recruit_application_list_request.job_id,
+            ),
+            ProjectRecruitApplicationListCursorCriteria,
+            decoded_next_cursor,
+            size,
+        )
+        return Response(
+            ProjectRecruitApplicationListResponse(
+                data=[
+                    ProjectRecruitApplicationItem(
+                        id=recruit_application.id,
+                        job_id=recruit_application.project_recruitment_job.job_id,
+                        member_id=recruit_application.member_id,
+                        nickname=recruit_application.member.nickname,
+                        profile_image=recruit_application.member.profile_image_url,
+                        request_message=recruit_application.request_message,
+                        request_status=recruit_application.request_status,
+                        created_at=format_utc(recruit_application.created_at),
+                    )
+                    for recruit_application in paginated_recruit_applications
+                ],
+                next_cursor=next_cursor,
+                has_more=has_more,
+            ).model_dump(),
+            status=200,
+        )
+
+
+class ProjectRecruitApplicationDecisionAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
+
+    def post(self, request, project_id: int):
+        try:
+            project_recruit_application_decision_request = ProjectRecruitApplicationDecisionRequest.of(request.data)
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=InvalidInputResponseErrorStatus.INVALID_RECRUIT_APPLICATION_DECISION_INPUT_ERROR_400.label,
+                error_code=InvalidInputResponseErrorStatus.INVALID_RECRUIT_APPLICATION_DECISION_INPUT_ERROR_400.value,
+                errors=e.errors(),
+            )
+
+        project_recruit_application_service = ProjectRecruitApplicationService(
+            project_id=project_id,
+            member_id=request.member.id,
+        )
+        project_recruit_application_service.validate_manageable()
+        decision_result = project_recruit_application_service.decide_recruit_applications(
+            project_recruit_application_decision_request.get_request_status_by_application_id()
+        )
+        return Response(
+            ProjectRecruitApplicationDecisionResponse(
+                message='모집 신청이 처리되었습니다.',
+                accepted_application_ids=decision_result.accepted_application_ids,
+                rejected_application_ids=decision_result.rejected_application_ids,
+            ).model_dump(),
+            status=200,
+        )
+
+
 class ProjectBookmarkAPIView(APIView):
     permission_classes = [
         IsMemberLogin,
@@ -333,59 +470,58 @@ class ProjectBookmarkAPIView(APIView):
         )
 
 
-class GetMyProjectBookmarkAPIView(APIView):
+class ProjectBookmarkSyncAPIView(APIView):
     permission_classes = [
         IsMemberLogin,
     ]
 
-    @staticmethod
-    def _extract_project_from_bookmark_qs(bookmark_qs: List[ProjectBookmark]) -> List[Project]:
-        return [bookmark.project for bookmark in bookmark_qs]
+    def post(self, request):
+        try:
+            project_bookmark_sync_request = ProjectBookmarkSyncRequest.of(request.data)
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=InvalidInputResponseErrorStatus.INVALID_BOOKMARK_SYNC_INPUT_ERROR_400.label,
+                error_code=InvalidInputResponseErrorStatus.INVALID_BOOKMARK_SYNC_INPUT_ERROR_400.value,
+                errors=e.errors(),
+            )
+
+        is_bookmarked_by_project_id = project_bookmark_sync_request.get_is_bookmarked_by_project_id()
+        BookmarkService(request.member.id).sync_bookmarks(is_bookmarked_by_project_id)
+        return Response(
+            ProjectBookmarkSyncResponse(
+                message='북마크가 동기화되었습니다.',
+                bookmarked_project_ids=sorted(
+                    get_member_bookmarked_project_ids(request.member, list(is_bookmarked_by_project_id))
+                ),
+            ).model_dump(),
+            status=200,
+        )
+
+
+class GetMyProjectBookmarkAPIView(APIView):
+    permission_classes = [
+        IsMemberLogin,
+    ]
 
     @cursor_pagination(default_size=20, cursor_criteria=[MyProjectBookmarkListCursorCriteria])
     def get(self, request, decoded_next_cursor: dict, size: int):
-        bookmark_qs = BookmarkService(request.member.id).get_my_active_bookmarks().select_related('project')
+        bookmark_qs = BookmarkService(request.member.id).get_my_active_bookmarks().only(
+            'id',
+            'updated_at',
+            'project_id',
+        )
         paginated_bookmark_qs, has_more, next_cursor = get_objects_with_cursor_pagination(
             bookmark_qs,
             MyProjectBookmarkListCursorCriteria,
             decoded_next_cursor,
             size,
         )
-        projects = self._extract_project_from_bookmark_qs(paginated_bookmark_qs)
-        project_ids = [project.id for project in projects]
-        job_recruits_by_project_id = get_current_active_project_job_recruitments(
-            project_ids
-        )
-        recent_recruited_at_by_project_id = get_project_recent_recruited_at(
-            project_ids
-        )
-        leader_ids_by_project_id = get_projects_leader_ids(project_ids)
-        member_ids_by_project_id = get_projects_participated_member_ids(project_ids)
-
         return Response(
             GetMyProjectBookmarkListResponse(
-                data=[
-                    MyProjectBookmarkListItem(
-                        id=project.id,
-                        category_id=project.category_id,
-                        title=project.title,
-                        simple_description=project.description[:100],
-                        jobs=[
-                            ProjectJobAvailabilities.from_recruit_info(job_recruit)
-                            for job_recruit in job_recruits_by_project_id.get(project.id, [])
-                        ],
-                        experience=project.job_experience_type,
-                        current_recruit_status=project.current_recruit_status,
-                        image=project.main_image,
-                        is_bookmarked=True,
-                        is_leader=request.member.id in leader_ids_by_project_id[project.id],
-                        is_member_manageable=request.member.id in leader_ids_by_project_id[project.id],
-                        is_participated=request.member.id in member_ids_by_project_id[project.id],
-                        hours_per_week=project.hours_per_week,
-                        recent_recruited_at=recent_recruited_at_by_project_id.get(project.id),
-                    )
-                    for project in projects
-                ],
+                data=ProjectCardAssembler(request.member).get_my_project_bookmark_list_items(
+                    [bookmark.project_id for bookmark in paginated_bookmark_qs]
+                ),
                 next_cursor=next_cursor,
                 has_more=has_more,
             ).model_dump(),